@@ -1,6 +1,6 @@
 """Polymarket API client package."""
 
-from .http_client import HttpClient
+from .http_client import AsyncHttpClient, HttpClient
 from .gamma import GammaClient, Market, MarketToken, MarketsFetchResult
 from .data_api import DataApiClient
 from .clob import ClobClient, OrderBookTop
@@ -17,6 +17,7 @@ from .pnl import PnlBucketResult, PnlComputeResult, compute_user_pnl_buckets
 
 __all__ = [
     "HttpClient",
+    "AsyncHttpClient",
     "GammaClient",
     "DataApiClient",
     "ClobClient",
@@ -0,0 +1,410 @@
+"""Background batching writer for ClickHouse inserts with an on-disk spill journal."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Optional, Protocol, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+DEFAULT_MAX_QUEUE_ROWS = 50_000
+DEFAULT_RETRY_INTERVAL_SECONDS = 5.0
+
+_JOURNAL_SUFFIX = ".jsonl"
+
+
+class RowInsertClient(Protocol):
+    """Anything with the ``insert_rows(table, column_names, rows) -> int`` contract."""
+
+    def insert_rows(self, table: str, column_names: list[str], rows: list[list[Any]]) -> int:
+        ...
+
+
+def _encode_value(value: Any) -> Any:
+    # Journal values must round-trip to the same Python types the client expects.
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"__decimal__": str(value)}
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(item) for item in value]
+    if isinstance(value, dict):
+        return {"__dict__": {str(k): _encode_value(v) for k, v in value.items()}}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    if isinstance(value, dict):
+        if "__datetime__" in value:
+            return datetime.fromisoformat(value["__datetime__"])
+        if "__date__" in value:
+            return date.fromisoformat(value["__date__"])
+        if "__decimal__" in value:
+            return Decimal(value["__decimal__"])
+        if "__dict__" in value:
+            return {k: _decode_value(v) for k, v in value["__dict__"].items()}
+    return value
+
+
+class BufferedClickHouseWriter:
+    """
+    Non-blocking ClickHouse insert queue drained by a daemon thread.
+
+    ``submit`` only appends to a bounded in-memory queue. The background thread
+    groups pending rows by ``(table, column_names)`` and issues one
+    ``insert_rows`` per group once ``batch_size`` rows are waiting or
+    ``flush_interval_s`` has elapsed. When an insert fails the batch is
+    appended to a JSONL journal in ``spill_dir`` (or kept in memory when no
+    directory is configured) and inserts pause for ``retry_interval_s``.
+    Each later batch first replays the journal files oldest first and is only
+    inserted once that succeeds, so spilled rows reach ClickHouse ahead of
+    rows submitted after them.  Rows submitted while the queue is full go
+    straight to the journal, or are dropped and counted when there is no
+    journal; those overflow rows are replayed ahead of the older rows still
+    in the queue.
+
+    ``metrics()`` reports queue depth, row counters and flush latency.
+    """
+
+    def __init__(
+        self,
+        client: RowInsertClient,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_queue_rows: int = DEFAULT_MAX_QUEUE_ROWS,
+        spill_dir: Optional[Union[str, Path]] = None,
+        retry_interval_s: float = DEFAULT_RETRY_INTERVAL_SECONDS,
+        name: str = "clickhouse",
+        clock=time.monotonic,
+    ) -> None:
+        self.client = client
+        self.batch_size = max(int(batch_size), 1)
+        self.flush_interval_s = max(float(flush_interval_s), 0.0)
+        self.max_queue_rows = max(int(max_queue_rows), 1)
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self.retry_interval_s = max(float(retry_interval_s), 0.0)
+        self.name = name
+        self._clock = clock
+
+        self._cond = threading.Condition()
+        # Entries: (table, column_names tuple, row)
+        self._queue: deque[tuple[str, tuple[str, ...], list[Any]]] = deque()
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closing = False
+        self._thread: Optional[threading.Thread] = None
+        self._retry_at: Optional[float] = None
+        self._last_flush_at = clock()
+        self._journal_seq = 0
+        self._journal_lock = threading.Lock()
+        # Spilled batches (including ones left by an earlier process) awaiting replay.
+        self._journal_pending = self._journal_file_count() > 0
+
+        self._rows_submitted = 0
+        self._rows_written = 0
+        self._rows_spilled = 0
+        self._rows_replayed = 0
+        self._rows_dropped = 0
+        self._flush_count = 0
+        self._flush_failures = 0
+        self._flush_latency_total_ms = 0.0
+        self._last_flush_latency_ms: Optional[float] = None
+        self._max_flush_latency_ms = 0.0
+        self._last_error = ""
+
+    # ------------------------------------------------------------------
+    # Public interface
+    # ------------------------------------------------------------------
+
+    def submit(self, table: str, column_names: Sequence[str], rows: Sequence[Sequence[Any]]) -> int:
+        """Queue rows for insertion without blocking; return rows accepted (queued or spilled)."""
+        rows = [list(row) for row in rows]
+        if not rows:
+            return 0
+        columns = tuple(column_names)
+        overflow: list[list[Any]] = []
+        with self._cond:
+            if self._closing:
+                raise RuntimeError(f"{self.name} writer is closed")
+            self._rows_submitted += len(rows)
+            room = self.max_queue_rows - len(self._queue)
+            accepted = rows[: max(room, 0)]
+            overflow = rows[len(accepted):]
+            self._queue.extend((table, columns, row) for row in accepted)
+            if len(self._queue) >= self.batch_size:
+                self._cond.notify_all()
+        self._ensure_thread()
+
+        if overflow:
+            if self._spill(table, columns, overflow):
+                logger.warning(f"{self.name} writer queue full; spilled {len(overflow)} rows to journal")
+            else:
+                with self._cond:
+                    self._rows_dropped += len(overflow)
+                logger.warning(f"{self.name} writer queue full; dropped {len(overflow)} rows")
+                return len(accepted)
+        return len(rows)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for one drain of the queue; return False on timeout or if an insert failed."""
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._cond:
+            failures_before = self._flush_failures
+            if not self._queue and not self._in_flight:
+                return True
+        self._ensure_thread()
+        with self._cond:
+            self._flush_requested = True
+            self._retry_at = None
+            self._cond.notify_all()
+            while self._in_flight or (self._queue and self._flush_failures == failures_before):
+                remaining = None if deadline is None else deadline - self._clock()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining if remaining is not None else 0.1)
+            return self._flush_failures == failures_before
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Flush pending rows, spill whatever could not be written, and stop the thread."""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return flushed
+
+    def replay_journal(self) -> int:
+        """Insert spilled batches oldest first; return rows replayed before the first failure."""
+        if self.spill_dir is None or not self.spill_dir.exists():
+            return 0
+        replayed = 0
+        with self._journal_lock:
+            for path in sorted(self.spill_dir.glob(f"*{_JOURNAL_SUFFIX}")):
+                try:
+                    entries = [
+                        json.loads(line)
+                        for line in path.read_text(encoding="utf-8").splitlines()
+                        if line.strip()
+                    ]
+                except (OSError, ValueError) as exc:
+                    logger.warning(f"Skipping unreadable {self.name} journal file {path}: {exc}")
+                    continue
+                for entry in entries:
+                    rows = _decode_value(entry["rows"])
+                    self.client.insert_rows(entry["table"], list(entry["columns"]), rows)
+                    replayed += len(rows)
+                path.unlink()
+            self._journal_pending = False
+        if replayed:
+            with self._cond:
+                self._rows_replayed += replayed
+            logger.info(f"Replayed {replayed} spilled rows into ClickHouse ({self.name})")
+        return replayed
+
+    def metrics(self) -> dict[str, Any]:
+        """Return queue depth, row counters and flush latency stats."""
+        with self._cond:
+            average = (
+                round(self._flush_latency_total_ms / self._flush_count, 3)
+                if self._flush_count
+                else None
+            )
+            return {
+                "queue_depth": len(self._queue) + self._in_flight,
+                "max_queue_rows": self.max_queue_rows,
+                "rows_submitted": self._rows_submitted,
+                "rows_written": self._rows_written,
+                "rows_spilled": self._rows_spilled,
+                "rows_replayed": self._rows_replayed,
+                "rows_dropped": self._rows_dropped,
+                "flush_count": self._flush_count,
+                "flush_failures": self._flush_failures,
+                "last_flush_latency_ms": self._last_flush_latency_ms,
+                "avg_flush_latency_ms": average,
+                "max_flush_latency_ms": round(self._max_flush_latency_ms, 3),
+                "journal_files": self._journal_file_count(),
+                "last_error": self._last_error,
+            }
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"{self.name}-writer",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _journal_file_count(self) -> int:
+        if self.spill_dir is None or not self.spill_dir.exists():
+            return 0
+        return sum(1 for _ in self.spill_dir.glob(f"*{_JOURNAL_SUFFIX}"))
+
+    def _spill(self, table: str, columns: tuple[str, ...], rows: list[list[Any]]) -> bool:
+        if self.spill_dir is None:
+            return False
+        entry = json.dumps({"table": table, "columns": list(columns), "rows": _encode_value(rows)})
+        with self._journal_lock:
+            self._journal_seq += 1
+            path = self.spill_dir / f"spill-{time.time_ns():020d}-{self._journal_seq:06d}{_JOURNAL_SUFFIX}"
+            try:
+                self.spill_dir.mkdir(parents=True, exist_ok=True)
+                with open(path, "w", encoding="utf-8") as handle:
+                    handle.write(entry + "\n")
+                    handle.flush()
+                    os.fsync(handle.fileno())
+            except OSError as exc:
+                logger.error(f"Failed to spill {len(rows)} rows to {path}: {exc}")
+                return False
+            self._journal_pending = True
+        with self._cond:
+            self._rows_spilled += len(rows)
+        return True
+
+    def _should_drain(self) -> bool:
+        if not self._queue:
+            return False
+        if self._flush_requested:
+            return True
+        if self._retry_at is not None and self._clock() < self._retry_at:
+            return False
+        return (
+            self._closing
+            or len(self._queue) >= self.batch_size
+            or self._clock() - self._last_flush_at >= self.flush_interval_s
+        )
+
+    def _next_batch(self) -> Optional[list[tuple[str, tuple[str, ...], list[Any]]]]:
+        """Block until rows should be written; return None once the writer is closing."""
+        with self._cond:
+            while not self._should_drain():
+                if self._closing and (not self._queue or self._retry_at is not None):
+                    return None
+                if self._flush_requested and not self._queue:
+                    self._flush_requested = False
+                    self._cond.notify_all()
+                self._cond.wait(self.flush_interval_s or 0.05)
+            batch = list(self._queue)
+            self._queue.clear()
+            self._in_flight = len(batch)
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                break
+            try:
+                self._write_batch(batch)
+            except Exception as exc:  # pragma: no cover - _write_batch handles insert errors
+                logger.error(f"{self.name} writer thread error: {exc}")
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._last_flush_at = self._clock()
+                    if not self._queue:
+                        self._flush_requested = False
+                    self._cond.notify_all()
+
+        # Closing while ClickHouse is unavailable: journal what is left.
+        with self._cond:
+            leftover = list(self._queue)
+            self._queue.clear()
+        for (table, columns), rows in self._group(leftover).items():
+            if not self._spill(table, columns, rows):
+                logger.warning(f"{self.name} writer closed with {len(rows)} unwritten rows for {table}")
+                with self._cond:
+                    self._rows_dropped += len(rows)
+        with self._cond:
+            self._cond.notify_all()
+
+    @staticmethod
+    def _group(
+        batch: list[tuple[str, tuple[str, ...], list[Any]]],
+    ) -> dict[tuple[str, tuple[str, ...]], list[list[Any]]]:
+        groups: dict[tuple[str, tuple[str, ...]], list[list[Any]]] = {}
+        for table, columns, row in batch:
+            groups.setdefault((table, columns), []).append(row)
+        return groups
+
+    def _replay_before_batch(self) -> bool:
+        """Replay the journal ahead of a new batch; back off and return False on failure."""
+        try:
+            self.replay_journal()
+        except Exception as exc:
+            logger.warning(f"{self.name} journal replay failed: {exc}")
+            with self._cond:
+                self._flush_failures += 1
+                self._last_error = str(exc)
+                self._retry_at = self._clock() + self.retry_interval_s
+                self._flush_requested = False
+            return False
+        return True
+
+    def _write_batch(self, batch: list[tuple[str, tuple[str, ...], list[Any]]]) -> None:
+        groups = self._group(batch)
+        failed: list[tuple[str, tuple[str, ...], list[list[Any]]]] = []
+        if self._journal_pending and not self._replay_before_batch():
+            # Spilled rows are older than this batch; spill it behind them.
+            failed = [(table, columns, rows) for (table, columns), rows in groups.items()]
+            groups = {}
+        for (table, columns), rows in groups.items():
+            if failed:
+                # Keep ordering: once one insert fails, spill the rest of this batch too.
+                failed.append((table, columns, rows))
+                continue
+            started = time.perf_counter()
+            try:
+                self.client.insert_rows(table, list(columns), rows)
+            except Exception as exc:
+                logger.warning(f"{self.name} insert into {table} failed ({len(rows)} rows): {exc}")
+                with self._cond:
+                    self._flush_failures += 1
+                    self._last_error = str(exc)
+                    self._retry_at = self._clock() + self.retry_interval_s
+                    # Stop forcing drains; the next attempt waits for retry_at.
+                    self._flush_requested = False
+                failed.append((table, columns, rows))
+                continue
+            latency_ms = (time.perf_counter() - started) * 1000.0
+            with self._cond:
+                self._retry_at = None
+                self._rows_written += len(rows)
+                self._flush_count += 1
+                self._flush_latency_total_ms += latency_ms
+                self._last_flush_latency_ms = round(latency_ms, 3)
+                self._max_flush_latency_ms = max(self._max_flush_latency_ms, latency_ms)
+
+        for table, columns, rows in failed:
+            if self._spill(table, columns, rows):
+                continue
+            # No journal: keep rows in memory (bounded) for the next attempt.
+            with self._cond:
+                room = self.max_queue_rows - len(self._queue)
+                keep = rows[: max(room, 0)]
+                for row in reversed(keep):
+                    self._queue.appendleft((table, columns, row))
+                self._rows_dropped += len(rows) - len(keep)
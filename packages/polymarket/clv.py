@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import logging
@@ -31,6 +32,9 @@ _LEGACY_FIDELITY_MINUTES = {
     "low": 60,
 }
 _MAX_HTTP_ERROR_BODY_CHARS = 800
+# Batch enrichment: keys per cache lookup query and concurrent history fetches.
+DEFAULT_CACHE_LOOKUP_BATCH_SIZE = 500
+DEFAULT_HISTORY_FETCH_CONCURRENCY = 4
 
 MISSING_REASON_NO_CLOSE_TS = "NO_CLOSE_TS"
 MISSING_REASON_NO_SETTLEMENT_CLOSE_TS = "NO_SETTLEMENT_CLOSE_TS"
@@ -141,6 +145,23 @@ class HistoryWindowResolution:
     network_call_made: bool = False
 
 
+@dataclass(frozen=True)
+class HistoryWindowRequest:
+    """Cache key of one price-history window (see build_cache_lookup_sql).
+
+    Build with ``history_window_request`` so anchors, windows and fidelity
+    are normalized exactly as the per-position resolvers normalize them.
+    """
+
+    token_id: str
+    anchor_ts: datetime
+    query_window_seconds: int
+    kind: str
+    source: str
+    interval: str
+    fidelity: str
+
+
 @dataclass(frozen=True)
 class EntryContextResolution:
     open_price: Optional[float]
@@ -768,24 +789,16 @@ def _insert_snapshot_points(
         return 0
 
 
-def _fetch_online_points(
+def _fetch_history_points(
     *,
     token_id: str,
     close_ts: datetime,
-    clickhouse_client: Any,
     clob_client: Any,
-    allow_online: bool,
     query_window_seconds: int,
-    kind: str,
-    source: str,
-    interval: str,
-    fidelity_key: str,
     fidelity_minutes: int,
-) -> Tuple[List[PricePoint], Optional[str], int, Optional[str]]:
-    if not allow_online:
-        return [], MISSING_REASON_OFFLINE, 0, None
+) -> Tuple[List[PricePoint], Optional[str], Optional[str]]:
     if clob_client is None:
-        return [], MISSING_REASON_AUTH_MISSING, 0, None
+        return [], MISSING_REASON_AUTH_MISSING, None
 
     window_start = _ensure_utc(close_ts) - timedelta(seconds=max(int(query_window_seconds), 0))
     try:
@@ -805,11 +818,40 @@ def _fetch_online_points(
             classified,
             error_detail,
         )
-        return [], classified, 0, error_detail
+        return [], classified, error_detail
 
     fetched_points = _extract_points_from_history_payload(payload, token_id=token_id)
     if not fetched_points:
-        return [], MISSING_REASON_EMPTY_HISTORY, 0, None
+        return [], MISSING_REASON_EMPTY_HISTORY, None
+    return fetched_points, None, None
+
+
+def _fetch_online_points(
+    *,
+    token_id: str,
+    close_ts: datetime,
+    clickhouse_client: Any,
+    clob_client: Any,
+    allow_online: bool,
+    query_window_seconds: int,
+    kind: str,
+    source: str,
+    interval: str,
+    fidelity_key: str,
+    fidelity_minutes: int,
+) -> Tuple[List[PricePoint], Optional[str], int, Optional[str]]:
+    if not allow_online:
+        return [], MISSING_REASON_OFFLINE, 0, None
+
+    fetched_points, fetch_error_reason, error_detail = _fetch_history_points(
+        token_id=token_id,
+        close_ts=close_ts,
+        clob_client=clob_client,
+        query_window_seconds=query_window_seconds,
+        fidelity_minutes=fidelity_minutes,
+    )
+    if fetch_error_reason is not None:
+        return [], fetch_error_reason, 0, error_detail
 
     written = _insert_snapshot_points(
         clickhouse_client,
@@ -837,6 +879,7 @@ def _resolve_history_window_points(
     source: str,
     interval: str,
     fidelity: Any,
+    prefetched: Optional[Dict[HistoryWindowRequest, HistoryWindowResolution]] = None,
 ) -> HistoryWindowResolution:
     anchor_ts_utc = _ensure_utc(anchor_ts)
     window_seconds = max(int(query_window_seconds), 0)
@@ -844,6 +887,21 @@ def _resolve_history_window_points(
     fidelity_minutes = normalize_prices_fidelity_minutes(fidelity)
     fidelity_key = str(fidelity_minutes)
 
+    if prefetched is not None:
+        request = HistoryWindowRequest(
+            token_id=token_id,
+            anchor_ts=anchor_ts_utc,
+            query_window_seconds=window_seconds,
+            kind=kind,
+            source=source,
+            interval=interval_key,
+            fidelity=fidelity_key,
+        )
+        resolution = prefetched.get(request)
+        if resolution is not None:
+            _mark_prefetched_window_used(prefetched, request, resolution)
+            return resolution
+
     cached_points = _query_cached_points(
         clickhouse_client,
         token_id=token_id,
@@ -906,6 +964,296 @@ def _resolve_history_window_points(
     )
 
 
+def _mark_prefetched_window_used(
+    prefetched: Dict[HistoryWindowRequest, HistoryWindowResolution],
+    request: HistoryWindowRequest,
+    resolution: HistoryWindowResolution,
+) -> None:
+    # Later positions sharing this window see it the way a sequential run would
+    # have: as a cache hit (or a repeated failure) with no new fetch or write.
+    prefetched[request] = HistoryWindowResolution(
+        points=resolution.points,
+        reason_if_missing=resolution.reason_if_missing,
+        history_points_count=0,
+        cache_points_written=0,
+        error_detail=resolution.error_detail,
+        from_cache=bool(resolution.points),
+        network_call_made=False,
+    )
+
+
+def history_window_request(
+    *,
+    token_id: str,
+    anchor_ts: datetime,
+    query_window_seconds: int,
+    kind: str,
+    source: str = PRICE_SNAPSHOT_SOURCE,
+    interval: str = DEFAULT_PRICES_INTERVAL,
+    fidelity: Any = DEFAULT_PRICES_FIDELITY,
+) -> HistoryWindowRequest:
+    """Build the normalized cache key for one price-history window."""
+    return HistoryWindowRequest(
+        token_id=token_id,
+        anchor_ts=_ensure_utc(anchor_ts),
+        query_window_seconds=max(int(query_window_seconds), 0),
+        kind=kind,
+        source=source,
+        interval=str(interval or "").strip() or DEFAULT_PRICES_INTERVAL,
+        fidelity=str(normalize_prices_fidelity_minutes(fidelity)),
+    )
+
+
+def build_bulk_cache_lookup_sql() -> str:
+    """Return the multi-key cache lookup query used by batch CLV resolution.
+
+    Each filter is an IN over the distinct values of one key column, so the
+    result can include rows for key combinations nobody asked for; callers
+    match rows back to their exact HistoryWindowRequest.
+    """
+    return f"""
+        SELECT
+            token_id,
+            kind,
+            close_ts,
+            source,
+            query_window_seconds,
+            interval,
+            fidelity,
+            ts_observed,
+            price
+        FROM {PRICE_SNAPSHOT_TABLE}
+        WHERE token_id IN {{token_ids:Array(String)}}
+          AND kind IN {{kinds:Array(String)}}
+          AND close_ts IN {{close_ts_values:Array(DateTime64(3))}}
+          AND source IN {{sources:Array(String)}}
+          AND query_window_seconds IN {{query_window_seconds_values:Array(UInt32)}}
+          AND interval IN {{intervals:Array(String)}}
+          AND fidelity IN {{fidelities:Array(String)}}
+        ORDER BY ts_observed DESC
+    """
+
+
+def _truncate_to_millis(value: datetime) -> datetime:
+    utc_value = _ensure_utc(value)
+    return utc_value.replace(microsecond=(utc_value.microsecond // 1000) * 1000)
+
+
+def _query_cached_points_bulk(
+    clickhouse_client: Any,
+    requests_batch: Sequence[HistoryWindowRequest],
+) -> Dict[HistoryWindowRequest, List[PricePoint]]:
+    if clickhouse_client is None or not requests_batch:
+        return {}
+
+    # close_ts is stored as DateTime64(3); match on millisecond precision.
+    by_key: Dict[Tuple[Any, ...], HistoryWindowRequest] = {}
+    for request in requests_batch:
+        by_key[
+            (
+                request.token_id,
+                request.kind,
+                _truncate_to_millis(request.anchor_ts),
+                request.source,
+                request.query_window_seconds,
+                request.interval,
+                request.fidelity,
+            )
+        ] = request
+
+    try:
+        result = clickhouse_client.query(
+            build_bulk_cache_lookup_sql(),
+            parameters={
+                "token_ids": sorted({r.token_id for r in requests_batch}),
+                "kinds": sorted({r.kind for r in requests_batch}),
+                "close_ts_values": sorted({r.anchor_ts for r in requests_batch}),
+                "sources": sorted({r.source for r in requests_batch}),
+                "query_window_seconds_values": sorted(
+                    {r.query_window_seconds for r in requests_batch}
+                ),
+                "intervals": sorted({r.interval for r in requests_batch}),
+                "fidelities": sorted({r.fidelity for r in requests_batch}),
+            },
+        )
+    except Exception as exc:
+        logger.warning(
+            "CLV bulk cache lookup failed for %d window(s): %s",
+            len(requests_batch),
+            exc,
+        )
+        return {}
+
+    cached: Dict[HistoryWindowRequest, List[PricePoint]] = {}
+    for row in getattr(result, "result_rows", []) or []:
+        if len(row) < 9:
+            continue
+        close_ts = _parse_timestamp(row[2])
+        window_seconds = _safe_float(row[4])
+        if close_ts is None or window_seconds is None:
+            continue
+        request = by_key.get(
+            (
+                str(row[0]),
+                str(row[1]),
+                _truncate_to_millis(close_ts),
+                str(row[3]),
+                int(window_seconds),
+                str(row[5]),
+                str(row[6]),
+            )
+        )
+        if request is None:
+            continue
+        ts_observed = _parse_timestamp(row[7])
+        price = _safe_float(row[8])
+        if ts_observed is None or price is None:
+            continue
+        cached.setdefault(request, []).append(
+            PricePoint(token_id=request.token_id, ts_observed=ts_observed, price=price)
+        )
+    return cached
+
+
+def _insert_snapshot_points_bulk(
+    clickhouse_client: Any,
+    fetched: Sequence[Tuple[HistoryWindowRequest, Sequence[PricePoint]]],
+) -> Optional[int]:
+    """Write all fetched windows in one insert; return rows written or None on failure."""
+    rows = [
+        (
+            request.token_id,
+            _ensure_utc(point.ts_observed),
+            float(point.price),
+            request.kind,
+            request.anchor_ts,
+            request.source,
+            int(request.query_window_seconds),
+            request.interval,
+            request.fidelity,
+        )
+        for request, points in fetched
+        for point in points
+    ]
+    if clickhouse_client is None or not rows:
+        return 0
+    try:
+        insert_result = clickhouse_client.insert(
+            PRICE_SNAPSHOT_TABLE,
+            rows,
+            column_names=_cache_insert_columns(),
+        )
+    except Exception as exc:
+        logger.warning(
+            "Failed writing CLV price snapshots for %d window(s): %s",
+            len(fetched),
+            exc,
+        )
+        return None
+    if isinstance(insert_result, int) and insert_result >= 0:
+        return int(insert_result)
+    return len(rows)
+
+
+def resolve_history_windows_bulk(
+    window_requests: Iterable[HistoryWindowRequest],
+    *,
+    clickhouse_client: Any,
+    clob_client: Any = None,
+    allow_online: bool = True,
+    lookup_batch_size: int = DEFAULT_CACHE_LOOKUP_BATCH_SIZE,
+    max_concurrent_fetches: int = DEFAULT_HISTORY_FETCH_CONCURRENCY,
+) -> Dict[HistoryWindowRequest, HistoryWindowResolution]:
+    """Resolve many price-history windows with batched cache reads and one bulk write.
+
+    Cache hits are read with one lookup query per ``lookup_batch_size``
+    distinct windows. Misses are fetched from CLOB /prices-history by at most
+    ``max_concurrent_fetches`` threads, and every fetched point is written
+    back in a single insert. The returned mapping can be passed as
+    ``prefetched`` to the per-position resolvers.
+    """
+    unique_requests = list(dict.fromkeys(window_requests))
+    if not unique_requests:
+        return {}
+
+    batch_size = max(int(lookup_batch_size), 1)
+    cached: Dict[HistoryWindowRequest, List[PricePoint]] = {}
+    for offset in range(0, len(unique_requests), batch_size):
+        cached.update(
+            _query_cached_points_bulk(
+                clickhouse_client,
+                unique_requests[offset : offset + batch_size],
+            )
+        )
+
+    resolutions: Dict[HistoryWindowRequest, HistoryWindowResolution] = {}
+    misses: List[HistoryWindowRequest] = []
+    for request in unique_requests:
+        points = cached.get(request)
+        if points:
+            resolutions[request] = HistoryWindowResolution(
+                points=points,
+                reason_if_missing=None,
+                from_cache=True,
+                network_call_made=False,
+            )
+        elif not allow_online:
+            resolutions[request] = HistoryWindowResolution(
+                points=[],
+                reason_if_missing=MISSING_REASON_OFFLINE,
+                network_call_made=False,
+            )
+        else:
+            misses.append(request)
+
+    if not misses:
+        return resolutions
+
+    def _fetch(request: HistoryWindowRequest) -> Tuple[List[PricePoint], Optional[str], Optional[str]]:
+        return _fetch_history_points(
+            token_id=request.token_id,
+            close_ts=request.anchor_ts,
+            clob_client=clob_client,
+            query_window_seconds=request.query_window_seconds,
+            fidelity_minutes=int(request.fidelity),
+        )
+
+    workers = max(1, min(int(max_concurrent_fetches), len(misses)))
+    if workers == 1 or clob_client is None:
+        fetch_results = [_fetch(request) for request in misses]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetch_results = list(executor.map(_fetch, misses))
+
+    fetched: List[Tuple[HistoryWindowRequest, List[PricePoint]]] = []
+    for request, (points, reason, error_detail) in zip(misses, fetch_results):
+        if reason is not None:
+            resolutions[request] = HistoryWindowResolution(
+                points=[],
+                reason_if_missing=reason,
+                error_detail=error_detail,
+                network_call_made=True,
+            )
+        else:
+            fetched.append((request, points))
+
+    # The backend may report fewer rows than sent (deduplicated writes); hand
+    # the reported count out to windows in request order.
+    remaining_written = _insert_snapshot_points_bulk(clickhouse_client, fetched) or 0
+    for request, points in fetched:
+        written = min(len(points), remaining_written)
+        remaining_written -= written
+        resolutions[request] = HistoryWindowResolution(
+            points=points,
+            reason_if_missing=None,
+            history_points_count=len(points),
+            cache_points_written=written,
+            from_cache=False,
+            network_call_made=True,
+        )
+    return resolutions
+
+
 def _compute_minutes_to_close(
     entry_ts: Optional[datetime],
     close_ts: Optional[datetime],
@@ -945,6 +1293,7 @@ def resolve_entry_price_context(
     source: str = PRICE_SNAPSHOT_SOURCE,
     interval: str = DEFAULT_PRICES_INTERVAL,
     fidelity: Any = DEFAULT_PRICES_FIDELITY,
+    prefetched: Optional[Dict[HistoryWindowRequest, HistoryWindowResolution]] = None,
 ) -> EntryContextResolution:
     minutes_to_close, minutes_to_close_missing_reason = _compute_minutes_to_close(entry_ts, close_ts)
     if entry_ts is None:
@@ -1000,6 +1349,7 @@ def resolve_entry_price_context(
         source=source,
         interval=interval,
         fidelity=fidelity,
+        prefetched=prefetched,
     )
     open_resolution = core_resolution
     if open_window != core_window:
@@ -1014,6 +1364,7 @@ def resolve_entry_price_context(
             source=source,
             interval=interval,
             fidelity=fidelity,
+            prefetched=prefetched,
         )
 
     open_choice = select_first_price_in_window(
@@ -1129,6 +1480,7 @@ def resolve_closing_price(
     source: str = PRICE_SNAPSHOT_SOURCE,
     interval: str = DEFAULT_PRICES_INTERVAL,
     fidelity: Any = DEFAULT_PRICES_FIDELITY,
+    prefetched: Optional[Dict[HistoryWindowRequest, HistoryWindowResolution]] = None,
 ) -> ClosingPriceResolution:
     """Resolve closing price from cache first, then optional live CLOB history."""
     if close_ts is None:
@@ -1154,6 +1506,7 @@ def resolve_closing_price(
         query_window_seconds=window_seconds,
         interval=interval,
         fidelity=fidelity,
+        prefetched=prefetched,
     )
     if not window_resolution.points:
         return ClosingPriceResolution(
@@ -1276,6 +1629,7 @@ def enrich_position_with_clv(
     closing_window_seconds: int = DEFAULT_CLOSING_WINDOW_SECONDS,
     interval: str = DEFAULT_PRICES_INTERVAL,
     fidelity: Any = DEFAULT_PRICES_FIDELITY,
+    prefetched: Optional[Dict[HistoryWindowRequest, HistoryWindowResolution]] = None,
 ) -> Dict[str, Any]:
     """Mutate one position with CLV fields and explicit missing reasons."""
     close_ts, close_ts_source, attempted_sources, close_ts_failure_reason = (
@@ -1303,6 +1657,7 @@ def enrich_position_with_clv(
         ),
         interval=interval,
         fidelity=fidelity,
+        prefetched=prefetched,
     )
     _apply_entry_context_fields(position, entry_context)
 
@@ -1328,6 +1683,7 @@ def enrich_position_with_clv(
         closing_window_seconds=closing_window_seconds,
         interval=interval,
         fidelity=fidelity,
+        prefetched=prefetched,
     )
     if resolved.closing_price is None:
         _set_missing_clv_fields(
@@ -1348,6 +1704,92 @@ def enrich_position_with_clv(
     return position
 
 
+def _clv_window_requests(
+    position: Dict[str, Any],
+    *,
+    closing_window_seconds: int,
+    interval: str,
+    fidelity: Any,
+    dual: bool,
+) -> List[HistoryWindowRequest]:
+    """List the history windows enrich_position_with_(dual_)clv will resolve."""
+    token_id = resolve_outcome_token_id(position)
+    if not token_id:
+        return []
+
+    def _request(anchor_ts: datetime, window_seconds: int, kind: str) -> HistoryWindowRequest:
+        return history_window_request(
+            token_id=token_id,
+            anchor_ts=anchor_ts,
+            query_window_seconds=window_seconds,
+            kind=kind,
+            interval=interval,
+            fidelity=fidelity,
+        )
+
+    window_requests: List[HistoryWindowRequest] = []
+    entry_ts = resolve_entry_ts(position)
+    if entry_ts is not None:
+        core_window = max(DEFAULT_ENTRY_CONTEXT_CORE_WINDOW_SECONDS, ONE_HOUR_SECONDS)
+        open_window = _normalize_entry_context_open_window(
+            max(int(closing_window_seconds), DEFAULT_ENTRY_CONTEXT_CORE_WINDOW_SECONDS)
+        )
+        window_requests.append(_request(entry_ts, core_window, PRICE_SNAPSHOT_KIND_ENTRY_CONTEXT))
+        if open_window != core_window:
+            window_requests.append(
+                _request(entry_ts, open_window, PRICE_SNAPSHOT_KIND_ENTRY_CONTEXT)
+            )
+
+    entry_price = _safe_float(position.get("entry_price"))
+    if entry_price is None or not (0.0 < entry_price <= 1.0):
+        return window_requests
+
+    close_anchors = [resolve_close_ts(position)[0]]
+    if dual:
+        close_anchors.append(resolve_close_ts_settlement(position)[0])
+        close_anchors.append(resolve_close_ts_pre_event(position)[0])
+    for close_ts in close_anchors:
+        if close_ts is not None:
+            window_requests.append(
+                _request(close_ts, closing_window_seconds, PRICE_SNAPSHOT_KIND_CLOSING)
+            )
+    return window_requests
+
+
+def _prefetch_clv_windows(
+    positions: List[Dict[str, Any]],
+    *,
+    clickhouse_client: Any,
+    clob_client: Any,
+    allow_online: bool,
+    closing_window_seconds: int,
+    interval: str,
+    fidelity: Any,
+    dual: bool,
+    lookup_batch_size: int,
+    max_concurrent_fetches: int,
+) -> Dict[HistoryWindowRequest, HistoryWindowResolution]:
+    window_requests: List[HistoryWindowRequest] = []
+    for position in positions:
+        window_requests.extend(
+            _clv_window_requests(
+                position,
+                closing_window_seconds=closing_window_seconds,
+                interval=interval,
+                fidelity=fidelity,
+                dual=dual,
+            )
+        )
+    return resolve_history_windows_bulk(
+        window_requests,
+        clickhouse_client=clickhouse_client,
+        clob_client=clob_client,
+        allow_online=allow_online,
+        lookup_batch_size=lookup_batch_size,
+        max_concurrent_fetches=max_concurrent_fetches,
+    )
+
+
 def enrich_positions_with_clv(
     positions: List[Dict[str, Any]],
     *,
@@ -1357,11 +1799,31 @@ def enrich_positions_with_clv(
     closing_window_seconds: int = DEFAULT_CLOSING_WINDOW_SECONDS,
     interval: str = DEFAULT_PRICES_INTERVAL,
     fidelity: Any = DEFAULT_PRICES_FIDELITY,
+    lookup_batch_size: int = DEFAULT_CACHE_LOOKUP_BATCH_SIZE,
+    max_concurrent_fetches: int = DEFAULT_HISTORY_FETCH_CONCURRENCY,
 ) -> Dict[str, Any]:
-    """Enrich a list of positions with CLV fields and return a summary."""
+    """Enrich a list of positions with CLV fields and return a summary.
+
+    Every price-history window the positions need is resolved up front by
+    resolve_history_windows_bulk, so the cache is read in a few queries and
+    fetched points are written in one insert.
+    """
     missing_reason_counts: Dict[str, int] = {}
     clv_present_count = 0
 
+    prefetched = _prefetch_clv_windows(
+        positions,
+        clickhouse_client=clickhouse_client,
+        clob_client=clob_client,
+        allow_online=allow_online,
+        closing_window_seconds=closing_window_seconds,
+        interval=interval,
+        fidelity=fidelity,
+        dual=False,
+        lookup_batch_size=lookup_batch_size,
+        max_concurrent_fetches=max_concurrent_fetches,
+    )
+
     for position in positions:
         enrich_position_with_clv(
             position,
@@ -1371,6 +1833,7 @@ def enrich_positions_with_clv(
             closing_window_seconds=closing_window_seconds,
             interval=interval,
             fidelity=fidelity,
+            prefetched=prefetched,
         )
         if _safe_float(position.get("clv")) is None:
             reason = str(position.get("clv_missing_reason") or "UNSPECIFIED")
@@ -1414,6 +1877,7 @@ def _apply_clv_variant(
     closing_window_seconds: int = DEFAULT_CLOSING_WINDOW_SECONDS,
     interval: str = DEFAULT_PRICES_INTERVAL,
     fidelity: Any = DEFAULT_PRICES_FIDELITY,
+    prefetched: Optional[Dict[HistoryWindowRequest, HistoryWindowResolution]] = None,
 ) -> None:
     """Resolve closing price for a specific variant and write the 6 per-variant fields."""
     if close_ts is None:
@@ -1434,6 +1898,7 @@ def _apply_clv_variant(
         closing_window_seconds=closing_window_seconds,
         interval=interval,
         fidelity=fidelity,
+        prefetched=prefetched,
     )
 
     if resolved.closing_price is None:
@@ -1463,6 +1928,7 @@ def enrich_position_with_dual_clv(
     closing_window_seconds: int = DEFAULT_CLOSING_WINDOW_SECONDS,
     interval: str = DEFAULT_PRICES_INTERVAL,
     fidelity: Any = DEFAULT_PRICES_FIDELITY,
+    prefetched: Optional[Dict[HistoryWindowRequest, HistoryWindowResolution]] = None,
 ) -> Dict[str, Any]:
     """Mutate one position with dual CLV variant fields (settlement + pre_event).
 
@@ -1478,6 +1944,7 @@ def enrich_position_with_dual_clv(
         closing_window_seconds=closing_window_seconds,
         interval=interval,
         fidelity=fidelity,
+        prefetched=prefetched,
     )
 
     token_id = resolve_outcome_token_id(position)
@@ -1526,6 +1993,7 @@ def enrich_position_with_dual_clv(
         closing_window_seconds=closing_window_seconds,
         interval=interval,
         fidelity=fidelity,
+        prefetched=prefetched,
     )
 
     # Pre-event variant: anchor = closedTime/endDate/umaEndDate ladder
@@ -1543,6 +2011,7 @@ def enrich_position_with_dual_clv(
         closing_window_seconds=closing_window_seconds,
         interval=interval,
         fidelity=fidelity,
+        prefetched=prefetched,
     )
 
     return position
@@ -1557,13 +2026,31 @@ def enrich_positions_with_dual_clv(
     closing_window_seconds: int = DEFAULT_CLOSING_WINDOW_SECONDS,
     interval: str = DEFAULT_PRICES_INTERVAL,
     fidelity: Any = DEFAULT_PRICES_FIDELITY,
+    lookup_batch_size: int = DEFAULT_CACHE_LOOKUP_BATCH_SIZE,
+    max_concurrent_fetches: int = DEFAULT_HISTORY_FETCH_CONCURRENCY,
 ) -> Dict[str, Any]:
-    """Enrich a list of positions with dual CLV variant fields and return a summary."""
+    """Enrich a list of positions with dual CLV variant fields and return a summary.
+
+    Windows are prefetched in bulk exactly as in enrich_positions_with_clv.
+    """
     missing_reason_counts: Dict[str, int] = {}
     clv_present_count = 0
     settlement_present_count = 0
     pre_event_present_count = 0
 
+    prefetched = _prefetch_clv_windows(
+        positions,
+        clickhouse_client=clickhouse_client,
+        clob_client=clob_client,
+        allow_online=allow_online,
+        closing_window_seconds=closing_window_seconds,
+        interval=interval,
+        fidelity=fidelity,
+        dual=True,
+        lookup_batch_size=lookup_batch_size,
+        max_concurrent_fetches=max_concurrent_fetches,
+    )
+
     for position in positions:
         enrich_position_with_dual_clv(
             position,
@@ -1573,6 +2060,7 @@ def enrich_positions_with_dual_clv(
             closing_window_seconds=closing_window_seconds,
             interval=interval,
             fidelity=fidelity,
+            prefetched=prefetched,
         )
         # Track base CLV
         if _safe_float(position.get("clv")) is None:
@@ -1608,6 +2096,8 @@ def warm_clv_snapshot_cache(
     closing_window_seconds: int = DEFAULT_CLOSING_WINDOW_SECONDS,
     interval: str = DEFAULT_PRICES_INTERVAL,
     fidelity: Any = DEFAULT_PRICES_FIDELITY,
+    lookup_batch_size: int = DEFAULT_CACHE_LOOKUP_BATCH_SIZE,
+    max_concurrent_fetches: int = DEFAULT_HISTORY_FETCH_CONCURRENCY,
 ) -> Dict[str, Any]:
     """Warm CLV price-snapshot cache without mutating position CLV outputs."""
     attempted = 0
@@ -1628,28 +2118,41 @@ def warm_clv_snapshot_cache(
             return "UNKNOWN_ERROR"
         return MISSING_REASON_HTTP_ERROR
 
+    window_seconds = max(int(closing_window_seconds), 0)
+    eligible: List[Tuple[str, HistoryWindowRequest]] = []
     for position in positions:
         close_ts, _ = resolve_close_ts(position)
         token_id = resolve_outcome_token_id(position)
         if close_ts is None or not token_id:
             skipped_not_eligible += 1
             continue
+        eligible.append(
+            (
+                token_id,
+                history_window_request(
+                    token_id=token_id,
+                    anchor_ts=close_ts,
+                    query_window_seconds=window_seconds,
+                    kind=PRICE_SNAPSHOT_KIND_CLOSING,
+                    interval=interval,
+                    fidelity=fidelity,
+                ),
+            )
+        )
 
+    prefetched = resolve_history_windows_bulk(
+        [request for _, request in eligible],
+        clickhouse_client=clickhouse_client,
+        clob_client=clob_client,
+        allow_online=allow_online,
+        lookup_batch_size=lookup_batch_size,
+        max_concurrent_fetches=max_concurrent_fetches,
+    )
+
+    for token_id, request in eligible:
         attempted += 1
-        close_ts_utc = _ensure_utc(close_ts)
-        window_seconds = max(int(closing_window_seconds), 0)
-        resolution = _resolve_history_window_points(
-            token_id=token_id,
-            anchor_ts=close_ts_utc,
-            clickhouse_client=clickhouse_client,
-            clob_client=clob_client,
-            allow_online=allow_online,
-            query_window_seconds=window_seconds,
-            kind=PRICE_SNAPSHOT_KIND_CLOSING,
-            source=PRICE_SNAPSHOT_SOURCE,
-            interval=interval,
-            fidelity=fidelity,
-        )
+        resolution = prefetched[request]
+        _mark_prefetched_window_used(prefetched, request, resolution)
         if resolution.from_cache and resolution.points:
             cache_hit_count += 1
         if resolution.network_call_made:
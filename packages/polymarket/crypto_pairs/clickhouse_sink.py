@@ -5,6 +5,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Optional, Protocol, Sequence
 
+from ..clickhouse_buffer import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_FLUSH_INTERVAL_SECONDS,
+    DEFAULT_MAX_QUEUE_ROWS,
+    BufferedClickHouseWriter,
+)
 from .event_models import (
     CLICKHOUSE_EVENT_COLUMNS,
     CRYPTO_PAIR_EVENT_SCHEMA_VERSION,
@@ -33,6 +39,13 @@ class CryptoPairClickHouseSinkConfig:
     clickhouse_user: str = "polytool_admin"
     clickhouse_password: str = ""
     soft_fail: bool = True
+    # Buffered mode: write_event only queues; a background thread batches inserts.
+    buffered: bool = False
+    batch_size: int = DEFAULT_BATCH_SIZE
+    flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_SECONDS
+    max_queue_events: int = DEFAULT_MAX_QUEUE_ROWS
+    spill_dir: Optional[str] = None
+    flush_timeout_s: float = 30.0
 
 
 @dataclass(frozen=True)
@@ -156,6 +169,7 @@ class CryptoPairClickHouseSink:
         self._client = client
         self._consecutive_fail_count: int = 0
         self._max_consecutive_failures: int = max_consecutive_failures
+        self._buffer: Optional[BufferedClickHouseWriter] = None
 
     def contract(self) -> ClickHouseSinkContract:
         return ClickHouseSinkContract.from_config(self.config)
@@ -165,6 +179,8 @@ class CryptoPairClickHouseSink:
         events: Sequence[CryptoPairTrack2Event],
     ) -> ClickHouseWriteResult:
         event_list = list(events)
+        if self.config.enabled and self.config.buffered:
+            return self._write_buffered(event_list, wait=True)
         if not self.config.enabled:
             return ClickHouseWriteResult(
                 enabled=False,
@@ -209,6 +225,8 @@ class CryptoPairClickHouseSink:
         )
 
     def write_event(self, event: CryptoPairTrack2Event) -> ClickHouseWriteResult:
+        if self.config.enabled and self.config.buffered:
+            return self._write_buffered([event], wait=False)
         if self._consecutive_fail_count >= self._max_consecutive_failures:
             return ClickHouseWriteResult(
                 enabled=True,
@@ -224,6 +242,103 @@ class CryptoPairClickHouseSink:
             self._consecutive_fail_count = 0
         return result
 
+    def buffer_metrics(self) -> dict[str, Any]:
+        """Queue depth and flush-latency metrics of the buffered writer (empty if unused)."""
+        return self._buffer.metrics() if self._buffer is not None else {}
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Flush and stop the buffered writer, if one was started."""
+        if self._buffer is None:
+            return True
+        return self._buffer.close(self.config.flush_timeout_s if timeout is None else timeout)
+
+    def _get_buffer(self) -> BufferedClickHouseWriter:
+        if self._buffer is None:
+            self._buffer = BufferedClickHouseWriter(
+                self._get_client(),
+                batch_size=self.config.batch_size,
+                flush_interval_s=self.config.flush_interval_s,
+                max_queue_rows=self.config.max_queue_events,
+                spill_dir=self.config.spill_dir,
+                name="crypto_pair_sink",
+            )
+        return self._buffer
+
+    def _write_buffered(
+        self,
+        event_list: list[CryptoPairTrack2Event],
+        *,
+        wait: bool,
+    ) -> ClickHouseWriteResult:
+        """Queue events on the background writer; ``wait`` also flushes the queue.
+
+        A flushing call counts towards ``max_consecutive_failures`` like
+        ``write_event`` does unbuffered: once the limit is reached, events are
+        still queued for the background writer but the call no longer waits
+        for a flush.  With ``soft_fail=False`` a failed flush or dropped events
+        raise ``RuntimeError`` instead of returning an error result.
+        """
+        if not event_list:
+            return ClickHouseWriteResult(
+                enabled=True,
+                table_name=self.config.table_name,
+                attempted_events=0,
+                written_rows=0,
+            )
+
+        buffer = self._get_buffer()
+        rows = project_clickhouse_rows(event_list)
+        accepted = buffer.submit(self.config.table_name, list(CLICKHOUSE_EVENT_COLUMNS), rows)
+        dropped = len(rows) - accepted
+        error = f"buffer full: dropped {dropped} events" if dropped else ""
+        if error and wait and not self.config.soft_fail:
+            raise RuntimeError(error)
+
+        if wait and self._consecutive_fail_count >= self._max_consecutive_failures:
+            return ClickHouseWriteResult(
+                enabled=True,
+                table_name=self.config.table_name,
+                attempted_events=len(event_list),
+                written_rows=0,
+                skipped_reason="consecutive_fail_limit",
+                error=error,
+            )
+
+        if not wait:
+            return ClickHouseWriteResult(
+                enabled=True,
+                table_name=self.config.table_name,
+                attempted_events=len(event_list),
+                written_rows=0,
+                skipped_reason="queued" if not dropped else "buffer_full",
+                error=error,
+            )
+
+        if buffer.flush(self.config.flush_timeout_s):
+            self._consecutive_fail_count = 0
+            return ClickHouseWriteResult(
+                enabled=True,
+                table_name=self.config.table_name,
+                attempted_events=len(event_list),
+                written_rows=accepted,
+                error=error,
+            )
+        self._consecutive_fail_count += 1
+        metrics = buffer.metrics()
+        if not self.config.soft_fail:
+            raise RuntimeError(
+                f"ClickHouse flush failed: {metrics['last_error'] or 'flush timed out'}"
+            )
+        spilled = self.config.spill_dir is not None and metrics["rows_spilled"] > 0
+        return ClickHouseWriteResult(
+            enabled=True,
+            table_name=self.config.table_name,
+            attempted_events=len(event_list),
+            written_rows=0,
+            skipped_reason="spilled_to_journal" if spilled else "write_failed",
+            error=error or ("" if spilled else metrics["last_error"] or "flush timed out"),
+        )
+
     def _get_client(self) -> CHInsertClient:
         if self._client is None:
             from packages.polymarket.historical_import.importer import ClickHouseClient
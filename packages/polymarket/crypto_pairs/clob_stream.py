@@ -7,7 +7,12 @@ Follows the TapeRecorder WebSocket pattern (raw websocket.WebSocket(), not
 WebSocketApp) and the BinanceFeed daemon-thread pattern from reference_feed.py.
 
 Key design choices:
-- All mutable state protected by a single threading.Lock.
+- Each token has its own book (sorted price index per side) guarded by a
+  per-token lock that only writers take. After every update the writer
+  publishes an immutable top-of-book tuple with a single attribute swap, so
+  readers (get_best_bid_ask / is_ready / get_book_age_ms) never lock.
+- The subscribed set is copy-on-write (frozenset swapped under self._lock).
+- Decoded events are applied directly; raw WS strings are parsed once.
 - _event_source injection enables fully offline unit testing (same pattern as
   ShadowRunner).
 - _time_fn injection enables staleness tests without real-time waits.
@@ -20,7 +25,8 @@ import json
 import logging
 import threading
 import time
-from typing import Any, Callable, Iterable, Iterator, Optional
+from bisect import bisect_left, insort
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional
 
 _log = logging.getLogger(__name__)
 
@@ -29,19 +35,70 @@ DEFAULT_STALE_THRESHOLD_S = 5.0
 DEFAULT_RECV_TIMEOUT_S = 5.0
 DEFAULT_RECONNECT_SLEEP_S = 1.0
 
-_BIDS_KEY = "bids"
-_ASKS_KEY = "asks"
 _SIDE_BUY = "BUY"    # maps to bids
 _SIDE_SELL = "SELL"  # maps to asks
 
 _SENTINEL_AGE_MS = 999999  # returned when no snapshot has been received
 
 
+class _TopOfBook(NamedTuple):
+    """Immutable top-of-book published to readers after each update."""
+
+    best_bid: Optional[float]
+    best_ask: Optional[float]
+    updated_at: float
+
+
+class _BookSide:
+    """One side of a token book: price -> size plus an ascending price index."""
+
+    __slots__ = ("levels", "prices", "descending")
+
+    def __init__(self, descending: bool) -> None:
+        self.levels: dict[float, float] = {}
+        self.prices: list[float] = []
+        self.descending = descending
+
+    def replace(self, levels: dict[float, float]) -> None:
+        self.levels = levels
+        self.prices = sorted(levels)
+
+    def set(self, price: float, size: float) -> None:
+        if size == 0.0:
+            if self.levels.pop(price, None) is not None:
+                del self.prices[bisect_left(self.prices, price)]
+            return
+        if price not in self.levels:
+            insort(self.prices, price)
+        self.levels[price] = size
+
+    def best(self) -> Optional[float]:
+        if not self.prices:
+            return None
+        return self.prices[-1] if self.descending else self.prices[0]
+
+
+class _TokenBook:
+    """Order book for one token. Writers hold ``lock``; readers use ``top``."""
+
+    __slots__ = ("lock", "bids", "asks", "top")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.bids = _BookSide(descending=True)
+        self.asks = _BookSide(descending=False)
+        self.top: Optional[_TopOfBook] = None
+
+    def publish(self, now: float) -> None:
+        self.top = _TopOfBook(self.bids.best(), self.asks.best(), now)
+
+
 class ClobStreamClient:
     """Persistent WebSocket CLOB market feed.
 
     Maintains an in-memory sorted order book per subscribed token.
-    Thread-safe: all state is protected by self._lock.
+    Thread-safe: book writes take a per-token lock, reads use the published
+    top-of-book snapshot, and self._lock guards subscriptions and lifecycle.
 
     Usage (production):
         stream = ClobStreamClient()
@@ -77,12 +134,10 @@ class ClobStreamClient:
         self._event_source = _event_source
 
         self._lock = threading.Lock()
-        # Per-token books: token_id -> side_key -> {price_float: size_float}
-        self._books: dict[str, dict[str, dict[float, float]]] = {}
-        # Per-token last-update timestamps
-        self._timestamps: dict[str, float] = {}
-        # Subscribed token IDs
-        self._subscribed: set[str] = set()
+        # Per-token books; each carries its own writer lock and top-of-book
+        self._books: dict[str, _TokenBook] = {}
+        # Subscribed token IDs (replaced, never mutated, under self._lock)
+        self._subscribed: frozenset[str] = frozenset()
         # Controls reconnect loop exit
         self._stopped: bool = False
         # Background thread handle
@@ -100,14 +155,13 @@ class ClobStreamClient:
         on the next reconnect.
         """
         with self._lock:
-            self._subscribed.add(token_id)
+            self._subscribed = self._subscribed | {token_id}
 
     def unsubscribe(self, token_id: str) -> None:
         """Remove a token from the subscribed set and clear its book state."""
         with self._lock:
-            self._subscribed.discard(token_id)
+            self._subscribed = self._subscribed - {token_id}
             self._books.pop(token_id, None)
-            self._timestamps.pop(token_id, None)
 
     def get_best_bid_ask(self, token_id: str) -> Optional[tuple[float, float]]:
         """Return (best_bid, best_ask) from the in-memory book.
@@ -118,55 +172,27 @@ class ClobStreamClient:
         - book age exceeds stale_threshold_s
         - either side of the book is empty
         """
-        with self._lock:
-            if token_id not in self._subscribed:
-                return None
-            book = self._books.get(token_id)
-            if book is None:
-                return None
-            ts = self._timestamps.get(token_id)
-            if ts is None:
-                return None
-            age = self._time_fn() - ts
-            if age > self._stale_threshold_s:
-                return None
-            bids = book.get(_BIDS_KEY, {})
-            asks = book.get(_ASKS_KEY, {})
-            if not bids or not asks:
-                return None
-            best_bid = max(bids.keys())
-            best_ask = min(asks.keys())
-            return (best_bid, best_ask)
+        top = self._fresh_top(token_id)
+        if top is None or top.best_bid is None or top.best_ask is None:
+            return None
+        return (top.best_bid, top.best_ask)
 
     def get_book_age_ms(self, token_id: str) -> int:
         """Return milliseconds since the last book update for token_id.
 
         Returns 999999 if no snapshot has been received.
         """
-        with self._lock:
-            ts = self._timestamps.get(token_id)
-            if ts is None:
-                return _SENTINEL_AGE_MS
-            age_s = self._time_fn() - ts
-            return int(age_s * 1000)
+        book = self._books.get(token_id)
+        top = book.top if book is not None else None
+        if top is None:
+            return _SENTINEL_AGE_MS
+        age_s = self._time_fn() - top.updated_at
+        return int(age_s * 1000)
 
     def is_ready(self, token_id: str) -> bool:
         """Return True when subscribed, has a snapshot, and age <= stale_threshold_s."""
-        with self._lock:
-            if token_id not in self._subscribed:
-                return False
-            book = self._books.get(token_id)
-            if book is None:
-                return False
-            ts = self._timestamps.get(token_id)
-            if ts is None:
-                return False
-            age = self._time_fn() - ts
-            if age > self._stale_threshold_s:
-                return False
-            bids = book.get(_BIDS_KEY, {})
-            asks = book.get(_ASKS_KEY, {})
-            return bool(bids) and bool(asks)
+        top = self._fresh_top(token_id)
+        return top is not None and top.best_bid is not None and top.best_ask is not None
 
     def start(self) -> None:
         """Start the background WS thread (idempotent).
@@ -193,6 +219,18 @@ class ClobStreamClient:
         with self._lock:
             self._stopped = True
 
+    def _fresh_top(self, token_id: str) -> Optional[_TopOfBook]:
+        """Return the published top-of-book if subscribed and not stale."""
+        if token_id not in self._subscribed:
+            return None
+        book = self._books.get(token_id)
+        top = book.top if book is not None else None
+        if top is None:
+            return None
+        if self._time_fn() - top.updated_at > self._stale_threshold_s:
+            return None
+        return top
+
     # ------------------------------------------------------------------
     # Internal: event-source loop (test mode)
     # ------------------------------------------------------------------
@@ -206,7 +244,7 @@ class ClobStreamClient:
                 if stopped:
                     break
                 if isinstance(event, dict):
-                    self._apply_message(json.dumps(event))
+                    self._apply_event(event)
                 else:
                     self._apply_message(str(event))
         except Exception as exc:
@@ -280,7 +318,15 @@ class ClobStreamClient:
         except (json.JSONDecodeError, ValueError) as exc:
             _log.debug("ClobStreamClient: failed to parse message: %s", exc)
             return
-
+        if isinstance(data, list):
+            for item in data:
+                if isinstance(item, dict):
+                    self._apply_event(item)
+        elif isinstance(data, dict):
+            self._apply_event(data)
+
+    def _apply_event(self, data: dict) -> None:
+        """Apply an already-decoded WS message to internal book state."""
         # Handle both single-event and batched price_changes[] format
         events = data.get("price_changes") or [data]
         for event in events:
@@ -310,18 +356,22 @@ class ClobStreamClient:
             if price is not None and size is not None and size > 0:
                 asks[price] = size
 
-        with self._lock:
-            self._books[token_id] = {_BIDS_KEY: bids, _ASKS_KEY: asks}
-            self._timestamps[token_id] = self._time_fn()
+        book = self._books.get(token_id)
+        if book is None:
+            book = self._books.setdefault(token_id, _TokenBook())
+        with book.lock:
+            book.bids.replace(bids)
+            book.asks.replace(asks)
+            book.publish(self._time_fn())
 
     def _apply_delta(self, token_id: str, event: dict) -> None:
         """Apply a price_change delta to the existing book for token_id."""
-        with self._lock:
-            if token_id not in self._books:
-                # No snapshot yet; ignore delta (will be corrected by next snapshot)
-                return
-            book = self._books[token_id]
+        book = self._books.get(token_id)
+        if book is None:
+            # No snapshot yet; ignore delta (will be corrected by next snapshot)
+            return
 
+        with book.lock:
             for change in event.get("changes") or []:
                 side_raw = change.get("side", "")
                 price_str = change.get("price")
@@ -334,19 +384,15 @@ class ClobStreamClient:
                     continue
 
                 if side_raw == _SIDE_BUY:
-                    side_key = _BIDS_KEY
+                    side = book.bids
                 elif side_raw == _SIDE_SELL:
-                    side_key = _ASKS_KEY
+                    side = book.asks
                 else:
                     continue
 
-                side_book = book.setdefault(side_key, {})
-                if size == 0.0:
-                    side_book.pop(price, None)
-                else:
-                    side_book[price] = size
+                side.set(price, size)
 
-            self._timestamps[token_id] = self._time_fn()
+            book.publish(self._time_fn())
 
 
 # ------------------------------------------------------------------
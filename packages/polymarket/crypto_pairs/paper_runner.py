@@ -949,6 +949,11 @@ class CryptoPairPaperRunner:
             skipped_reason=write_result.skipped_reason,
             error=write_result.error,
         )
+        buffer_metrics = getattr(self.sink, "buffer_metrics", None)
+        if callable(buffer_metrics):
+            sink_buffer_metrics = buffer_metrics()
+            if sink_buffer_metrics:
+                self.store.record_runtime_event("sink_buffer_metrics", **sink_buffer_metrics)
 
         manifest = self.store.finalize(
             stopped_reason=stopped_reason,
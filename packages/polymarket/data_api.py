@@ -3,7 +3,7 @@
 import hashlib
 import json
 import logging
-from typing import Iterator, Optional
+from typing import Any, Iterator, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 # Default Data API base URL
 DEFAULT_DATA_API_BASE = "https://data-api.polymarket.com"
 
+# Pages the paginated fetchers request at once over pooled connections.
+DEFAULT_PAGE_WINDOW = 4
+
 
 @dataclass
 class Trade:
@@ -325,6 +328,7 @@ class DataApiClient:
         self,
         base_url: str = DEFAULT_DATA_API_BASE,
         timeout: float = 20.0,
+        page_window: int = DEFAULT_PAGE_WINDOW,
     ):
         """
         Initialize Data API client.
@@ -332,8 +336,68 @@ class DataApiClient:
         Args:
             base_url: Data API base URL
             timeout: Request timeout in seconds
+            page_window: Pages requested concurrently by the paginated fetchers
         """
         self.client = HttpClient(base_url=base_url, timeout=timeout)
+        self.page_window = max(int(page_window), 1)
+
+    @staticmethod
+    def _page_rows(response: Any, key: str) -> list[dict]:
+        """Unwrap a page response: a bare list, or ``{"data"|key: [...]}``."""
+        if isinstance(response, list):
+            return response
+        elif isinstance(response, dict):
+            return response.get("data", response.get(key, []))
+        else:
+            logger.warning(f"Unexpected response type: {type(response)}")
+            return []
+
+    def _iter_pages(
+        self,
+        path: str,
+        key: str,
+        proxy_wallet: str,
+        max_pages: int,
+        page_size: int,
+    ) -> Iterator[tuple[int, int, list[dict]]]:
+        """
+        Yield ``(page_index, offset, rows)`` for each page of ``path`` in order.
+
+        Pages are requested ``page_window`` at a time over the client's pooled
+        async connections (``HttpClient.get_json_many``). Iteration stops after
+        the first empty or short page, or at the first failed request, so at
+        most ``page_window - 1`` requests are spent past the end of the data.
+        """
+        for window_start in range(0, max_pages, self.page_window):
+            pages = range(window_start, min(window_start + self.page_window, max_pages))
+            logger.info(
+                f"Fetching {key} pages {pages[0] + 1}-{pages[-1] + 1}/{max_pages} "
+                f"(offset={pages[0] * page_size}, wallet={proxy_wallet[:10]}...)"
+            )
+            responses = self.client.get_json_many(
+                [
+                    (
+                        path,
+                        {
+                            "user": proxy_wallet,
+                            "limit": min(page_size, 1000),
+                            "offset": page * page_size,
+                        },
+                    )
+                    for page in pages
+                ],
+                max_concurrency=self.page_window,
+                return_exceptions=True,
+            )
+            for page, response in zip(pages, responses):
+                offset = page * page_size
+                if isinstance(response, Exception):
+                    logger.error(f"Failed to fetch {key} page {page + 1} (offset={offset}): {response}")
+                    return
+                rows = self._page_rows(response, key)
+                yield page, offset, rows
+                if len(rows) < page_size:
+                    return
 
     def fetch_trades_page(
         self,
@@ -367,15 +431,8 @@ class DataApiClient:
             logger.error(f"Error fetching trades page (offset={offset}): {e}")
             raise
 
-        # Response is typically a list of trades
-        if isinstance(response, list):
-            return response
-        elif isinstance(response, dict):
-            # Some APIs wrap in { "data": [...] } or { "trades": [...] }
-            return response.get("data", response.get("trades", []))
-        else:
-            logger.warning(f"Unexpected response type: {type(response)}")
-            return []
+        # Some APIs wrap the list in { "data": [...] } or { "trades": [...] }
+        return self._page_rows(response, "trades")
 
     def fetch_activity_page(
         self,
@@ -409,13 +466,7 @@ class DataApiClient:
             logger.error(f"Error fetching activity page (offset={offset}): {e}")
             raise
 
-        if isinstance(response, list):
-            return response
-        elif isinstance(response, dict):
-            return response.get("data", response.get("activity", []))
-        else:
-            logger.warning(f"Unexpected response type: {type(response)}")
-            return []
+        return self._page_rows(response, "activity")
 
     def fetch_all_activity(
         self,
@@ -435,24 +486,10 @@ class DataApiClient:
             ActivityFetchResult with all fetched activity
         """
         result = ActivityFetchResult()
-        offset = 0
-
-        for page in range(max_pages):
-            logger.info(
-                f"Fetching activity page {page + 1}/{max_pages} "
-                f"(offset={offset}, wallet={proxy_wallet[:10]}...)"
-            )
-
-            try:
-                raw_activity = self.fetch_activity_page(
-                    proxy_wallet=proxy_wallet,
-                    limit=page_size,
-                    offset=offset,
-                )
-            except Exception as e:
-                logger.error(f"Failed to fetch activity page {page + 1}: {e}")
-                break
 
+        for _, offset, raw_activity in self._iter_pages(
+            "/activity", "activity", proxy_wallet, max_pages, page_size
+        ):
             result.pages_fetched += 1
 
             if not raw_activity:
@@ -475,8 +512,6 @@ class DataApiClient:
                 )
                 break
 
-            offset += page_size
-
         logger.info(
             f"Activity fetch complete: {result.pages_fetched} pages, "
             f"{result.total_rows} rows"
@@ -508,13 +543,7 @@ class DataApiClient:
             logger.error(f"Error fetching positions: {e}")
             return result
 
-        if isinstance(response, list):
-            raw_positions = response
-        elif isinstance(response, dict):
-            raw_positions = response.get("data", response.get("positions", []))
-        else:
-            logger.warning(f"Unexpected response type: {type(response)}")
-            raw_positions = []
+        raw_positions = self._page_rows(response, "positions")
 
         for raw in raw_positions:
             try:
@@ -546,24 +575,10 @@ class DataApiClient:
             TradesFetchResult with all fetched trades
         """
         result = TradesFetchResult()
-        offset = 0
-
-        for page in range(max_pages):
-            logger.info(
-                f"Fetching page {page + 1}/{max_pages} "
-                f"(offset={offset}, wallet={proxy_wallet[:10]}...)"
-            )
-
-            try:
-                raw_trades = self.fetch_trades_page(
-                    proxy_wallet=proxy_wallet,
-                    limit=page_size,
-                    offset=offset,
-                )
-            except Exception as e:
-                logger.error(f"Failed to fetch page {page + 1}: {e}")
-                break
 
+        for _, offset, raw_trades in self._iter_pages(
+            "/trades", "trades", proxy_wallet, max_pages, page_size
+        ):
             result.pages_fetched += 1
 
             if not raw_trades:
@@ -588,8 +603,6 @@ class DataApiClient:
                 )
                 break
 
-            offset += page_size
-
         logger.info(
             f"Fetch complete: {result.pages_fetched} pages, "
             f"{result.total_rows} trades"
@@ -614,28 +627,11 @@ class DataApiClient:
         Yields:
             Trade objects one at a time
         """
-        offset = 0
-
-        for page in range(max_pages):
-            try:
-                raw_trades = self.fetch_trades_page(
-                    proxy_wallet=proxy_wallet,
-                    limit=page_size,
-                    offset=offset,
-                )
-            except Exception:
-                break
-
-            if not raw_trades:
-                break
-
+        for _, _, raw_trades in self._iter_pages(
+            "/trades", "trades", proxy_wallet, max_pages, page_size
+        ):
             for raw_trade in raw_trades:
                 try:
                     yield Trade.from_api_response(raw_trade, proxy_wallet)
                 except Exception:
                     continue
-
-            if len(raw_trades) < page_size:
-                break
-
-            offset += page_size
@@ -17,8 +17,9 @@ import urllib.error
 import urllib.parse
 import urllib.request
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
+from packages.polymarket.clickhouse_buffer import BufferedClickHouseWriter
 from packages.polymarket.discovery.models import (
     LeaderboardSnapshotRow,
     ScanQueueRow,
@@ -98,6 +99,70 @@ def _get_query(
         return None
 
 
+class ClickHouseHttpInsertClient:
+    """``insert_rows`` adapter over the JSONEachRow HTTP path.
+
+    Lets ``BufferedClickHouseWriter`` batch discovery writes. ``None`` values are
+    omitted so optional columns keep their table defaults, matching the
+    ``write_*_rows`` functions below. Raises RuntimeError when the POST fails.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "localhost",
+        port: int = 8123,
+        user: str = "polytool_admin",
+        password: str,
+    ) -> None:
+        _require_password(password)
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+
+    def insert_rows(self, table: str, column_names: list[str], rows: list[list[Any]]) -> int:
+        if not rows:
+            return 0
+        lines = []
+        for row in rows:
+            d = {}
+            for column, value in zip(column_names, row):
+                if value is None:
+                    continue
+                if isinstance(value, datetime):
+                    value = _dt_to_ch(value)
+                elif hasattr(value, "value"):
+                    value = value.value
+                d[column] = value
+            lines.append(json.dumps(d))
+        ok = _post_jsonl(
+            "\n".join(lines),
+            table=table,
+            host=self.host,
+            port=self.port,
+            user=self.user,
+            password=self.password,
+        )
+        if not ok:
+            raise RuntimeError(f"ClickHouse insert into polytool.{table} failed")
+        return len(rows)
+
+
+def build_buffered_writer(
+    *,
+    host: str = "localhost",
+    port: int = 8123,
+    user: str = "polytool_admin",
+    password: str,
+    **writer_kwargs: Any,
+) -> BufferedClickHouseWriter:
+    """Background batching writer for discovery tables (see BufferedClickHouseWriter)."""
+    client = ClickHouseHttpInsertClient(host=host, port=port, user=user, password=password)
+    writer_kwargs.setdefault("name", "discovery")
+    return BufferedClickHouseWriter(client, **writer_kwargs)
+
+
 # ---------------------------------------------------------------------------
 # Write functions
 # ---------------------------------------------------------------------------
@@ -13,12 +13,43 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional
 
+import requests
+
 from packages.polymarket.discovery.models import LeaderboardSnapshotRow
 
 logger = logging.getLogger(__name__)
 
 _LEADERBOARD_BASE_URL = "https://data-api.polymarket.com"
 _LEADERBOARD_PATH = "/v1/leaderboard"
+# Pages requested concurrently per get_json_many round.
+_PAGE_WINDOW = 5
+
+
+def _extend_pages(
+    all_entries: list[dict],
+    pages: range,
+    page_size: int,
+    results: list,
+) -> bool:
+    """Append one window of page results in order; False once pagination should stop."""
+    for page_num, page_data in zip(pages, results):
+        if isinstance(page_data, requests.HTTPError):
+            logger.warning(
+                "Leaderboard API returned status %d on page %d — stopping.",
+                page_data.response.status_code,
+                page_num + 1,
+            )
+            return False
+        if isinstance(page_data, Exception):
+            logger.error("Leaderboard fetch error on page %d: %s", page_num + 1, page_data)
+            return False
+        if not page_data:
+            logger.debug("Empty page at offset %d — stopping pagination.", page_num * page_size)
+            return False
+
+        all_entries.extend(page_data)
+        logger.debug("Fetched page %d: %d entries (total so far: %d)", page_num + 1, len(page_data), len(all_entries))
+    return True
 
 
 def fetch_leaderboard(
@@ -38,12 +69,14 @@ def fetch_leaderboard(
         max_pages: Maximum pages to fetch (DoS guard, T-qeu-04)
         page_size: Entries per page (default 50 matching API default)
         http_client: Optional injectable HttpClient for testing. If None,
-            creates a real HttpClient against the data API.
+            creates (and closes) a real HttpClient against the data API.
+            Pages are requested a window at a time via ``get_json_many``.
 
     Returns:
         List of raw dict entries from the API, ordered by rank (ascending).
     """
-    if http_client is None:
+    owns_client = http_client is None
+    if owns_client:
         from packages.polymarket.http_client import HttpClient
         http_client = HttpClient(
             base_url=_LEADERBOARD_BASE_URL,
@@ -54,38 +87,29 @@ def fetch_leaderboard(
 
     all_entries: list[dict] = []
 
-    for page_num in range(max_pages):
-        offset = page_num * page_size
-        params = {
-            "order_by": order_by,
-            "time_period": time_period,
-            "limit": page_size,
-            "offset": offset,
-        }
-        if category and category.upper() != "OVERALL":
-            params["category"] = category
-
-        try:
-            resp = http_client.get(_LEADERBOARD_PATH, params=params)
-            if resp.status_code != 200:
-                logger.warning(
-                    "Leaderboard API returned status %d on page %d — stopping.",
-                    resp.status_code,
-                    page_num + 1,
-                )
-                break
-
-            page_data = resp.json()
-            if not page_data:
-                logger.debug("Empty page at offset %d — stopping pagination.", offset)
+    try:
+        for window_start in range(0, max_pages, _PAGE_WINDOW):
+            pages = range(window_start, min(window_start + _PAGE_WINDOW, max_pages))
+            calls = []
+            for page_num in pages:
+                params = {
+                    "order_by": order_by,
+                    "time_period": time_period,
+                    "limit": page_size,
+                    "offset": page_num * page_size,
+                }
+                if category and category.upper() != "OVERALL":
+                    params["category"] = category
+                calls.append((_LEADERBOARD_PATH, params))
+
+            results = http_client.get_json_many(
+                calls, max_concurrency=_PAGE_WINDOW, return_exceptions=True
+            )
+            if not _extend_pages(all_entries, pages, page_size, results):
                 break
-
-            all_entries.extend(page_data)
-            logger.debug("Fetched page %d: %d entries (total so far: %d)", page_num + 1, len(page_data), len(all_entries))
-
-        except Exception as exc:
-            logger.error("Leaderboard fetch error on page %d: %s", page_num + 1, exc)
-            break
+    finally:
+        if owns_client:
+            http_client.close()
 
     # Sort by rank ascending (spec AT-01 requires ordered rank 1-N, no duplicates)
     all_entries.sort(key=lambda e: e.get("rank", 0))
@@ -7,6 +7,15 @@ This module is the Phase 1 historical data-plane foundation.  It provides
 a context-managed connection plus two scan helpers that return a compact
 ScanSummary without any ClickHouse dependency.
 
+It also maintains an optional per-file catalog for a dataset directory
+(:func:`build_file_catalog`): for every file, the distinct tokens it holds
+with their min/max timestamp.  Readers use it to open only the files that
+can contain a (token, time) lookup, and the scan helpers answer row counts
+and timestamp ranges from it without reading the data.  The catalog lives
+in ``<dataset_dir>/_catalog/`` and is refreshed incrementally -- only new
+or modified files (by size and mtime) are rescanned.  Files the catalog
+does not cover yet are always read, so a stale catalog never hides data.
+
 Usage::
 
     from packages.polymarket.duckdb_helper import connection, scan_parquet, scan_csv
@@ -18,13 +27,27 @@ Usage::
             ts_candidates=["snapshot_ts", "ts", "timestamp"],
         )
         print(summary.row_count, summary.min_ts, summary.max_ts)
+
+        # One-time (re-run to refresh) catalog for pruned point lookups:
+        build_file_catalog(
+            conn,
+            "/data/raw/pmxt_archive/Polymarket",
+            pattern="**/*.parquet",
+            token_cols=["token_id"],
+            ts_col="snapshot_ts",
+        )
 """
 
 from __future__ import annotations
 
+import glob as _glob
+import json
+import os
+import tempfile
 from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import Generator, List, Optional
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Generator, List, Optional, Sequence, Tuple
 
 import duckdb
 
@@ -139,6 +162,336 @@ def _csv_columns(
         return None
 
 
+# ---------------------------------------------------------------------------
+# Per-file token/timestamp catalog
+# ---------------------------------------------------------------------------
+
+CATALOG_DIRNAME = "_catalog"
+_CATALOG_VERSION = 1
+_CATALOG_MANIFEST = "catalog.json"
+# Parquet, but without a .parquet suffix so dataset globs never pick it up.
+_CATALOG_RANGES = "token_ranges.idx"
+
+
+@dataclass
+class FileCatalog:
+    """Per-file token/timestamp ranges for one dataset directory.
+
+    Attributes:
+        dataset_dir: Directory the catalog describes.
+        fmt:         ``"parquet"`` or ``"csv"``.
+        pattern:     Glob (relative to dataset_dir) of the indexed files.
+        token_cols:  Columns whose values were indexed as tokens.
+        ts_col:      Timestamp column the ranges were computed on.
+        files:       ``relative path -> (size, mtime_ns, row_count)``.
+    """
+
+    dataset_dir: Path
+    fmt: str
+    pattern: str
+    token_cols: List[str]
+    ts_col: str
+    files: Dict[str, Tuple[int, int, int]] = field(default_factory=dict)
+
+    @property
+    def ranges_path(self) -> Path:
+        return self.dataset_dir / CATALOG_DIRNAME / _CATALOG_RANGES
+
+    def ranges_expr(self) -> str:
+        """SQL table expression with columns file, token, ts_min, ts_max, row_count."""
+        return f"read_parquet('{_to_duckdb_glob(str(self.ranges_path))}')"
+
+    def covers(self, token_cols: Sequence[str], ts_col: str) -> bool:
+        """True when the catalog was built on *ts_col* and every token column."""
+        return ts_col == self.ts_col and set(token_cols) <= set(self.token_cols)
+
+    def file_path(self, rel: str) -> Path:
+        return self.dataset_dir / rel
+
+    def unindexed_files(self, current: Dict[str, Tuple[int, int]]) -> List[str]:
+        """Relative paths in *current* that are new or changed since indexing."""
+        return sorted(
+            rel
+            for rel, (size, mtime_ns) in current.items()
+            if self.files.get(rel, (None, None, None))[:2] != (size, mtime_ns)
+        )
+
+
+@dataclass
+class CatalogRefresh:
+    """Outcome of :func:`build_file_catalog`."""
+
+    catalog: FileCatalog
+    files_scanned: int = 0
+    files_reused: int = 0
+    files_removed: int = 0
+    token_ranges: int = 0
+
+
+def dataset_files(dataset_dir: Path, pattern: str) -> Dict[str, Tuple[int, int]]:
+    """Return ``relative posix path -> (size, mtime_ns)`` for files matching *pattern*."""
+    dataset_dir = Path(dataset_dir)
+    found: Dict[str, Tuple[int, int]] = {}
+    for path in dataset_dir.glob(pattern):
+        if not path.is_file() or CATALOG_DIRNAME in path.relative_to(dataset_dir).parts:
+            continue
+        st = path.stat()
+        found[path.relative_to(dataset_dir).as_posix()] = (st.st_size, st.st_mtime_ns)
+    return found
+
+
+def load_file_catalog(dataset_dir: Path) -> Optional[FileCatalog]:
+    """Load the catalog for *dataset_dir*, or None if absent or unreadable."""
+    dataset_dir = Path(dataset_dir)
+    manifest = dataset_dir / CATALOG_DIRNAME / _CATALOG_MANIFEST
+    try:
+        data = json.loads(manifest.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != _CATALOG_VERSION:
+        return None
+    catalog = FileCatalog(
+        dataset_dir=dataset_dir,
+        fmt=data.get("fmt", "parquet"),
+        pattern=data.get("pattern", ""),
+        token_cols=list(data.get("token_cols") or []),
+        ts_col=data.get("ts_col", ""),
+        files={rel: tuple(v) for rel, v in (data.get("files") or {}).items()},
+    )
+    if not catalog.ranges_path.exists():
+        return None
+    return catalog
+
+
+def find_file_catalog(glob: str) -> Optional[FileCatalog]:
+    """Return the catalog of the nearest directory above *glob*'s wildcards."""
+    parts = Path(glob).parts
+    base_parts: List[str] = []
+    for part in parts:
+        if any(ch in part for ch in "*?["):
+            break
+        base_parts.append(part)
+    if not base_parts:
+        return None
+    base = Path(*base_parts)
+    for candidate in (base, *base.parents):
+        if (candidate / CATALOG_DIRNAME / _CATALOG_MANIFEST).exists():
+            return load_file_catalog(candidate)
+    return None
+
+
+def read_expr_for_files(
+    files: Sequence[Path], fmt: str, *, filename: bool = False
+) -> str:
+    """Return a ``read_parquet`` / ``read_csv`` expression over an explicit file list.
+
+    With ``filename=True`` each row carries its source path in ``filename``.
+    """
+    listed = ", ".join(f"'{_to_duckdb_glob(str(f))}'" for f in files)
+    options = "union_by_name=true, filename=true" if filename else "union_by_name=true"
+    if fmt == "csv":
+        return f"read_csv([{listed}], auto_detect=true, {options})"
+    return f"read_parquet([{listed}], {options})"
+
+
+def build_file_catalog(
+    conn: duckdb.DuckDBPyConnection,
+    dataset_dir: Path,
+    *,
+    pattern: str,
+    token_cols: Sequence[str],
+    ts_col: str,
+    fmt: str = "parquet",
+    rebuild: bool = False,
+) -> CatalogRefresh:
+    """Create or incrementally refresh the catalog for *dataset_dir*.
+
+    Files whose size and mtime match the existing catalog keep their ranges;
+    new or modified files are scanned (one grouped query over all of them)
+    and deleted files are dropped.  Pass ``rebuild=True`` to rescan
+    everything.  A catalog built for different columns is always rebuilt.
+    """
+    dataset_dir = Path(dataset_dir).resolve()
+    token_cols = list(token_cols)
+    current = dataset_files(dataset_dir, pattern)
+
+    existing = None if rebuild else load_file_catalog(dataset_dir)
+    if existing is not None and (
+        existing.fmt != fmt
+        or existing.pattern != pattern
+        or existing.token_cols != token_cols
+        or existing.ts_col != ts_col
+    ):
+        existing = None
+    stale = set(existing.unindexed_files(current)) if existing else set(current)
+    kept = sorted(set(current) - stale)
+    removed = len(set(existing.files) - set(current)) if existing else 0
+
+    catalog_dir = dataset_dir / CATALOG_DIRNAME
+    catalog_dir.mkdir(parents=True, exist_ok=True)
+    prefix = _to_duckdb_glob(str(dataset_dir)) + "/"
+
+    conn.execute(
+        "CREATE OR REPLACE TEMP TABLE _catalog_kept_files (file VARCHAR)"
+    )
+    if kept:
+        conn.executemany(
+            "INSERT INTO _catalog_kept_files VALUES (?)", [(rel,) for rel in kept]
+        )
+    parts: List[str] = []
+    if existing is not None and kept:
+        parts.append(
+            f"SELECT * FROM {existing.ranges_expr()} "
+            "WHERE file IN (SELECT file FROM _catalog_kept_files)"
+        )
+
+    row_counts: Dict[str, int] = {}
+    if stale:
+        read_expr = read_expr_for_files(
+            [dataset_dir / rel for rel in sorted(stale)], fmt, filename=True
+        )
+        rel_expr = f"substr(filename, {len(prefix) + 1})"
+        legs = " UNION ALL ".join(
+            f'SELECT {rel_expr} AS file, CAST("{col}" AS VARCHAR) AS token, '
+            f'"{ts_col}" AS ts FROM {read_expr}'
+            for col in token_cols
+        )
+        parts.append(
+            f"SELECT file, token, min(ts) AS ts_min, max(ts) AS ts_max, "
+            f"count(*) AS row_count FROM ({legs}) "
+            f"WHERE token IS NOT NULL GROUP BY file, token"
+        )
+        for rel, count in conn.execute(
+            f"SELECT {rel_expr}, count(*) FROM {read_expr} GROUP BY 1"
+        ).fetchall():
+            row_counts[rel] = int(count)
+
+    ranges_path = catalog_dir / _CATALOG_RANGES
+    fd, tmp_name = tempfile.mkstemp(prefix=_CATALOG_RANGES + ".", dir=catalog_dir)
+    os.close(fd)
+    try:
+        if parts:
+            query = " UNION ALL BY NAME ".join(f"({part})" for part in parts)
+            conn.execute(
+                f"COPY (SELECT file, token, ts_min, ts_max, row_count FROM ({query}) "
+                f"ORDER BY token, file) TO '{_to_duckdb_glob(tmp_name)}' (FORMAT PARQUET)"
+            )
+        else:
+            conn.execute(
+                "COPY (SELECT NULL::VARCHAR AS file, NULL::VARCHAR AS token, "
+                "NULL::DOUBLE AS ts_min, NULL::DOUBLE AS ts_max, "
+                "NULL::BIGINT AS row_count WHERE false) "
+                f"TO '{_to_duckdb_glob(tmp_name)}' (FORMAT PARQUET)"
+            )
+        os.replace(tmp_name, ranges_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    files: Dict[str, Tuple[int, int, int]] = {}
+    for rel, (size, mtime_ns) in current.items():
+        rows = row_counts.get(rel, 0) if rel in stale else existing.files[rel][2]
+        files[rel] = (size, mtime_ns, rows)
+    catalog = FileCatalog(
+        dataset_dir=dataset_dir,
+        fmt=fmt,
+        pattern=pattern,
+        token_cols=token_cols,
+        ts_col=ts_col,
+        files=files,
+    )
+    _write_catalog_manifest(catalog)
+
+    token_ranges = conn.execute(
+        f"SELECT count(*) FROM {catalog.ranges_expr()}"
+    ).fetchone()[0]
+    return CatalogRefresh(
+        catalog=catalog,
+        files_scanned=len(stale),
+        files_reused=len(kept),
+        files_removed=removed,
+        token_ranges=int(token_ranges),
+    )
+
+
+def _write_catalog_manifest(catalog: FileCatalog) -> None:
+    target = catalog.dataset_dir / CATALOG_DIRNAME / _CATALOG_MANIFEST
+    payload = {
+        "version": _CATALOG_VERSION,
+        "fmt": catalog.fmt,
+        "pattern": catalog.pattern,
+        "token_cols": catalog.token_cols,
+        "ts_col": catalog.ts_col,
+        "files": {rel: list(v) for rel, v in sorted(catalog.files.items())},
+    }
+    fd, tmp_name = tempfile.mkstemp(prefix=_CATALOG_MANIFEST + ".", dir=target.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _catalog_summary(
+    conn: duckdb.DuckDBPyConnection,
+    glob: str,
+    columns: List[str],
+    ts_candidates: Optional[List[str]],
+) -> Optional[ScanSummary]:
+    """Answer a scan from the catalog when it fully covers the files in *glob*.
+
+    Returns None (caller scans the data) when there is no catalog, any
+    matching file is unindexed or changed, or the timestamp column the scan
+    would report is not the catalog's ts_col.
+    """
+    catalog = find_file_catalog(glob)
+    if catalog is None:
+        return None
+    matched: Dict[str, Tuple[int, int]] = {}
+    for name in _glob.glob(glob, recursive=True):
+        path = Path(name).resolve()
+        try:
+            rel = path.relative_to(catalog.dataset_dir.resolve()).as_posix()
+        except ValueError:
+            return None
+        if os.path.isfile(path):
+            st = path.stat()
+            matched[rel] = (st.st_size, st.st_mtime_ns)
+    if not matched or catalog.unindexed_files(matched):
+        return None
+
+    row_count = sum(catalog.files[rel][2] for rel in matched)
+    if not ts_candidates:
+        return ScanSummary(row_count=row_count)
+
+    ts_col = next(
+        (col for col in (detect_ts_column(columns, [c]) for c in ts_candidates) if col),
+        None,
+    )
+    if ts_col is None:
+        return ScanSummary(row_count=row_count)
+    if ts_col != catalog.ts_col:
+        return None
+    conn.execute("CREATE OR REPLACE TEMP TABLE _catalog_scan_files (file VARCHAR)")
+    conn.executemany(
+        "INSERT INTO _catalog_scan_files VALUES (?)", [(rel,) for rel in matched]
+    )
+    row = conn.execute(
+        f"SELECT min(ts_min), max(ts_max) FROM {catalog.ranges_expr()} "
+        "WHERE file IN (SELECT file FROM _catalog_scan_files)"
+    ).fetchone()
+    if not row or row[0] is None:
+        return None  # all-null column: let the scan fall through to later candidates
+    return ScanSummary(
+        row_count=row_count,
+        min_ts=str(row[0]),
+        max_ts=str(row[1]) if row[1] is not None else None,
+        ts_col=ts_col,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Public scan helpers
 # ---------------------------------------------------------------------------
@@ -179,7 +532,8 @@ def scan_parquet(
     """Scan a Parquet glob and return row count + optional timestamp range.
 
     Uses ``read_parquet(..., union_by_name=true)`` so files with slightly
-    different schemas are merged safely.
+    different schemas are merged safely.  When a :class:`FileCatalog` fully
+    covers the matched files, the counts and range come from the catalog.
 
     Timestamp detection falls through candidates in order: if the first matching
     column is all-null (MIN returns NULL), the next candidate is tried.
@@ -202,6 +556,10 @@ def scan_parquet(
     if columns is None:
         return ScanSummary(error=f"no readable parquet files matching: {glob}")
 
+    cataloged = _catalog_summary(conn, glob, columns, ts_candidates)
+    if cataloged is not None:
+        return cataloged
+
     try:
         row_count = conn.execute(f"SELECT COUNT(*) FROM {read_expr}").fetchone()
         count = row_count[0] if row_count else 0
@@ -223,7 +581,8 @@ def scan_csv(
     """Scan a CSV / CSV.GZ glob and return row count + optional timestamp range.
 
     Uses ``read_csv(..., auto_detect=true)``.  DuckDB handles ``.gz``
-    decompression transparently.
+    decompression transparently.  Like :func:`scan_parquet`, answers from a
+    covering :class:`FileCatalog` when one is present.
 
     Timestamp detection falls through candidates in order: if the first matching
     column is all-null (MIN returns NULL), the next candidate is tried.
@@ -245,6 +604,10 @@ def scan_csv(
     if columns is None:
         return ScanSummary(error=f"no readable csv files matching: {glob}")
 
+    cataloged = _catalog_summary(conn, glob, columns, ts_candidates)
+    if cataloged is not None:
+        return cataloged
+
     try:
         row_count = conn.execute(f"SELECT COUNT(*) FROM {read_expr}").fetchone()
         count = row_count[0] if row_count else 0
@@ -3,7 +3,7 @@
 import json
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Any, Iterator, Optional
 from dataclasses import dataclass
 
 from .http_client import HttpClient
@@ -14,6 +14,12 @@ logger = logging.getLogger(__name__)
 # Default Gamma API base URL
 DEFAULT_GAMMA_API_BASE = "https://gamma-api.polymarket.com"
 
+# Market pages kept in flight by fetch_all_markets, ids per /events query, and
+# the most event ids (and, separately, slugs) one taxonomy pass looks up.
+DEFAULT_MARKETS_PREFETCH_PAGES = 4
+MAX_EVENT_LOOKUPS_PER_QUERY = 200
+MAX_EVENT_LOOKUPS_PER_PASS = 1000
+
 
 @dataclass
 class MarketToken:
@@ -326,11 +332,15 @@ class GammaClient:
             logger.error(f"Error fetching markets page: {e}")
             return []
 
-        # Response can be a list directly or wrapped in an object
+        return self._unwrap_list(response, "markets")
+
+    @staticmethod
+    def _unwrap_list(response: Any, key: str) -> list:
+        """Response can be a list directly or wrapped in ``{"data"|key: [...]}``."""
         if isinstance(response, list):
             return response
         elif isinstance(response, dict):
-            return response.get("data", response.get("markets", []))
+            return response.get("data", response.get(key, []))
         return []
 
     def _build_markets_page_params(
@@ -445,12 +455,65 @@ class GammaClient:
         self._hydrate_markets_with_event_taxonomy(markets)
         return markets
 
+    def iter_markets_pages(
+        self,
+        max_pages: int = 50,
+        page_size: int = 100,
+        active_only: bool = True,
+        prefetch_pages: int = DEFAULT_MARKETS_PREFETCH_PAGES,
+    ) -> Iterator[tuple[int, list[dict]]]:
+        """
+        Yield ``(offset, raw_markets)`` pages in order, a window at a time.
+
+        Pages are requested ``prefetch_pages`` at a time over the client's
+        pooled async connections (``HttpClient.get_json_many``). Iteration
+        stops after the first empty or short page; a failed page counts as
+        empty, and pages already requested past it are discarded.
+
+        Args:
+            max_pages: Maximum pages to fetch
+            page_size: Markets per page
+            active_only: Only fetch non-closed markets
+            prefetch_pages: Pages requested per concurrent window
+        """
+        window = max(1, int(prefetch_pages))
+        for window_start in range(0, max(int(max_pages), 0), window):
+            offsets = [
+                page * page_size
+                for page in range(window_start, min(window_start + window, max_pages))
+            ]
+            responses = self.client.get_json_many(
+                [
+                    (
+                        "/markets",
+                        self._build_markets_page_params(
+                            limit=page_size,
+                            offset=offset,
+                            active_only=active_only,
+                        ),
+                    )
+                    for offset in offsets
+                ],
+                max_concurrency=window,
+                return_exceptions=True,
+            )
+            for offset, response in zip(offsets, responses):
+                if isinstance(response, Exception):
+                    logger.error(f"Error fetching markets page: {response}")
+                    raw_markets: list[dict] = []
+                else:
+                    raw_markets = self._unwrap_list(response, "markets")
+                yield offset, raw_markets
+                if len(raw_markets) < page_size:
+                    return
+
     def fetch_all_markets(
         self,
         max_pages: int = 50,
         page_size: int = 100,
         active_only: bool = True,
         capture_debug_sample: bool = False,
+        prefetch_pages: int = DEFAULT_MARKETS_PREFETCH_PAGES,
     ) -> MarketsFetchResult:
         """
         Fetch all markets with pagination.
@@ -459,6 +522,7 @@ class GammaClient:
             max_pages: Maximum pages to fetch
             page_size: Markets per page
             active_only: Only fetch non-closed markets
+            prefetch_pages: Concurrent page requests (see iter_markets_pages)
 
         Returns:
             MarketsFetchResult with markets and flattened market_tokens
@@ -470,23 +534,23 @@ class GammaClient:
             pages_fetched=0,
             total_markets=0,
         )
-        offset = 0
 
-        for page in range(max_pages):
-            request_params = self._build_markets_page_params(
-                limit=page_size,
-                offset=offset,
-                active_only=active_only,
-            )
-            raw_markets = self.fetch_markets_page(
-                limit=page_size, offset=offset, active_only=active_only
-            )
+        for offset, raw_markets in self.iter_markets_pages(
+            max_pages=max_pages,
+            page_size=page_size,
+            active_only=active_only,
+            prefetch_pages=prefetch_pages,
+        ):
             result.pages_fetched += 1
 
             if capture_debug_sample and result.gamma_markets_sample is None:
                 result.gamma_markets_sample = self._build_gamma_markets_sample(
                     raw_markets=raw_markets,
-                    request_params=request_params,
+                    request_params=self._build_markets_page_params(
+                        limit=page_size,
+                        offset=offset,
+                        active_only=active_only,
+                    ),
                     max_items=10,
                 )
 
@@ -499,12 +563,7 @@ class GammaClient:
                     result.markets.append(market)
                     result.total_markets += 1
 
-            logger.info(f"Fetched page {page + 1}: {len(raw_markets)} markets")
-
-            if len(raw_markets) < page_size:
-                break
-
-            offset += page_size
+            logger.info(f"Fetched page {result.pages_fetched}: {len(raw_markets)} markets")
 
         self._hydrate_markets_with_event_taxonomy(result.markets)
 
@@ -557,32 +616,35 @@ class GammaClient:
         *,
         event_ids: list[str],
         event_slugs: list[str],
-        limit: int = 200,
+        limit: int = MAX_EVENT_LOOKUPS_PER_QUERY,
     ) -> list[dict]:
         query_params: list[dict[str, object]] = []
-        if event_ids:
-            query_params.append({"id": event_ids, "limit": limit})
-            query_params.append({"event_id": event_ids, "limit": limit})
-        if event_slugs:
-            query_params.append({"slug": event_slugs, "limit": limit})
-            query_params.append({"event_slug": event_slugs, "limit": limit})
+        for start in range(0, len(event_ids), limit):
+            chunk = event_ids[start : start + limit]
+            query_params.append({"id": chunk, "limit": limit})
+            query_params.append({"event_id": chunk, "limit": limit})
+        for start in range(0, len(event_slugs), limit):
+            chunk = event_slugs[start : start + limit]
+            query_params.append({"slug": chunk, "limit": limit})
+            query_params.append({"event_slug": chunk, "limit": limit})
+        if not query_params:
+            return []
 
-        collected: list[dict] = []
-        seen: set[str] = set()
-        for params in query_params:
-            try:
-                response = self.client.get_json("/events", params=params)
-            except Exception as exc:
-                logger.debug(f"Skipping /events query {params}: {exc}")
+        results = self.client.get_json_many(
+            [("/events", params) for params in query_params],
+            max_concurrency=DEFAULT_MARKETS_PREFETCH_PAGES,
+            return_exceptions=True,
+        )
+        responses: list[list] = []
+        for params, response in zip(query_params, results):
+            if isinstance(response, Exception):
+                logger.debug(f"Skipping /events query {params}: {response}")
                 continue
+            responses.append(self._unwrap_list(response, "events"))
 
-            if isinstance(response, list):
-                raw_events = response
-            elif isinstance(response, dict):
-                raw_events = response.get("data", response.get("events", []))
-            else:
-                raw_events = []
-
+        collected: list[dict] = []
+        seen: set[str] = set()
+        for raw_events in responses:
             for raw_event in raw_events:
                 if not isinstance(raw_event, dict):
                     continue
@@ -610,22 +672,34 @@ class GammaClient:
         if not needs_lookup:
             return
 
-        event_ids: list[str] = []
-        event_slugs: list[str] = []
-        for market in needs_lookup:
-            for event_id in market.event_ids:
-                if event_id and event_id not in event_ids:
-                    event_ids.append(event_id)
-            for event_slug in market.event_slugs:
-                if event_slug and event_slug not in event_slugs:
-                    event_slugs.append(event_slug)
-
-        # Bound network usage to only events needed for this batch/page pass.
-        max_event_lookups = 200
+        event_ids = list(
+            dict.fromkeys(
+                event_id
+                for market in needs_lookup
+                for event_id in market.event_ids
+                if event_id
+            )
+        )
+        event_slugs = list(
+            dict.fromkeys(
+                event_slug
+                for market in needs_lookup
+                for event_slug in market.event_slugs
+                if event_slug
+            )
+        )
+
+        # One batched lookup pass for the events this market set references;
+        # ids are chunked per query and the queries run concurrently. Bound
+        # the pass so a huge market set cannot fan out into unbounded queries.
+        if len(event_ids) > MAX_EVENT_LOOKUPS_PER_PASS or len(event_slugs) > MAX_EVENT_LOOKUPS_PER_PASS:
+            logger.warning(
+                f"Event taxonomy lookup capped at {MAX_EVENT_LOOKUPS_PER_PASS} ids/slugs "
+                f"({len(event_ids)} ids, {len(event_slugs)} slugs referenced)"
+            )
         fetched_events = self._fetch_events(
-            event_ids=event_ids[:max_event_lookups],
-            event_slugs=event_slugs[:max_event_lookups],
-            limit=max_event_lookups,
+            event_ids=event_ids[:MAX_EVENT_LOOKUPS_PER_PASS],
+            event_slugs=event_slugs[:MAX_EVENT_LOOKUPS_PER_PASS],
         )
         if not fetched_events:
             return
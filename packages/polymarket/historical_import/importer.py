@@ -23,6 +23,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Protocol
 
+from packages.polymarket.clickhouse_buffer import BufferedClickHouseWriter
+
 
 # ---------------------------------------------------------------------------
 # Enums and constants
@@ -144,6 +146,14 @@ class ClickHouseClient:
         client.insert(table, rows, column_names=column_names)
         return len(rows)
 
+    def buffered(self, **writer_kwargs: Any) -> BufferedClickHouseWriter:
+        """Return a background batching writer that inserts through this client.
+
+        Keyword arguments are passed to ``BufferedClickHouseWriter`` (batch_size,
+        flush_interval_s, max_queue_rows, spill_dir, ...).
+        """
+        return BufferedClickHouseWriter(self, **writer_kwargs)
+
 
 # ---------------------------------------------------------------------------
 # Parquet reading helper
@@ -1,9 +1,27 @@
-"""HTTP client with retries, exponential backoff, and jitter."""
-
+"""HTTP clients with retries, exponential backoff, jitter and per-host rate limits.
+
+``HttpClient`` is the synchronous ``requests`` client every API wrapper uses.
+``AsyncHttpClient`` is its asyncio counterpart with a pooled keep-alive
+transport (httpx with HTTP/2 when installed, otherwise a ``requests`` session
+driven from a thread pool).
+
+Client-side rate limiting is opt-in. Requests are unthrottled unless a budget
+was configured for the host with ``set_host_rate_limit`` (or for every host
+with ``set_default_host_rate_limit``), or a ``TokenBucket`` is passed in
+explicitly. Sync and async clients for a configured host draw from the same
+bucket, so concurrent callers share one request budget per API host.
+"""
+
+import asyncio
+import multiprocessing
+import threading
 import time
 import random
 import logging
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -11,6 +29,164 @@ from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_HOST_RATE_PER_SECOND = 20.0
+DEFAULT_HOST_BURST = 40
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_RETRY_AFTER_SECONDS = 5
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by sync and async clients.
+
+    ``reserve`` takes a token immediately (the balance may go negative) and
+    returns how long the caller must wait, so waiting happens outside the lock
+    with either ``time.sleep`` or ``asyncio.sleep``.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int, clock=time.monotonic):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be > 0")
+        self.rate_per_second = float(rate_per_second)
+        self.burst = max(int(burst), 1)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            elapsed = max(now - self._updated, 0.0)
+            self._updated = now
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate_per_second)
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_second
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait on the event loop until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class SharedTokenBucket(TokenBucket):
+    """``TokenBucket`` whose balance lives in shared memory.
+
+    Create it in a parent process and hand it to worker processes (e.g. as a
+    ``ProcessPoolExecutor`` initializer argument); every process then draws
+    from one budget instead of each getting its own. Uses ``time.monotonic``,
+    which is system-wide.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int, ctx: Any = None):
+        super().__init__(rate_per_second, burst)
+        ctx = ctx or multiprocessing.get_context()
+        # [tokens, updated]
+        self._state = ctx.Array("d", [self._tokens, self._updated], lock=False)
+        self._lock = ctx.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            tokens, updated = self._state[0], self._state[1]
+            tokens = min(float(self.burst), tokens + max(now - updated, 0.0) * self.rate_per_second)
+            tokens -= 1.0
+            self._state[0], self._state[1] = tokens, now
+            if tokens >= 0:
+                return 0.0
+            return -tokens / self.rate_per_second
+
+
+_HOST_RATE_LIMITERS: Dict[str, TokenBucket] = {}
+_HOST_RATE_LIMITERS_LOCK = threading.Lock()
+# Budget for hosts without an explicit set_host_rate_limit: (rate_per_second, burst).
+# None leaves those hosts unthrottled.
+_DEFAULT_HOST_BUDGET: Optional[Tuple[float, int]] = None
+
+
+def _host_key(base_url: str) -> str:
+    return (urlsplit(base_url).netloc or base_url).lower()
+
+
+def set_host_rate_limit(base_url: str, rate_per_second: float, burst: Optional[int] = None) -> TokenBucket:
+    """Replace the shared request budget for the host of ``base_url``."""
+    bucket = TokenBucket(rate_per_second, burst if burst is not None else max(int(rate_per_second), 1))
+    return set_host_rate_limiter(base_url, bucket)
+
+
+def set_host_rate_limiter(base_url: str, bucket: TokenBucket) -> TokenBucket:
+    """Use an existing bucket (e.g. a ``SharedTokenBucket``) for the host of ``base_url``.
+
+    Only clients created afterwards pick it up.
+    """
+    with _HOST_RATE_LIMITERS_LOCK:
+        _HOST_RATE_LIMITERS[_host_key(base_url)] = bucket
+    return bucket
+
+
+def set_default_host_rate_limit(rate_per_second: Optional[float], burst: Optional[int] = None) -> None:
+    """Set (or clear with ``None``) the budget for hosts without an explicit limit.
+
+    Buckets already handed out keep their budget; hosts seen afterwards get the
+    new one. Without a default, hosts that were not configured are unthrottled.
+    """
+    global _DEFAULT_HOST_BUDGET
+    if rate_per_second is None:
+        with _HOST_RATE_LIMITERS_LOCK:
+            _DEFAULT_HOST_BUDGET = None
+        return
+    if rate_per_second <= 0:
+        raise ValueError("rate_per_second must be > 0")
+    resolved_burst = burst if burst is not None else max(int(rate_per_second), 1)
+    with _HOST_RATE_LIMITERS_LOCK:
+        _DEFAULT_HOST_BUDGET = (float(rate_per_second), resolved_burst)
+
+
+def get_host_rate_limiter(base_url: str) -> Optional[TokenBucket]:
+    """Return the process-wide token bucket for the host of ``base_url``.
+
+    Returns None when neither the host nor a default budget was configured.
+    """
+    key = _host_key(base_url)
+    with _HOST_RATE_LIMITERS_LOCK:
+        bucket = _HOST_RATE_LIMITERS.get(key)
+        if bucket is None and _DEFAULT_HOST_BUDGET is not None:
+            bucket = TokenBucket(*_DEFAULT_HOST_BUDGET)
+            _HOST_RATE_LIMITERS[key] = bucket
+        return bucket
+
+
+def _retry_after_seconds(headers: Any, default: float = DEFAULT_RETRY_AFTER_SECONDS) -> float:
+    """Parse a Retry-After header given as seconds or an HTTP date."""
+    raw = headers.get("Retry-After") if headers is not None else None
+    if raw is None:
+        return float(default)
+    text = str(raw).strip()
+    try:
+        return max(float(text), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return float(default)
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def _add_jitter(delay: float) -> float:
+    """Add random jitter to delay (0-50% of delay)."""
+    return delay + random.uniform(0, delay * 0.5)
+
 
 class HttpClient:
     """HTTP client wrapper with automatic retries and exponential backoff."""
@@ -22,6 +198,8 @@ class HttpClient:
         max_retries: int = 5,
         backoff_factor: float = 1.0,
         retry_statuses: tuple = (429, 500, 502, 503, 504),
+        rate_limiter: Optional[TokenBucket] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
     ):
         """
         Initialize HTTP client.
@@ -32,15 +210,27 @@ class HttpClient:
             max_retries: Maximum number of retry attempts
             backoff_factor: Multiplier for exponential backoff
             retry_statuses: HTTP status codes that trigger a retry
+            rate_limiter: Token bucket to wait on before each request; defaults
+                to the host's configured bucket, or no throttling
+            max_connections: Connection pool size used by ``get_json_many``
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.retry_statuses = retry_statuses
+        self.rate_limiter = rate_limiter or get_host_rate_limiter(self.base_url)
+        self.max_connections = max(int(max_connections), 1)
 
         self.session = self._create_session()
 
+        # Event loop thread and pooled AsyncHttpClient behind get_json_many,
+        # started on first use and reused until close().
+        self._async_lock = threading.Lock()
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_thread: Optional[threading.Thread] = None
+        self._async_client: Optional["AsyncHttpClient"] = None
+
     def _create_session(self) -> requests.Session:
         """Create a requests session with retry configuration."""
         session = requests.Session()
@@ -62,8 +252,7 @@ class HttpClient:
 
     def _add_jitter(self, delay: float) -> float:
         """Add random jitter to delay (0-50% of delay)."""
-        jitter = random.uniform(0, delay * 0.5)
-        return delay + jitter
+        return _add_jitter(delay)
 
     def get(
         self,
@@ -90,6 +279,8 @@ class HttpClient:
 
         while attempt <= self.max_retries:
             try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
                 response = self.session.get(
                     url,
                     params=params,
@@ -99,7 +290,7 @@ class HttpClient:
 
                 # Handle rate limiting with custom backoff
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 5))
+                    retry_after = _retry_after_seconds(response.headers)
                     delay = self._add_jitter(retry_after)
                     logger.warning(
                         f"Rate limited (429). Waiting {delay:.2f}s before retry. "
@@ -162,6 +353,8 @@ class HttpClient:
 
         while attempt <= self.max_retries:
             try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
                 response = self.session.get(
                     url,
                     params=params,
@@ -171,7 +364,7 @@ class HttpClient:
                 last_response = response
 
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 5))
+                    retry_after = _retry_after_seconds(response.headers)
                     delay = self._add_jitter(retry_after)
                     logger.warning(
                         f"Rate limited (429). Waiting {delay:.2f}s before retry. "
@@ -243,3 +436,314 @@ class HttpClient:
         response = self.get(path, params=params, headers=headers)
         response.raise_for_status()
         return response.json()
+
+    def get_json_many(
+        self,
+        calls: Sequence[Tuple[str, Optional[dict]]],
+        headers: Optional[dict] = None,
+        max_concurrency: int = DEFAULT_MAX_CONNECTIONS,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Fetch several ``(path, params)`` pairs concurrently and return JSON in order.
+
+        Sync adapter over ``AsyncHttpClient.get_json_many``. The async client
+        (pool of ``max_connections``) and the event loop thread driving it are
+        created on first use and kept for the life of this client, so repeated
+        calls reuse warm connections. Shares this client's rate limiter.
+        """
+        loop, client = self._async_runner()
+        future = asyncio.run_coroutine_threadsafe(
+            client.get_json_many(
+                calls,
+                headers=headers,
+                max_concurrency=max_concurrency,
+                return_exceptions=return_exceptions,
+            ),
+            loop,
+        )
+        return future.result()
+
+    def _async_runner(self) -> Tuple[asyncio.AbstractEventLoop, "AsyncHttpClient"]:
+        with self._async_lock:
+            if self._async_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name=f"http-client-loop-{_host_key(self.base_url)}",
+                    daemon=True,
+                )
+                thread.start()
+                self._async_loop = loop
+                self._async_thread = thread
+                self._async_client = AsyncHttpClient(
+                    self.base_url,
+                    timeout=self.timeout,
+                    max_retries=self.max_retries,
+                    backoff_factor=self.backoff_factor,
+                    retry_statuses=self.retry_statuses,
+                    max_connections=self.max_connections,
+                    rate_limiter=self.rate_limiter,
+                )
+            return self._async_loop, self._async_client
+
+    def close(self) -> None:
+        """Close the sync session and the async client/loop if one was started."""
+        with self._async_lock:
+            loop, thread, client = self._async_loop, self._async_thread, self._async_client
+            self._async_loop = self._async_thread = self._async_client = None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+        self.session.close()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _to_requests_response(response: Any) -> requests.Response:
+    """Adapt an httpx response so callers keep seeing ``requests`` semantics."""
+    converted = requests.Response()
+    converted.status_code = int(response.status_code)
+    converted.headers.update(response.headers)
+    converted._content = response.content
+    converted.url = str(response.url)
+    converted.encoding = response.encoding
+    converted.reason = getattr(response, "reason_phrase", "") or ""
+    return converted
+
+
+class _RequestsTransport:
+    """Pooled keep-alive ``requests`` session driven from a thread pool."""
+
+    def __init__(self, max_connections: int):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max_connections,
+            pool_maxsize=max_connections,
+            max_retries=0,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_connections,
+            thread_name_prefix="http-client",
+        )
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[dict],
+        headers: Optional[dict],
+        timeout: float,
+    ) -> requests.Response:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            lambda: self.session.get(url, params=params, headers=headers, timeout=timeout),
+        )
+
+    async def aclose(self) -> None:
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+
+class _HttpxTransport:
+    """Native asyncio transport; negotiates HTTP/2 when ``h2`` is installed."""
+
+    def __init__(self, httpx_module: Any, max_connections: int, http2: bool):
+        self._httpx = httpx_module
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                http2 = False
+        self.client = httpx_module.AsyncClient(
+            http2=http2,
+            limits=httpx_module.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[dict],
+        headers: Optional[dict],
+        timeout: float,
+    ) -> requests.Response:
+        try:
+            response = await self.client.get(url, params=params, headers=headers, timeout=timeout)
+        except self._httpx.TimeoutException as exc:
+            raise requests.exceptions.Timeout(str(exc)) from exc
+        except self._httpx.TransportError as exc:
+            raise requests.exceptions.ConnectionError(str(exc)) from exc
+        return _to_requests_response(response)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+def _default_transport(max_connections: int, http2: bool) -> Any:
+    try:
+        import httpx
+    except ImportError:
+        return _RequestsTransport(max_connections)
+    return _HttpxTransport(httpx, max_connections, http2)
+
+
+class AsyncHttpClient:
+    """Asyncio HTTP client with pooled connections and HttpClient retry semantics.
+
+    Retries 429 after ``Retry-After`` (plus jitter), retries ``retry_statuses``,
+    timeouts and connection errors with exponential backoff, and waits on the
+    host's ``TokenBucket`` (when one is configured) before every attempt.
+    Responses are ``requests.Response`` objects whichever transport is in use.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 20.0,
+        max_retries: int = 5,
+        backoff_factor: float = 1.0,
+        retry_statuses: tuple = (429, 500, 502, 503, 504),
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        http2: bool = True,
+        transport: Any = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_statuses = retry_statuses
+        self.max_connections = max(int(max_connections), 1)
+        self.rate_limiter = rate_limiter or get_host_rate_limiter(self.base_url)
+        self._transport = transport or _default_transport(self.max_connections, http2)
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    async def _request(
+        self,
+        path: str,
+        params: Optional[dict],
+        headers: Optional[dict],
+    ) -> Tuple[Optional[requests.Response], bool]:
+        """Run the retry loop; return (last response, whether it is final)."""
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        attempt = 0
+        last_response: Optional[requests.Response] = None
+
+        while attempt <= self.max_retries:
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async()
+                response = await self._transport.get(url, params, headers, self.timeout)
+                last_response = response
+
+                if response.status_code == 429:
+                    delay = _add_jitter(_retry_after_seconds(response.headers))
+                    logger.warning(
+                        f"Rate limited (429). Waiting {delay:.2f}s before retry. "
+                        f"Attempt {attempt + 1}/{self.max_retries + 1}"
+                    )
+                elif response.status_code in self.retry_statuses:
+                    delay = _add_jitter(self.backoff_factor * (2**attempt))
+                    logger.warning(
+                        f"Server error ({response.status_code}). "
+                        f"Waiting {delay:.2f}s before retry. "
+                        f"Attempt {attempt + 1}/{self.max_retries + 1}"
+                    )
+                else:
+                    return response, True
+
+            except requests.exceptions.Timeout:
+                delay = _add_jitter(self.backoff_factor * (2**attempt))
+                logger.warning(
+                    f"Request timeout. Waiting {delay:.2f}s before retry. "
+                    f"Attempt {attempt + 1}/{self.max_retries + 1}"
+                )
+
+            except requests.exceptions.ConnectionError as e:
+                delay = _add_jitter(self.backoff_factor * (2**attempt))
+                logger.warning(
+                    f"Connection error: {e}. Waiting {delay:.2f}s before retry. "
+                    f"Attempt {attempt + 1}/{self.max_retries + 1}"
+                )
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        return last_response, False
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> requests.Response:
+        """Async counterpart of ``HttpClient.get``."""
+        response, final = await self._request(path, params, headers)
+        if response is None or not final:
+            raise requests.exceptions.RetryError(
+                f"Max retries ({self.max_retries}) exceeded for {self.base_url}/{path.lstrip('/')}"
+            )
+        return response
+
+    async def get_response(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> requests.Response:
+        """Async counterpart of ``HttpClient.get_response``."""
+        response, _ = await self._request(path, params, headers)
+        if response is None:
+            raise requests.exceptions.RetryError(
+                f"Max retries ({self.max_retries}) exceeded for {self.base_url}/{path.lstrip('/')}"
+            )
+        return response
+
+    async def get_json(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> Any:
+        """Async counterpart of ``HttpClient.get_json``."""
+        response = await self.get(path, params=params, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    async def get_json_many(
+        self,
+        calls: Sequence[Tuple[str, Optional[dict]]],
+        headers: Optional[dict] = None,
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Fetch ``(path, params)`` pairs with bounded concurrency, results in input order."""
+        semaphore = asyncio.Semaphore(max(int(max_concurrency or self.max_connections), 1))
+
+        async def _one(path: str, params: Optional[dict]) -> Any:
+            async with semaphore:
+                return await self.get_json(path, params=params, headers=headers)
+
+        return await asyncio.gather(
+            *(_one(path, params) for path, params in calls),
+            return_exceptions=return_exceptions,
+        )
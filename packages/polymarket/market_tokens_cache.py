@@ -0,0 +1,168 @@
+"""Shared in-process cache of market_tokens metadata keyed by token_id."""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+MARKET_TOKEN_METADATA_FIELDS = ("condition_id", "outcome_index", "outcome_name", "category")
+DEFAULT_REFRESH_INTERVAL_SECONDS = 60.0
+# Tokens per IN (...) lookup query.
+DEFAULT_LOOKUP_CHUNK_SIZE = 5000
+
+
+class MarketTokenMetadataCache:
+    """
+    Versioned token metadata cache filled on demand from ClickHouse market_tokens.
+
+    Handlers ask only for the tokens they need; unknown tokens are loaded with
+    a primary-key IN lookup and tokens absent from the table are remembered so
+    they are not re-queried. Every ``refresh_interval_seconds`` (or right after
+    ``refresh``) rows with ``ingested_at >= watermark`` are re-read, updating
+    cached tokens and filling previously-missing ones. ``invalidate`` drops
+    everything, e.g. after a bulk market ingest. ``version`` increases
+    whenever the cached contents change.
+    """
+
+    def __init__(
+        self,
+        refresh_interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+        lookup_chunk_size: int = DEFAULT_LOOKUP_CHUNK_SIZE,
+        clock=time.monotonic,
+    ):
+        self.refresh_interval_seconds = float(refresh_interval_seconds)
+        self.lookup_chunk_size = max(int(lookup_chunk_size), 1)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rows: dict[str, dict[str, Any]] = {}
+        self._missing: set[str] = set()
+        self._watermark: Optional[datetime] = None
+        self._last_refresh: Optional[float] = None
+        self.version = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._rows)
+
+    @staticmethod
+    def _select_fields() -> str:
+        return ",\n                ".join(
+            f"argMax({field}, ingested_at) AS {field}" for field in MARKET_TOKEN_METADATA_FIELDS
+        )
+
+    @staticmethod
+    def _row_to_metadata(row: Any) -> dict[str, Any]:
+        return {field: row[idx] for idx, field in enumerate(MARKET_TOKEN_METADATA_FIELDS, start=1)}
+
+    def invalidate(self) -> None:
+        """Drop every cached entry; the next lookups reload from ClickHouse."""
+        with self._lock:
+            self._rows.clear()
+            self._missing.clear()
+            self._watermark = None
+            self._last_refresh = None
+            self.version += 1
+
+    def _capture_watermark(self, client) -> None:
+        # Taken before the first load so later writes are picked up by refresh.
+        result = client.query("SELECT max(ingested_at) FROM market_tokens")
+        rows = result.result_rows
+        watermark = rows[0][0] if rows and rows[0] else None
+        with self._lock:
+            if self._watermark is None:
+                self._watermark = watermark if isinstance(watermark, datetime) else datetime(1970, 1, 1)
+                self._last_refresh = self._clock()
+
+    def refresh(self, client) -> int:
+        """Apply rows ingested since the watermark to known tokens; return tokens updated."""
+        with self._lock:
+            watermark = self._watermark
+        if watermark is None:
+            return 0
+
+        query = f"""
+            SELECT
+                token_id,
+                {self._select_fields()},
+                max(ingested_at) AS last_ingested_at
+            FROM market_tokens
+            WHERE ingested_at >= {{watermark:DateTime}}
+            GROUP BY token_id
+        """
+        result = client.query(query, parameters={"watermark": watermark})
+
+        updated = 0
+        with self._lock:
+            new_watermark = self._watermark or watermark
+            for row in result.result_rows:
+                token_id = str(row[0] or "")
+                last_ingested_at = row[len(MARKET_TOKEN_METADATA_FIELDS) + 1]
+                if isinstance(last_ingested_at, datetime) and last_ingested_at > new_watermark:
+                    new_watermark = last_ingested_at
+                if token_id not in self._rows and token_id not in self._missing:
+                    continue
+                metadata = self._row_to_metadata(row)
+                if self._rows.get(token_id) != metadata:
+                    self._rows[token_id] = metadata
+                    updated += 1
+                self._missing.discard(token_id)
+            self._watermark = new_watermark
+            self._last_refresh = self._clock()
+            if updated:
+                self.version += 1
+        return updated
+
+    def _refresh_due(self) -> bool:
+        with self._lock:
+            if self._watermark is None or self._last_refresh is None:
+                return False
+            return self._clock() - self._last_refresh >= self.refresh_interval_seconds
+
+    def _load(self, client, token_ids: list[str]) -> None:
+        query = f"""
+            SELECT
+                token_id,
+                {self._select_fields()}
+            FROM market_tokens
+            WHERE token_id IN {{tokens:Array(String)}}
+            GROUP BY token_id
+        """
+        for start in range(0, len(token_ids), self.lookup_chunk_size):
+            chunk = token_ids[start : start + self.lookup_chunk_size]
+            result = client.query(query, parameters={"tokens": chunk})
+            found = {str(row[0] or ""): self._row_to_metadata(row) for row in result.result_rows}
+            with self._lock:
+                self._rows.update(found)
+                self._missing.update(token_id for token_id in chunk if token_id not in found)
+                if found:
+                    self.version += 1
+
+    def lookup(self, client, token_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """
+        Return ``{token_id: metadata}`` for the requested tokens present in market_tokens.
+
+        Metadata has the keys in ``MARKET_TOKEN_METADATA_FIELDS``, the shape the
+        detector and arb market_tokens_map arguments expect.
+        """
+        wanted = list(dict.fromkeys(str(token_id) for token_id in token_ids if token_id))
+        if not wanted:
+            return {}
+
+        with self._lock:
+            cold = self._watermark is None
+        if cold:
+            self._capture_watermark(client)
+        elif self._refresh_due():
+            self.refresh(client)
+
+        with self._lock:
+            misses = [t for t in wanted if t not in self._rows and t not in self._missing]
+        if misses:
+            logger.debug(f"Loading {len(misses)} market tokens into metadata cache")
+            self._load(client, misses)
+
+        with self._lock:
+            return {t: dict(self._rows[t]) for t in wanted if t in self._rows}
@@ -8,10 +8,12 @@ Captures point-in-time liquidity metrics from the CLOB orderbook:
 
 from __future__ import annotations
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Literal
 import logging
+import time
 
 from .clob import ClobClient
 from .slippage import estimate_slippage_bps
@@ -24,6 +26,8 @@ SnapshotStatus = Literal["ok", "empty", "one_sided", "no_orderbook", "error"]
 # Default configuration - can be overridden via function params
 DEFAULT_DEPTH_BAND_BPS = 50
 DEFAULT_NOTIONALS = [100, 500]  # USD notional sizes for slippage
+# Book fetches kept in flight at once; the CLOB host rate budget still applies.
+DEFAULT_SNAPSHOT_CONCURRENCY = 8
 
 
 @dataclass
@@ -87,6 +91,31 @@ class SnapshotBatchResult:
     tokens_http_5xx: int = 0
     tokens_skipped_limit: list[str] = field(default_factory=list)
     errors: list[dict] = field(default_factory=list)
+    # Per-token fetch diagnostics: token_id, status, http_status, fetch_ms
+    token_timings: list[dict] = field(default_factory=list)
+    fetch_wall_ms: float = 0.0
+
+    def record(self, snapshot: OrderbookSnapshot, http_status: Optional[int] = None) -> None:
+        """Append a snapshot and update the status counters."""
+        self.snapshots.append(snapshot)
+        if snapshot.status == "ok":
+            self.tokens_ok += 1
+        elif snapshot.status == "empty":
+            self.tokens_empty += 1
+        elif snapshot.status == "one_sided":
+            self.tokens_one_sided += 1
+        elif snapshot.status == "no_orderbook":
+            self.tokens_no_orderbook += 1
+        else:
+            self.tokens_error += 1
+            if http_status == 429:
+                self.tokens_http_429 += 1
+            elif http_status is not None and 500 <= http_status <= 599:
+                self.tokens_http_5xx += 1
+            self.errors.append({
+                "token_id": snapshot.token_id,
+                "reason": snapshot.reason,
+            })
 
 
 def _extract_level_price(level: object) -> Optional[float]:
@@ -426,88 +455,228 @@ def snapshot_token_book(
     )
 
 
-def snapshot_tokens(
+def snapshot_from_book_response(
+    token_id: str,
+    response: requests.Response,
+    snapshot_ts: datetime,
+    depth_band_bps: float = DEFAULT_DEPTH_BAND_BPS,
+    notional_sizes: Optional[list[float]] = None,
+) -> OrderbookSnapshot:
+    """
+    Build a snapshot from a raw CLOB /book response.
+
+    200 responses are parsed into book metrics; a 404 whose message says
+    "No orderbook exists" becomes ``no_orderbook``; anything else is an
+    ``error`` carrying the API message or ``HTTP <status>``.
+    """
+    status_code = response.status_code
+    if status_code == 200:
+        try:
+            book = response.json()
+        except ValueError:
+            return _build_basic_snapshot(
+                token_id=token_id,
+                snapshot_ts=snapshot_ts,
+                status="error",
+                reason="Invalid JSON response",
+            )
+        return snapshot_from_book(
+            token_id=token_id,
+            book=book,
+            snapshot_ts=snapshot_ts,
+            depth_band_bps=depth_band_bps,
+            notional_sizes=notional_sizes,
+        )
+
+    error_message = _extract_error_message_from_response(response)
+    if status_code == 404 and error_message and "No orderbook exists" in error_message:
+        return _build_basic_snapshot(
+            token_id=token_id,
+            snapshot_ts=snapshot_ts,
+            status="no_orderbook",
+            reason=error_message,
+        )
+
+    return _build_basic_snapshot(
+        token_id=token_id,
+        snapshot_ts=snapshot_ts,
+        status="error",
+        reason=error_message or f"HTTP {status_code}",
+    )
+
+
+def _fetch_book_timed(clob_client: ClobClient, token_id: str):
+    started = time.perf_counter()
+    try:
+        response = clob_client.fetch_book_response(token_id)
+        error = None
+    except Exception as exc:
+        response = None
+        error = exc
+    return response, error, (time.perf_counter() - started) * 1000.0
+
+
+def snapshot_books_concurrently(
     token_ids: list[str],
     clob_client: ClobClient,
-    max_tokens: int = 200,
+    snapshot_ts: Optional[datetime] = None,
+    max_attempts: Optional[int] = None,
+    min_ok_target: Optional[int] = None,
+    max_concurrency: int = DEFAULT_SNAPSHOT_CONCURRENCY,
     depth_band_bps: float = DEFAULT_DEPTH_BAND_BPS,
     notional_sizes: Optional[list[float]] = None,
 ) -> SnapshotBatchResult:
     """
-    Snapshot multiple tokens with rate limiting and error handling.
+    Fetch CLOB books for many tokens concurrently and compute their snapshots.
+
+    Up to ``max_concurrency`` fetches run at once through the shared
+    ``clob_client`` (whose per-host rate budget throttles the whole batch).
+    A token is only started while the OK snapshots seen so far plus the
+    fetches still in flight are below ``min_ok_target``, so the set of tokens
+    attempted is the same prefix a sequential loop would attempt. Tokens never
+    started are returned in ``tokens_skipped_limit``.
+
+    Snapshots and ``token_timings`` are returned in input order, ready for a
+    single bulk insert.
 
     Args:
-        token_ids: List of token IDs to snapshot
+        token_ids: Tokens in priority order (duplicates are ignored)
         clob_client: CLOB API client
-        max_tokens: Maximum tokens to process (default 200)
+        snapshot_ts: Timestamp for every snapshot (defaults to now)
+        max_attempts: Maximum tokens to fetch (default: all)
+        min_ok_target: Stop starting fetches once this many are OK (default: no target)
+        max_concurrency: Maximum fetches in flight
         depth_band_bps: Band for depth calculation (default 50bps)
         notional_sizes: List of notional USD sizes for slippage
 
     Returns:
-        SnapshotBatchResult with all snapshots and statistics
+        SnapshotBatchResult with snapshots, counters and per-token timings
     """
+    if snapshot_ts is None:
+        snapshot_ts = datetime.utcnow()
     if notional_sizes is None:
         notional_sizes = DEFAULT_NOTIONALS
 
     result = SnapshotBatchResult()
-    snapshot_ts = datetime.utcnow()
-
-    # Deduplicate and limit
-    unique_tokens = list(dict.fromkeys(token_ids))  # Preserve order, remove dupes
-    tokens_to_process = unique_tokens[:max_tokens]
-    result.tokens_skipped_limit = unique_tokens[max_tokens:]
-
-    result.tokens_attempted = len(tokens_to_process)
-
-    for token_id in tokens_to_process:
-        try:
-            snapshot = snapshot_token_book(
+    unique_tokens = list(dict.fromkeys(token_ids))
+    if max_attempts is None:
+        max_attempts = len(unique_tokens)
+    ok_target = min_ok_target if min_ok_target is not None else len(unique_tokens) + 1
+    max_concurrency = max(int(max_concurrency), 1)
+
+    fetched: dict[int, tuple] = {}
+    ok_done = 0
+    next_idx = 0
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        in_flight: dict = {}
+        while True:
+            while (
+                next_idx < len(unique_tokens)
+                and next_idx < max_attempts
+                and len(in_flight) < max_concurrency
+                and ok_done + len(in_flight) < ok_target
+            ):
+                future = pool.submit(_fetch_book_timed, clob_client, unique_tokens[next_idx])
+                in_flight[future] = next_idx
+                next_idx += 1
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = in_flight.pop(future)
+                response, error, fetch_ms = future.result()
+                if error is None and response.status_code == 200:
+                    # Parse now so the OK count can gate further fetches.
+                    snapshot = snapshot_from_book_response(
+                        unique_tokens[idx],
+                        response,
+                        snapshot_ts,
+                        depth_band_bps=depth_band_bps,
+                        notional_sizes=notional_sizes,
+                    )
+                    if snapshot.status == "ok":
+                        ok_done += 1
+                    fetched[idx] = (response, error, fetch_ms, snapshot)
+                else:
+                    fetched[idx] = (response, error, fetch_ms, None)
+
+    result.fetch_wall_ms = round((time.perf_counter() - started) * 1000.0, 2)
+    result.tokens_attempted = next_idx
+    result.tokens_skipped_limit = unique_tokens[next_idx:]
+
+    for idx in range(next_idx):
+        token_id = unique_tokens[idx]
+        response, error, fetch_ms, snapshot = fetched[idx]
+        http_status = response.status_code if response is not None else None
+        if error is not None:
+            logger.warning(f"Failed to fetch orderbook for {token_id}: {error}")
+            snapshot = _build_basic_snapshot(
                 token_id=token_id,
-                clob_client=clob_client,
                 snapshot_ts=snapshot_ts,
+                status="error",
+                reason=str(error),
+            )
+        elif snapshot is None:
+            snapshot = snapshot_from_book_response(
+                token_id,
+                response,
+                snapshot_ts,
                 depth_band_bps=depth_band_bps,
                 notional_sizes=notional_sizes,
             )
-            result.snapshots.append(snapshot)
-
-            if snapshot.status == "ok":
-                result.tokens_ok += 1
-            elif snapshot.status == "empty":
-                result.tokens_empty += 1
-            elif snapshot.status == "one_sided":
-                result.tokens_one_sided += 1
-            elif snapshot.status == "no_orderbook":
-                result.tokens_no_orderbook += 1
-            elif snapshot.status == "error":
-                result.tokens_error += 1
-                if snapshot.reason:
-                    if "HTTP 429" in snapshot.reason:
-                        result.tokens_http_429 += 1
-                    elif "HTTP 5" in snapshot.reason:
-                        result.tokens_http_5xx += 1
-                result.errors.append({
-                    "token_id": token_id,
-                    "reason": snapshot.reason,
-                })
-        except Exception as exc:
-            logger.error(f"Unexpected error snapshotting {token_id}: {exc}")
-            result.tokens_error += 1
-            exc_str = str(exc)
-            result.errors.append({
-                "token_id": token_id,
-                "reason": exc_str,
-            })
+        result.record(snapshot, http_status=http_status)
+        result.token_timings.append({
+            "token_id": token_id,
+            "status": snapshot.status,
+            "http_status": http_status,
+            "fetch_ms": round(fetch_ms, 2),
+        })
 
     logger.info(
         f"Snapshot complete: attempted={result.tokens_attempted}, "
         f"ok={result.tokens_ok}, empty={result.tokens_empty}, "
         f"one_sided={result.tokens_one_sided}, no_orderbook={result.tokens_no_orderbook}, "
-        f"error={result.tokens_error}"
+        f"error={result.tokens_error}, fetch_wall_ms={result.fetch_wall_ms}"
     )
 
     return result
 
 
+def snapshot_tokens(
+    token_ids: list[str],
+    clob_client: ClobClient,
+    max_tokens: int = 200,
+    depth_band_bps: float = DEFAULT_DEPTH_BAND_BPS,
+    notional_sizes: Optional[list[float]] = None,
+    max_concurrency: int = DEFAULT_SNAPSHOT_CONCURRENCY,
+) -> SnapshotBatchResult:
+    """
+    Snapshot multiple tokens with rate limiting and error handling.
+
+    Args:
+        token_ids: List of token IDs to snapshot
+        clob_client: CLOB API client
+        max_tokens: Maximum tokens to process (default 200)
+        depth_band_bps: Band for depth calculation (default 50bps)
+        notional_sizes: List of notional USD sizes for slippage
+        max_concurrency: Maximum book fetches in flight
+
+    Returns:
+        SnapshotBatchResult with all snapshots and statistics
+    """
+    return snapshot_books_concurrently(
+        token_ids,
+        clob_client,
+        max_attempts=max_tokens,
+        max_concurrency=max_concurrency,
+        depth_band_bps=depth_band_bps,
+        notional_sizes=notional_sizes,
+    )
+
+
 def get_insert_columns() -> list[str]:
     """Get column names for ClickHouse insert."""
     return [
@@ -13,6 +13,7 @@ __all__ = [
     "EvalReport",
     "SentenceTransformerEmbedder",
     "TextChunk",
+    "WarmRagResources",
     "build_chunk_metadata",
     "build_chroma_where",
     "build_index",
@@ -22,6 +23,7 @@ __all__ = [
     "compute_doc_id",
     "lexical_query",
     "lexical_search",
+    "list_indexed_doc_ids",
     "list_indexed_file_paths",
     "load_suite",
     "query_index",
@@ -29,6 +31,7 @@ __all__ = [
     "reciprocal_rank_fusion",
     "rerank_results",
     "run_eval",
+    "run_query",
     "write_manifest",
     "write_report",
 ]
@@ -44,6 +47,7 @@ _EXPORTS: dict[str, tuple[str, str]] = {
         "SentenceTransformerEmbedder",
     ),
     "TextChunk": ("packages.polymarket.rag.chunker", "TextChunk"),
+    "WarmRagResources": ("packages.polymarket.rag.service", "WarmRagResources"),
     "build_chunk_metadata": ("packages.polymarket.rag.metadata", "build_chunk_metadata"),
     "build_chroma_where": ("packages.polymarket.rag.query", "build_chroma_where"),
     "build_index": ("packages.polymarket.rag.index", "build_index"),
@@ -53,6 +57,10 @@ _EXPORTS: dict[str, tuple[str, str]] = {
     "compute_doc_id": ("packages.polymarket.rag.metadata", "compute_doc_id"),
     "lexical_query": ("packages.polymarket.rag.lexical", "lexical_query"),
     "lexical_search": ("packages.polymarket.rag.lexical", "lexical_search"),
+    "list_indexed_doc_ids": (
+        "packages.polymarket.rag.lexical",
+        "list_indexed_doc_ids",
+    ),
     "list_indexed_file_paths": (
         "packages.polymarket.rag.lexical",
         "list_indexed_file_paths",
@@ -66,6 +74,7 @@ _EXPORTS: dict[str, tuple[str, str]] = {
     ),
     "rerank_results": ("packages.polymarket.rag.reranker", "rerank_results"),
     "run_eval": ("packages.polymarket.rag.eval", "run_eval"),
+    "run_query": ("packages.polymarket.rag.service", "run_query"),
     "write_manifest": ("packages.polymarket.rag.manifest", "write_manifest"),
     "write_report": ("packages.polymarket.rag.eval", "write_report"),
 }
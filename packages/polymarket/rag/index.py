@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import json
 import os
+import queue
 import re
 import shutil
 import stat
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Iterable, List, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 from .chunker import TextChunk, chunk_text
 from .defaults import RAG_DEFAULT_COLLECTION, RAG_DEFAULT_PERSIST_DIR
@@ -18,10 +21,11 @@ from .lexical import (
     clear_all as _lexical_clear_all,
     delete_file_chunks as _lexical_delete_file,
     insert_chunks as _lexical_insert,
+    list_indexed_doc_ids as _lexical_list_doc_ids,
     list_indexed_file_paths as _lexical_list_paths,
     open_lexical_db,
 )
-from .manifest import write_manifest
+from .manifest import SCHEMA_VERSION, bump_index_generation, write_manifest
 from .metadata import build_chunk_metadata, canonicalize_rel_path, compute_chunk_id, compute_doc_id
 
 ALLOWED_ROOTS = {"kb", "artifacts"}
@@ -29,6 +33,10 @@ DEFAULT_COLLECTION = RAG_DEFAULT_COLLECTION
 DEFAULT_PERSIST_DIR = RAG_DEFAULT_PERSIST_DIR
 DEFAULT_MANIFEST_PATH = Path("kb") / "rag" / "manifests" / "index_manifest.json"
 DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+# Chunks embedded per embedder call; chunks from many files share a batch.
+DEFAULT_EMBED_BATCH_SIZE = 512
+# Files read + chunked ahead of the embedder by the background reader.
+DEFAULT_PREFETCH_FILES = 64
 
 TEXT_SUFFIXES = {
     ".md",
@@ -77,6 +85,7 @@ class IndexSummary:
     skipped_binary: int = 0
     skipped_too_big: int = 0
     skipped_decode: int = 0
+    skipped_unchanged: int = 0
 
 
 @dataclass
@@ -90,6 +99,7 @@ class IndexProgress:
     chunks_indexed: int
     last_path: str
     is_final: bool = False
+    skipped_unchanged: int = 0
 
 
 @dataclass
@@ -243,6 +253,141 @@ def _clear_rebuild_directory(persist_path: Path, repo_root: Path) -> bool:
         return False
 
 
+_T = TypeVar("_T")
+_PREFETCH_DONE = object()
+
+
+@dataclass
+class _PreparedFile:
+    """One scanned file, read and chunked off the embedding thread."""
+
+    path: Path
+    rel_path: str
+    status: str  # "ready", "unchanged", "empty", "binary", "too_big", "decode"
+    doc_id: str = ""
+    chunks: List[TextChunk] = field(default_factory=list)
+
+
+def _prepare_file(
+    path: Path,
+    repo_root: Path,
+    *,
+    max_bytes: int,
+    chunk_size: int,
+    overlap: int,
+    known_doc_ids: Set[str],
+) -> _PreparedFile:
+    rel_path = canonicalize_rel_path(path.relative_to(repo_root).as_posix())
+
+    skip_reason = _classify_skip_reason(path, max_bytes=max_bytes)
+    if skip_reason is not None:
+        return _PreparedFile(path=path, rel_path=rel_path, status=skip_reason)
+
+    raw_bytes = _load_bytes(path)
+    try:
+        text = raw_bytes.decode("utf-8")
+    except UnicodeDecodeError:
+        return _PreparedFile(path=path, rel_path=rel_path, status="decode")
+    if not text.strip():
+        return _PreparedFile(path=path, rel_path=rel_path, status="empty")
+
+    # doc_id hashes path + bytes, so an indexed doc_id means identical content.
+    doc_id = compute_doc_id(rel_path, raw_bytes)
+    if doc_id in known_doc_ids:
+        return _PreparedFile(path=path, rel_path=rel_path, status="unchanged", doc_id=doc_id)
+
+    chunks = chunk_text(text, chunk_size=chunk_size, overlap=overlap)
+    if not chunks:
+        return _PreparedFile(path=path, rel_path=rel_path, status="empty")
+    return _PreparedFile(path=path, rel_path=rel_path, status="ready", doc_id=doc_id, chunks=chunks)
+
+
+def _prefetch(items: Iterable[_T], depth: int) -> Iterator[_T]:
+    """Produce *items* on a background thread, buffering up to *depth* ahead.
+
+    File reads, hashing and chunking then overlap with embedding on the
+    caller's thread. Producer exceptions are re-raised in the caller.
+    ``depth <= 0`` iterates inline.
+    """
+    if depth <= 0:
+        yield from items
+        return
+
+    buffer: "queue.Queue[tuple]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _put(entry: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in items:
+                if not _put((item, None)):
+                    return
+        except BaseException as exc:  # noqa: BLE001 - re-raised by the consumer
+            _put((_PREFETCH_DONE, exc))
+            return
+        _put((_PREFETCH_DONE, None))
+
+    thread = threading.Thread(target=_produce, name="rag-index-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, exc = buffer.get()
+            if item is _PREFETCH_DONE:
+                if exc is not None:
+                    raise exc
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _manifest_matches(
+    manifest_path: Path,
+    *,
+    embedder: BaseEmbedder,
+    chunk_size: int,
+    overlap: int,
+    collection_name: str,
+) -> bool:
+    """True when the existing manifest was built with the same embedding + chunking settings."""
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    if not isinstance(manifest, dict):
+        return False
+    expected = {
+        "schema_version": SCHEMA_VERSION,
+        "embed_model": embedder.model_name,
+        "embed_dim": int(embedder.dimension),
+        "chunk_size": int(chunk_size),
+        "overlap": int(overlap),
+    }
+    if any(manifest.get(key) != value for key, value in expected.items()):
+        return False
+    return manifest.get("collection_name", collection_name) == collection_name
+
+
+def _chroma_indexed_doc_ids(collection) -> set[str]:
+    """Return the set of distinct ``doc_id`` values stored in a Chroma collection."""
+    result = collection.get(include=["metadatas"])
+    doc_ids: set[str] = set()
+    for meta in result.get("metadatas", []) or []:
+        doc_id = (meta or {}).get("doc_id")
+        if doc_id:
+            doc_ids.add(doc_id)
+    return doc_ids
+
+
 def build_index(
     *,
     roots: List[str],
@@ -252,19 +397,35 @@ def build_index(
     persist_directory: Path = DEFAULT_PERSIST_DIR,
     collection_name: str = DEFAULT_COLLECTION,
     rebuild: bool = False,
+    incremental: bool = False,
     manifest_path: Optional[Path] = None,
     lexical_db_path: Optional[Path] = DEFAULT_LEXICAL_DB_PATH,
     max_bytes: int = DEFAULT_MAX_BYTES,
+    embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+    prefetch_files: int = DEFAULT_PREFETCH_FILES,
     progress_every_files: int = 100,
     progress_every_chunks: int = 100,
     progress_callback: Optional[Callable[[IndexProgress], None]] = None,
 ) -> IndexSummary:
+    """Chunk, embed and store every text file under *roots*.
+
+    With ``incremental=True`` (ignored on ``rebuild``) files whose doc_id is
+    already present in both the vector and lexical indexes are skipped
+    without re-chunking or re-embedding. Skipping only applies when the
+    existing manifest records the same embedder and chunking settings.
+
+    Chunks from consecutive files are embedded together in batches of about
+    *embed_batch_size*; each batch is written with one Chroma upsert and one
+    lexical transaction. Up to *prefetch_files* files are read and chunked
+    ahead on a background thread (0 disables the reader thread).
+    """
     try:
         import chromadb
     except ImportError as exc:
         raise RuntimeError("chromadb is required. Install requirements-rag.txt.") from exc
 
     collection_name = sanitize_collection_name(collection_name)
+    embed_batch_size = max(int(embed_batch_size), 1)
 
     repo_root = _resolve_repo_root()
     resolved_roots: List[Path] = []
@@ -274,6 +435,10 @@ def build_index(
         resolved_roots.append(resolved)
         indexed_roots.append(rel)
 
+    final_manifest_path = manifest_path or DEFAULT_MANIFEST_PATH
+    if not final_manifest_path.is_absolute():
+        final_manifest_path = repo_root / final_manifest_path
+
     persist_path = Path(persist_directory)
     if not persist_path.is_absolute():
         persist_path = (repo_root / persist_path).resolve()
@@ -305,12 +470,26 @@ def build_index(
         if rebuild:
             _lexical_clear_all(lex_conn)
 
+    # --- incremental: doc_ids already present in every enabled index ---
+    known_doc_ids: Set[str] = set()
+    if incremental and not rebuild and _manifest_matches(
+        final_manifest_path,
+        embedder=embedder,
+        chunk_size=chunk_size,
+        overlap=overlap,
+        collection_name=collection_name,
+    ):
+        known_doc_ids = _chroma_indexed_doc_ids(collection)
+        if lex_conn is not None:
+            known_doc_ids &= _lexical_list_doc_ids(lex_conn)
+
     files_indexed = 0
     chunks_indexed = 0
     scanned_files = 0
     skipped_binary = 0
     skipped_too_big = 0
     skipped_decode = 0
+    skipped_unchanged = 0
     last_progress_scan = 0
     last_progress_chunks = 0
     last_path = ""
@@ -334,122 +513,129 @@ def build_index(
                 chunks_indexed=chunks_indexed,
                 last_path=last_path,
                 is_final=is_final,
+                skipped_unchanged=skipped_unchanged,
             )
         )
         last_progress_scan = scanned_files
         last_progress_chunks = chunks_indexed
 
-    for path in _iter_candidate_files(resolved_roots, repo_root):
-        scanned_files += 1
-        last_path = canonicalize_rel_path(path.relative_to(repo_root).as_posix())
-
-        skip_reason = _classify_skip_reason(path, max_bytes=max_bytes)
-        if skip_reason == "binary":
-            skipped_binary += 1
-            _emit_progress()
-            continue
-        if skip_reason == "too_big":
-            skipped_too_big += 1
-            _emit_progress()
-            continue
-
-        raw_bytes = _load_bytes(path)
-        try:
-            text = raw_bytes.decode("utf-8")
-        except UnicodeDecodeError:
-            skipped_decode += 1
-            _emit_progress()
-            continue
-        if not text.strip():
-            _emit_progress()
-            continue
-        chunks: List[TextChunk] = chunk_text(text, chunk_size=chunk_size, overlap=overlap)
-        if not chunks:
-            _emit_progress()
-            continue
-        embeddings = embedder.embed_texts([chunk.text for chunk in chunks])
-        rel_path = last_path
-        doc_id = compute_doc_id(rel_path, raw_bytes)
-
-        # --- delete-before-insert: remove stale chunks for this file ---
-        # This handles content changes (different chunks) and file shrinkage
-        # (fewer chunks) without leaving orphans.  On a fresh/rebuild index
-        # the delete is a harmless no-op.
-        if not rebuild:
-            try:
-                collection.delete(where={"file_path": rel_path})
-            except Exception:
-                # Chroma versions < 0.4 may not support where-delete;
-                # fall through to upsert which is still safe for same-count
-                # changes (but may leave orphans on shrinkage).
-                pass
-            if lex_conn is not None:
-                _lexical_delete_file(lex_conn, rel_path)
-
+    def _write_batch(batch: List[_PreparedFile]) -> None:
+        nonlocal files_indexed, chunks_indexed
         ids: List[str] = []
         metadatas: List[dict] = []
         documents: List[str] = []
-        for chunk in chunks:
-            cid = compute_chunk_id(doc_id, chunk.chunk_id, chunk.text)
-            ids.append(cid)
-            metadatas.append(
-                build_chunk_metadata(
-                    rel_path=rel_path,
-                    abs_path=path,
-                    doc_id=doc_id,
+        lex_rows: List[dict] = []
+        for prepared in batch:
+            for chunk in prepared.chunks:
+                cid = compute_chunk_id(prepared.doc_id, chunk.chunk_id, chunk.text)
+                meta = build_chunk_metadata(
+                    rel_path=prepared.rel_path,
+                    abs_path=prepared.path,
+                    doc_id=prepared.doc_id,
                     chunk_index=chunk.chunk_id,
                     start_word=chunk.start_word,
                     end_word=chunk.end_word,
                 )
-            )
-            documents.append(chunk.text)
-
-        if hasattr(collection, "upsert"):
-            collection.upsert(
-                ids=ids,
-                documents=documents,
-                embeddings=embeddings.tolist(),
-                metadatas=metadatas,
-            )
-        else:
-            collection.add(
-                ids=ids,
-                documents=documents,
-                embeddings=embeddings.tolist(),
-                metadatas=metadatas,
+                ids.append(cid)
+                metadatas.append(meta)
+                documents.append(chunk.text)
+                if lex_conn is not None:
+                    lex_rows.append({
+                        "chunk_id": cid,
+                        "doc_id": prepared.doc_id,
+                        "file_path": prepared.rel_path,
+                        "chunk_index": chunk.chunk_id,
+                        "doc_type": meta.get("doc_type"),
+                        "user_slug": meta.get("user_slug"),
+                        "proxy_wallet": meta.get("proxy_wallet"),
+                        "is_private": meta.get("is_private", True),
+                        "created_at": meta.get("created_at"),
+                        "chunk_text": chunk.text,
+                    })
+
+        embeddings = embedder.embed_texts(documents).tolist()
+
+        # --- delete-before-insert: remove stale chunks for these files ---
+        # This handles content changes (different chunks) and file shrinkage
+        # (fewer chunks) without leaving orphans.  On a fresh/rebuild index
+        # the delete is a harmless no-op.
+        if not rebuild:
+            for prepared in batch:
+                try:
+                    collection.delete(where={"file_path": prepared.rel_path})
+                except Exception:
+                    # Chroma versions < 0.4 may not support where-delete;
+                    # fall through to upsert which is still safe for same-count
+                    # changes (but may leave orphans on shrinkage).
+                    pass
+
+        write = collection.upsert if hasattr(collection, "upsert") else collection.add
+        for start in range(0, len(ids), embed_batch_size):
+            end = start + embed_batch_size
+            write(
+                ids=ids[start:end],
+                documents=documents[start:end],
+                embeddings=embeddings[start:end],
+                metadatas=metadatas[start:end],
             )
 
-        # --- lexical: mirror the same chunks into FTS5 ---
+        # --- lexical: mirror the same chunks into FTS5, one transaction per batch ---
         if lex_conn is not None:
-            lex_rows = []
-            for i, chunk in enumerate(chunks):
-                lex_rows.append({
-                    "chunk_id": ids[i],
-                    "doc_id": doc_id,
-                    "file_path": rel_path,
-                    "chunk_index": chunk.chunk_id,
-                    "doc_type": metadatas[i].get("doc_type"),
-                    "user_slug": metadatas[i].get("user_slug"),
-                    "proxy_wallet": metadatas[i].get("proxy_wallet"),
-                    "is_private": metadatas[i].get("is_private", True),
-                    "created_at": metadatas[i].get("created_at"),
-                    "chunk_text": chunk.text,
-                })
-            _lexical_insert(lex_conn, lex_rows)
-            lex_conn.commit()
-
-        files_indexed += 1
-        chunks_indexed += len(chunks)
-        _emit_progress()
+            with lex_conn:
+                if not rebuild:
+                    for prepared in batch:
+                        _lexical_delete_file(lex_conn, prepared.rel_path)
+                _lexical_insert(lex_conn, lex_rows)
+
+        files_indexed += len(batch)
+        chunks_indexed += len(ids)
+
+    prepared_files = _prefetch(
+        (
+            _prepare_file(
+                path,
+                repo_root,
+                max_bytes=max_bytes,
+                chunk_size=chunk_size,
+                overlap=overlap,
+                known_doc_ids=known_doc_ids,
+            )
+            for path in _iter_candidate_files(resolved_roots, repo_root)
+        ),
+        prefetch_files,
+    )
 
-    if lex_conn is not None:
-        lex_conn.close()
+    pending: List[_PreparedFile] = []
+    pending_chunks = 0
+    try:
+        for prepared in prepared_files:
+            scanned_files += 1
+            last_path = prepared.rel_path
+            if prepared.status == "binary":
+                skipped_binary += 1
+            elif prepared.status == "too_big":
+                skipped_too_big += 1
+            elif prepared.status == "decode":
+                skipped_decode += 1
+            elif prepared.status == "unchanged":
+                skipped_unchanged += 1
+            elif prepared.status == "ready":
+                pending.append(prepared)
+                pending_chunks += len(prepared.chunks)
+                if pending_chunks >= embed_batch_size:
+                    _write_batch(pending)
+                    pending = []
+                    pending_chunks = 0
+            _emit_progress()
 
-    _emit_progress(is_final=True)
+        if pending:
+            _write_batch(pending)
+    finally:
+        prepared_files.close()
+        if lex_conn is not None:
+            lex_conn.close()
 
-    final_manifest_path = manifest_path or DEFAULT_MANIFEST_PATH
-    if not final_manifest_path.is_absolute():
-        final_manifest_path = repo_root / final_manifest_path
+    _emit_progress(is_final=True)
 
     write_manifest(
         final_manifest_path,
@@ -461,6 +647,7 @@ def build_index(
         repo_root=repo_root,
         collection_name=collection_name,
     )
+    bump_index_generation(persist_path)
 
     return IndexSummary(
         files_indexed=files_indexed,
@@ -470,6 +657,7 @@ def build_index(
         skipped_binary=skipped_binary,
         skipped_too_big=skipped_too_big,
         skipped_decode=skipped_decode,
+        skipped_unchanged=skipped_unchanged,
     )
 
 
@@ -571,6 +759,8 @@ def reconcile_index(
     if lex_conn is not None:
         lex_conn.commit()
         lex_conn.close()
+    if vector_deleted:
+        bump_index_generation(persist_path)
 
     return ReconcileSummary(
         disk_files=len(disk_paths),
@@ -47,7 +47,7 @@ import json
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from packages.polymarket.rag.freshness import (
     compute_freshness_modifier,
@@ -262,9 +262,7 @@ class KnowledgeStore:
         The ID is derived from ``source_url`` and ``content_hash``.  Inserting
         the same document twice is idempotent (INSERT OR IGNORE).
         """
-        url_part = source_url or ""
-        hash_part = content_hash or ""
-        doc_id = _sha256_id("source_document", url_part, hash_part)
+        doc_id = self.source_document_id(source_url, content_hash)
 
         self._conn.execute(
             """INSERT OR IGNORE INTO source_documents
@@ -280,6 +278,13 @@ class KnowledgeStore:
         self._conn.commit()
         return doc_id
 
+    @staticmethod
+    def source_document_id(
+        source_url: Optional[str], content_hash: Optional[str]
+    ) -> str:
+        """Return the ID ``add_source_document`` assigns to this URL/hash pair."""
+        return _sha256_id("source_document", source_url or "", content_hash or "")
+
     def get_source_document(self, doc_id: str) -> Optional[dict]:
         """Return a source document dict by ID, or None if not found."""
         row = self._conn.execute(
@@ -287,6 +292,20 @@ class KnowledgeStore:
         ).fetchone()
         return dict(row) if row else None
 
+    def iter_source_documents(self, batch_size: int = 500) -> Iterator[dict]:
+        """Yield every source document dict, ordered by ID, in keyset-paged batches."""
+        last_id = ""
+        while True:
+            rows = self._conn.execute(
+                "SELECT * FROM source_documents WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, batch_size),
+            ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield dict(row)
+            last_id = rows[-1]["id"]
+
     # ------------------------------------------------------------------
     # CRUD: derived_claims
     # ------------------------------------------------------------------
@@ -62,13 +62,19 @@ def _sanitize_fts_query(query: str) -> str:
 # Database lifecycle
 # ---------------------------------------------------------------------------
 
-def open_lexical_db(lexical_db_path: Path) -> sqlite3.Connection:
-    """Open (or create) the FTS5 lexical database at *lexical_db_path*."""
+def open_lexical_db(
+    lexical_db_path: Path, *, check_same_thread: bool = True
+) -> sqlite3.Connection:
+    """Open (or create) the FTS5 lexical database at *lexical_db_path*.
+
+    Pass ``check_same_thread=False`` only when the caller serializes access
+    to the connection itself (e.g. the resident query service).
+    """
     lexical_db_path = Path(lexical_db_path)
     if lexical_db_path.suffix == "":
         lexical_db_path = lexical_db_path / "lexical.sqlite3"
     lexical_db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(lexical_db_path))
+    conn = sqlite3.connect(str(lexical_db_path), check_same_thread=check_same_thread)
     conn.execute("PRAGMA journal_mode=WAL")
     conn.row_factory = sqlite3.Row
     _init_schema(conn)
@@ -93,6 +99,7 @@ def _init_schema(conn: sqlite3.Connection) -> None:
         CREATE INDEX IF NOT EXISTS idx_chunks_is_private ON chunks(is_private);
         CREATE INDEX IF NOT EXISTS idx_chunks_user_slug  ON chunks(user_slug);
         CREATE INDEX IF NOT EXISTS idx_chunks_doc_type   ON chunks(doc_type);
+        CREATE INDEX IF NOT EXISTS idx_chunks_doc_id     ON chunks(doc_id);
     """)
     # FTS5 content-sync table backed by the chunks table.
     # porter: English stemming.  unicode61: unicode-aware tokeniser.
@@ -141,6 +148,12 @@ def list_indexed_file_paths(conn: sqlite3.Connection) -> set[str]:
     return {row[0] for row in rows}
 
 
+def list_indexed_doc_ids(conn: sqlite3.Connection) -> set[str]:
+    """Return the set of distinct ``doc_id`` values currently in the lexical DB."""
+    rows = conn.execute("SELECT DISTINCT doc_id FROM chunks").fetchall()
+    return {row[0] for row in rows}
+
+
 def delete_file_chunks(conn: sqlite3.Connection, file_path: str) -> None:
     """Remove all chunks for *file_path*.  Triggers update FTS automatically."""
     conn.execute("DELETE FROM chunks WHERE file_path = ?", (file_path,))
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
+import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -11,6 +13,9 @@ from typing import Any, Dict, List, Optional
 # Bump when the indexing schema changes in a way that requires re-indexing.
 SCHEMA_VERSION = 3
 
+# Written into the Chroma persist directory after every index write.
+INDEX_GENERATION_FILENAME = "index_generation"
+
 
 def _git_sha(repo_root: Path) -> str:
     try:
@@ -56,3 +61,26 @@ def write_manifest(
         manifest["collection_name"] = collection_name
     manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
     return manifest
+
+
+def bump_index_generation(persist_path: Path) -> str:
+    """Write a fresh generation stamp into the Chroma persist directory.
+
+    Long-lived readers (``rag-serve``) compare the stamp to decide when to
+    reopen their Chroma handles; chroma.sqlite3 itself is updated in place.
+    """
+    persist_path.mkdir(parents=True, exist_ok=True)
+    stamp = uuid.uuid4().hex
+    target = persist_path / INDEX_GENERATION_FILENAME
+    tmp_path = target.with_name(target.name + ".tmp")
+    tmp_path.write_text(stamp, encoding="utf-8")
+    os.replace(tmp_path, target)
+    return stamp
+
+
+def read_index_generation(persist_path: Path) -> Optional[str]:
+    """The current generation stamp of *persist_path*, or None if never written."""
+    try:
+        return (persist_path / INDEX_GENERATION_FILENAME).read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from .embedder import BaseEmbedder
 from .index import DEFAULT_COLLECTION, DEFAULT_PERSIST_DIR, sanitize_collection_name
@@ -18,6 +18,9 @@ from .lexical import (
 )
 from .reranker import BaseReranker, rerank_results
 
+if TYPE_CHECKING:
+    from .service import WarmRagResources
+
 
 def _resolve_repo_root() -> Path:
     return Path.cwd()
@@ -90,15 +93,11 @@ def _run_vector_query(
     collection_name: str,
     where_filter: Optional[dict],
     filter_prefixes: Optional[List[str]],
+    resources: Optional["WarmRagResources"] = None,
 ) -> List[dict]:
     if n_results <= 0 or output_limit <= 0:
         return []
 
-    try:
-        import chromadb
-    except ImportError as exc:
-        raise RuntimeError("chromadb is required. Install requirements-rag.txt.") from exc
-
     collection_name = sanitize_collection_name(collection_name)
 
     repo_root = _resolve_repo_root()
@@ -106,11 +105,21 @@ def _run_vector_query(
     if not persist_path.is_absolute():
         persist_path = (repo_root / persist_path).resolve()
 
-    client = chromadb.PersistentClient(path=str(persist_path))
-    try:
-        collection = client.get_collection(collection_name)
-    except Exception:
-        return []
+    if resources is not None:
+        collection = resources.get_collection(persist_path, collection_name)
+        if collection is None:
+            return []
+    else:
+        try:
+            import chromadb
+        except ImportError as exc:
+            raise RuntimeError("chromadb is required. Install requirements-rag.txt.") from exc
+
+        client = chromadb.PersistentClient(path=str(persist_path))
+        try:
+            collection = client.get_collection(collection_name)
+        except Exception:
+            return []
 
     query_embedding = embedder.embed_query(question)
 
@@ -122,7 +131,18 @@ def _run_vector_query(
     if where_filter is not None:
         query_kwargs["where"] = where_filter
 
-    result = collection.query(**query_kwargs)
+    try:
+        result = collection.query(**query_kwargs)
+    except Exception:
+        if resources is None:
+            raise
+        # A cached handle can go stale when the index is rebuilt underneath
+        # a long-lived process; reopen once before giving up.
+        resources.invalidate_collection(persist_path, collection_name)
+        collection = resources.get_collection(persist_path, collection_name)
+        if collection is None:
+            return []
+        result = collection.query(**query_kwargs)
 
     ids = result.get("ids", [[]])[0]
     documents = result.get("documents", [[]])[0]
@@ -180,8 +200,13 @@ def _run_lexical_query(
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
     include_archive: bool = False,
+    resources: Optional["WarmRagResources"] = None,
 ) -> List[dict]:
-    """Open the lexical DB, run an FTS5 search, close, and return results."""
+    """Run an FTS5 search against the lexical DB and return results.
+
+    Without *resources* the DB is opened and closed around the search;
+    with them the resident connection is reused.
+    """
     if k <= 0:
         return []
 
@@ -189,26 +214,32 @@ def _run_lexical_query(
     if not lex_path.is_absolute():
         lex_path = (_resolve_repo_root() / lex_path).resolve()
 
-    try:
-        conn = open_lexical_db(lex_path)
-    except Exception:
-        return []
+    search_kw = dict(
+        k=k,
+        user_slug=user_slug,
+        doc_types=doc_types,
+        private_only=private_only,
+        public_only=public_only,
+        date_from=date_from,
+        date_to=date_to,
+        include_archive=include_archive,
+    )
 
-    try:
-        results = lexical_search(
-            conn,
-            question,
-            k=k,
-            user_slug=user_slug,
-            doc_types=doc_types,
-            private_only=private_only,
-            public_only=public_only,
-            date_from=date_from,
-            date_to=date_to,
-            include_archive=include_archive,
-        )
-    finally:
-        conn.close()
+    if resources is not None:
+        with resources.lexical_connection(lex_path) as conn:
+            if conn is None:
+                return []
+            results = lexical_search(conn, question, **search_kw)
+    else:
+        try:
+            conn = open_lexical_db(lex_path)
+        except Exception:
+            return []
+
+        try:
+            results = lexical_search(conn, question, **search_kw)
+        finally:
+            conn.close()
 
     if filter_prefixes:
         results = [
@@ -249,6 +280,8 @@ def query_index(
     source_family: Optional[str] = None,
     min_freshness: Optional[float] = None,
     top_k_knowledge: int = 25,
+    # --- resident handles (query service) ---
+    resources: Optional["WarmRagResources"] = None,
 ) -> List[dict]:
     if hybrid and lexical_only:
         raise ValueError("hybrid and lexical_only are mutually exclusive")
@@ -280,6 +313,7 @@ def query_index(
             k=k,
             lexical_db_path=lexical_db_path,
             filter_prefixes=filter_prefixes,
+            resources=resources,
             **_filter_kw,
         )
     # --- vector (and hybrid) path: embedder required ---
@@ -296,6 +330,7 @@ def query_index(
             collection_name=collection_name,
             where_filter=where_filter,
             filter_prefixes=filter_prefixes,
+            resources=resources,
         )
     else:
         # --- hybrid path ---
@@ -312,6 +347,7 @@ def query_index(
             collection_name=collection_name,
             where_filter=where_filter,
             filter_prefixes=filter_prefixes,
+            resources=resources,
         )
 
         lexical_results = _run_lexical_query(
@@ -319,6 +355,7 @@ def query_index(
             k=lexical_k,
             lexical_db_path=lexical_db_path,
             filter_prefixes=filter_prefixes,
+            resources=resources,
             **_filter_kw,
         )
 
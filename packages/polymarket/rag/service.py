@@ -0,0 +1,619 @@
+"""Resident RAG query service.
+
+Every ``rag-query`` invocation, MCP tool call and research sub-query used to
+load the embedding model (and reranker), open a fresh Chroma client and open
+the FTS5 database before running a single search.  Model load dominates the
+latency of a one-shot query, so this module keeps those resources warm:
+
+WarmRagResources
+    Process-wide cache of embedders and rerankers (keyed by model/device),
+    Chroma collection handles (keyed by persist dir + collection) and FTS5
+    connections.  Query embeddings go through an LRU cache.  Pass it to
+    :func:`query_index` as ``resources=`` or call :meth:`WarmRagResources.query`
+    with a JSON request.
+
+RagQueryServer
+    Localhost HTTP front end (``polytool rag-serve``) so short-lived CLI
+    processes can share one warm process.  ``GET /health`` returns cache
+    stats; ``POST /query`` takes an ``application/json`` request and returns
+    ``{"results"}``.  Requests may only name the server's configured models
+    and index paths under its repo root.
+
+:func:`run_query` is the client entry point: it posts to the service when a
+URL is configured and falls back to in-process warm resources otherwise.
+Nothing here listens on a non-loopback address unless explicitly asked to.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from . import embedder as _embedder_mod
+from . import query as _query_mod
+from . import reranker as _reranker_mod
+from .embedder import DEFAULT_EMBED_MODEL, BaseEmbedder
+from .lexical import open_lexical_db
+from .manifest import read_index_generation
+from .reranker import DEFAULT_RERANK_MODEL, BaseReranker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SERVICE_HOST = "127.0.0.1"
+DEFAULT_SERVICE_PORT = 8765
+DEFAULT_SERVICE_URL = f"http://{DEFAULT_SERVICE_HOST}:{DEFAULT_SERVICE_PORT}"
+SERVICE_URL_ENV = "POLYTOOL_RAG_SERVICE_URL"
+DEFAULT_QUERY_CACHE_SIZE = 1024
+DEFAULT_RERANK_CACHE_FOLDER = "kb/rag/models"
+
+# query_index() keyword arguments accepted verbatim in a service request.
+_QUERY_INDEX_FIELDS = frozenset({
+    "question",
+    "k",
+    "persist_directory",
+    "collection_name",
+    "filter_prefixes",
+    "user_slug",
+    "doc_types",
+    "private_only",
+    "public_only",
+    "date_from",
+    "date_to",
+    "include_archive",
+    "hybrid",
+    "lexical_only",
+    "lexical_db_path",
+    "top_k_vector",
+    "top_k_lexical",
+    "rrf_k",
+    "rerank_top_n",
+    "knowledge_store_path",
+    "source_family",
+    "min_freshness",
+    "top_k_knowledge",
+})
+_PATH_FIELDS = ("persist_directory", "lexical_db_path", "knowledge_store_path")
+# Service-level request fields that select which warm models to use.
+_MODEL_FIELDS = frozenset({
+    "embed_model",
+    "device",
+    "rerank",
+    "rerank_model",
+    "rerank_cache_folder",
+})
+_SERVICE_DEVICES = frozenset({"auto", "cpu", "cuda"})
+
+
+class RagServiceUnavailable(RuntimeError):
+    """Nothing is listening at the service URL (connection refused)."""
+
+
+class RagServiceTimeout(RuntimeError):
+    """The service was reached but did not answer within the timeout."""
+
+
+class CachingQueryEmbedder(BaseEmbedder):
+    """Wrap an embedder with an LRU cache for :meth:`embed_query`.
+
+    Document embedding (``embed_texts``) is passed through uncached.  Cached
+    vectors are returned read-only so a caller cannot corrupt the cache.
+    """
+
+    def __init__(self, embedder: BaseEmbedder, max_entries: int = DEFAULT_QUERY_CACHE_SIZE) -> None:
+        if max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+        self.inner = embedder
+        self.model_name = getattr(embedder, "model_name", "")
+        self.dimension = getattr(embedder, "dimension", 0)
+        self.max_entries = int(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def embed_texts(self, texts: Iterable[str]) -> np.ndarray:
+        return self.inner.embed_texts(texts)
+
+    def embed_query(self, text: str) -> np.ndarray:
+        with self._lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        vector = np.asarray(self.inner.embed_query(text))
+        if self.max_entries == 0:
+            return vector
+        vector = vector.copy()
+        vector.setflags(write=False)
+        with self._lock:
+            self._cache[text] = vector
+            self._cache.move_to_end(text)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return vector
+
+    def cache_info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._cache),
+                "max_entries": self.max_entries,
+            }
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+def _file_identity(path: Path) -> Optional[Tuple[int, int]]:
+    """(device, inode) of *path*, or None if missing; changes when a rebuild replaces it."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _chroma_stamp(persist_path: Path) -> Tuple[Optional[str], Optional[Tuple[int, int, int, int]]]:
+    """What must stay unchanged for a cached Chroma client to still be current.
+
+    Chroma updates chroma.sqlite3 in place, so its inode alone misses
+    incremental indexing and collection rebuilds.  The stamp combines the
+    generation ``rag-index`` writes after every change with the identity,
+    mtime and size of chroma.sqlite3 (for writers that do not bump it).
+    """
+    try:
+        st = (persist_path / "chroma.sqlite3").stat()
+        db_stamp: Optional[Tuple[int, int, int, int]] = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+    except OSError:
+        db_stamp = None
+    return read_index_generation(persist_path), db_stamp
+
+
+def _default_embedder_factory(model_name: str, device: str) -> BaseEmbedder:
+    return _embedder_mod.SentenceTransformerEmbedder(model_name=model_name, device=device)
+
+
+def _default_reranker_factory(model_name: str, device: str, cache_folder: Optional[str]) -> BaseReranker:
+    return _reranker_mod.CrossEncoderReranker(
+        model_name=model_name,
+        device=device,
+        cache_folder=cache_folder,
+    )
+
+
+class _LexicalHandle:
+    __slots__ = ("conn", "identity", "lock")
+
+    def __init__(self, conn: sqlite3.Connection, identity: Optional[Tuple[int, int]]) -> None:
+        self.conn = conn
+        self.identity = identity
+        self.lock = threading.Lock()
+
+
+class WarmRagResources:
+    """Long-lived models and index handles shared by successive queries.
+
+    Thread-safe: model loads and handle (re)opens happen under a lock, each
+    FTS5 connection is used by one query at a time.  Chroma handles are
+    reopened whenever the index generation or chroma.sqlite3 changes (see
+    :func:`_chroma_stamp`); FTS5 connections when the lexical DB file is
+    replaced (``--rebuild``).
+    """
+
+    def __init__(
+        self,
+        *,
+        query_cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
+        embedder_factory: Optional[Callable[[str, str], BaseEmbedder]] = None,
+        reranker_factory: Optional[Callable[[str, str, Optional[str]], BaseReranker]] = None,
+    ) -> None:
+        self.query_cache_size = int(query_cache_size)
+        self._embedder_factory = embedder_factory or _default_embedder_factory
+        self._reranker_factory = reranker_factory or _default_reranker_factory
+        self._lock = threading.RLock()
+        self._embedders: Dict[Tuple[str, str], CachingQueryEmbedder] = {}
+        self._rerankers: Dict[Tuple[str, str, Optional[str]], BaseReranker] = {}
+        self._clients: Dict[str, Tuple[Any, Any]] = {}
+        self._collections: Dict[Tuple[str, str], Any] = {}
+        self._lexical: Dict[str, _LexicalHandle] = {}
+        self.queries_served = 0
+
+    # -- models ---------------------------------------------------------------
+
+    def get_embedder(self, model_name: str = DEFAULT_EMBED_MODEL, device: str = "auto") -> CachingQueryEmbedder:
+        key = (model_name, device)
+        with self._lock:
+            embedder = self._embedders.get(key)
+            if embedder is None:
+                logger.info("Loading embedder %s (device=%s)", model_name, device)
+                embedder = CachingQueryEmbedder(
+                    self._embedder_factory(model_name, device),
+                    max_entries=self.query_cache_size,
+                )
+                self._embedders[key] = embedder
+            return embedder
+
+    def get_reranker(
+        self,
+        model_name: str = DEFAULT_RERANK_MODEL,
+        device: str = "auto",
+        cache_folder: Optional[str] = DEFAULT_RERANK_CACHE_FOLDER,
+    ) -> BaseReranker:
+        key = (model_name, device, cache_folder)
+        with self._lock:
+            reranker = self._rerankers.get(key)
+            if reranker is None:
+                logger.info("Loading reranker %s (device=%s)", model_name, device)
+                reranker = self._reranker_factory(model_name, device, cache_folder)
+                self._rerankers[key] = reranker
+            return reranker
+
+    # -- index handles --------------------------------------------------------
+
+    def get_collection(self, persist_path: Path, collection_name: str) -> Optional[Any]:
+        """Cached Chroma collection, or None if it does not exist (not cached)."""
+        persist_key = str(Path(persist_path))
+        with self._lock:
+            stamp = _chroma_stamp(Path(persist_path))
+            cached_client = self._clients.get(persist_key)
+            if cached_client is not None and cached_client[1] != stamp:
+                self._drop_client(persist_key)
+                cached_client = None
+
+            collection = self._collections.get((persist_key, collection_name))
+            if collection is not None:
+                return collection
+
+            if cached_client is None:
+                try:
+                    import chromadb
+                except ImportError as exc:
+                    raise RuntimeError("chromadb is required. Install requirements-rag.txt.") from exc
+                client = chromadb.PersistentClient(path=persist_key)
+                # The client may have just created or migrated the DB file; record that stamp.
+                self._clients[persist_key] = (client, _chroma_stamp(Path(persist_path)))
+            else:
+                client = cached_client[0]
+
+            try:
+                collection = client.get_collection(collection_name)
+            except Exception:
+                return None
+            self._collections[(persist_key, collection_name)] = collection
+            return collection
+
+    def invalidate_collection(self, persist_path: Path, collection_name: str) -> None:
+        persist_key = str(Path(persist_path))
+        with self._lock:
+            self._collections.pop((persist_key, collection_name), None)
+            self._drop_client(persist_key)
+
+    def _drop_client(self, persist_key: str) -> None:
+        cached = self._clients.pop(persist_key, None)
+        if cached is not None:
+            # chromadb shares one System per path; without this a new
+            # PersistentClient would get the stale one back.
+            clear_cache = getattr(cached[0], "clear_system_cache", None)
+            if callable(clear_cache):
+                clear_cache()
+        for key in [key for key in self._collections if key[0] == persist_key]:
+            del self._collections[key]
+
+    @contextlib.contextmanager
+    def lexical_connection(self, lex_path: Path) -> Iterator[Optional[sqlite3.Connection]]:
+        """Yield the resident FTS5 connection for *lex_path* (None if it cannot be opened)."""
+        db_file = Path(lex_path)
+        if db_file.suffix == "":
+            db_file = db_file / "lexical.sqlite3"
+        key = str(db_file)
+
+        with self._lock:
+            handle = self._lexical.get(key)
+            if handle is not None and handle.identity != _file_identity(db_file):
+                self._lexical.pop(key)
+                with handle.lock:
+                    handle.conn.close()
+                handle = None
+            if handle is None:
+                try:
+                    conn = open_lexical_db(db_file, check_same_thread=False)
+                except Exception:
+                    conn = None
+                if conn is not None:
+                    handle = _LexicalHandle(conn, _file_identity(db_file))
+                    self._lexical[key] = handle
+
+        if handle is None:
+            yield None
+            return
+        with handle.lock:
+            yield handle.conn
+
+    # -- queries --------------------------------------------------------------
+
+    def query(self, request: Dict[str, Any]) -> List[dict]:
+        """Run a JSON-style query request against the warm resources.
+
+        *request* holds :func:`query_index` keyword arguments (``question``
+        required) plus the optional model selectors ``embed_model``,
+        ``device``, ``rerank``, ``rerank_model`` and ``rerank_cache_folder``.
+        """
+        kwargs = _query_kwargs_from_request(request)
+        device = request.get("device") or "auto"
+
+        embedder = None
+        if not kwargs.get("lexical_only"):
+            embedder = self.get_embedder(request.get("embed_model") or DEFAULT_EMBED_MODEL, device)
+        reranker = None
+        if request.get("rerank"):
+            reranker = self.get_reranker(
+                request.get("rerank_model") or DEFAULT_RERANK_MODEL,
+                device,
+                request.get("rerank_cache_folder", DEFAULT_RERANK_CACHE_FOLDER),
+            )
+
+        results = _query_mod.query_index(
+            embedder=embedder,
+            reranker=reranker,
+            resources=self,
+            **kwargs,
+        )
+        with self._lock:
+            self.queries_served += 1
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queries_served": self.queries_served,
+                "embedders": {
+                    f"{model}@{device}": embedder.cache_info()
+                    for (model, device), embedder in self._embedders.items()
+                },
+                "rerankers": sorted(f"{model}@{device}" for model, device, _ in self._rerankers),
+                "collections": sorted(f"{path}:{name}" for path, name in self._collections),
+                "lexical_dbs": sorted(self._lexical),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            for handle in self._lexical.values():
+                with handle.lock:
+                    handle.conn.close()
+            self._lexical.clear()
+            self._collections.clear()
+            self._clients.clear()
+
+
+def _query_kwargs_from_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    if not isinstance(request, dict):
+        raise ValueError("query request must be a JSON object")
+    unknown = set(request) - _QUERY_INDEX_FIELDS - _MODEL_FIELDS
+    if unknown:
+        raise ValueError(f"unknown query request fields: {', '.join(sorted(unknown))}")
+    question = request.get("question")
+    if not isinstance(question, str) or not question:
+        raise ValueError("question is required")
+
+    kwargs = {key: value for key, value in request.items() if key in _QUERY_INDEX_FIELDS}
+    for key in _PATH_FIELDS:
+        if kwargs.get(key) is not None:
+            kwargs[key] = Path(kwargs[key])
+    return kwargs
+
+
+_default_resources: Optional[WarmRagResources] = None
+_default_resources_lock = threading.Lock()
+
+
+def default_resources() -> WarmRagResources:
+    """The process-wide :class:`WarmRagResources` instance."""
+    global _default_resources
+    with _default_resources_lock:
+        if _default_resources is None:
+            _default_resources = WarmRagResources()
+        return _default_resources
+
+
+# ---------------------------------------------------------------------------
+# HTTP service
+# ---------------------------------------------------------------------------
+
+
+class _RagQueryHandler(BaseHTTPRequestHandler):
+    server: "RagQueryServer"
+
+    def do_GET(self) -> None:  # noqa: N802 (http.server naming)
+        if self.path.rstrip("/") != "/health":
+            self._send_json(404, {"error": f"unknown path: {self.path}"})
+            return
+        self._send_json(200, {"ok": True, "stats": self.server.resources.stats()})
+
+    def do_POST(self) -> None:  # noqa: N802
+        if self.path.rstrip("/") != "/query":
+            self._send_json(404, {"error": f"unknown path: {self.path}"})
+            return
+        if self.headers.get_content_type() != "application/json":
+            self._send_json(415, {"error": "Content-Type must be application/json"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+            results = self.server.resources.query(self.server.check_request(request))
+        except ValueError as exc:
+            self._send_json(400, {"error": str(exc)})
+            return
+        except Exception as exc:  # surface to the client instead of dropping the connection
+            logger.exception("RAG query failed")
+            self._send_json(500, {"error": str(exc)})
+            return
+        self._send_json(200, {"results": results})
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class RagQueryServer(ThreadingHTTPServer):
+    """Threaded localhost HTTP server answering queries from warm resources.
+
+    Requests are confined to what the operator configured: ``embed_model``
+    and ``rerank_model`` must be one of *embed_models* / *rerank_models*
+    (default: the package defaults), and every path field must resolve
+    under *repo_root* (default: the working directory).  A request can
+    therefore neither trigger a model download nor make the service create
+    files outside the repo.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = DEFAULT_SERVICE_HOST,
+        port: int = DEFAULT_SERVICE_PORT,
+        resources: Optional[WarmRagResources] = None,
+        *,
+        repo_root: Optional[Path] = None,
+        embed_models: Iterable[str] = (DEFAULT_EMBED_MODEL,),
+        rerank_models: Iterable[str] = (DEFAULT_RERANK_MODEL,),
+    ) -> None:
+        self.resources = resources if resources is not None else default_resources()
+        self.repo_root = Path(repo_root if repo_root is not None else Path.cwd()).resolve()
+        self.embed_models = frozenset(embed_models)
+        self.rerank_models = frozenset(rerank_models)
+        super().__init__((host, port), _RagQueryHandler)
+
+    def check_request(self, request: Any) -> Dict[str, Any]:
+        """Validate a wire request; return it with paths resolved under ``repo_root``.
+
+        Raises ``ValueError`` (HTTP 400) for a disallowed model or device, or
+        for a path outside the repo root.
+        """
+        if not isinstance(request, dict):
+            raise ValueError("query request must be a JSON object")
+        checked = dict(request)
+        embed_model = checked.get("embed_model") or DEFAULT_EMBED_MODEL
+        if not checked.get("lexical_only") and embed_model not in self.embed_models:
+            raise ValueError(f"embed_model not served here: {embed_model}")
+        if checked.get("rerank"):
+            rerank_model = checked.get("rerank_model") or DEFAULT_RERANK_MODEL
+            if rerank_model not in self.rerank_models:
+                raise ValueError(f"rerank_model not served here: {rerank_model}")
+        device = checked.get("device") or "auto"
+        if device not in _SERVICE_DEVICES:
+            raise ValueError(f"unsupported device: {device}")
+        for key in _PATH_FIELDS + ("rerank_cache_folder",):
+            if checked.get(key) is not None:
+                checked[key] = str(self._resolve_path(key, checked[key]))
+        return checked
+
+    def _resolve_path(self, field: str, value: Any) -> Path:
+        path = Path(str(value))
+        if not path.is_absolute():
+            path = self.repo_root / path
+        path = path.resolve()
+        try:
+            path.relative_to(self.repo_root)
+        except ValueError as exc:
+            raise ValueError(f"{field} must be inside the repo root: {value}") from exc
+        return path
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+def resolve_service_url(url: Optional[str] = None) -> Optional[str]:
+    """Explicit *url*, else ``$POLYTOOL_RAG_SERVICE_URL``, else None."""
+    resolved = url or os.environ.get(SERVICE_URL_ENV) or None
+    return resolved.rstrip("/") if resolved else None
+
+
+def query_service(request: Dict[str, Any], *, url: str, timeout: float = 60.0) -> List[dict]:
+    """POST *request* to a running service and return its results.
+
+    Raises :class:`RagServiceUnavailable` when the connection is refused
+    (nothing listening), :class:`RagServiceTimeout` when the service does not
+    answer in *timeout* seconds, ``ValueError`` for a rejected request and
+    ``RuntimeError`` for a server-side or other transport failure.
+    """
+    body = json.dumps(request, default=str).encode("utf-8")
+    http_request = urllib.request.Request(
+        url.rstrip("/") + "/query",
+        data=body,
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(http_request, timeout=timeout) as response:
+            payload = json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        try:
+            message = json.loads(exc.read()).get("error", str(exc))
+        except (ValueError, AttributeError):
+            message = str(exc)
+        if 400 <= exc.code < 500:
+            raise ValueError(message) from exc
+        raise RuntimeError(f"RAG query service error: {message}") from exc
+    except (urllib.error.URLError, OSError) as exc:
+        reason = exc.reason if isinstance(exc, urllib.error.URLError) else exc
+        if isinstance(reason, ConnectionRefusedError):
+            raise RagServiceUnavailable(f"RAG query service unavailable at {url}: {reason}") from exc
+        if isinstance(reason, TimeoutError):
+            raise RagServiceTimeout(f"RAG query service at {url} timed out after {timeout:g}s") from exc
+        raise RuntimeError(f"RAG query service request to {url} failed: {reason}") from exc
+    return payload.get("results", [])
+
+
+def run_query(
+    request: Dict[str, Any],
+    *,
+    service_url: Optional[str] = None,
+    resources: Optional[WarmRagResources] = None,
+    timeout: float = 60.0,
+) -> List[dict]:
+    """Answer *request* via the service at *service_url*, else in-process.
+
+    Falls back to *resources* (default: the process-wide instance) when no
+    service URL is given or nothing is listening there.  A service that is
+    up but slow raises :class:`RagServiceTimeout` rather than silently
+    running a second, cold query in this process.
+    """
+    if service_url:
+        try:
+            return query_service(request, url=service_url, timeout=timeout)
+        except RagServiceUnavailable as exc:
+            logger.info("%s; answering in-process", exc)
+    if resources is None:
+        resources = default_resources()
+    return resources.query(request)
@@ -44,6 +44,12 @@ Usage::
         out_dir=Path("artifacts/tapes/silver/0xabc/2023-11"),
     )
     print(result.reconstruction_confidence, result.warnings)
+
+    # Many targets: one DuckDB scan per source instead of one per target.
+    results = rec.reconstruct_many(
+        [SilverTarget("0xabc...", 1700000000.0, 1700007200.0), ...],
+        out_dirs=[Path("artifacts/tapes/silver/0xabc/2023-11"), ...],
+    )
 """
 
 from __future__ import annotations
@@ -54,7 +60,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from packages.polymarket.simtrader.tape.schema import PARSER_VERSION as _TAPE_PARSER_VERSION
 
@@ -120,6 +126,15 @@ class ReconstructConfig:
     skip_price_2min: bool = False
 
 
+@dataclass(frozen=True)
+class SilverTarget:
+    """One (token, window) reconstruction target for batched source fetches."""
+
+    token_id: str
+    window_start: float
+    window_end: float
+
+
 # ---------------------------------------------------------------------------
 # Result types
 # ---------------------------------------------------------------------------
@@ -314,6 +329,218 @@ def _csv_columns(conn: Any, ddb_glob: str) -> Optional[List[str]]:
 # ---------------------------------------------------------------------------
 
 
+def _column_types(conn: Any, read_expr: str) -> Dict[str, str]:
+    """Return {column name: DuckDB type} for *read_expr*, or {} on error."""
+    try:
+        rows = conn.execute(f"DESCRIBE SELECT * FROM {read_expr}").fetchall()
+        return {r[0]: str(r[1]) for r in rows}
+    except Exception:
+        return {}
+
+
+def _target_bound_exprs(ts_type: Optional[str], bound: str) -> List[str]:
+    """SQL expressions for a silver_targets bound, in the order to try them.
+
+    Mirrors the single-token queries, which bind the ISO string first and fall
+    back to the epoch float: the ISO text is cast to the column's own type
+    (a no-op for VARCHAR columns), the epoch is compared as-is.
+    """
+    exprs = [f"t.{bound}_epoch"]
+    if ts_type:
+        exprs.insert(0, f"CAST(t.{bound}_iso AS {ts_type})")
+    return exprs
+
+
+def _load_targets_table(conn: Any, targets: Sequence["SilverTarget"]) -> None:
+    """Create the temp ``silver_targets`` table joined against by batch fetches."""
+    conn.execute(
+        "CREATE OR REPLACE TEMP TABLE silver_targets ("
+        "idx INTEGER, token_id VARCHAR, "
+        "ws_iso VARCHAR, we_iso VARCHAR, ws_epoch DOUBLE, we_epoch DOUBLE)"
+    )
+    conn.executemany(
+        "INSERT INTO silver_targets VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (
+                idx,
+                t.token_id,
+                _ts_to_iso(t.window_start),
+                _ts_to_iso(t.window_end),
+                float(t.window_start),
+                float(t.window_end),
+            )
+            for idx, t in enumerate(targets)
+        ],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Dataset layout + file catalog
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _Dataset:
+    """A raw source directory and how to read it."""
+
+    root: Path      # directory holding the files (and its _catalog/)
+    pattern: str    # glob relative to root
+    fmt: str        # "parquet" | "csv"
+
+    @property
+    def glob(self) -> str:
+        return str(self.root / self.pattern).replace("\\", "/")
+
+    @property
+    def read_expr(self) -> str:
+        if self.fmt == "csv":
+            return f"read_csv('{self.glob}', auto_detect=true)"
+        return f"read_parquet('{self.glob}', union_by_name=true)"
+
+    def columns(self, conn: Any) -> Optional[List[str]]:
+        get_cols = _csv_columns if self.fmt == "csv" else _parquet_columns
+        return get_cols(conn, self.glob)
+
+
+def _pmxt_dataset(pmxt_root: str) -> _Dataset:
+    return _Dataset(Path(pmxt_root).resolve() / "Polymarket", "**/*.parquet", "parquet")
+
+
+def _jon_dataset(jon_root: str) -> Optional[_Dataset]:
+    """Jon-Becker trades: Parquet when present, else CSV; None when empty."""
+    trades_dir = Path(jon_root).resolve() / "data" / "polymarket" / "trades"
+    if not trades_dir.is_dir():
+        return None
+    if any(trades_dir.rglob("*.parquet")):
+        return _Dataset(trades_dir, "**/*.parquet", "parquet")
+    if any(trades_dir.rglob("*.csv")):
+        return _Dataset(trades_dir, "**/*.csv", "csv")
+    return None
+
+
+def _jon_token_cols(columns: List[str]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return (token_col, maker_col, taker_col) for a Jon-Becker schema.
+
+    The real dataset uses maker_asset_id + taker_asset_id instead of a
+    single asset_id; maker/taker are only used when no token column exists.
+    """
+    token_col = _detect_col(columns, _JON_TOKEN_CANDIDATES)
+    col_lower = {c.lower(): c for c in columns}
+    maker_col = col_lower.get("maker_asset_id")
+    taker_col = col_lower.get("taker_asset_id")
+    if token_col or not (maker_col and taker_col):
+        return token_col, None, None
+    return None, maker_col, taker_col
+
+
+def _catalog_files(
+    conn: Any,
+    dataset: _Dataset,
+    token_cols: List[str],
+    ts_col: str,
+    files_sql: str,
+) -> Optional[List[Path]]:
+    """Files that can hold rows for silver_targets, per the dataset catalog.
+
+    *files_sql* selects a ``file`` column from ``{ranges} r`` joined to
+    ``silver_targets t``.  Files added or modified since the catalog was
+    built are always included.  Returns None when there is no catalog for
+    these columns (read the whole glob), else the -- possibly empty -- list.
+    """
+    from packages.polymarket import duckdb_helper as dh
+
+    catalog = dh.load_file_catalog(dataset.root)
+    if catalog is None or catalog.fmt != dataset.fmt or not catalog.covers(token_cols, ts_col):
+        return None
+    rels = {
+        row[0]
+        for row in conn.execute(
+            files_sql.format(ranges=catalog.ranges_expr())
+        ).fetchall()
+    }
+    rels.update(catalog.unindexed_files(dh.dataset_files(dataset.root, dataset.pattern)))
+    return [catalog.file_path(rel) for rel in sorted(rels)]
+
+
+def _projection(
+    conn: Any, read_expr: str, columns: List[str], pruned: bool
+) -> str:
+    """Select *columns* from *read_expr*, NULL-filling any it lacks.
+
+    A catalog-pruned file list can have a narrower union schema than the full
+    glob; projecting keeps row dicts identical to an unpruned read.
+    """
+    if not pruned:
+        return "*"
+    present = set(_column_types(conn, read_expr))
+    return ", ".join(f'"{c}"' if c in present else f'NULL AS "{c}"' for c in columns)
+
+
+def index_pmxt_dataset(pmxt_root: str, *, rebuild: bool = False) -> Optional[Any]:
+    """Build or refresh the pmxt token/timestamp file catalog.
+
+    Returns the ``duckdb_helper.CatalogRefresh``, or None when the dataset
+    has no readable files or no detectable token/timestamp column.
+    """
+    from packages.polymarket import duckdb_helper as dh
+
+    dataset = _pmxt_dataset(pmxt_root)
+    with dh.connection() as conn:
+        columns = dataset.columns(conn)
+        if columns is None:
+            logger.warning("pmxt: no readable parquet files at %s", dataset.glob)
+            return None
+        token_col = _detect_col(columns, _PMXT_TOKEN_CANDIDATES)
+        ts_col = _detect_col(columns, _PMXT_TS_CANDIDATES)
+        if not token_col or not ts_col:
+            logger.warning(
+                "pmxt: cannot index without token/timestamp columns; columns: %s",
+                columns[:20],
+            )
+            return None
+        return dh.build_file_catalog(
+            conn, dataset.root, pattern=dataset.pattern, token_cols=[token_col],
+            ts_col=ts_col, fmt=dataset.fmt, rebuild=rebuild,
+        )
+
+
+def index_jon_dataset(jon_root: str, *, rebuild: bool = False) -> Optional[Any]:
+    """Build or refresh the Jon-Becker token/timestamp file catalog.
+
+    Maker/taker schemas index both asset columns.  Returns the
+    ``duckdb_helper.CatalogRefresh``, or None when nothing can be indexed.
+    """
+    from packages.polymarket import duckdb_helper as dh
+
+    dataset = _jon_dataset(jon_root)
+    if dataset is None:
+        logger.warning("jon: no parquet or csv files under %s", jon_root)
+        return None
+    with dh.connection() as conn:
+        columns = dataset.columns(conn)
+        if columns is None:
+            logger.warning("jon: could not read schema from %s", dataset.glob)
+            return None
+        token_col, maker_col, taker_col = _jon_token_cols(columns)
+        ts_col = _detect_col(columns, _JON_TS_CANDIDATES)
+        token_cols = [token_col] if token_col else [c for c in (maker_col, taker_col) if c]
+        if not token_cols or not ts_col:
+            logger.warning(
+                "jon: cannot index without token/timestamp columns; columns: %s",
+                columns[:20],
+            )
+            return None
+        return dh.build_file_catalog(
+            conn, dataset.root, pattern=dataset.pattern, token_cols=token_cols,
+            ts_col=ts_col, fmt=dataset.fmt, rebuild=rebuild,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Default (real) fetch functions
+# ---------------------------------------------------------------------------
+
+
 def _real_fetch_pmxt_anchor(
     pmxt_root: str,
     token_id: str,
@@ -323,14 +550,33 @@ def _real_fetch_pmxt_anchor(
 
     Returns a raw column->value dict for the matching row, or None.
     """
+    anchors = _real_fetch_pmxt_anchors_batch(
+        pmxt_root, [SilverTarget(token_id, window_start, window_start)]
+    )
+    return anchors[0] if anchors else None
+
+
+def _real_fetch_pmxt_anchors_batch(
+    pmxt_root: str,
+    targets: Sequence["SilverTarget"],
+) -> Optional[List[Optional[Dict[str, Any]]]]:
+    """Fetch the pmxt anchor for every target in one Parquet scan.
+
+    The targets are loaded into a temp table and joined against the pmxt
+    data, keeping the latest snapshot at or before each target's
+    window_start.  With a file catalog (see :func:`index_pmxt_dataset`)
+    only the files that can hold each target's anchor are read.  Returns
+    one row dict (or None) per target, in target order, or None when the
+    scan itself could not run.
+    """
     from packages.polymarket import duckdb_helper as dh
 
-    root = Path(pmxt_root).resolve()
-    glob = str(root / "Polymarket" / "**" / "*.parquet").replace("\\", "/")
+    dataset = _pmxt_dataset(pmxt_root)
+    glob = dataset.glob
 
     try:
         with dh.connection() as conn:
-            columns = _parquet_columns(conn, glob)
+            columns = dataset.columns(conn)
             if columns is None:
                 logger.warning("pmxt: no readable parquet files at %s", glob)
                 return None
@@ -351,21 +597,51 @@ def _real_fetch_pmxt_anchor(
                 )
                 return None
 
-            read_expr = f"read_parquet('{glob}', union_by_name=true)"
-            query = (
-                f'SELECT * FROM {read_expr} '
-                f'WHERE "{token_col}" = ? AND "{ts_col}" <= ? '
-                f'ORDER BY "{ts_col}" DESC LIMIT 1'
-            )
-            # Try ISO timestamp first, then epoch float
-            for ts_param in [_ts_to_iso(window_start), window_start]:
+            ts_type = _column_types(conn, dataset.read_expr).get(ts_col)
+            _load_targets_table(conn, targets)
+            anchors: List[Optional[Dict[str, Any]]] = [None] * len(targets)
+            for ws_expr in _target_bound_exprs(ts_type, "ws"):
                 try:
-                    row = conn.execute(query, [token_id, ts_param]).fetchone()
-                    if row is not None:
-                        return dict(zip(columns, row))
+                    # A file can hold the anchor only if its latest possible
+                    # row <= ws is not older than some file's guaranteed one.
+                    files = _catalog_files(
+                        conn, dataset, [token_col], ts_col,
+                        "SELECT DISTINCT file FROM ("
+                        "SELECT t.idx, r.file, "
+                        f"CASE WHEN r.ts_max <= {ws_expr} THEN r.ts_max "
+                        "ELSE r.ts_min END AS lower_bound, "
+                        f"CASE WHEN r.ts_max <= {ws_expr} THEN r.ts_max "
+                        f"ELSE {ws_expr} END AS upper_bound "
+                        "FROM {ranges} r JOIN silver_targets t ON r.token = t.token_id "
+                        f"WHERE r.ts_min <= {ws_expr} "
+                        "QUALIFY upper_bound >= max(lower_bound) OVER (PARTITION BY t.idx))",
+                    )
+                    if files == []:
+                        continue
+                    read_expr = (
+                        dataset.read_expr if files is None
+                        else dh.read_expr_for_files(files, dataset.fmt)
+                    )
+                    select = _projection(conn, read_expr, columns, files is not None)
+                    query = (
+                        f"WITH snaps AS MATERIALIZED ("
+                        f"SELECT {select} FROM {read_expr} "
+                        f'WHERE "{token_col}" IN (SELECT token_id FROM silver_targets)) '
+                        f"SELECT t.idx, snaps.* FROM silver_targets t "
+                        f'JOIN snaps ON snaps."{token_col}" = t.token_id '
+                        f'AND snaps."{ts_col}" <= {ws_expr} '
+                        f"QUALIFY row_number() OVER ("
+                        f'PARTITION BY t.idx ORDER BY snaps."{ts_col}" DESC) = 1'
+                    )
+                    rows = conn.execute(query).fetchall()
                 except Exception:
                     continue
-            return None
+                # Like the per-token ISO-then-epoch retry, a later comparison
+                # only fills targets the earlier one left without an anchor.
+                for row in rows:
+                    if anchors[row[0]] is None:
+                        anchors[row[0]] = dict(zip(columns, row[1:]))
+            return anchors
 
     except Exception as exc:
         logger.warning("pmxt: connection/query error: %s", exc)
@@ -382,80 +658,113 @@ def _real_fetch_jon_fills(
 
     Returns list of raw column->value dicts sorted by timestamp, or [].
     """
+    fills = _real_fetch_jon_fills_batch(
+        jon_root, [SilverTarget(token_id, window_start, window_end)]
+    )
+    return fills[0] if fills else []
+
+
+def _real_fetch_jon_fills_batch(
+    jon_root: str,
+    targets: Sequence["SilverTarget"],
+) -> Optional[List[List[Dict[str, Any]]]]:
+    """Fetch Jon-Becker fills for every target in one trades scan.
+
+    Trades touching any target token are read once into a materialized CTE
+    and range-joined against the temp targets table; the maker/taker schema
+    is matched as two equi-joins (maker leg, then taker leg) rather than an
+    OR join.  With a file catalog (see :func:`index_jon_dataset`) only files
+    whose token/time ranges overlap a target are read.  Returns per-target
+    fill lists in target order (each sorted by timestamp), or None when the
+    scan itself could not run.
+    """
     from packages.polymarket import duckdb_helper as dh
 
-    root = Path(jon_root).resolve()
-    trades_dir = root / "data" / "polymarket" / "trades"
-
-    parquet_files = list(trades_dir.rglob("*.parquet")) if trades_dir.is_dir() else []
-    csv_files = list(trades_dir.rglob("*.csv")) if trades_dir.is_dir() else []
-
-    if parquet_files:
-        glob = str(trades_dir / "**" / "*.parquet").replace("\\", "/")
-        read_expr = f"read_parquet('{glob}', union_by_name=true)"
-        get_cols = _parquet_columns
-    elif csv_files:
-        glob = str(trades_dir / "**" / "*.csv").replace("\\", "/")
-        read_expr = f"read_csv('{glob}', auto_detect=true)"
-        get_cols = _csv_columns
-    else:
-        logger.warning("jon: no parquet or csv files under %s", trades_dir)
-        return []
+    dataset = _jon_dataset(jon_root)
+    if dataset is None:
+        logger.warning(
+            "jon: no parquet or csv files under %s",
+            Path(jon_root).resolve() / "data" / "polymarket" / "trades",
+        )
+        return None
+    glob = dataset.glob
 
     try:
         with dh.connection() as conn:
-            columns = get_cols(conn, glob)
+            columns = dataset.columns(conn)
             if columns is None:
                 logger.warning("jon: could not read schema from %s", glob)
-                return []
+                return None
 
-            token_col = _detect_col(columns, _JON_TOKEN_CANDIDATES)
+            token_col, maker_col, taker_col = _jon_token_cols(columns)
             ts_col = _detect_col(columns, _JON_TS_CANDIDATES)
 
-            # Detect maker/taker schema (Jon-Becker real dataset uses
-            # maker_asset_id + taker_asset_id instead of a single asset_id)
-            _col_lower = {c.lower(): c for c in columns}
-            _maker_col = _col_lower.get("maker_asset_id")
-            _taker_col = _col_lower.get("taker_asset_id")
-            _maker_taker = bool(_maker_col and _taker_col)
-
-            if not ts_col or (not token_col and not _maker_taker):
+            if not ts_col or (not token_col and not maker_col):
                 logger.warning(
                     "jon: missing required columns. token_col=%s ts_col=%s in %s",
                     token_col, ts_col, columns[:20],
                 )
-                return []
-
-            if _maker_taker and not token_col:
-                query = (
-                    f'SELECT * FROM {read_expr} '
-                    f'WHERE ("{_maker_col}" = ? OR "{_taker_col}" = ?) '
-                    f'AND "{ts_col}" >= ? AND "{ts_col}" <= ? '
-                    f'ORDER BY "{ts_col}" ASC'
+                return None
+
+            if maker_col and taker_col:
+                token_cols = [maker_col, taker_col]
+                legs = [
+                    f'trades."{maker_col}" = t.token_id',
+                    f'trades."{taker_col}" = t.token_id '
+                    f'AND trades."{maker_col}" IS DISTINCT FROM t.token_id',
+                ]
+                prefilter = (
+                    f'"{maker_col}" IN (SELECT token_id FROM silver_targets) '
+                    f'OR "{taker_col}" IN (SELECT token_id FROM silver_targets)'
                 )
-                params_prefix: List[Any] = [token_id, token_id]
             else:
-                query = (
-                    f'SELECT * FROM {read_expr} '
-                    f'WHERE "{token_col}" = ? AND "{ts_col}" >= ? AND "{ts_col}" <= ? '
-                    f'ORDER BY "{ts_col}" ASC'
-                )
-                params_prefix = [token_id]
-
-            for ts_start, ts_end in [
-                (_ts_to_iso(window_start), _ts_to_iso(window_end)),
-                (window_start, window_end),
-            ]:
+                token_cols = [token_col]
+                legs = [f'trades."{token_col}" = t.token_id']
+                prefilter = f'"{token_col}" IN (SELECT token_id FROM silver_targets)'
+
+            ts_type = _column_types(conn, dataset.read_expr).get(ts_col)
+            _load_targets_table(conn, targets)
+            for ws_expr, we_expr in zip(
+                _target_bound_exprs(ts_type, "ws"), _target_bound_exprs(ts_type, "we")
+            ):
                 try:
-                    rows = conn.execute(query, params_prefix + [ts_start, ts_end]).fetchall()
-                    return [dict(zip(columns, r)) for r in rows]
+                    files = _catalog_files(
+                        conn, dataset, token_cols, ts_col,
+                        "SELECT DISTINCT r.file FROM {ranges} r "
+                        "JOIN silver_targets t ON r.token = t.token_id "
+                        f"WHERE r.ts_max >= {ws_expr} AND r.ts_min <= {we_expr}",
+                    )
+                    if files == []:
+                        return [[] for _ in targets]
+                    read_expr = (
+                        dataset.read_expr if files is None
+                        else dh.read_expr_for_files(files, dataset.fmt)
+                    )
+                    select = _projection(conn, read_expr, columns, files is not None)
+                    joins = " UNION ALL ".join(
+                        f"SELECT t.idx AS __silver_idx, trades.* "
+                        f"FROM silver_targets t JOIN trades ON {leg} "
+                        f'AND trades."{ts_col}" >= {ws_expr} '
+                        f'AND trades."{ts_col}" <= {we_expr}'
+                        for leg in legs
+                    )
+                    query = (
+                        f"WITH trades AS MATERIALIZED ("
+                        f"SELECT {select} FROM {read_expr} WHERE {prefilter}) "
+                        f'SELECT * FROM ({joins}) ORDER BY __silver_idx, "{ts_col}" ASC'
+                    )
+                    rows = conn.execute(query).fetchall()
                 except Exception:
                     continue
-            return []
+                fills: List[List[Dict[str, Any]]] = [[] for _ in targets]
+                for row in rows:
+                    fills[row[0]].append(dict(zip(columns, row[1:])))
+                return fills
+            return [[] for _ in targets]
 
     except Exception as exc:
         logger.warning("jon: connection/query error: %s", exc)
-        return []
+        return None
 
 
 def _real_fetch_price_2min(
@@ -641,6 +950,16 @@ JonFetchFn = Callable[[str, str, float, float], List[Dict[str, Any]]]
 Price2minFetchFn = Callable[[str, float, float], List[Dict[str, Any]]]
 # (token_id, window_start, window_end) -> list of {ts, price} dicts
 
+PmxtBatchFetchFn = Callable[
+    [str, Sequence[SilverTarget]], Optional[List[Optional[Dict[str, Any]]]]
+]
+# (pmxt_root, targets) -> one Optional[row dict] per target, or None on failure
+
+JonBatchFetchFn = Callable[
+    [str, Sequence[SilverTarget]], Optional[List[List[Dict[str, Any]]]]
+]
+# (jon_root, targets) -> one list of row dicts per target, or None on failure
+
 
 class SilverReconstructor:
     """Reconstruct a Silver tape for one market/token over a bounded window.
@@ -650,11 +969,17 @@ class SilverReconstructor:
 
     When not injected, the real DuckDB + ClickHouse implementations are used.
 
+    For many targets, call :meth:`prefetch` (or use :meth:`reconstruct_many`)
+    first: pmxt anchors and Jon fills for all targets are then fetched in one
+    DuckDB scan per source instead of one full glob scan per target.
+
     Args:
         config:             ReconstructConfig with source roots and CH settings.
         _pmxt_fetch_fn:     Override pmxt anchor fetch (for testing).
         _jon_fetch_fn:      Override Jon fill fetch (for testing).
         _price_2min_fetch_fn: Override price_2min fetch (for testing).
+        _pmxt_batch_fetch_fn: Override batched pmxt fetch used by prefetch().
+        _jon_batch_fetch_fn:  Override batched Jon fetch used by prefetch().
     """
 
     def __init__(
@@ -664,11 +989,81 @@ class SilverReconstructor:
         _pmxt_fetch_fn: Optional[PmxtFetchFn] = None,
         _jon_fetch_fn: Optional[JonFetchFn] = None,
         _price_2min_fetch_fn: Optional[Price2minFetchFn] = None,
+        _pmxt_batch_fetch_fn: Optional[PmxtBatchFetchFn] = None,
+        _jon_batch_fetch_fn: Optional[JonBatchFetchFn] = None,
     ) -> None:
         self._config = config or ReconstructConfig()
         self._pmxt_fetch_fn = _pmxt_fetch_fn
         self._jon_fetch_fn = _jon_fetch_fn
         self._price_2min_fetch_fn = _price_2min_fetch_fn
+        self._pmxt_batch_fetch_fn = _pmxt_batch_fetch_fn
+        self._jon_batch_fetch_fn = _jon_batch_fetch_fn
+        # Prefetched source rows, consumed by reconstruct().
+        self._prefetched_pmxt: Dict[Tuple[str, float], Optional[Dict[str, Any]]] = {}
+        self._prefetched_jon: Dict[Tuple[str, float, float], List[Dict[str, Any]]] = {}
+
+    def prefetch(self, targets: Sequence[SilverTarget]) -> None:
+        """Fetch pmxt anchors and Jon fills for all *targets* in batched scans.
+
+        Results are held until :meth:`reconstruct` is called for the same
+        (token_id, window) and are consumed there.  Sources whose per-target
+        fetch function was injected without a batched counterpart are left
+        to that function.  If a batched scan fails, the affected targets
+        simply fall back to per-target fetching.
+        """
+        targets = list(dict.fromkeys(targets))
+        if not targets:
+            return
+
+        if self._config.pmxt_root and (
+            self._pmxt_batch_fetch_fn is not None or self._pmxt_fetch_fn is None
+        ):
+            fetch_many = self._pmxt_batch_fetch_fn or _real_fetch_pmxt_anchors_batch
+            anchors = fetch_many(self._config.pmxt_root, targets)
+            if anchors is not None:
+                for target, row in zip(targets, anchors):
+                    self._prefetched_pmxt[(target.token_id, target.window_start)] = row
+
+        if self._config.jon_root and (
+            self._jon_batch_fetch_fn is not None or self._jon_fetch_fn is None
+        ):
+            fetch_many = self._jon_batch_fetch_fn or _real_fetch_jon_fills_batch
+            fills = fetch_many(self._config.jon_root, targets)
+            if fills is not None:
+                for target, rows in zip(targets, fills):
+                    key = (target.token_id, target.window_start, target.window_end)
+                    self._prefetched_jon[key] = rows
+
+    def reconstruct_many(
+        self,
+        targets: Sequence[SilverTarget],
+        out_dirs: Optional[Sequence[Optional[Path]]] = None,
+        *,
+        dry_run: bool = False,
+    ) -> List[SilverResult]:
+        """Prefetch sources for *targets*, then reconstruct each one in order.
+
+        Args:
+            targets:  Targets to reconstruct.
+            out_dirs: Output directory per target (same length as *targets*);
+                      may be None when dry_run=True.
+            dry_run:  Passed through to :meth:`reconstruct`.
+        """
+        if out_dirs is None:
+            out_dirs = [None] * len(targets)
+        if len(out_dirs) != len(targets):
+            raise ValueError("out_dirs must have one entry per target")
+        self.prefetch(targets)
+        return [
+            self.reconstruct(
+                token_id=target.token_id,
+                window_start=target.window_start,
+                window_end=target.window_end,
+                out_dir=out_dir,
+                dry_run=dry_run,
+            )
+            for target, out_dir in zip(targets, out_dirs)
+        ]
 
     def reconstruct(
         self,
@@ -724,10 +1119,14 @@ class SilverReconstructor:
         pmxt_row: Optional[Dict[str, Any]] = None
         pmxt_columns: List[str] = []
         if self._config.pmxt_root:
-            fetch_fn = self._pmxt_fetch_fn or (
-                lambda root, tid, ws: _real_fetch_pmxt_anchor(root, tid, ws)
-            )
-            pmxt_row = fetch_fn(self._config.pmxt_root, token_id, window_start)
+            pmxt_key = (token_id, window_start)
+            if pmxt_key in self._prefetched_pmxt:
+                pmxt_row = self._prefetched_pmxt.pop(pmxt_key)
+            else:
+                fetch_fn = self._pmxt_fetch_fn or (
+                    lambda root, tid, ws: _real_fetch_pmxt_anchor(root, tid, ws)
+                )
+                pmxt_row = fetch_fn(self._config.pmxt_root, token_id, window_start)
             if pmxt_row is not None:
                 pmxt_columns = list(pmxt_row.keys())
                 inputs.pmxt_anchor_found = True
@@ -755,10 +1154,16 @@ class SilverReconstructor:
         jon_fills: List[Dict[str, Any]] = []
         jon_columns: List[str] = []
         if self._config.jon_root:
-            fetch_fn = self._jon_fetch_fn or (
-                lambda root, tid, ws, we: _real_fetch_jon_fills(root, tid, ws, we)
-            )
-            jon_fills = fetch_fn(self._config.jon_root, token_id, window_start, window_end)
+            jon_key = (token_id, window_start, window_end)
+            if jon_key in self._prefetched_jon:
+                jon_fills = self._prefetched_jon.pop(jon_key)
+            else:
+                fetch_fn = self._jon_fetch_fn or (
+                    lambda root, tid, ws, we: _real_fetch_jon_fills(root, tid, ws, we)
+                )
+                jon_fills = fetch_fn(
+                    self._config.jon_root, token_id, window_start, window_end
+                )
             if jon_fills:
                 jon_columns = list(jon_fills[0].keys())
                 inputs.jon_fill_count = len(jon_fills)
@@ -21,6 +21,14 @@ Artifacts layout::
 
 Idempotency: if ``markets/<slug>/sweep_summary.json`` already exists this
 market is skipped unless ``rerun=True``.
+
+Concurrency: with ``workers > 1`` up to ``workers`` markets record at once on
+a thread pool (recording is I/O-bound), and each finished tape is swept in a
+process pool of ``min(workers, cpu_count)`` (sweeping is CPU-bound), so
+recording the next markets overlaps with sweeping the previous ones.  The
+time budget is checked before each market is launched, exactly as in the
+sequential loop, and rows keep market order, so the summary artifacts match
+a sequential run.
 """
 
 from __future__ import annotations
@@ -28,9 +36,17 @@ from __future__ import annotations
 import csv
 import hashlib
 import json
+import os
 import shutil
 import sys
 import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -45,6 +61,7 @@ from ..strategy_presets import (
     normalize_strategy_preset,
 )
 from ..sweeps.runner import SweepRunParams, run_sweep
+from ..tape.cache import default_tape_cache_dir, load_tape
 from ..tape.recorder import TapeRecorder
 from ..tape.schema import EVENT_TYPE_BOOK, EVENT_TYPE_PRICE_CHANGE
 
@@ -73,6 +90,7 @@ class BatchRunParams:
     batch_id: Optional[str] = None
     rerun: bool = False
     time_budget_seconds: Optional[float] = None
+    workers: int = 1
 
 
 @dataclass
@@ -102,6 +120,20 @@ class _MarketRow:
     tape_dir: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class _RecordedMarket:
+    """A recorded tape waiting to be swept (handed from record to sweep pool)."""
+
+    resolved: Any
+    market_dir: Path
+    tape_dir: Path
+    events_path: Path
+    tape_events_count: int
+    yes_snapshot: bool
+    no_snapshot: bool
+    tape_bbo_rows: int
+
+
 @dataclass(frozen=True)
 class BatchRunResult:
     """Outcome of a completed batch run."""
@@ -174,6 +206,8 @@ def run_batch(
             "time_budget_seconds must be > 0 when provided "
             f"(got {params.time_budget_seconds})"
         )
+    if params.workers < 1:
+        raise BatchRunError(f"workers must be >= 1 (got {params.workers})")
     try:
         strategy_preset = normalize_strategy_preset(params.strategy_preset)
     except ValueError as exc:
@@ -245,10 +279,48 @@ def run_batch(
     _write_json(batch_dir / "batch_manifest.json", manifest)
 
     # -- Process each market ---------------------------------------------------
-    rows: list[_MarketRow] = []
     sweep_config = sweep_config_factory()
     batch_start_monotonic = time.monotonic()
+    run_markets = (
+        _run_markets_concurrently
+        if params.workers > 1 and len(markets) > 1
+        else _run_markets_sequentially
+    )
+    rows = run_markets(
+        markets,
+        params=params,
+        markets_dir=markets_dir,
+        sweep_config=sweep_config,
+        ts=ts,
+        strategy_preset=strategy_preset,
+        batch_start_monotonic=batch_start_monotonic,
+    )
 
+    # -- Aggregate + write summary --------------------------------------------
+    summary = _build_summary(batch_id, ts, params, rows)
+    _write_json(batch_dir / "batch_summary.json", summary)
+    _write_csv(batch_dir / "batch_summary.csv", rows)
+
+    return BatchRunResult(
+        batch_id=batch_id,
+        batch_dir=batch_dir,
+        summary=summary,
+        manifest=manifest,
+    )
+
+
+def _run_markets_sequentially(
+    markets: list[Any],
+    *,
+    params: BatchRunParams,
+    markets_dir: Path,
+    sweep_config: dict[str, Any],
+    ts: str,
+    strategy_preset: str,
+    batch_start_monotonic: float,
+) -> list[_MarketRow]:
+    """Record and sweep one market at a time, in market order."""
+    rows: list[_MarketRow] = []
     market_iter = iter(markets)
     while True:
         # Check time budget BEFORE fetching the next candidate so the iterator
@@ -279,18 +351,93 @@ def run_batch(
             strategy_preset=strategy_preset,
         )
         rows.append(row)
+    return rows
 
-    # -- Aggregate + write summary --------------------------------------------
-    summary = _build_summary(batch_id, ts, params, rows)
-    _write_json(batch_dir / "batch_summary.json", summary)
-    _write_csv(batch_dir / "batch_summary.csv", rows)
 
-    return BatchRunResult(
-        batch_id=batch_id,
-        batch_dir=batch_dir,
-        summary=summary,
-        manifest=manifest,
-    )
+def _budget_exhausted(params: BatchRunParams, batch_start_monotonic: float) -> Optional[float]:
+    """Return elapsed seconds if the batch time budget is used up, else None."""
+    if params.time_budget_seconds is None:
+        return None
+    elapsed = time.monotonic() - batch_start_monotonic
+    return elapsed if elapsed >= params.time_budget_seconds else None
+
+
+def _run_markets_concurrently(
+    markets: list[Any],
+    *,
+    params: BatchRunParams,
+    markets_dir: Path,
+    sweep_config: dict[str, Any],
+    ts: str,
+    strategy_preset: str,
+    batch_start_monotonic: float,
+) -> list[_MarketRow]:
+    """Record on a thread pool and sweep on a process pool; rows in market order.
+
+    At most ``params.workers`` markets are recording at any time.  A market
+    is launched (or budget-skipped) only when a recording slot frees up, so
+    the time budget bounds launches the same way the sequential loop does;
+    launched markets always run to completion.
+    """
+    rows: list[Optional[_MarketRow]] = [None] * len(markets)
+    next_idx = 0
+    recording: dict[Future, int] = {}
+    sweeping: dict[Future, int] = {}
+
+    with ProcessPoolExecutor(
+        max_workers=min(params.workers, os.cpu_count() or 1)
+    ) as sweep_pool, ThreadPoolExecutor(max_workers=params.workers) as record_pool:
+        # Fork the sweep workers now, while no recorder thread is running.
+        sweep_pool.submit(int).result()
+
+        while True:
+            while len(recording) < params.workers and next_idx < len(markets):
+                elapsed = _budget_exhausted(params, batch_start_monotonic)
+                if elapsed is not None:
+                    print(
+                        "[batch] time budget exhausted "
+                        f"({elapsed:.1f}s >= {params.time_budget_seconds:.1f}s); "
+                        f"skipping {len(markets) - next_idx} remaining market(s).",
+                        file=sys.stderr,
+                    )
+                    for idx in range(next_idx, len(markets)):
+                        rows[idx] = _time_budget_skipped_row(markets[idx])
+                    next_idx = len(markets)
+                    break
+                resolved = markets[next_idx]
+                existing = _existing_market_row(resolved, params, markets_dir)
+                if existing is not None:
+                    rows[next_idx] = existing
+                else:
+                    future = record_pool.submit(
+                        _record_market, resolved, params, markets_dir, ts, strategy_preset
+                    )
+                    recording[future] = next_idx
+                next_idx += 1
+
+            if not recording and not sweeping:
+                break
+            done, _ = wait([*recording, *sweeping], return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in recording:
+                    idx = recording.pop(future)
+                    recorded = future.result()
+                    if isinstance(recorded, _MarketRow):
+                        rows[idx] = recorded
+                    else:
+                        sweep_future = sweep_pool.submit(
+                            _sweep_market,
+                            recorded,
+                            params,
+                            sweep_config,
+                            ts,
+                            strategy_preset,
+                        )
+                        sweeping[sweep_future] = idx
+                else:
+                    rows[sweeping.pop(future)] = future.result()
+
+    return [row for row in rows if row is not None]
 
 
 def _time_budget_skipped_row(resolved) -> _MarketRow:
@@ -334,7 +481,21 @@ def _run_market(
     strategy_preset: str,
 ) -> _MarketRow:
     """Record tape + run sweep for one market, return aggregated row."""
+    existing = _existing_market_row(resolved, params, markets_dir)
+    if existing is not None:
+        return existing
+    recorded = _record_market(resolved, params, markets_dir, ts, strategy_preset)
+    if isinstance(recorded, _MarketRow):
+        return recorded
+    return _sweep_market(recorded, params, sweep_config, ts, strategy_preset)
+
 
+def _existing_market_row(
+    resolved,
+    params: BatchRunParams,
+    markets_dir: Path,
+) -> Optional[_MarketRow]:
+    """Return a "skipped" row when this market already has sweep results."""
     slug = resolved.slug
     market_dir = markets_dir / slug
     sweep_summary_path = market_dir / "sweep_summary.json"
@@ -372,7 +533,22 @@ def _run_market(
             )
         except Exception:  # noqa: BLE001
             pass  # fall through and re-run
+    return None
+
+
+def _record_market(
+    resolved,
+    params: BatchRunParams,
+    markets_dir: Path,
+    ts: str,
+    strategy_preset: str,
+) -> _MarketRow | _RecordedMarket:
+    """Record the tape for one market; return an error row on failure.
 
+    I/O-bound: the concurrent batch runs this on a thread pool.
+    """
+    slug = resolved.slug
+    market_dir = markets_dir / slug
     market_dir.mkdir(parents=True, exist_ok=True)
 
     # -- Record tape -----------------------------------------------------------
@@ -443,8 +619,13 @@ def _run_market(
 
     # Tape quality stats
     tape_meta_path = tape_dir / "meta.json"
+    # Decoded through the shared tape cache so the sweep below reuses this parse.
     tape_events_count, yes_snapshot, no_snapshot, tape_bbo_rows = _read_tape_stats(
-        events_path, tape_meta_path, resolved.yes_token_id, resolved.no_token_id
+        events_path,
+        tape_meta_path,
+        resolved.yes_token_id,
+        resolved.no_token_id,
+        tape_cache_dir=default_tape_cache_dir(params.artifacts_root),
     )
     if params.min_events > 0 and tape_events_count < params.min_events:
         print(
@@ -460,6 +641,40 @@ def _run_market(
     if tape_meta_path.exists():
         shutil.copy2(tape_meta_path, market_dir / "tape_meta.json")
 
+    return _RecordedMarket(
+        resolved=resolved,
+        market_dir=market_dir,
+        tape_dir=tape_dir,
+        events_path=events_path,
+        tape_events_count=tape_events_count,
+        yes_snapshot=yes_snapshot,
+        no_snapshot=no_snapshot,
+        tape_bbo_rows=tape_bbo_rows,
+    )
+
+
+def _sweep_market(
+    recorded: _RecordedMarket,
+    params: BatchRunParams,
+    sweep_config: dict[str, Any],
+    ts: str,
+    strategy_preset: str,
+) -> _MarketRow:
+    """Sweep a recorded tape and return the aggregated market row.
+
+    CPU-bound: the concurrent batch runs this in a process pool, so it is
+    module-level and takes only picklable arguments.
+    """
+    resolved = recorded.resolved
+    slug = resolved.slug
+    market_dir = recorded.market_dir
+    tape_dir = recorded.tape_dir
+    events_path = recorded.events_path
+    tape_events_count = recorded.tape_events_count
+    yes_snapshot = recorded.yes_snapshot
+    no_snapshot = recorded.no_snapshot
+    tape_bbo_rows = recorded.tape_bbo_rows
+
     # -- Build strategy config -------------------------------------------------
     strategy_config = build_binary_complement_strategy_config(
         yes_asset_id=resolved.yes_token_id,
@@ -630,6 +845,7 @@ def _read_tape_stats(
     tape_meta_path: Path,
     yes_token_id: str,
     no_token_id: str,
+    tape_cache_dir: Optional[Path] = None,
 ) -> tuple[int, bool, bool, int]:
     """Return (parsed_events, yes_snapshot, no_snapshot, bbo_rows) from tape files."""
     parsed_events = 0
@@ -639,35 +855,29 @@ def _read_tape_stats(
     tracked_assets = {yes_token_id, no_token_id}
 
     try:
-        with open(events_path, encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    ev = json.loads(line)
-                except Exception:  # noqa: BLE001
-                    continue
-                parsed_events += 1
-                event_type = ev.get("event_type")
-                asset_id = str(ev.get("asset_id") or "")
-                if event_type == EVENT_TYPE_BOOK and asset_id in tracked_assets:
+        for ev in load_tape(events_path, cache_dir=tape_cache_dir).events:
+            if not isinstance(ev, dict):
+                continue
+            parsed_events += 1
+            event_type = ev.get("event_type")
+            asset_id = str(ev.get("asset_id") or "")
+            if event_type == EVENT_TYPE_BOOK and asset_id in tracked_assets:
+                bbo_rows += 1
+                if asset_id == yes_token_id:
+                    yes_snapshot = True
+                elif asset_id == no_token_id:
+                    no_snapshot = True
+            elif event_type == EVENT_TYPE_PRICE_CHANGE:
+                entries = ev.get("price_changes")
+                if isinstance(entries, list):
+                    for entry in entries:
+                        entry_asset = str(
+                            (entry or {}).get("asset_id") if isinstance(entry, dict) else ""
+                        )
+                        if entry_asset in tracked_assets:
+                            bbo_rows += 1
+                elif asset_id in tracked_assets:
                     bbo_rows += 1
-                    if asset_id == yes_token_id:
-                        yes_snapshot = True
-                    elif asset_id == no_token_id:
-                        no_snapshot = True
-                elif event_type == EVENT_TYPE_PRICE_CHANGE:
-                    entries = ev.get("price_changes")
-                    if isinstance(entries, list):
-                        for entry in entries:
-                            entry_asset = str(
-                                (entry or {}).get("asset_id") if isinstance(entry, dict) else ""
-                            )
-                            if entry_asset in tracked_assets:
-                                bbo_rows += 1
-                    elif asset_id in tracked_assets:
-                        bbo_rows += 1
     except Exception:  # noqa: BLE001
         pass
 
@@ -3,8 +3,8 @@
 Design invariants (all enforced by this module):
 
   1. No fill at prices not present in the book at the evaluation time.
-     Levels are read directly from ``book._bids`` / ``book._asks``; nothing
-     is invented.
+     Levels are read directly from the book's sorted sides; nothing is
+     invented.
 
   2. Walk-the-book math is correct.
      For a BUY order the engine walks ask levels from cheapest up to the
@@ -18,18 +18,21 @@ Design invariants (all enforced by this module):
      invents liquidity.
 
 Note on book access:
-    ``fill_engine`` reads ``book._bids`` and ``book._asks`` directly for
-    performance.  The book is **read-only** from this module's perspective;
-    it is never modified here.  The caller (SimBroker) is responsible for
-    driving the book forward via ``book.apply()``.
+    ``fill_engine`` walks ``book.asks`` / ``book.bids`` in their stored
+    best-first order and stops at the order's limit price, so a fill costs
+    O(levels consumed) rather than a parse-and-sort of the whole side.  The
+    book is **read-only** from this module's perspective; it is never
+    modified here.  The caller (SimBroker) is responsible for driving the
+    book forward via ``book.apply()``.
 """
 
 from __future__ import annotations
 
 import logging
-from decimal import Decimal
-from typing import TYPE_CHECKING
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+from typing import TYPE_CHECKING, Any, Iterator
 
+from ..orderbook.l2book import TICK_DECIMALS
 from .rules import FillRecord, Order, Side
 
 if TYPE_CHECKING:
@@ -59,6 +62,13 @@ def try_fill(order: Order, book: "L2Book", eval_seq: int, ts_recv: float) -> Fil
         when available size is smaller than the order's remaining size.
     """
 
+    # Top-of-book context is captured once and shared by every exit path.
+    because_base: dict[str, Any] = {
+        "eval_seq": eval_seq,
+        "book_best_bid": book.best_bid,
+        "book_best_ask": book.best_ask,
+    }
+
     def _reject(reason: str) -> FillRecord:
         return FillRecord(
             order_id=order.order_id,
@@ -71,37 +81,29 @@ def try_fill(order: Order, book: "L2Book", eval_seq: int, ts_recv: float) -> Fil
             remaining=order.remaining,
             fill_status="rejected",
             reject_reason=reason,
-            because={
-                "eval_seq": eval_seq,
-                "book_best_bid": book.best_bid,
-                "book_best_ask": book.best_ask,
-                "levels_consumed": [],
-            },
+            because={**because_base, "levels_consumed": []},
         )
 
     if not book._initialized:
         return _reject("book_not_initialized")
 
-    if order.side == Side.BUY:
-        # Walk the ask side, cheapest-first, up to the order's limit (ceiling).
-        levels = _sorted_ask_levels(book, order.limit_price)
-    elif order.side == Side.SELL:
-        # Walk the bid side, highest-first, down to the order's limit (floor).
-        levels = _sorted_bid_levels(book, order.limit_price)
-    else:
+    if order.side not in (Side.BUY, Side.SELL):
         return _reject(f"unknown_side:{order.side!r}")
 
-    if not levels:
-        return _reject("no_competitive_levels")
-
     remaining = order.remaining
     total_filled = _ZERO
     total_notional = _ZERO          # running sum of price * size consumed
     consumed: list[dict[str, str]] = []   # [{price, size}, ...]
 
-    for price_str, available_size in levels:
+    # BUY walks asks cheapest-first up to the limit (ceiling); SELL walks
+    # bids highest-first down to the limit (floor).
+    for price_str, available_size in iter_competitive_levels(
+        book, order.side, order.limit_price
+    ):
         if remaining <= _ZERO:
             break
+        if available_size <= _ZERO:
+            continue                          # defensive; shouldn't occur
         price = Decimal(price_str)
         consume = min(available_size, remaining)
         total_filled += consume
@@ -110,7 +112,6 @@ def try_fill(order: Order, book: "L2Book", eval_seq: int, ts_recv: float) -> Fil
         remaining -= consume
 
     if total_filled == _ZERO:
-        # Defensive: levels existed but all had zero size (shouldn't happen).
         return _reject("no_competitive_levels")
 
     avg_price = total_notional / total_filled
@@ -128,49 +129,41 @@ def try_fill(order: Order, book: "L2Book", eval_seq: int, ts_recv: float) -> Fil
         remaining=new_remaining,
         fill_status=fill_status,
         reject_reason=None,
-        because={
-            "eval_seq": eval_seq,
-            "book_best_bid": book.best_bid,
-            "book_best_ask": book.best_ask,
-            "levels_consumed": consumed,
-        },
+        because={**because_base, "levels_consumed": consumed},
     )
 
 
 # ---------------------------------------------------------------------------
-# Internal helpers: level selection and sorting
+# Level selection
 # ---------------------------------------------------------------------------
 
 
-def _sorted_ask_levels(
-    book: "L2Book", limit_price: Decimal
-) -> list[tuple[str, Decimal]]:
-    """Ask levels at price <= *limit_price*, sorted cheapest-first.
+def iter_competitive_levels(
+    book: "L2Book", side: str, limit_price: Decimal
+) -> Iterator[tuple[str, Decimal]]:
+    """Yield ``(price_str, size)`` levels an order on *side* could take.
 
-    Only levels genuinely present in the book (positive size) are returned.
+    BUY orders see asks at price <= *limit_price*, cheapest-first; SELL
+    orders see bids at price >= *limit_price*, highest-first.  The walk is
+    lazy and reads the book's already-sorted levels, so stopping early is
+    free.  Any other *side* yields nothing.
     """
-    result: list[tuple[str, Decimal]] = []
-    for price_str, size in book._asks.items():
-        if size <= _ZERO:
-            continue                          # defensive; shouldn't occur
-        if Decimal(price_str) <= limit_price:
-            result.append((price_str, size))
-    result.sort(key=lambda x: Decimal(x[0]))  # ascending: cheapest first
-    return result
+    scaled = Decimal(limit_price).scaleb(TICK_DECIMALS)
+    if side == Side.BUY:
+        # Round the ceiling down so off-grid limits never admit a dearer level.
+        return book.asks.levels_through(int(scaled.to_integral_value(ROUND_FLOOR)))
+    if side == Side.SELL:
+        return book.bids.levels_through(int(scaled.to_integral_value(ROUND_CEILING)))
+    return iter(())
 
 
-def _sorted_bid_levels(
-    book: "L2Book", limit_price: Decimal
-) -> list[tuple[str, Decimal]]:
-    """Bid levels at price >= *limit_price*, sorted highest-first.
+def has_competitive_levels(book: "L2Book", order: Order) -> bool:
+    """Return True if *order* could fill at least partially against *book*.
 
-    Only levels genuinely present in the book (positive size) are returned.
+    A cheap pre-check for callers that discard rejected ``FillRecord``s: it
+    inspects only the best opposite level and builds no diagnostics.
     """
-    result: list[tuple[str, Decimal]] = []
-    for price_str, size in book._bids.items():
-        if size <= _ZERO:
-            continue
-        if Decimal(price_str) >= limit_price:
-            result.append((price_str, size))
-    result.sort(key=lambda x: Decimal(x[0]), reverse=True)  # descending
-    return result
+    if not book._initialized:
+        return False
+    levels = iter_competitive_levels(book, order.side, order.limit_price)
+    return next(levels, None) is not None
@@ -27,6 +27,15 @@ Usage::
     # Retrieve results:
     all_fills   = broker.fills         # list[FillRecord]
     order_log   = broker.order_events  # list[dict]  (lifecycle events)
+
+    # Or follow them incrementally with cursors (no history copies):
+    new_fills = broker.fills_since(fill_cursor)
+    fill_cursor = broker.fill_count
+
+Only orders that can change state are visited by ``step()``: PENDING orders
+awaiting activation, ACTIVE/PARTIAL orders resting on the stepped asset, and
+orders with a pending cancel.  Terminal orders drop out of every index, so
+per-event cost scales with live orders rather than with run history.
 """
 
 from __future__ import annotations
@@ -38,7 +47,7 @@ from typing import Any, Optional
 
 from ..orderbook.l2book import L2Book
 from ..tape.schema import EVENT_TYPE_BOOK, EVENT_TYPE_PRICE_CHANGE
-from .fill_engine import try_fill
+from .fill_engine import has_competitive_levels, try_fill
 from .latency import ZERO_LATENCY, LatencyConfig
 from .rules import FillRecord, Order, OrderStatus, Side
 
@@ -57,8 +66,20 @@ class SimBroker:
     def __init__(self, latency: LatencyConfig = ZERO_LATENCY) -> None:
         self._latency = latency
         self._orders: dict[str, Order] = {}
+        # Live-order indexes (terminal orders appear in none of them).
+        # _rank preserves submission order so step() visits candidates in the
+        # same order as a scan over _orders would.
+        self._rank: dict[str, int] = {}
+        self._next_rank = 0
+        self._open: dict[str, Order] = {}
+        self._pending: dict[str, Order] = {}
+        self._active_by_asset: dict[str, dict[str, Order]] = {}
+        self._cancel_pending: dict[str, Order] = {}
         self._fills: list[FillRecord] = []
         self._order_events: list[dict] = []
+        # Number of history rows already handed out by drain_*() and dropped.
+        self._drained_fills = 0
+        self._drained_order_events = 0
 
     # ------------------------------------------------------------------
     # Public API
@@ -102,7 +123,11 @@ class SimBroker:
             submit_seq=submit_seq,
             effective_seq=eff_seq,
         )
+        previous = self._orders.get(order_id)
+        if previous is not None:
+            self._unindex(previous)
         self._orders[order_id] = order
+        self._track(order)
         self._append_event(
             "submitted",
             order_id,
@@ -147,6 +172,7 @@ class SimBroker:
             )
         eff_cancel = self._latency.cancel_effective_seq(cancel_seq)
         order.cancel_effective_seq = eff_cancel
+        self._cancel_pending[order_id] = order
         self._append_event(
             "cancel_submitted",
             order_id,
@@ -173,17 +199,21 @@ class SimBroker:
             Number of orders cancelled.
         """
         count = 0
-        for order in self._orders.values():
-            if not OrderStatus.is_terminal(order.status):
-                order.status = OrderStatus.CANCELLED
-                self._append_event(
-                    "cancelled",
-                    order.order_id,
-                    seq,
-                    ts_recv,
-                    {"remaining": str(order.remaining), "reason": "disconnect"},
-                )
-                count += 1
+        for order in list(self._open.values()):
+            if OrderStatus.is_terminal(order.status):
+                # Status changed outside the broker; just drop it from the index.
+                self._unindex(order)
+                continue
+            order.status = OrderStatus.CANCELLED
+            self._unindex(order)
+            self._append_event(
+                "cancelled",
+                order.order_id,
+                seq,
+                ts_recv,
+                {"remaining": str(order.remaining), "reason": "disconnect"},
+            )
+            count += 1
         return count
 
     def step(
@@ -220,19 +250,29 @@ class SimBroker:
 
         new_fills: list[FillRecord] = []
 
-        for order in list(self._orders.values()):
+        for order in self._step_candidates(seq, is_book_event, fill_asset_id):
             if OrderStatus.is_terminal(order.status):
+                self._unindex(order)
                 continue
 
             # --- 1. Activate ---
             if order.status == OrderStatus.PENDING and seq >= order.effective_seq:
                 order.status = OrderStatus.ACTIVE
+                self._pending.pop(order.order_id, None)
+                self._active_by_asset.setdefault(order.asset_id, {})[order.order_id] = order
                 self._append_event("activated", order.order_id, seq, ts_recv, {})
                 logger.debug("Order activated: id=%s seq=%d", order.order_id, seq)
 
             # --- 2. Fill (book-affecting events only; optionally asset-filtered) ---
             fill_allowed = fill_asset_id is None or order.asset_id == fill_asset_id
-            if is_book_event and order.is_active and fill_allowed:
+            # Rejected fills are discarded here, so skip building them for
+            # orders that cannot cross the current book.
+            if (
+                is_book_event
+                and order.is_active
+                and fill_allowed
+                and has_competitive_levels(book, order)
+            ):
                 fill = try_fill(order, book, seq, ts_recv)
                 if fill.fill_size > _ZERO:
                     order.filled_size += fill.fill_size
@@ -241,6 +281,8 @@ class SimBroker:
                         if fill.fill_status == "full"
                         else OrderStatus.PARTIAL
                     )
+                    if order.status == OrderStatus.FILLED:
+                        self._unindex(order)
                     self._fills.append(fill)
                     new_fills.append(fill)
                     self._append_event(
@@ -273,6 +315,7 @@ class SimBroker:
                 )
             ):
                 order.status = OrderStatus.CANCELLED
+                self._unindex(order)
                 self._append_event(
                     "cancelled",
                     order.order_id,
@@ -288,6 +331,20 @@ class SimBroker:
     # Read-only accessors
     # ------------------------------------------------------------------
 
+    def open_orders(self, asset_id: Optional[str] = None) -> list[Order]:
+        """Non-terminal orders in submission order, optionally for one asset."""
+        return [
+            order
+            for order in self._open.values()
+            if (asset_id is None or order.asset_id == asset_id)
+            and not OrderStatus.is_terminal(order.status)
+        ]
+
+    @property
+    def open_order_count(self) -> int:
+        """Number of non-terminal orders."""
+        return len(self._open)
+
     @property
     def fills(self) -> list[FillRecord]:
         """All fill records produced so far (copies; safe to iterate)."""
@@ -300,14 +357,45 @@ class SimBroker:
 
     @property
     def order_event_count(self) -> int:
-        """Number of broker lifecycle events recorded so far."""
-        return len(self._order_events)
+        """Number of broker lifecycle events recorded so far (including drained)."""
+        return self._drained_order_events + len(self._order_events)
+
+    @property
+    def fill_count(self) -> int:
+        """Number of fill records produced so far (including drained)."""
+        return self._drained_fills + len(self._fills)
+
+    def drain_fills(self) -> list[FillRecord]:
+        """Return fills recorded since the last drain and drop them from history.
+
+        Used by streaming replay so broker memory stays bounded; after the
+        first drain, :attr:`fills` only holds the undrained tail.
+        """
+        drained, self._fills = self._fills, []
+        self._drained_fills += len(drained)
+        return drained
+
+    def drain_order_events(self) -> list[dict]:
+        """Return lifecycle events since the last drain and drop them from history."""
+        drained, self._order_events = self._order_events, []
+        self._drained_order_events += len(drained)
+        return drained
 
     def order_events_since(self, start_index: int) -> list[dict]:
-        """Return broker lifecycle events from *start_index* onward."""
-        if start_index <= 0:
-            return list(self._order_events)
-        return list(self._order_events[start_index:])
+        """Return broker lifecycle events from *start_index* onward.
+
+        *start_index* counts from the start of the run (compare
+        :attr:`order_event_count`); drained events are no longer returned.
+        """
+        return self._since(self._order_events, start_index - self._drained_order_events)
+
+    def fills_since(self, start_index: int) -> list[FillRecord]:
+        """Return fill records from *start_index* onward (compare :attr:`fill_count`).
+
+        Only the new tail is copied, so polling with a cursor each tick stays
+        linear in the number of fills.
+        """
+        return self._since(self._fills, start_index - self._drained_fills)
 
     def snapshot_state(self, include_history: bool = False) -> dict[str, Any]:
         """Return a JSON-safe snapshot of broker state.
@@ -368,6 +456,15 @@ class SimBroker:
             )
             self._orders[order.order_id] = order
 
+        self._rank = {}
+        self._next_rank = 0
+        self._open = {}
+        self._pending = {}
+        self._active_by_asset = {}
+        self._cancel_pending = {}
+        for order in self._orders.values():
+            self._track(order)
+
         self._fills = []
         for row in state.get("fills", []):
             self._fills.append(
@@ -386,6 +483,8 @@ class SimBroker:
                 )
             )
         self._order_events = list(state.get("order_events", []))
+        self._drained_fills = 0
+        self._drained_order_events = 0
 
     def get_order(self, order_id: str) -> Order:
         """Return the Order for *order_id* (raises KeyError if not found)."""
@@ -395,6 +494,64 @@ class SimBroker:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _track(self, order: Order) -> None:
+        """Assign a submission rank to *order* and add it to the live indexes."""
+        if order.order_id not in self._rank:
+            self._rank[order.order_id] = self._next_rank
+            self._next_rank += 1
+        if OrderStatus.is_terminal(order.status):
+            return
+        self._open[order.order_id] = order
+        if order.status == OrderStatus.PENDING:
+            self._pending[order.order_id] = order
+        else:
+            self._active_by_asset.setdefault(order.asset_id, {})[order.order_id] = order
+        if order.cancel_effective_seq is not None:
+            self._cancel_pending[order.order_id] = order
+
+    def _unindex(self, order: Order) -> None:
+        """Drop *order* from every live index (it became terminal or was replaced)."""
+        order_id = order.order_id
+        self._open.pop(order_id, None)
+        self._pending.pop(order_id, None)
+        self._cancel_pending.pop(order_id, None)
+        resting = self._active_by_asset.get(order.asset_id)
+        if resting is not None:
+            resting.pop(order_id, None)
+            if not resting:
+                del self._active_by_asset[order.asset_id]
+
+    def _step_candidates(
+        self,
+        seq: int,
+        is_book_event: bool,
+        fill_asset_id: Optional[str],
+    ) -> list[Order]:
+        """Orders that may activate, fill or cancel at *seq*, in submission order."""
+        candidates: dict[str, Order] = {}
+        for order_id, order in self._pending.items():
+            if seq >= order.effective_seq:
+                candidates[order_id] = order
+        if is_book_event:
+            if fill_asset_id is None:
+                for resting in self._active_by_asset.values():
+                    candidates.update(resting)
+            else:
+                candidates.update(self._active_by_asset.get(fill_asset_id, {}))
+        for order_id, order in self._cancel_pending.items():
+            if seq >= order.cancel_effective_seq:
+                candidates[order_id] = order
+        if len(candidates) <= 1:
+            return list(candidates.values())
+        rank = self._rank
+        return sorted(candidates.values(), key=lambda order: rank[order.order_id])
+
+    @staticmethod
+    def _since(rows: list, local_index: int) -> list:
+        if local_index <= 0:
+            return list(rows)
+        return rows[local_index:]
+
     def _append_event(
         self,
         event_type: str,
@@ -42,10 +42,11 @@ AdverseSelectionGuard
 from __future__ import annotations
 
 import logging
-from collections import deque
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from packages.polymarket.simtrader.rolling_stats import RollingWindow
+
 logger = logging.getLogger(__name__)
 
 ORDER_FLOW_SIGNAL_PROXY = "proxy"
@@ -202,7 +203,8 @@ class OFISignal:
         self.threshold = threshold
         self.min_samples = min_samples
 
-        self._ticks: deque[int] = deque(maxlen=window_ticks)
+        # +1 / -1 ticks; the running total is buy_ticks - sell_ticks.
+        self._ticks = RollingWindow(window_ticks)
         self._last_mid: Optional[float] = None
         self._updates_seen: int = 0
 
@@ -245,8 +247,8 @@ class OFISignal:
             )
 
         classified = len(self._ticks)
-        buy_ticks = sum(1 for t in self._ticks if t > 0)
-        sell_ticks = sum(1 for t in self._ticks if t < 0)
+        buy_ticks = (classified + self._ticks.total) // 2
+        sell_ticks = classified - buy_ticks
         total = buy_ticks + sell_ticks
 
         # Neutral (all flat) takes precedence over warming_up: if no classified
@@ -401,7 +403,10 @@ class MMWithdrawalSignal:
         self.depth_drop_threshold = depth_drop_threshold
         self.min_samples = min_samples
 
-        self._depths: deque[float] = deque(maxlen=window_ticks)
+        self._depths = RollingWindow(window_ticks)
+        # Exact count of non-empty samples: a float running total may not
+        # return to exactly 0.0, so the zero-baseline check uses this instead.
+        self._nonempty = RollingWindow(window_ticks)
         self._updates_seen: int = 0
 
     def on_book_update(
@@ -423,7 +428,9 @@ class MMWithdrawalSignal:
         ask_depth = sum(
             float(lvl.get("size", 0.0)) for lvl in top_asks[: self.depth_levels]
         )
-        self._depths.append(bid_depth + ask_depth)
+        depth = bid_depth + ask_depth
+        self._depths.append(depth)
+        self._nonempty.append(1 if depth > 0.0 else 0)
 
     def check(self) -> SignalResult:
         """Evaluate current MM-withdrawal state and return a SignalResult."""
@@ -448,8 +455,7 @@ class MMWithdrawalSignal:
             )
 
         current = self._depths[-1]
-        prior = list(self._depths)[:-1]
-        if not prior:
+        if n < 2:
             # Only one sample; cannot compute a meaningful baseline.
             return SignalResult(
                 triggered=False,
@@ -461,9 +467,10 @@ class MMWithdrawalSignal:
                     "min_samples": self.min_samples,
                 },
             )
-        baseline_avg = sum(prior) / len(prior)
+        nonempty_prior = self._nonempty.total - (1 if current > 0.0 else 0)
+        baseline_avg = (self._depths.total - current) / (n - 1)
 
-        if baseline_avg <= 0.0:
+        if nonempty_prior == 0 or baseline_avg <= 0.0:
             return SignalResult(
                 triggered=False,
                 reason="",
@@ -1,8 +1,13 @@
 """L2 order book state machine for SimTrader replay.
 
 Applies book snapshots and price_change deltas to maintain a two-sided
-level-2 order book.  Prices and sizes are stored as Decimal strings to
-avoid floating-point precision drift during accumulation.
+level-2 order book.  Sizes are stored as Decimal to avoid floating-point
+precision drift during accumulation.
+
+Prices are keyed by integer ticks (``1 tick == 1e-6``) and each side keeps
+its ticks in a sorted array, best level first.  Top-of-book reads are O(1)
+and ``top_bids`` / ``top_asks`` are plain slices; the original price strings
+are retained per level so snapshots and fill diagnostics round-trip exactly.
 
 Terminology:
   bid  (BUY)  — highest price wins  → best_bid  = max(bid prices)
@@ -12,18 +17,142 @@ Terminology:
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left, insort
 from decimal import Decimal, InvalidOperation
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from ..tape.schema import EVENT_TYPE_BOOK, EVENT_TYPE_PRICE_CHANGE
 
 logger = logging.getLogger(__name__)
 
+# Integer tick resolution.  Polymarket tick sizes are 0.01 / 0.001 / 0.0001,
+# so six decimal places represent every listed price exactly.
+TICK_DECIMALS = 6
+TICK_SCALE = 10**TICK_DECIMALS
+
+
+def price_to_tick(price: object) -> Optional[int]:
+    """Convert a price (string or number) to integer ticks.
+
+    Returns None if *price* is not a finite decimal number.  Prices finer
+    than the tick resolution are rounded half-even to the nearest tick.
+    """
+    try:
+        scaled = Decimal(str(price)).scaleb(TICK_DECIMALS)
+    except InvalidOperation:
+        return None
+    if not scaled.is_finite():
+        return None
+    return int(scaled.to_integral_value())
+
 
 class L2BookError(Exception):
     """Raised when the L2 book receives an invalid state transition."""
 
 
+class BookSide:
+    """One side of an L2 book: integer-tick levels kept in priority order.
+
+    ``_keys`` holds sort keys best-first (``tick`` for asks, ``-tick`` for
+    bids) so both sides share the same ascending bisect logic.  Sizes and
+    the original price strings are looked up by tick.
+
+    Iterating ``items()`` yields ``(price_str, size)`` pairs best-first,
+    mirroring the old ``dict[str, Decimal]`` interface.
+    """
+
+    __slots__ = ("_sign", "_keys", "_sizes", "_prices")
+
+    def __init__(self, descending: bool) -> None:
+        self._sign = -1 if descending else 1
+        self._keys: list[int] = []
+        self._sizes: dict[int, Decimal] = {}
+        self._prices: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._sizes.clear()
+        self._prices.clear()
+
+    def set(self, tick: int, price: str, size: Decimal) -> None:
+        """Insert or update the level at *tick*."""
+        if tick not in self._sizes:
+            insort(self._keys, self._sign * tick)
+        self._sizes[tick] = size
+        self._prices[tick] = price
+
+    def discard(self, tick: int) -> None:
+        """Remove the level at *tick* if present."""
+        if self._sizes.pop(tick, None) is None:
+            return
+        del self._prices[tick]
+        del self._keys[bisect_left(self._keys, self._sign * tick)]
+
+    def load(self, levels: dict[int, tuple[str, Decimal]]) -> None:
+        """Replace all levels at once (one sort instead of N inserts)."""
+        self._sizes = {tick: size for tick, (_, size) in levels.items()}
+        self._prices = {tick: price for tick, (price, _) in levels.items()}
+        self._keys = sorted(self._sign * tick for tick in levels)
+
+    def best_tick(self) -> Optional[int]:
+        """Tick of the best level, or None if empty."""
+        if not self._keys:
+            return None
+        return self._sign * self._keys[0]
+
+    def best_price(self) -> Optional[float]:
+        """Price of the best level as a float, or None if empty."""
+        if not self._keys:
+            return None
+        return self._sign * self._keys[0] / TICK_SCALE
+
+    def ticks(self, n: Optional[int] = None) -> list[int]:
+        """Level ticks best-first, optionally limited to the top *n*."""
+        keys = self._keys if n is None else self._keys[:n]
+        sign = self._sign
+        return [sign * key for key in keys]
+
+    def levels_through(self, limit_tick: int) -> Iterator[tuple[str, Decimal]]:
+        """Yield ``(price_str, size)`` best-first, stopping past *limit_tick*.
+
+        For asks this walks up to and including prices <= *limit_tick*; for
+        bids it walks down to prices >= *limit_tick*.  Iteration is lazy, so
+        callers that stop early never touch deeper levels.  Do not mutate
+        the side while iterating.
+        """
+        sign = self._sign
+        bound = sign * limit_tick
+        for key in self._keys:
+            if key > bound:
+                return
+            tick = sign * key
+            yield self._prices[tick], self._sizes[tick]
+
+    def size_at(self, tick: int) -> Decimal:
+        """Size resting at *tick* (zero if the level is absent)."""
+        return self._sizes.get(tick, Decimal(0))
+
+    def price_str(self, tick: int) -> str:
+        """Original price string for the level at *tick*."""
+        return self._prices[tick]
+
+    def items(self) -> Iterator[tuple[str, Decimal]]:
+        """Yield ``(price_str, size)`` pairs best-first."""
+        sign = self._sign
+        for key in self._keys:
+            tick = sign * key
+            yield self._prices[tick], self._sizes[tick]
+
+    def to_state(self) -> dict[str, str]:
+        return {self._prices[tick]: str(size) for tick, size in self._sizes.items()}
+
+
 class L2Book:
     """Level-2 order book driven by normalized SimTrader events.
 
@@ -46,9 +175,9 @@ class L2Book:
         self.asset_id = asset_id
         self.strict = strict
         self._initialized = False
-        # price string -> Decimal size  (size > 0 means level is present)
-        self._bids: dict[str, Decimal] = {}
-        self._asks: dict[str, Decimal] = {}
+        # Only levels with size > 0 are present.
+        self._bids = BookSide(descending=True)
+        self._asks = BookSide(descending=False)
 
     # ------------------------------------------------------------------
     # Public API
@@ -57,16 +186,22 @@ class L2Book:
     @property
     def best_bid(self) -> Optional[float]:
         """Highest bid price, or None if the bid side is empty."""
-        if not self._bids:
-            return None
-        return float(max(Decimal(p) for p in self._bids))
+        return self._bids.best_price()
 
     @property
     def best_ask(self) -> Optional[float]:
         """Lowest ask price, or None if the ask side is empty."""
-        if not self._asks:
-            return None
-        return float(min(Decimal(p) for p in self._asks))
+        return self._asks.best_price()
+
+    @property
+    def bids(self) -> BookSide:
+        """Bid side, best (highest) level first.  Treat as read-only."""
+        return self._bids
+
+    @property
+    def asks(self) -> BookSide:
+        """Ask side, best (lowest) level first.  Treat as read-only."""
+        return self._asks
 
     def top_bids(self, n: int = 5) -> list[dict]:
         """Return top N bid levels sorted by price descending (highest first).
@@ -74,14 +209,7 @@ class L2Book:
         Each entry: {"price": float, "size": float}
         Returns empty list if book not initialized or bid side is empty.
         """
-        if not self._bids:
-            return []
-        sorted_levels = sorted(
-            ((Decimal(p), s) for p, s in self._bids.items()),
-            key=lambda x: x[0],
-            reverse=True,
-        )
-        return [{"price": float(p), "size": float(s)} for p, s in sorted_levels[:n]]
+        return self._top_levels(self._bids, n)
 
     def top_asks(self, n: int = 5) -> list[dict]:
         """Return top N ask levels sorted by price ascending (lowest first).
@@ -89,13 +217,7 @@ class L2Book:
         Each entry: {"price": float, "size": float}
         Returns empty list if book not initialized or ask side is empty.
         """
-        if not self._asks:
-            return []
-        sorted_levels = sorted(
-            ((Decimal(p), s) for p, s in self._asks.items()),
-            key=lambda x: x[0],
-        )
-        return [{"price": float(p), "size": float(s)} for p, s in sorted_levels[:n]]
+        return self._top_levels(self._asks, n)
 
     def snapshot_state(self) -> dict[str, Any]:
         """Return a JSON-safe snapshot of the current book state."""
@@ -103,8 +225,8 @@ class L2Book:
             "asset_id": self.asset_id,
             "strict": self.strict,
             "initialized": self._initialized,
-            "bids": {price: str(size) for price, size in self._bids.items()},
-            "asks": {price: str(size) for price, size in self._asks.items()},
+            "bids": self._bids.to_state(),
+            "asks": self._asks.to_state(),
         }
 
     def restore_state(self, state: dict[str, Any]) -> None:
@@ -112,14 +234,8 @@ class L2Book:
         self.asset_id = str(state.get("asset_id", self.asset_id))
         self.strict = bool(state.get("strict", self.strict))
         self._initialized = bool(state.get("initialized", False))
-        self._bids = {
-            str(price): Decimal(str(size))
-            for price, size in dict(state.get("bids", {})).items()
-        }
-        self._asks = {
-            str(price): Decimal(str(size))
-            for price, size in dict(state.get("asks", {})).items()
-        }
+        self._bids.load(self._parse_levels(dict(state.get("bids", {})).items()))
+        self._asks.load(self._parse_levels(dict(state.get("asks", {})).items()))
 
     def apply(self, event: dict) -> bool:
         """Apply a normalized tape event to update book state.
@@ -162,19 +278,12 @@ class L2Book:
 
     def _apply_snapshot(self, event: dict) -> None:
         """Replace entire book state from a 'book' snapshot event."""
-        self._bids.clear()
-        self._asks.clear()
-
-        for level in event.get("bids", []):
-            price, size = self._parse_level(level)
-            if price is not None and size is not None and size > 0:
-                self._bids[price] = size
-
-        for level in event.get("asks", []):
-            price, size = self._parse_level(level)
-            if price is not None and size is not None and size > 0:
-                self._asks[price] = size
-
+        self._bids.load(
+            self._parse_levels(self._parse_level(lvl) for lvl in event.get("bids", []))
+        )
+        self._asks.load(
+            self._parse_levels(self._parse_level(lvl) for lvl in event.get("asks", []))
+        )
         self._initialized = True
 
     def apply_single_delta(self, change: dict) -> bool:
@@ -239,10 +348,46 @@ class L2Book:
             )
             return
 
+        tick = price_to_tick(price)
+        if tick is None:
+            logger.warning("Invalid price in price_change: %r — skipping.", price)
+            return
+
         if size == 0:
-            book.pop(price, None)
+            book.discard(tick)
         else:
-            book[price] = size
+            book.set(tick, price, size)
+
+    @staticmethod
+    def _top_levels(side: BookSide, n: int) -> list[dict]:
+        return [
+            {"price": tick / TICK_SCALE, "size": float(side.size_at(tick))}
+            for tick in side.ticks(n)
+        ]
+
+    @staticmethod
+    def _parse_levels(
+        levels: Any,
+    ) -> dict[int, tuple[str, Decimal]]:
+        """Map parsed ``(price_str, size)`` pairs to ``{tick: (price_str, size)}``.
+
+        Levels with an unparseable price or a non-positive size are dropped.
+        Later duplicates of the same tick win, matching delta semantics.
+        """
+        result: dict[int, tuple[str, Decimal]] = {}
+        for price, size in levels:
+            if price is None or size is None:
+                continue
+            if not isinstance(size, Decimal):
+                size = Decimal(str(size))
+            if size <= 0:
+                continue
+            tick = price_to_tick(price)
+            if tick is None:
+                logger.warning("Invalid price in level: %r", price)
+                continue
+            result[tick] = (str(price), size)
+        return result
 
     @staticmethod
     def _parse_level(level: object) -> tuple[Optional[str], Optional[Decimal]]:
@@ -30,6 +30,11 @@ Post-process a completed broker replay::
 
 All three outputs are serialisable with ``json.dumps``.
 
+For long tapes, :meth:`PortfolioLedger.iter_process` consumes seq-ordered
+order events and timeline rows from any iterables (e.g. JSONL files being
+read back lazily) and yields rows one at a time, so neither input nor output
+has to fit in memory.
+
 Artifact schemas
 ----------------
 **ledger.jsonl** (one row per order lifecycle event)::
@@ -79,7 +84,7 @@ from __future__ import annotations
 import logging
 from collections import defaultdict
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from .fees import DEFAULT_FEE_RATE_BPS, compute_fill_fee
 from .mark import MARK_BID, mark_price
@@ -161,8 +166,8 @@ class PortfolioLedger:
 
     def process(
         self,
-        order_events: list[dict],
-        timeline: list[dict],
+        order_events: Iterable[dict],
+        timeline: Iterable[dict],
     ) -> tuple[list[dict], list[dict]]:
         """Process broker order events and book timeline to build artifacts.
 
@@ -217,6 +222,55 @@ class PortfolioLedger:
 
         return ledger_snapshots, equity_curve
 
+    def iter_process(
+        self,
+        order_events: Iterable[dict],
+        timeline: Iterable[dict],
+    ) -> Iterator[tuple[str, dict]]:
+        """Streaming counterpart of :meth:`process`.
+
+        Both inputs must already be sorted by ``seq`` (as produced by a
+        replay loop).  They are merged lazily with the same per-seq rules as
+        :meth:`process`: all order events at a seq are applied first, then
+        one equity row is emitted from the *last* timeline row at that seq.
+
+        Yields:
+            ``("ledger", snapshot)`` and ``("equity", row)`` tuples in the
+            order :meth:`process` would have appended them.
+        """
+        oe_iter = iter(order_events)
+        tl_iter = iter(timeline)
+        next_oe = next(oe_iter, None)
+        next_tl = next(tl_iter, None)
+
+        while next_oe is not None or next_tl is not None:
+            if next_tl is None or (
+                next_oe is not None and int(next_oe["seq"]) <= int(next_tl["seq"])
+            ):
+                seq = int(next_oe["seq"])  # type: ignore[index]
+            else:
+                seq = int(next_tl["seq"])
+
+            # 1. Process all broker order events at this seq
+            while next_oe is not None and int(next_oe["seq"]) == seq:
+                snapshot = self._process_order_event(next_oe)
+                if snapshot is not None:
+                    yield "ledger", snapshot
+                next_oe = next(oe_iter, None)
+
+            # 2. Emit equity curve row if we have book data at this seq
+            tl_row: Optional[dict] = None
+            while next_tl is not None and int(next_tl["seq"]) == seq:
+                tl_row = next_tl
+                next_tl = next(tl_iter, None)
+            if tl_row is not None:
+                yield "equity", self._equity_snapshot(
+                    seq,
+                    tl_row["ts_recv"],
+                    tl_row.get("best_bid"),
+                    tl_row.get("best_ask"),
+                )
+
     def apply_order_event(self, evt: dict) -> Optional[dict]:
         """Process one broker lifecycle event against the live ledger state."""
         return self._process_order_event(evt)
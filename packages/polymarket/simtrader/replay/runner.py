@@ -8,6 +8,15 @@ Output:
   meta.json           — run quality summary + warning log
 
 Run quality is "ok" when no events were skipped; "warnings" otherwise.
+
+With ``stream=True`` the tape is read lazily (it must already be in ``seq``
+order) and timeline rows are written as they are produced, so memory use
+does not grow with tape length.
+
+With ``start_ts`` / ``end_ts`` only events inside that ``ts_recv`` window
+emit timeline rows.  Books are brought to the window start from the nearest
+checkpoint in the tape's index sidecar (see ``tape.index``), so replaying the
+last hour of a long tape does not decode the hours before it.
 """
 
 from __future__ import annotations
@@ -16,10 +25,14 @@ import csv
 import json
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Optional
 
 from ..orderbook.l2book import L2Book, L2BookError
+from ..tape.index import open_tape_window, prime_books
 from ..tape.schema import EVENT_TYPE_BOOK, EVENT_TYPE_PRICE_CHANGE
+from .stream import collect_asset_ids, iter_tape_events
+
+_TIMELINE_FIELDS = ["seq", "ts_recv", "asset_id", "event_type", "best_bid", "best_ask"]
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +53,9 @@ class ReplayRunner:
         run_dir: Path,
         strict: bool = True,
         output_format: str = "jsonl",
+        stream: bool = False,
+        start_ts: Optional[float] = None,
+        end_ts: Optional[float] = None,
     ) -> None:
         """
         Args:
@@ -48,11 +64,18 @@ class ReplayRunner:
             strict:        If True, raise on missing book snapshot or bad events.
                            If False, log warnings and skip bad events.
             output_format: "jsonl" or "csv".
+            stream:        If True, read the (seq-ordered) tape lazily and
+                           write timeline rows as they are produced.
+            start_ts:      Replay only events with ts_recv >= start_ts.
+            end_ts:        Replay only events with ts_recv <= end_ts.
         """
         self.events_path = events_path
         self.run_dir = run_dir
         self.strict = strict
         self.output_format = output_format
+        self.stream = stream
+        self.start_ts = start_ts
+        self.end_ts = end_ts
 
     # ------------------------------------------------------------------
     # Public API
@@ -67,116 +90,109 @@ class ReplayRunner:
         """
         self.run_dir.mkdir(parents=True, exist_ok=True)
 
-        events = self._load_events()
-        if not events:
-            raise ValueError(f"No events found in {self.events_path}")
+        if self.output_format == "csv":
+            out_path = self.run_dir / "best_bid_ask.csv"
+        else:
+            out_path = self.run_dir / "best_bid_ask.jsonl"
 
-        # Collect all asset IDs present in the tape (both top-level and from
-        # modern batched price_changes[] entries).
-        asset_ids: set[str] = {
-            e.get("asset_id", "") for e in events if e.get("asset_id")
-        }
-        for e in events:
-            for entry in e.get("price_changes", []):
-                if entry.get("asset_id"):
-                    asset_ids.add(str(entry["asset_id"]))
-        if len(asset_ids) > 1:
-            logger.warning(
-                "Multiple asset_ids in tape: %s.  Replaying all.", sorted(asset_ids)
+        warnings: list[str] = []
+        books: dict[str, L2Book] = {}
+        windowed = self.start_ts is not None or self.end_ts is not None
+        warmup_events = 0
+
+        if windowed:
+            window = open_tape_window(self.events_path, self.start_ts, self.end_ts)
+            for msg in window.warnings:
+                logger.warning("%s in %s", msg, self.events_path)
+            books = {aid: L2Book(aid, strict=self.strict) for aid in sorted(window.asset_ids)}
+            warmup_events = prime_books(
+                window,
+                books,
+                apply=lambda e: self._replay_event(e, books, warnings, lambda row: None),
             )
+            events: Iterable[dict] = window.events()
+            if self.stream:
+                emit, close_timeline = self._open_timeline(out_path)
+            else:
+                timeline: list[dict] = []
+                emit, close_timeline = timeline.append, lambda: None
+        elif self.stream:
+            events = iter_tape_events(self.events_path)
+            emit, close_timeline = self._open_timeline(out_path)
+        else:
+            loaded = self._load_events()
+            if not loaded:
+                raise ValueError(f"No events found in {self.events_path}")
+            events = loaded
+            # Collect all asset IDs present in the tape (both top-level and from
+            # modern batched price_changes[] entries).
+            asset_ids = collect_asset_ids(loaded)
+            if len(asset_ids) > 1:
+                logger.warning(
+                    "Multiple asset_ids in tape: %s.  Replaying all.", sorted(asset_ids)
+                )
+            books = {aid: L2Book(aid, strict=self.strict) for aid in asset_ids}
+            timeline = []
+            emit, close_timeline = timeline.append, lambda: None
 
-        books: dict[str, L2Book] = {
-            aid: L2Book(aid, strict=self.strict) for aid in asset_ids
-        }
+        total_events = 0
+        timeline_rows = 0
+        prev_seq: Optional[int] = None
 
-        timeline: list[dict] = []
-        warnings: list[str] = []
+        try:
+            for event in events:
+                total_events += 1
+                seq = event.get("seq", 0)
+                if self.stream and prev_seq is not None and seq < prev_seq:
+                    msg = (
+                        f"stream mode: seq went backwards ({prev_seq} -> {seq}); "
+                        "tape is not seq-ordered."
+                    )
+                    if self.strict:
+                        raise ValueError(msg)
+                    warnings.append(msg)
+                    logger.warning(msg)
+                prev_seq = seq
+                timeline_rows += self._replay_event(event, books, warnings, emit)
+        finally:
+            close_timeline()
 
-        for event in events:
-            asset_id: str = event.get("asset_id", "")
-            event_type: str = event.get("event_type", "")
-
-            # Modern batched format: price_changes[] with per-entry asset_id.
-            # Each entry is applied to its own book; one timeline row per entry.
-            if event_type == EVENT_TYPE_PRICE_CHANGE and "price_changes" in event:
-                for entry in event.get("price_changes", []):
-                    entry_asset = str(entry.get("asset_id") or "")
-                    if not entry_asset:
-                        continue
-                    if entry_asset not in books:
-                        books[entry_asset] = L2Book(entry_asset, strict=self.strict)
-                    try:
-                        if books[entry_asset].apply_single_delta(entry):
-                            book = books[entry_asset]
-                            timeline.append(
-                                {
-                                    "seq": event.get("seq"),
-                                    "ts_recv": event.get("ts_recv"),
-                                    "asset_id": entry_asset,
-                                    "event_type": event_type,
-                                    "best_bid": book.best_bid,
-                                    "best_ask": book.best_ask,
-                                }
-                            )
-                    except L2BookError as exc:
-                        msg = f"seq={event.get('seq')} asset={entry_asset}: {exc}"
-                        if self.strict:
-                            raise
-                        warnings.append(msg)
-                        logger.warning(msg)
-                continue
-
-            # Legacy / single-asset format.
-            if asset_id not in books:
-                books[asset_id] = L2Book(asset_id, strict=self.strict)
-
-            try:
-                applied = books[asset_id].apply(event)
-            except L2BookError as exc:
-                msg = f"seq={event.get('seq')}: {exc}"
-                if self.strict:
-                    raise
-                warnings.append(msg)
-                logger.warning(msg)
-                continue
-
-            # Emit a timeline row only when the event was successfully applied.
-            if applied and event_type in (EVENT_TYPE_BOOK, EVENT_TYPE_PRICE_CHANGE):
-                book = books[asset_id]
-                timeline.append(
-                    {
-                        "seq": event.get("seq"),
-                        "ts_recv": event.get("ts_recv"),
-                        "asset_id": asset_id,
-                        "event_type": event_type,
-                        "best_bid": book.best_bid,
-                        "best_ask": book.best_ask,
-                    }
+        if total_events == 0:
+            if windowed:
+                raise ValueError(
+                    f"No events between start_ts={self.start_ts} and "
+                    f"end_ts={self.end_ts} in {self.events_path}"
                 )
+            raise ValueError(f"No events found in {self.events_path}")
 
         # Write quality metadata.
         quality = "ok" if not warnings else "warnings"
         meta: dict = {
             "run_quality": quality,
             "events_path": str(self.events_path),
-            "total_events": len(events),
-            "timeline_rows": len(timeline),
+            "total_events": total_events,
+            "timeline_rows": timeline_rows,
             "warnings": warnings[:50],
         }
+        if windowed:
+            meta["window"] = {
+                "start_ts": self.start_ts,
+                "end_ts": self.end_ts,
+                "warmup_events": warmup_events,
+            }
         meta_path = self.run_dir / "meta.json"
         meta_path.write_text(json.dumps(meta, indent=2) + "\n", encoding="utf-8")
 
-        # Write timeline.
-        if self.output_format == "csv":
-            out_path = self.run_dir / "best_bid_ask.csv"
-            self._write_csv(out_path, timeline)
-        else:
-            out_path = self.run_dir / "best_bid_ask.jsonl"
-            self._write_jsonl(out_path, timeline)
+        # Write timeline (already on disk when streaming).
+        if not self.stream:
+            if self.output_format == "csv":
+                self._write_csv(out_path, timeline)
+            else:
+                self._write_jsonl(out_path, timeline)
 
         logger.info(
             "Replay complete: %d timeline rows -> %s  (quality=%s)",
-            len(timeline),
+            timeline_rows,
             out_path,
             quality,
         )
@@ -186,29 +202,98 @@ class ReplayRunner:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _load_events(self) -> list[dict]:
-        """Load events.jsonl and sort by seq for deterministic replay."""
-        events: list[dict] = []
-        with open(self.events_path, encoding="utf-8") as fh:
-            for lineno, line in enumerate(fh, start=1):
-                line = line.strip()
-                if not line:
+    def _replay_event(
+        self,
+        event: dict,
+        books: dict[str, L2Book],
+        warnings: list[str],
+        emit: Callable[[dict], Any],
+    ) -> int:
+        """Apply one event to *books*, emit its timeline rows, return the row count."""
+        rows = 0
+        asset_id: str = event.get("asset_id", "")
+        event_type: str = event.get("event_type", "")
+
+        # Modern batched format: price_changes[] with per-entry asset_id.
+        # Each entry is applied to its own book; one timeline row per entry.
+        if event_type == EVENT_TYPE_PRICE_CHANGE and "price_changes" in event:
+            for entry in event.get("price_changes", []):
+                entry_asset = str(entry.get("asset_id") or "")
+                if not entry_asset:
                     continue
+                if entry_asset not in books:
+                    books[entry_asset] = L2Book(entry_asset, strict=self.strict)
                 try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError as exc:
-                    logger.warning(
-                        "Skipping malformed line %d in %s: %s",
-                        lineno,
-                        self.events_path,
-                        exc,
-                    )
+                    if books[entry_asset].apply_single_delta(entry):
+                        book = books[entry_asset]
+                        emit(
+                            {
+                                "seq": event.get("seq"),
+                                "ts_recv": event.get("ts_recv"),
+                                "asset_id": entry_asset,
+                                "event_type": event_type,
+                                "best_bid": book.best_bid,
+                                "best_ask": book.best_ask,
+                            }
+                        )
+                        rows += 1
+                except L2BookError as exc:
+                    msg = f"seq={event.get('seq')} asset={entry_asset}: {exc}"
+                    if self.strict:
+                        raise
+                    warnings.append(msg)
+                    logger.warning(msg)
+            return rows
+
+        # Legacy / single-asset format.
+        if asset_id not in books:
+            books[asset_id] = L2Book(asset_id, strict=self.strict)
+
+        try:
+            applied = books[asset_id].apply(event)
+        except L2BookError as exc:
+            msg = f"seq={event.get('seq')}: {exc}"
+            if self.strict:
+                raise
+            warnings.append(msg)
+            logger.warning(msg)
+            return rows
+
+        # Emit a timeline row only when the event was successfully applied.
+        if applied and event_type in (EVENT_TYPE_BOOK, EVENT_TYPE_PRICE_CHANGE):
+            book = books[asset_id]
+            emit(
+                {
+                    "seq": event.get("seq"),
+                    "ts_recv": event.get("ts_recv"),
+                    "asset_id": asset_id,
+                    "event_type": event_type,
+                    "best_bid": book.best_bid,
+                    "best_ask": book.best_ask,
+                }
+            )
+            rows += 1
+        return rows
+
+    def _load_events(self) -> list[dict]:
+        """Load the tape (JSONL or columnar) and sort by seq for deterministic replay."""
+        events: list[dict] = list(iter_tape_events(self.events_path))
         # Sort by seq (monotonic arrival counter); ties are impossible
         # by construction but secondary-sort by lineno is implicit via
         # stable sort preserving file order for equal seqs.
         events.sort(key=lambda e: e.get("seq", 0))
         return events
 
+    def _open_timeline(self, path: Path) -> tuple[Callable[[dict], Any], Callable[[], None]]:
+        """Open a streaming timeline writer; returns ``(emit_row, close)``."""
+        if self.output_format == "csv":
+            fh = open(path, "w", newline="", encoding="utf-8")
+            writer = csv.DictWriter(fh, fieldnames=_TIMELINE_FIELDS)
+            writer.writeheader()
+            return writer.writerow, fh.close
+        fh = open(path, "w", encoding="utf-8")
+        return (lambda row: fh.write(json.dumps(row) + "\n")), fh.close
+
     @staticmethod
     def _write_jsonl(path: Path, rows: list[dict]) -> None:
         with open(path, "w", encoding="utf-8") as fh:
@@ -217,9 +302,8 @@ class ReplayRunner:
 
     @staticmethod
     def _write_csv(path: Path, rows: list[dict]) -> None:
-        fieldnames = ["seq", "ts_recv", "asset_id", "event_type", "best_bid", "best_ask"]
         with open(path, "w", newline="", encoding="utf-8") as fh:
-            writer = csv.DictWriter(fh, fieldnames=fieldnames)
+            writer = csv.DictWriter(fh, fieldnames=_TIMELINE_FIELDS)
             writer.writeheader()
             if rows:
                 writer.writerows(rows)
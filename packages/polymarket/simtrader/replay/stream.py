@@ -0,0 +1,167 @@
+"""Bounded-memory helpers for streaming tape replay.
+
+Buffered replay loads the whole ``events.jsonl`` into a list, sorts it by
+``seq`` and keeps every timeline / decision / broker row in memory until the
+run finishes.  Streaming replay instead:
+
+  * reads events lazily with :func:`iter_tape_events` (the tape must already
+    be in ``seq`` order, which ``TapeRecorder`` guarantees), and
+  * appends output rows to :class:`JsonlSpool` sinks that write straight to
+    their artifact file, so peak memory does not grow with tape length.
+
+A :class:`JsonlSpool` without a path buffers rows in memory instead, which
+lets the runners share one code path for both modes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from ..tape.columnar import ColumnarTape, is_columnar_tape, iter_columnar_events
+
+logger = logging.getLogger(__name__)
+
+# Write buffer for streamed artifact files.
+_WRITE_BUFFER_BYTES = 1 << 20
+
+
+def iter_tape_events(
+    events_path: Path,
+    on_malformed: Optional[Callable[[int, json.JSONDecodeError], None]] = None,
+) -> Iterator[dict]:
+    """Yield decoded events from *events_path* one line at a time.
+
+    Blank lines are skipped.  Malformed lines are reported through
+    *on_malformed* (``lineno, exc``) when given, otherwise logged, and never
+    stop iteration.  Columnar ``.ctape`` tapes (see ``tape.columnar``) are
+    detected by their magic bytes and read through the columnar reader.
+    """
+    if is_columnar_tape(events_path):
+        yield from iter_columnar_events(events_path)
+        return
+    with open(events_path, encoding="utf-8") as fh:
+        for lineno, line in enumerate(fh, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as exc:
+                if on_malformed is not None:
+                    on_malformed(lineno, exc)
+                else:
+                    logger.warning(
+                        "Skipping malformed line %d in %s: %s", lineno, events_path, exc
+                    )
+
+
+def tape_asset_ids(events_path: Path) -> set[str]:
+    """Return every asset_id in the tape at *events_path*.
+
+    Columnar tapes answer from their string dictionary without decoding any
+    events; JSONL tapes are scanned with :func:`collect_asset_ids`.
+    """
+    if is_columnar_tape(events_path):
+        with ColumnarTape(events_path) as tape:
+            return tape.asset_ids()
+    return collect_asset_ids(iter_tape_events(events_path, on_malformed=lambda *_: None))
+
+
+def collect_asset_ids(events: Iterable[dict]) -> set[str]:
+    """Return every asset_id in *events*, including batched ``price_changes[]``."""
+    ids: set[str] = set()
+    for e in events:
+        if e.get("asset_id"):
+            ids.add(str(e["asset_id"]))
+        for entry in e.get("price_changes", []):
+            if entry.get("asset_id"):
+                ids.add(str(entry["asset_id"]))
+    return ids
+
+
+class JsonlSpool:
+    """Append-only row sink backed by memory or by a JSONL file.
+
+    With ``path=None`` rows are kept in a list and written out by
+    :meth:`dump`.  With a path, each row is serialised immediately and only
+    the row count and the last row are retained.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path
+        self._rows: Optional[list[Any]] = [] if path is None else None
+        self._fh = (
+            open(path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_BYTES)
+            if path is not None
+            else None
+        )
+        self._count = 0
+        self._last: Any = None
+
+    @classmethod
+    def from_rows(cls, rows: list[Any]) -> "JsonlSpool":
+        """Wrap an existing in-memory row list without copying it."""
+        spool = cls()
+        spool._rows = rows
+        spool._count = len(rows)
+        spool._last = rows[-1] if rows else None
+        return spool
+
+    @property
+    def streaming(self) -> bool:
+        return self.path is not None
+
+    @property
+    def last(self) -> Any:
+        """Most recently appended row, or None if empty."""
+        return self._last
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def append(self, row: Any) -> None:
+        self._count += 1
+        self._last = row
+        if self._fh is not None:
+            self._fh.write(json.dumps(row) + "\n")
+        else:
+            assert self._rows is not None
+            self._rows.append(row)
+
+    def extend(self, rows: Iterable[Any]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def rows(self) -> Iterator[Any]:
+        """Iterate all rows in append order.
+
+        For a file-backed spool this closes the writer and re-reads the
+        file lazily; no further appends are allowed afterwards.
+        """
+        if self._rows is not None:
+            return iter(self._rows)
+        self.close()
+        assert self.path is not None
+        return iter_tape_events(self.path)
+
+    def dump(self, path: Path) -> None:
+        """Materialise the spool at *path* (a no-op flush when already streamed there)."""
+        if self._rows is None:
+            self.close()
+            if path != self.path:
+                raise ValueError(f"spool streams to {self.path}, not {path}")
+            return
+        with open(path, "w", encoding="utf-8") as fh:
+            for row in self._rows:
+                fh.write(json.dumps(row) + "\n")
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
@@ -0,0 +1,324 @@
+"""Windowed rolling statistics with O(1) updates for per-event strategy state.
+
+Strategies and risk signals keep short trailing windows (mid history, trade
+arrivals, book depth) and ask for a variance, rate, or mean on every event.
+Recomputing those from the whole window makes per-event cost grow with the
+window length; the components here keep running moments instead:
+
+RollingMoments
+    Welford mean / population variance with ``add`` *and* ``remove``.
+
+TimeWindowedSeries
+    ``(ts, value)`` samples inside a trailing time window.  Tracks the
+    moments of successive changes (``value[i] - value[i-1]``), which is what
+    the market makers use as their volatility estimate.
+
+ArrivalRateCounter
+    Event timestamps inside a trailing time window; ``count`` / ``rate``.
+
+RollingWindow
+    Last ``maxlen`` values with a running total (count-based window).
+
+EWMA
+    Exponentially weighted moving average, per-update or time-decayed.
+
+The window containers are deque-compatible (``append``, ``clear``, ``len``,
+indexing, iteration) so existing code that seeds or inspects history
+directly keeps working.  Floating-point running sums are periodically
+recomputed from the retained samples, which keeps drift bounded while
+staying O(1) amortized per update.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+# Extra evictions tolerated (beyond the window length) before running float
+# sums are recomputed from the retained samples.
+_REBUILD_SLACK = 64
+
+
+class RollingMoments:
+    """Running count / mean / population variance supporting removals (Welford)."""
+
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def reset(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def remove(self, value: float) -> None:
+        """Remove a value previously passed to :meth:`add`."""
+        if self.count <= 1:
+            self.reset()
+            return
+        self.count -= 1
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self._m2 -= delta * (value - self.mean)
+        if self._m2 < 0.0:
+            self._m2 = 0.0
+
+    @property
+    def variance(self) -> float:
+        """Population variance (matches ``statistics.pvariance``); 0.0 when empty."""
+        if self.count == 0:
+            return 0.0
+        return self._m2 / self.count
+
+
+class TimeWindowedSeries:
+    """``(ts, value)`` samples within the trailing ``window_seconds``.
+
+    Samples are evicted when ``ts < t_now - window_seconds``.  Appends are
+    expected in non-decreasing ``ts`` order (tape order); eviction stops at
+    the first sample still inside the window, like a deque scan from the left.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        samples: Iterable[Tuple[float, float]] = (),
+    ) -> None:
+        self.window_seconds = float(window_seconds)
+        self._samples: deque[Tuple[float, float]] = deque()
+        self._changes = RollingMoments()
+        self._evictions = 0
+        for sample in samples:
+            self.append(sample)
+
+    # -- deque-compatible surface -------------------------------------------
+
+    def append(self, sample: Tuple[float, float]) -> None:
+        ts, value = sample
+        sample = (float(ts), float(value))
+        if self._samples:
+            self._changes.add(sample[1] - self._samples[-1][1])
+        self._samples.append(sample)
+
+    def clear(self) -> None:
+        self._samples.clear()
+        self._changes.reset()
+        self._evictions = 0
+
+    def popleft(self) -> Tuple[float, float]:
+        oldest = self._samples.popleft()
+        if self._samples:
+            self._changes.remove(self._samples[0][1] - oldest[1])
+        else:
+            self._changes.reset()
+        self._evictions += 1
+        return oldest
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def __bool__(self) -> bool:
+        return bool(self._samples)
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        return iter(self._samples)
+
+    def __getitem__(self, index: int) -> Tuple[float, float]:
+        return self._samples[index]
+
+    # -- windowing + statistics ----------------------------------------------
+
+    def add(self, ts: float, value: float) -> None:
+        """Append a sample and evict everything older than the window."""
+        self.append((ts, value))
+        self.evict(ts)
+
+    def evict(self, t_now: float) -> None:
+        cutoff = t_now - self.window_seconds
+        samples = self._samples
+        while samples and samples[0][0] < cutoff:
+            self.popleft()
+        if self._evictions > len(samples) + _REBUILD_SLACK:
+            self._rebuild()
+
+    @property
+    def change_count(self) -> int:
+        return self._changes.count
+
+    def change_variance(self) -> float:
+        """Population variance of successive value changes in the window."""
+        return self._changes.variance
+
+    def _rebuild(self) -> None:
+        self._changes.reset()
+        previous: Optional[float] = None
+        for _, value in self._samples:
+            if previous is not None:
+                self._changes.add(value - previous)
+            previous = value
+        self._evictions = 0
+
+
+class ArrivalRateCounter:
+    """Event arrival timestamps within the trailing ``window_seconds``."""
+
+    def __init__(self, window_seconds: float, timestamps: Iterable[float] = ()) -> None:
+        self.window_seconds = float(window_seconds)
+        self._timestamps: deque[float] = deque(float(ts) for ts in timestamps)
+
+    def append(self, ts: float) -> None:
+        self._timestamps.append(float(ts))
+
+    def clear(self) -> None:
+        self._timestamps.clear()
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __bool__(self) -> bool:
+        return bool(self._timestamps)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._timestamps)
+
+    def __getitem__(self, index: int) -> float:
+        return self._timestamps[index]
+
+    def record(self, ts: float) -> None:
+        """Record an arrival at *ts* and evict arrivals older than the window."""
+        self.append(ts)
+        self.evict(ts)
+
+    def evict(self, t_now: float) -> None:
+        cutoff = t_now - self.window_seconds
+        timestamps = self._timestamps
+        while timestamps and timestamps[0] < cutoff:
+            timestamps.popleft()
+
+    def count(self, t_now: float) -> int:
+        """Arrivals in ``[t_now - window_seconds, ...]`` after evicting older ones."""
+        self.evict(t_now)
+        return len(self._timestamps)
+
+    def rate(self, t_now: float) -> float:
+        """Arrivals per second over the full window length."""
+        return self.count(t_now) / self.window_seconds
+
+
+Number = Union[int, float]
+
+
+class RollingWindow:
+    """The last ``maxlen`` values with a running total and mean.
+
+    Integer totals are exact; float totals are recomputed from the retained
+    values every ``maxlen + 64`` evictions to bound rounding drift.
+    """
+
+    def __init__(self, maxlen: int, values: Iterable[Number] = ()) -> None:
+        if maxlen < 1:
+            raise ValueError("RollingWindow: maxlen must be >= 1")
+        self.maxlen = int(maxlen)
+        self._values: deque[Number] = deque()
+        self.total: Number = 0
+        self._evictions = 0
+        for value in values:
+            self.append(value)
+
+    def append(self, value: Number) -> None:
+        if len(self._values) == self.maxlen:
+            self.total -= self._values.popleft()
+            self._evictions += 1
+            if self._evictions > self.maxlen + _REBUILD_SLACK:
+                self.total = sum(self._values)
+                self._evictions = 0
+        self._values.append(value)
+        self.total += value
+
+    def clear(self) -> None:
+        self._values.clear()
+        self.total = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __bool__(self) -> bool:
+        return bool(self._values)
+
+    def __iter__(self) -> Iterator[Number]:
+        return iter(self._values)
+
+    def __getitem__(self, index: int) -> Number:
+        return self._values[index]
+
+    @property
+    def mean(self) -> float:
+        if not self._values:
+            return 0.0
+        return self.total / len(self._values)
+
+
+class EWMA:
+    """Exponentially weighted moving average.
+
+    With ``alpha`` every update has the same weight.  With
+    ``half_life_seconds`` the weight of the new value depends on the time
+    since the previous update, so irregular event spacing is handled.
+    """
+
+    def __init__(
+        self,
+        *,
+        alpha: Optional[float] = None,
+        half_life_seconds: Optional[float] = None,
+    ) -> None:
+        if (alpha is None) == (half_life_seconds is None):
+            raise ValueError("EWMA: pass exactly one of alpha or half_life_seconds")
+        if alpha is not None and not 0.0 < alpha <= 1.0:
+            raise ValueError("EWMA: alpha must be in (0, 1]")
+        if half_life_seconds is not None and half_life_seconds <= 0:
+            raise ValueError("EWMA: half_life_seconds must be > 0")
+        self.alpha = alpha
+        self.half_life_seconds = half_life_seconds
+        self.value: Optional[float] = None
+        self.count = 0
+        self._last_ts: Optional[float] = None
+
+    def reset(self) -> None:
+        self.value = None
+        self.count = 0
+        self._last_ts = None
+
+    def update(self, value: float, ts: Optional[float] = None) -> float:
+        """Fold *value* in and return the new average.
+
+        Time-decayed averages require *ts*; updates with a ``ts`` earlier
+        than the previous one are treated as simultaneous.
+        """
+        value = float(value)
+        if self.value is None:
+            self.value = value
+        else:
+            if self.alpha is not None:
+                weight = self.alpha
+            else:
+                if ts is None:
+                    raise ValueError("EWMA: ts is required for time-decayed updates")
+                elapsed = max(float(ts) - (self._last_ts if self._last_ts is not None else float(ts)), 0.0)
+                weight = 1.0 - math.exp(-elapsed * math.log(2.0) / self.half_life_seconds)
+            self.value += weight * (value - self.value)
+        if ts is not None:
+            self._last_ts = float(ts) if self._last_ts is None else max(self._last_ts, float(ts))
+        self.count += 1
+        return self.value
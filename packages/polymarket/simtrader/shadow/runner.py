@@ -738,8 +738,8 @@ class ShadowRunner:
             broker.step(event, all_books[step_asset], fill_asset_id=step_asset)
 
         # 6. Dispatch on_fill for new fills.
-        new_fills = broker.fills[state["last_fill_idx"]:]
-        state["last_fill_idx"] = len(broker.fills)
+        new_fills = broker.fills_since(state["last_fill_idx"])
+        state["last_fill_idx"] = broker.fill_count
         for fill in new_fills:
             if fill.fill_size > _ZERO:
                 self.strategy.on_fill(
@@ -754,8 +754,8 @@ class ShadowRunner:
                 )
 
         # 7. Update open-order tracking.
-        new_broker_events = broker.order_events[state["last_order_event_idx"]:]
-        state["last_order_event_idx"] = len(broker.order_events)
+        new_broker_events = broker.order_events_since(state["last_order_event_idx"])
+        state["last_order_event_idx"] = broker.order_event_count
         for bev in new_broker_events:
             _update_open_orders(open_orders, bev)
 
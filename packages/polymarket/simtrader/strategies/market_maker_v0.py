@@ -10,14 +10,13 @@ from __future__ import annotations
 
 import logging
 import math
-from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal, InvalidOperation
-from statistics import pvariance
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from packages.polymarket.simtrader.orderbook.l2book import L2Book
+from packages.polymarket.simtrader.rolling_stats import TimeWindowedSeries
 from packages.polymarket.simtrader.strategy.base import OrderIntent, Strategy
 
 logger = logging.getLogger(__name__)
@@ -80,6 +79,9 @@ class MMConfig:
 class MarketMakerV0(Strategy):
     """Two-sided market maker with an Avellaneda-Stoikov reservation price."""
 
+    # Variance used until the mid window holds at least three samples.
+    _fallback_sigma_sq: float = _DEFAULT_SIGMA_SQ
+
     def __init__(
         self,
         tick_size: Any = "0.01",
@@ -149,7 +151,7 @@ class MarketMakerV0(Strategy):
         self._asset_id: Optional[str] = None
         self._inventory: Decimal = _ZERO
         self._book: Optional[L2Book] = None
-        self._mid_history: deque[tuple[float, float]] = deque()
+        self._mid_window = TimeWindowedSeries(self.mm_config.vol_window_seconds)
         self._session_start_ts: Optional[float] = None
         self._last_ts_recv: Optional[float] = None
         self._hours_to_resolution = self.default_hours_to_resolution
@@ -177,6 +179,15 @@ class MarketMakerV0(Strategy):
         if config.spread_multiplier <= 0:
             raise ValueError("market_maker_v0: spread_multiplier must be > 0")
 
+    @property
+    def _mid_history(self) -> TimeWindowedSeries:
+        """Deque-compatible view of the ``(ts, mid)`` volatility window."""
+        return self._mid_window
+
+    @_mid_history.setter
+    def _mid_history(self, samples: Iterable[tuple[float, float]]) -> None:
+        self._mid_window = TimeWindowedSeries(self.mm_config.vol_window_seconds, samples)
+
     # ------------------------------------------------------------------
     # Strategy lifecycle
     # ------------------------------------------------------------------
@@ -303,26 +314,14 @@ class MarketMakerV0(Strategy):
         return normalized[:depth]
 
     def _record_mid(self, t_now: float, mid: float) -> None:
-        self._mid_history.append((t_now, mid))
-        cutoff = t_now - self.mm_config.vol_window_seconds
-        while self._mid_history and self._mid_history[0][0] < cutoff:
-            self._mid_history.popleft()
+        self._mid_window.add(t_now, mid)
 
     def _sigma_sq(self, t_now: float) -> float:
-        cutoff = t_now - self.mm_config.vol_window_seconds
-        while self._mid_history and self._mid_history[0][0] < cutoff:
-            self._mid_history.popleft()
-
-        if len(self._mid_history) < 3:
-            return _DEFAULT_SIGMA_SQ
-
-        changes = [
-            current_mid - previous_mid
-            for (_, previous_mid), (_, current_mid) in zip(self._mid_history, list(self._mid_history)[1:])
-        ]
-        if len(changes) < 2:
-            return _DEFAULT_SIGMA_SQ
-        return float(pvariance(changes))
+        """Population variance of mid changes in the window, O(1) per call."""
+        self._mid_window.evict(t_now)
+        if len(self._mid_window) < 3:
+            return self._fallback_sigma_sq
+        return self._mid_window.change_variance()
 
     def _compute_quotes(self, mid: float, t_elapsed_hours: float, sigma_sq: float) -> tuple[float, float]:
         remaining_hours = max(self.mm_config.session_hours - t_elapsed_hours, _MIN_REMAINING_HOURS)
@@ -33,10 +33,8 @@ with existing replay, sweep, and live-execution interfaces.
 from __future__ import annotations
 
 import math
-from collections import deque
 from decimal import Decimal
-from statistics import pvariance
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from packages.polymarket.simtrader.strategies.market_maker_v0 import (
     MarketMakerV0,
@@ -47,6 +45,7 @@ from packages.polymarket.simtrader.strategies.market_maker_v0 import (
     _MIN_REMAINING_HOURS,
     _clamp,
 )
+from packages.polymarket.simtrader.rolling_stats import ArrivalRateCounter
 from packages.polymarket.simtrader.strategy.base import OrderIntent
 
 # ---------------------------------------------------------------------------
@@ -134,11 +133,10 @@ class MarketMakerV1(MarketMakerV0):
     reprice-threshold logic from MarketMakerV0.
 
     Methods overridden beyond V0:
-      __init__        — adds _trade_arrival_ts deque for kappa calibration
+      __init__        — adds a trade-arrival counter for kappa calibration
       on_start        — resets _trade_arrival_ts on session open
       on_event        — captures last_trade_price arrivals before forwarding
       _record_mid     — stores logit(mid) so vol is measured in logit space
-      _sigma_sq       — falls back to logit-scale default instead of V0 default
       _kappa          — trade-arrival proxy for kappa; explicit static fallback
       _compute_quotes — applies A-S entirely in logit space using _kappa()
 
@@ -157,11 +155,23 @@ class MarketMakerV1(MarketMakerV0):
     kappa is returned verbatim (the explicit documented fallback).
     """
 
+    # Logit-scale variance fallback instead of V0's probability-scale default.
+    _fallback_sigma_sq: float = _DEFAULT_SIGMA_SQ_LOGIT
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        self._trade_arrival_ts: deque[float] = deque()
+        self._trade_arrivals = ArrivalRateCounter(self.mm_config.vol_window_seconds)
         self.calibration_provenance: Optional[dict] = None
 
+    @property
+    def _trade_arrival_ts(self) -> ArrivalRateCounter:
+        """Deque-compatible view of the trade-arrival window."""
+        return self._trade_arrivals
+
+    @_trade_arrival_ts.setter
+    def _trade_arrival_ts(self, timestamps: Iterable[float]) -> None:
+        self._trade_arrivals = ArrivalRateCounter(self.mm_config.vol_window_seconds, timestamps)
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -178,10 +188,7 @@ class MarketMakerV1(MarketMakerV0):
         """Append ts_recv when event is a last_trade_price; prune old entries."""
         if str(event.get("event_type") or "") != "last_trade_price":
             return
-        self._trade_arrival_ts.append(ts_recv)
-        cutoff = ts_recv - self.mm_config.vol_window_seconds
-        while self._trade_arrival_ts and self._trade_arrival_ts[0] < cutoff:
-            self._trade_arrival_ts.popleft()
+        self._trade_arrivals.record(ts_recv)
 
     def _kappa(self, t_now: float) -> float:
         """Return effective kappa: trade-arrival proxy or constructor fallback.
@@ -200,11 +207,7 @@ class MarketMakerV1(MarketMakerV0):
         fill-decay parameter.  See module-level docstring and constants for
         the explicit statement of what is and is not being calibrated.
         """
-        cutoff = t_now - self.mm_config.vol_window_seconds
-        while self._trade_arrival_ts and self._trade_arrival_ts[0] < cutoff:
-            self._trade_arrival_ts.popleft()
-
-        n = len(self._trade_arrival_ts)
+        n = self._trade_arrivals.count(t_now)
         if n < _MIN_TRADES_FOR_KAPPA:
             return self.mm_config.kappa  # explicit static fallback
 
@@ -233,29 +236,7 @@ class MarketMakerV1(MarketMakerV0):
 
     def _record_mid(self, t_now: float, mid: float) -> None:
         """Record clipped logit(mid) for logit-space variance estimation."""
-        self._mid_history.append((t_now, _logit(_clip_prob(mid))))
-        cutoff = t_now - self.mm_config.vol_window_seconds
-        while self._mid_history and self._mid_history[0][0] < cutoff:
-            self._mid_history.popleft()
-
-    def _sigma_sq(self, t_now: float) -> float:
-        """Variance of logit-space mid changes; falls back to logit default."""
-        cutoff = t_now - self.mm_config.vol_window_seconds
-        while self._mid_history and self._mid_history[0][0] < cutoff:
-            self._mid_history.popleft()
-
-        if len(self._mid_history) < 3:
-            return _DEFAULT_SIGMA_SQ_LOGIT
-
-        changes = [
-            curr - prev
-            for (_, prev), (_, curr) in zip(
-                self._mid_history, list(self._mid_history)[1:]
-            )
-        ]
-        if len(changes) < 2:
-            return _DEFAULT_SIGMA_SQ_LOGIT
-        return float(pvariance(changes))
+        super()._record_mid(t_now, _logit(_clip_prob(mid)))
 
     # ------------------------------------------------------------------
     # Override: logit-space quote math
@@ -335,7 +316,7 @@ class MarketMakerV1(MarketMakerV0):
         """Snapshot calibration state at *t_now* and return provenance dict.
 
         Calls ``_sigma_sq`` and ``_kappa`` (which prune their respective
-        deques in-place) then reads the post-prune counts to determine
+        windows in-place) then reads the post-prune counts to determine
         which path was actually taken.
 
         Schema::
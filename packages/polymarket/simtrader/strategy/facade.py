@@ -194,6 +194,10 @@ class StrategyRunParams:
     market_slug: Optional[str] = None
     fee_category: Optional[str] = None
     fee_role: str = "taker"
+    stream: bool = False
+    tape_cache_dir: Optional[Path] = None
+    start_ts: Optional[float] = None
+    end_ts: Optional[float] = None
 
 
 @dataclass(frozen=True)
@@ -234,6 +238,12 @@ def run_strategy(params: StrategyRunParams) -> StrategyRunResult:
         raise StrategyRunConfigError("latency_submit_ticks must be non-negative")
     if params.latency_cancel_ticks < 0:
         raise StrategyRunConfigError("latency_cancel_ticks must be non-negative")
+    if (
+        params.start_ts is not None
+        and params.end_ts is not None
+        and params.end_ts < params.start_ts
+    ):
+        raise StrategyRunConfigError("end_ts must not be before start_ts")
     validate_mark_method(params.mark_method)
 
     strategy = _build_strategy(params.strategy_name, params.strategy_config)
@@ -268,6 +278,10 @@ def run_strategy(params: StrategyRunParams) -> StrategyRunResult:
         strategy_name=params.strategy_name,
         strategy_preset=params.strategy_preset,
         market_slug=params.market_slug,
+        stream=params.stream,
+        tape_cache_dir=params.tape_cache_dir,
+        start_ts=params.start_ts,
+        end_ts=params.end_ts,
     )
 
     summary = runner.run()
@@ -24,6 +24,16 @@ After the loop
 - ``PortfolioLedger.process(broker.order_events, timeline)``
 - Write all artifacts to ``run_dir``
 
+Streaming mode
+--------------
+With ``stream=True`` the tape is read lazily instead of being loaded and
+sorted up front (it must already be in ``seq`` order), and timeline,
+decision, order and fill rows are written to their JSONL artifacts as they
+are produced.  The broker history is drained every tick and the ledger
+replays ``orders.jsonl`` / ``best_bid_ask.jsonl`` back from disk via
+``PortfolioLedger.iter_process``, so peak memory stays bounded regardless
+of tape length.  Artifacts are byte-identical to a buffered run.
+
 Artifacts written
 -----------------
   best_bid_ask.jsonl, orders.jsonl, fills.jsonl, ledger.jsonl,
@@ -34,6 +44,7 @@ Artifacts written
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 from datetime import datetime, timezone
@@ -47,6 +58,14 @@ from ..display_name import build_display_name
 from ..orderbook.l2book import L2Book
 from ..portfolio.ledger import PortfolioLedger
 from ..portfolio.mark import MARK_BID
+from ..replay.stream import (
+    JsonlSpool,
+    collect_asset_ids,
+    iter_tape_events,
+    tape_asset_ids,
+)
+from ..tape.cache import load_tape
+from ..tape.index import TapeWindow, apply_event_to_books, open_tape_window, prime_books
 from ..tape.schema import EVENT_TYPE_BOOK, EVENT_TYPE_PRICE_CHANGE
 from .base import OrderIntent, Strategy
 
@@ -54,6 +73,11 @@ logger = logging.getLogger(__name__)
 
 _BOOK_AFFECTING = frozenset({EVENT_TYPE_BOOK, EVENT_TYPE_PRICE_CHANGE})
 _ZERO_STR = "0"
+_ZERO = Decimal("0")
+_RUN_QUALITY_OK = "ok"
+_RUN_QUALITY_WARNINGS = "warnings"
+_RUN_QUALITY_DEGRADED = "degraded"
+_RUN_QUALITY_INVALID = "invalid"
 
 
 def _no_trade_ledger_snapshot(label: str, event: dict, starting_cash: Decimal) -> dict:
@@ -70,11 +94,6 @@ def _no_trade_ledger_snapshot(label: str, event: dict, starting_cash: Decimal) -
         "realized_pnl": _ZERO_STR,
         "total_fees": _ZERO_STR,
     }
-_ZERO = Decimal("0")
-_RUN_QUALITY_OK = "ok"
-_RUN_QUALITY_WARNINGS = "warnings"
-_RUN_QUALITY_DEGRADED = "degraded"
-_RUN_QUALITY_INVALID = "invalid"
 
 
 class StrategyRunner:
@@ -103,6 +122,10 @@ class StrategyRunner:
         strategy_name: Optional[str] = None,
         strategy_preset: Optional[str] = None,
         market_slug: Optional[str] = None,
+        stream: bool = False,
+        tape_cache_dir: Optional[Path] = None,
+        start_ts: Optional[float] = None,
+        end_ts: Optional[float] = None,
     ) -> None:
         """
         Args:
@@ -120,6 +143,17 @@ class StrategyRunner:
             strict:                If True, raise on L2BookError or malformed events.
             allow_degraded:        If True, continue multi-asset runs even when
                                    required tape coverage is incomplete.
+            stream:                If True, replay in bounded memory: read the
+                                   (seq-ordered) tape lazily and write artifact
+                                   rows to disk as they are produced.
+            tape_cache_dir:        If set, load the tape through the shared
+                                   parse-once cache (``tape.cache``) stored in
+                                   this directory.  Ignored when streaming.
+            start_ts / end_ts:     If either is set, only events with
+                                   start_ts <= ts_recv <= end_ts reach the
+                                   strategy, broker and ledger.  Books are first
+                                   brought to the window start from the tape
+                                   index's nearest checkpoint (``tape.index``).
         """
         self.events_path = events_path
         self.run_dir = run_dir
@@ -137,6 +171,10 @@ class StrategyRunner:
         self.strategy_name = strategy_name or strategy.__class__.__name__
         self.strategy_preset = strategy_preset
         self.market_slug = market_slug
+        self.stream = stream
+        self.tape_cache_dir = tape_cache_dir
+        self.start_ts = start_ts
+        self.end_ts = end_ts
 
     # ------------------------------------------------------------------
     # Public API
@@ -153,12 +191,24 @@ class StrategyRunner:
         """
         self.run_dir.mkdir(parents=True, exist_ok=True)
 
-        events, warnings = self._load_events()
-        if not events:
-            raise ValueError(f"No events found in {self.events_path}")
+        window: Optional[TapeWindow] = None
+        if self.start_ts is not None or self.end_ts is not None:
+            window = open_tape_window(self.events_path, self.start_ts, self.end_ts)
+            events = window.events()
+            warnings = list(window.warnings)
+            seen_asset_ids = set(window.asset_ids)
+            if not seen_asset_ids and not self.asset_id:
+                raise ValueError(f"No events found in {self.events_path}")
+        elif self.stream:
+            events, warnings, seen_asset_ids = self._scan_events_stream()
+        else:
+            events, warnings = self._load_events()
+            if not events:
+                raise ValueError(f"No events found in {self.events_path}")
+            seen_asset_ids = collect_asset_ids(events)
 
-        asset_id = self._resolve_asset_id(events)
-        coverage = self._validate_tape_coverage(events)
+        asset_id = self._resolve_asset_id(seen_asset_ids)
+        coverage = self._validate_tape_coverage(seen_asset_ids)
         run_quality = _RUN_QUALITY_OK
 
         if coverage is not None and coverage["warnings"]:
@@ -170,7 +220,9 @@ class StrategyRunner:
             self._write_failure_artifacts(
                 warnings=warnings,
                 asset_id=asset_id,
-                total_events=len(events),
+                total_events=(
+                    self._count_events() if self.stream or window else len(events)
+                ),
                 error=error_message,
                 tape_coverage=(coverage or {}).get("details"),
             )
@@ -182,6 +234,10 @@ class StrategyRunner:
             if extra_id not in all_books:
                 all_books[extra_id] = L2Book(extra_id, strict=self.strict)
 
+        warmup_events = 0
+        if window is not None:
+            warmup_events = prime_books(window, all_books)
+
         broker = SimBroker(latency=self.latency)
 
         # Open-order tracking: keyed by order_id, plain dict values
@@ -189,19 +245,46 @@ class StrategyRunner:
         _last_order_event_idx = 0
         _last_fill_idx = 0
 
-        timeline: list[dict] = []
-        decisions: list[dict] = []
+        # Row sinks: in-memory lists for buffered runs, JSONL files when streaming.
+        def _sink(name: str) -> JsonlSpool:
+            return JsonlSpool(self.run_dir / name if self.stream else None)
+
+        timeline = _sink("best_bid_ask.jsonl")
+        decisions = _sink("decisions.jsonl")
+        stream_orders = _sink("orders.jsonl") if self.stream else None
+        stream_fills = _sink("fills.jsonl") if self.stream else None
+
+        total_events = 0
+        first_event: Optional[dict] = None
+        last_event: Optional[dict] = None
+        prev_seq: Optional[int] = None
+        out_of_order_warned = False
 
         self.strategy.on_start(asset_id, self.starting_cash)
 
         for event in events:
             seq: int = event.get("seq", 0)
             ts_recv: float = event.get("ts_recv", 0.0)
-            evt_asset: str = event.get("asset_id", "")
             event_type: str = event.get("event_type", "")
 
-            primary_book = all_books[asset_id]
+            total_events += 1
+            if first_event is None:
+                first_event = event
+            last_event = event
+            if (
+                self.stream
+                and not out_of_order_warned
+                and prev_seq is not None
+                and seq < prev_seq
+            ):
+                out_of_order_warned = True
+                warnings.append(
+                    f"stream mode: seq went backwards ({prev_seq} -> {seq}); "
+                    "tape is not seq-ordered, results may differ from a buffered run."
+                )
+            prev_seq = seq
 
+            primary_book = all_books[asset_id]
             # 1. Update book(s).  Track which assets had book state changed.
             #
             # Schema A — legacy / single-asset:
@@ -210,17 +293,7 @@ class StrategyRunner:
             # Schema B — modern / batched (Polymarket Market Channel):
             #   event has price_changes[]; each entry carries its own asset_id and
             #   direct side/price/size fields.  There may be no top-level asset_id.
-            _active_assets: set[str] = set()
-            if event_type == EVENT_TYPE_PRICE_CHANGE and "price_changes" in event:
-                # Modern batched format — apply each entry to the matching book.
-                for entry in event.get("price_changes", []):
-                    entry_asset = str(entry.get("asset_id") or "")
-                    if entry_asset and entry_asset in all_books:
-                        all_books[entry_asset].apply_single_delta(entry)
-                        _active_assets.add(entry_asset)
-            elif evt_asset in all_books:
-                all_books[evt_asset].apply(event)
-                _active_assets.add(evt_asset)
+            _active_assets = apply_event_to_books(event, all_books)
 
             event_ctx = dict(event)
             event_ctx["_best_by_asset"] = {
@@ -253,8 +326,12 @@ class StrategyRunner:
                 broker.step(event, all_books[step_asset], fill_asset_id=step_asset)
 
             # 5. Dispatch on_fill for each new fill (non-zero size only)
-            new_fills = broker.fills[_last_fill_idx:]
-            _last_fill_idx = len(broker.fills)
+            if stream_fills is not None:
+                new_fills = broker.drain_fills()
+                stream_fills.extend(f.to_dict() for f in new_fills)
+            else:
+                new_fills = broker.fills_since(_last_fill_idx)
+                _last_fill_idx = broker.fill_count
             for fill in new_fills:
                 if fill.fill_size > _ZERO:
                     self.strategy.on_fill(
@@ -269,8 +346,12 @@ class StrategyRunner:
                     )
 
             # 6. Update open-order tracking from new broker events
-            new_events = broker.order_events[_last_order_event_idx:]
-            _last_order_event_idx = len(broker.order_events)
+            if stream_orders is not None:
+                new_events = broker.drain_order_events()
+                stream_orders.extend(new_events)
+            else:
+                new_events = broker.order_events_since(_last_order_event_idx)
+                _last_order_event_idx = broker.order_event_count
             for bev in new_events:
                 _update_open_orders(open_orders, bev)
 
@@ -289,6 +370,14 @@ class StrategyRunner:
                     }
                 )
 
+        if first_event is None or last_event is None:
+            if window is not None:
+                raise ValueError(
+                    f"No events between start_ts={self.start_ts} and "
+                    f"end_ts={self.end_ts} in {self.events_path}"
+                )
+            raise ValueError(f"No events found in {self.events_path}")
+
         self.strategy.on_finish()
 
         # Portfolio ledger (primary asset timeline for mark-to-market)
@@ -299,17 +388,32 @@ class StrategyRunner:
             fee_category=self.fee_category,
             fee_role=self.fee_role,
         )
-        ledger_events, equity_curve = ledger.process(broker.order_events, timeline)
-        final_best_bid: Optional[float] = timeline[-1].get("best_bid") if timeline else None
-        final_best_ask: Optional[float] = timeline[-1].get("best_ask") if timeline else None
+        if stream_orders is not None and stream_fills is not None:
+            orders = stream_orders
+            fills = stream_fills
+            ledger_events = _sink("ledger.jsonl")
+            equity_curve = _sink("equity_curve.jsonl")
+            for kind, row in ledger.iter_process(orders.rows(), timeline.rows()):
+                (ledger_events if kind == "ledger" else equity_curve).append(row)
+        else:
+            orders = JsonlSpool.from_rows(broker.order_events)
+            fills = JsonlSpool.from_rows([f.to_dict() for f in broker.fills])
+            ledger_rows, equity_rows = ledger.process(broker.order_events, timeline.rows())
+            ledger_events = JsonlSpool.from_rows(ledger_rows)
+            equity_curve = JsonlSpool.from_rows(equity_rows)
+        final_row: Optional[dict] = timeline.last
+        final_best_bid: Optional[float] = final_row.get("best_bid") if final_row else None
+        final_best_ask: Optional[float] = final_row.get("best_ask") if final_row else None
 
         # Guarantee at least initial + final snapshots even for no-trade runs.
         # Both snapshots reflect starting state (cash=starting_cash, no positions).
         if not ledger_events:
-            ledger_events = [
-                _no_trade_ledger_snapshot("initial", events[0], self.starting_cash),
-                _no_trade_ledger_snapshot("final", events[-1], self.starting_cash),
-            ]
+            ledger_events.append(
+                _no_trade_ledger_snapshot("initial", first_event, self.starting_cash)
+            )
+            ledger_events.append(
+                _no_trade_ledger_snapshot("final", last_event, self.starting_cash)
+            )
 
         run_id = self.run_dir.name
         pnl_summary = ledger.summary(run_id, final_best_bid, final_best_ask)
@@ -317,9 +421,9 @@ class StrategyRunner:
         # Warn when a large tape produced almost no timeline rows — this often
         # means the tape uses the modern batched price_changes[] schema that was
         # not previously supported, or it is missing a book snapshot.
-        if len(events) > 5 and len(timeline) <= 1:
+        if total_events > 5 and len(timeline) <= 1:
             warnings.append(
-                f"timeline_rows={len(timeline)} despite total_events={len(events)}; "
+                f"timeline_rows={len(timeline)} despite total_events={total_events}; "
                 "check for modern price_changes[] batching, missing book snapshot, "
                 "or mismatched asset_id."
             )
@@ -328,7 +432,8 @@ class StrategyRunner:
             run_quality = _RUN_QUALITY_WARNINGS
 
         self._write_artifacts(
-            broker=broker,
+            orders=orders,
+            fills=fills,
             timeline=timeline,
             ledger_events=ledger_events,
             equity_curve=equity_curve,
@@ -336,9 +441,18 @@ class StrategyRunner:
             decisions=decisions,
             warnings=warnings,
             asset_id=asset_id,
-            total_events=len(events),
+            total_events=total_events,
             run_quality=run_quality,
             tape_coverage=(coverage or {}).get("details"),
+            window=(
+                {
+                    "start_ts": self.start_ts,
+                    "end_ts": self.end_ts,
+                    "warmup_events": warmup_events,
+                }
+                if window is not None
+                else None
+            ),
         )
 
         return pnl_summary
@@ -348,31 +462,52 @@ class StrategyRunner:
     # ------------------------------------------------------------------
 
     def _load_events(self) -> tuple[list[dict], list[str]]:
-        events: list[dict] = []
+        if self.tape_cache_dir is not None:
+            tape = load_tape(self.events_path, cache_dir=self.tape_cache_dir)
+            tape.events.sort(key=lambda e: e.get("seq", 0))
+            return tape.events, [
+                f"Skipping malformed line {lineno}: {msg}"
+                for lineno, msg in tape.malformed
+            ]
+
         warnings: list[str] = []
-        with open(self.events_path, encoding="utf-8") as fh:
-            for lineno, line in enumerate(fh, start=1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError as exc:
-                    warnings.append(f"Skipping malformed line {lineno}: {exc}")
+
+        def _on_malformed(lineno: int, exc: json.JSONDecodeError) -> None:
+            warnings.append(f"Skipping malformed line {lineno}: {exc}")
+
+        events = list(iter_tape_events(self.events_path, on_malformed=_on_malformed))
         events.sort(key=lambda e: e.get("seq", 0))
         return events, warnings
 
-    def _resolve_asset_id(self, events: list[dict]) -> str:
+    def _scan_events_stream(self) -> tuple[Any, list[str], set[str]]:
+        """Prepare a lazy event source for streaming mode.
+
+        A metadata-only pre-pass over the tape runs only when asset ids are
+        actually needed (no explicit asset_id, or a coverage check); it keeps
+        nothing but the id set.  Malformed-line warnings are collected by the
+        replay pass itself.
+        """
+        warnings: list[str] = []
+
+        def _on_malformed(lineno: int, exc: json.JSONDecodeError) -> None:
+            warnings.append(f"Skipping malformed line {lineno}: {exc}")
+
+        seen_asset_ids: set[str] = set()
+        if not self.asset_id or self._required_strategy_asset_ids():
+            seen_asset_ids = tape_asset_ids(self.events_path)
+        events = iter_tape_events(self.events_path, on_malformed=_on_malformed)
+        first = next(events, None)
+        if first is None:
+            raise ValueError(f"No events found in {self.events_path}")
+        return itertools.chain([first], events), warnings, seen_asset_ids
+
+    def _count_events(self) -> int:
+        return sum(1 for _ in iter_tape_events(self.events_path, lambda *_: None))
+
+    def _resolve_asset_id(self, ids: set[str]) -> str:
+        """Pick the primary asset from the tape's asset-id set (see ``collect_asset_ids``)."""
         if self.asset_id:
             return self.asset_id
-        ids: set[str] = set()
-        for e in events:
-            if e.get("asset_id"):
-                ids.add(str(e["asset_id"]))
-            # Modern batched format: collect asset_ids from price_changes[] entries.
-            for entry in e.get("price_changes", []):
-                if entry.get("asset_id"):
-                    ids.add(str(entry["asset_id"]))
         # Prefer to return the primary even from a multi-asset tape when the
         # caller gave us extra_book_asset_ids — we need a primary.
         if len(ids) == 1:
@@ -384,16 +519,11 @@ class StrategyRunner:
             )
         raise ValueError("Tape has no asset_id fields.")
 
-    def _validate_tape_coverage(self, events: list[dict]) -> Optional[dict[str, Any]]:
+    def _validate_tape_coverage(self, seen_set: set[str]) -> Optional[dict[str, Any]]:
         required_asset_ids = self._required_strategy_asset_ids()
         if not required_asset_ids:
             return None
 
-        seen_set: set[str] = {str(e["asset_id"]) for e in events if e.get("asset_id")}
-        for e in events:
-            for entry in e.get("price_changes", []):
-                if entry.get("asset_id"):
-                    seen_set.add(str(entry["asset_id"]))
         seen_asset_ids = sorted(seen_set)
         missing_asset_ids = [
             asset_id for asset_id in required_asset_ids if asset_id not in seen_asset_ids
@@ -466,7 +596,7 @@ class StrategyRunner:
         all_books: dict[str, L2Book],
         broker: SimBroker,
         open_orders: dict[str, dict],
-        decisions: list[dict],
+        decisions: JsonlSpool,
     ) -> None:
         if intent.action == "submit":
             effective_asset = intent.asset_id or asset_id
@@ -547,17 +677,19 @@ class StrategyRunner:
     def _write_artifacts(
         self,
         *,
-        broker: SimBroker,
-        timeline: list[dict],
-        ledger_events: list[dict],
-        equity_curve: list[dict],
+        orders: JsonlSpool,
+        fills: JsonlSpool,
+        timeline: JsonlSpool,
+        ledger_events: JsonlSpool,
+        equity_curve: JsonlSpool,
         pnl_summary: dict,
-        decisions: list[dict],
+        decisions: JsonlSpool,
         warnings: list[str],
         asset_id: str,
         total_events: int,
         run_quality: str,
         tape_coverage: Optional[dict[str, Any]],
+        window: Optional[dict[str, Any]] = None,
     ) -> None:
         run_dir = self.run_dir
 
@@ -566,12 +698,12 @@ class StrategyRunner:
                 for row in rows:
                     fh.write(json.dumps(row) + "\n")
 
-        _jsonl(run_dir / "best_bid_ask.jsonl", timeline)
-        _jsonl(run_dir / "orders.jsonl", broker.order_events)
-        _jsonl(run_dir / "fills.jsonl", [f.to_dict() for f in broker.fills])
-        _jsonl(run_dir / "ledger.jsonl", ledger_events)
-        _jsonl(run_dir / "equity_curve.jsonl", equity_curve)
-        _jsonl(run_dir / "decisions.jsonl", decisions)
+        timeline.dump(run_dir / "best_bid_ask.jsonl")
+        orders.dump(run_dir / "orders.jsonl")
+        fills.dump(run_dir / "fills.jsonl")
+        ledger_events.dump(run_dir / "ledger.jsonl")
+        equity_curve.dump(run_dir / "equity_curve.jsonl")
+        decisions.dump(run_dir / "decisions.jsonl")
 
         # Duck-typed strategy outputs resolved early so they're available for both
         # summary.json and run_manifest.json below.
@@ -606,7 +738,7 @@ class StrategyRunner:
             summary_payload["calibration_provenance"] = calibration_provenance
         # Observational label: strategy activity present but no fills.
         # Informational only — does NOT change Gate 2 eligibility or pass criteria.
-        if decisions and not broker.fills:
+        if decisions and not fills:
             summary_payload["observational_evidence"] = True
         (run_dir / "summary.json").write_text(
             json.dumps(summary_payload, indent=2) + "\n", encoding="utf-8"
@@ -643,7 +775,7 @@ class StrategyRunner:
                 "fee_role": self.fee_role,
                 "mark_method": self.mark_method,
             },
-            "fills_count": len(broker.fills),
+            "fills_count": len(fills),
             "decisions_count": len(decisions),
             "opportunities_count": opportunities_count,
             "timeline_rows": len(timeline),
@@ -662,12 +794,14 @@ class StrategyRunner:
             manifest["calibration_provenance"] = calibration_provenance
         if tape_coverage is not None:
             manifest["tape_coverage"] = tape_coverage
+        if window is not None:
+            manifest["window"] = window
         if modeled_arb_summary:
             manifest["modeled_arb_summary"] = modeled_arb_summary
         if rejection_counts is not None:
             manifest["strategy_debug"] = {"rejection_counts": rejection_counts}
         # Observational label: informational only — does NOT affect Gate 2 eligibility.
-        if decisions and not broker.fills:
+        if decisions and not fills:
             manifest["observational_evidence"] = True
         manifest["display_name"] = build_display_name(
             kind="run",
@@ -690,6 +824,8 @@ class StrategyRunner:
         }
         if tape_coverage is not None:
             meta["tape_coverage"] = tape_coverage
+        if window is not None:
+            meta["window"] = window
         (run_dir / "meta.json").write_text(
             json.dumps(meta, indent=2) + "\n", encoding="utf-8"
         )
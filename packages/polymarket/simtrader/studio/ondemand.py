@@ -9,30 +9,33 @@ Provides deterministic tape playback with manual order submission:
 Design notes
 ------------
 - Tape events are indexed once, then read on demand by file offset. The full
-  tape payload is never loaded into RAM.
+  tape payload is never loaded into RAM. The index (``tape.index``) persists
+  as an ``events.jsonl.idx`` sidecar, so reopening a tape skips JSON decoding.
 - User actions are replayable. Seeking backward preserves past actions; taking
   a new action after seeking truncates the old future and starts a new branch.
 - Checkpoints are in-memory snapshots. They stay small by storing only runtime
-  state needed to continue replay, not duplicated tape history.
+  state needed to continue replay, not duplicated tape history. A new session
+  starts with the sidecar's book checkpoints, so early seeks are cheap too.
 """
 
 from __future__ import annotations
 
-from bisect import bisect_right
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass
 import json
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from ..broker.latency import ZERO_LATENCY
-from ..broker.rules import OrderStatus
 from ..broker.sim_broker import SimBroker
 from ..display_name import build_display_name
 from ..orderbook.l2book import L2Book
 from ..portfolio.ledger import PortfolioLedger
+from ..tape.index import TapeIndex, load_tape_index
 from ..tape.schema import (
     EVENT_TYPE_BOOK,
     EVENT_TYPE_LAST_TRADE_PRICE,
@@ -46,84 +49,6 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-@dataclass(frozen=True)
-class TapeIndex:
-    """Sparse tape metadata for indexed event reads."""
-
-    events_path: Path
-    offsets: tuple[int, ...]
-    timestamps: tuple[float, ...]
-    seqs: tuple[int, ...]
-    asset_ids: tuple[str, ...]
-
-    @classmethod
-    def build(cls, events_path: Path) -> "TapeIndex":
-        rows: list[tuple[int, int, int, float]] = []
-        asset_ids: list[str] = []
-        seen_assets: set[str] = set()
-
-        with open(events_path, "rb") as fh:
-            ordinal = 0
-            while True:
-                offset = fh.tell()
-                raw_line = fh.readline()
-                if not raw_line:
-                    break
-                raw_line = raw_line.strip()
-                if not raw_line:
-                    continue
-                event = json.loads(raw_line.decode("utf-8"))
-                seq = int(event.get("seq", ordinal))
-                ts_recv = float(event.get("ts_recv", 0.0))
-                rows.append((seq, ordinal, offset, ts_recv))
-                cls._collect_asset_ids(event, asset_ids, seen_assets)
-                ordinal += 1
-
-        rows.sort(key=lambda row: (row[0], row[1]))
-
-        return cls(
-            events_path=events_path,
-            offsets=tuple(row[2] for row in rows),
-            timestamps=tuple(row[3] for row in rows),
-            seqs=tuple(row[0] for row in rows),
-            asset_ids=tuple(asset_ids),
-        )
-
-    @staticmethod
-    def _collect_asset_ids(event: dict, ordered: list[str], seen: set[str]) -> None:
-        asset_id = event.get("asset_id")
-        if asset_id and asset_id not in seen:
-            ordered.append(str(asset_id))
-            seen.add(str(asset_id))
-
-        for entry in event.get("price_changes", []):
-            entry_asset_id = entry.get("asset_id")
-            if entry_asset_id and entry_asset_id not in seen:
-                ordered.append(str(entry_asset_id))
-                seen.add(str(entry_asset_id))
-
-    def __len__(self) -> int:
-        return len(self.offsets)
-
-    @property
-    def start_ts(self) -> Optional[float]:
-        if not self.timestamps:
-            return None
-        return self.timestamps[0]
-
-    @property
-    def end_ts(self) -> Optional[float]:
-        if not self.timestamps:
-            return None
-        return self.timestamps[-1]
-
-    def cursor_for_timestamp(self, timestamp: float) -> int:
-        """Return the replay cursor after applying all events at or before *timestamp*."""
-        if not self.timestamps:
-            return 0
-        return bisect_right(self.timestamps, float(timestamp))
-
-
 @dataclass
 class _Checkpoint:
     """Sparse runtime snapshot for fast seek."""
@@ -138,6 +63,69 @@ class _Checkpoint:
     portfolio: dict[str, Any]
 
 
+class _CheckpointStore:
+    """Checkpoints sorted by cursor, with bisect lookup and oldest-first eviction.
+
+    ``_cursors`` mirrors the checkpoint list for bisection; ``_by_age`` keeps
+    cursors in creation order (a replaced checkpoint keeps its age) so the
+    oldest one can be evicted without scanning.  The earliest checkpoint is
+    never evicted, so every cursor stays reachable.
+    """
+
+    def __init__(self, max_checkpoints: int = 0) -> None:
+        self._max = max_checkpoints
+        self._items: list[_Checkpoint] = []
+        self._cursors: list[int] = []
+        self._by_age: OrderedDict[int, None] = OrderedDict()
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, idx: int) -> _Checkpoint:
+        return self._items[idx]
+
+    def __iter__(self) -> Iterator[_Checkpoint]:
+        return iter(self._items)
+
+    def put(self, checkpoint: _Checkpoint) -> None:
+        """Insert *checkpoint*, replacing any checkpoint at the same cursor."""
+        idx = bisect_left(self._cursors, checkpoint.cursor)
+        if idx < len(self._items) and self._cursors[idx] == checkpoint.cursor:
+            checkpoint.order = self._items[idx].order
+            self._items[idx] = checkpoint
+        else:
+            checkpoint.order = self._next_order
+            self._next_order += 1
+            self._items.insert(idx, checkpoint)
+            self._cursors.insert(idx, checkpoint.cursor)
+            self._by_age[checkpoint.cursor] = None
+        self._trim()
+
+    def at_or_before(self, cursor: int) -> Optional[_Checkpoint]:
+        idx = bisect_right(self._cursors, cursor)
+        return self._items[idx - 1] if idx else None
+
+    def drop_after(self, cursor: int) -> None:
+        """Remove every checkpoint with ``checkpoint.cursor > cursor``."""
+        idx = bisect_right(self._cursors, cursor)
+        for stale in self._cursors[idx:]:
+            del self._by_age[stale]
+        del self._items[idx:]
+        del self._cursors[idx:]
+
+    def _trim(self) -> None:
+        if self._max == 0:
+            return
+        while len(self._items) > self._max and len(self._items) > 1:
+            protected = self._cursors[0]
+            victim = next(c for c in self._by_age if c != protected)
+            del self._by_age[victim]
+            idx = bisect_left(self._cursors, victim)
+            del self._items[idx]
+            del self._cursors[idx]
+
+
 class OnDemandSession:
     """Deterministic tape-playback session with manual order submission."""
 
@@ -172,7 +160,7 @@ class OnDemandSession:
             raise ValueError("max_checkpoints must be >= 0")
 
         events_file = Path(tape_path) / "events.jsonl"
-        self._tape_index = TapeIndex.build(events_file)
+        self._tape_index: TapeIndex = load_tape_index(events_file)
         self._events_fh = open(events_file, "rb")
 
         self._asset_ids: list[str] = list(self._tape_index.asset_ids)
@@ -184,17 +172,16 @@ class OnDemandSession:
         self._fee_role: str = fee_role
         self._checkpoint_every_events = checkpoint_every_events
         self._checkpoint_every_seconds = checkpoint_every_seconds
-        self._max_checkpoints = max_checkpoints
 
         self._user_actions: list[dict[str, Any]] = []
         self._actions_by_cursor: dict[int, list[dict[str, Any]]] = {}
         self._next_action_index = 0
-        self._checkpoints: list[_Checkpoint] = []
-        self._next_checkpoint_order = 0
+        self._checkpoints = _CheckpointStore(max_checkpoints)
         self._activity_feed: list[dict[str, Any]] = []
 
         self._reset_runtime_state()
         self._capture_checkpoint(force=True)
+        self._seed_tape_checkpoints()
 
     # ------------------------------------------------------------------
     # Public API
@@ -293,8 +280,7 @@ class OnDemandSession:
                 "filled_size": str(order.filled_size),
                 "status": order.status,
             }
-            for order in self._broker._orders.values()
-            if not OrderStatus.is_terminal(order.status)
+            for order in self._broker.open_orders()
         ]
 
         recent_activity = list(self._activity_feed[-200:])
@@ -423,11 +409,7 @@ class OnDemandSession:
         self._activity_feed = [
             item for item in self._activity_feed if int(item.get("cursor", 0)) <= self._cursor
         ]
-        self._checkpoints = [
-            checkpoint
-            for checkpoint in self._checkpoints
-            if checkpoint.cursor <= self._cursor
-        ]
+        self._checkpoints.drop_after(self._cursor)
         if not self._checkpoints:
             self._capture_checkpoint(force=True)
 
@@ -746,57 +728,50 @@ class OnDemandSession:
                 ):
                     return
 
-        snapshot = _Checkpoint(
-            cursor=self._cursor,
-            order=self._next_checkpoint_order,
-            seq=self._current_seq,
-            ts_recv=self._current_ts_recv,
-            last_trade_price=self._last_trade_price,
-            books={
-                asset_id: book.snapshot_state()
-                for asset_id, book in self._books.items()
-            },
-            broker=self._broker.snapshot_state(include_history=False),
-            portfolio=self._portfolio.snapshot_state(),
+        self._checkpoints.put(
+            _Checkpoint(
+                cursor=self._cursor,
+                order=0,
+                seq=self._current_seq,
+                ts_recv=self._current_ts_recv,
+                last_trade_price=self._last_trade_price,
+                books={
+                    asset_id: book.snapshot_state()
+                    for asset_id, book in self._books.items()
+                },
+                broker=self._broker.snapshot_state(include_history=False),
+                portfolio=self._portfolio.snapshot_state(),
+            )
         )
 
-        for idx, existing in enumerate(self._checkpoints):
-            if existing.cursor == snapshot.cursor:
-                snapshot.order = existing.order
-                self._checkpoints[idx] = snapshot
-                self._trim_checkpoints()
-                return
-            if existing.cursor > snapshot.cursor:
-                self._checkpoints.insert(idx, snapshot)
-                self._next_checkpoint_order += 1
-                self._trim_checkpoints()
-                return
-        self._checkpoints.append(snapshot)
-        self._next_checkpoint_order += 1
-        self._trim_checkpoints()
-
-    def _trim_checkpoints(self) -> None:
-        if self._max_checkpoints == 0:
-            return
-        while len(self._checkpoints) > self._max_checkpoints:
-            if len(self._checkpoints) <= 1:
-                break
-            oldest_idx = min(
-                range(1, len(self._checkpoints)),
-                key=lambda idx: self._checkpoints[idx].order,
+    def _seed_tape_checkpoints(self) -> None:
+        """Add the tape index's book checkpoints as action-free session checkpoints.
+
+        Called before any user action exists, so broker and portfolio state at
+        every tape checkpoint equals the freshly reset state.
+        """
+        broker_state = self._broker.snapshot_state(include_history=False)
+        portfolio_state = self._portfolio.snapshot_state()
+        for tape_checkpoint in self._tape_index.checkpoints:
+            self._checkpoints.put(
+                _Checkpoint(
+                    cursor=tape_checkpoint.cursor,
+                    order=0,
+                    seq=tape_checkpoint.seq,
+                    ts_recv=tape_checkpoint.ts_recv,
+                    last_trade_price=tape_checkpoint.last_trade_price,
+                    books=tape_checkpoint.books,
+                    broker=broker_state,
+                    portfolio=portfolio_state,
+                )
             )
-            self._checkpoints.pop(oldest_idx)
 
     def _checkpoint_at_or_before(
         self,
         cursor: int,
         required: bool = True,
     ) -> Optional[_Checkpoint]:
-        candidate: Optional[_Checkpoint] = None
-        for checkpoint in self._checkpoints:
-            if checkpoint.cursor > cursor:
-                break
-            candidate = checkpoint
+        candidate = self._checkpoints.at_or_before(cursor)
         if candidate is None and required:
             raise RuntimeError("no checkpoint available for replay")
         return candidate
@@ -827,15 +802,7 @@ class OnDemandSession:
         self._last_trade_price = checkpoint.last_trade_price
 
     def _read_event(self, index: int) -> dict[str, Any]:
-        offset = self._tape_index.offsets[index]
-        self._events_fh.seek(offset)
-        raw_line = self._events_fh.readline()
-        if not raw_line:
-            raise IndexError(f"tape event missing at index {index}")
-        raw_line = raw_line.strip()
-        if not raw_line:
-            raise ValueError(f"blank tape line at index {index}")
-        return json.loads(raw_line.decode("utf-8"))
+        return self._tape_index.read_event(self._events_fh, index)
 
     def _primary_book(self) -> Optional[L2Book]:
         return self._primary_book_for(self._books)
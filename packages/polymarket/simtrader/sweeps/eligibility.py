@@ -49,9 +49,10 @@ import logging
 from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from ..orderbook.l2book import L2Book
+from ..tape.cache import load_tape
 from ..tape.schema import EVENT_TYPE_BOOK, EVENT_TYPE_PRICE_CHANGE
 from .runner import SweepConfigError
 
@@ -106,9 +107,13 @@ def check_sweep_eligibility(
     events_path: Path,
     strategy_name: str,
     strategy_config: dict[str, Any],
+    tape_cache_dir: Optional[Path] = None,
 ) -> None:
     """Run the pre-sweep eligibility check for *strategy_name*.
 
+    When *tape_cache_dir* is given the tape is read through the shared
+    parse-once cache (see ``tape.cache``) that the sweep scenarios reuse.
+
     Raises:
         SweepEligibilityError: If the tape is non-actionable.
 
@@ -117,7 +122,9 @@ def check_sweep_eligibility(
     if strategy_name != _BINARY_ARB_STRATEGY:
         return  # No check registered for this strategy.
 
-    result = check_binary_arb_tape_eligibility(events_path, strategy_config)
+    result = check_binary_arb_tape_eligibility(
+        events_path, strategy_config, tape_cache_dir=tape_cache_dir
+    )
     if not result.eligible:
         raise SweepEligibilityError(
             f"[pre-sweep eligibility] Tape is non-actionable — {result.reason}. "
@@ -138,6 +145,7 @@ def check_sweep_eligibility(
 def check_binary_arb_tape_eligibility(
     events_path: Path,
     strategy_config: dict[str, Any],
+    tape_cache_dir: Optional[Path] = None,
 ) -> EligibilityResult:
     """Scan a tape and check whether it is actionable for binary_complement_arb.
 
@@ -145,6 +153,8 @@ def check_binary_arb_tape_eligibility(
         events_path:     Path to an ``events.jsonl`` tape file.
         strategy_config: Strategy config dict (must include ``yes_asset_id``,
                          ``no_asset_id``, ``max_size``, ``buffer``).
+        tape_cache_dir:  Optional ``tape.cache`` directory; when given the
+                         tape is decoded once and shared with later readers.
 
     Returns:
         ``EligibilityResult`` with ``eligible=True`` if the tape contains at
@@ -188,82 +198,74 @@ def check_binary_arb_tape_eligibility(
     min_sum_ask: Optional[Decimal] = None
 
     try:
-        with open(events_path, encoding="utf-8") as fh:
-            for raw_line in fh:
-                raw_line = raw_line.strip()
-                if not raw_line:
-                    continue
-                try:
-                    event = json.loads(raw_line)
-                except json.JSONDecodeError:
-                    continue
-                if not isinstance(event, dict):
-                    continue
-
-                stats["events_scanned"] += 1
-                event_type = event.get("event_type", "")
-
-                # ── Update books ──────────────────────────────────────────
-                if event_type == EVENT_TYPE_PRICE_CHANGE and "price_changes" in event:
-                    for entry in event.get("price_changes", []):
-                        if not isinstance(entry, dict):
-                            continue
-                        entry_asset = str(entry.get("asset_id") or "")
-                        if entry_asset == yes_id:
-                            yes_book.apply_single_delta(entry)
-                        elif entry_asset == no_id:
-                            no_book.apply_single_delta(entry)
-                elif event_type in (EVENT_TYPE_BOOK, EVENT_TYPE_PRICE_CHANGE):
-                    asset_id = str(event.get("asset_id") or "")
-                    if asset_id == yes_id:
-                        yes_book.apply(event)
-                    elif asset_id == no_id:
-                        no_book.apply(event)
-                else:
-                    # last_trade_price / tick_size_change — skip
-                    continue
-
-                # ── Sample BBO state ──────────────────────────────────────
-                yes_ask_f = yes_book.best_ask
-                no_ask_f = no_book.best_ask
-                if yes_ask_f is None or no_ask_f is None:
-                    continue
-
-                stats["ticks_with_both_bbo"] += 1
-                yes_ask = Decimal(str(yes_ask_f))
-                no_ask = Decimal(str(no_ask_f))
-                sum_ask = yes_ask + no_ask
-
-                if min_sum_ask is None or sum_ask < min_sum_ask:
-                    min_sum_ask = sum_ask
-
-                # ── Depth check ───────────────────────────────────────────
-                yes_depth = _best_ask_size(yes_book)
-                no_depth = _best_ask_size(no_book)
-
-                if yes_depth is not None:
-                    if min_yes_ask_size is None or yes_depth < min_yes_ask_size:
-                        min_yes_ask_size = yes_depth
-                if no_depth is not None:
-                    if min_no_ask_size is None or no_depth < min_no_ask_size:
-                        min_no_ask_size = no_depth
-
-                depth_ok = (
-                    yes_depth is not None
-                    and yes_depth >= max_size
-                    and no_depth is not None
-                    and no_depth >= max_size
-                )
-                if depth_ok:
-                    stats["ticks_with_depth_ok"] += 1
-
-                # ── Edge check ────────────────────────────────────────────
-                edge_ok = sum_ask < threshold
-                if edge_ok:
-                    stats["ticks_with_edge_ok"] += 1
-
-                if depth_ok and edge_ok:
-                    stats["ticks_with_depth_and_edge"] += 1
+        for event in _iter_tape_events(events_path, tape_cache_dir):
+            if not isinstance(event, dict):
+                continue
+
+            stats["events_scanned"] += 1
+            event_type = event.get("event_type", "")
+
+            # ── Update books ──────────────────────────────────────────
+            if event_type == EVENT_TYPE_PRICE_CHANGE and "price_changes" in event:
+                for entry in event.get("price_changes", []):
+                    if not isinstance(entry, dict):
+                        continue
+                    entry_asset = str(entry.get("asset_id") or "")
+                    if entry_asset == yes_id:
+                        yes_book.apply_single_delta(entry)
+                    elif entry_asset == no_id:
+                        no_book.apply_single_delta(entry)
+            elif event_type in (EVENT_TYPE_BOOK, EVENT_TYPE_PRICE_CHANGE):
+                asset_id = str(event.get("asset_id") or "")
+                if asset_id == yes_id:
+                    yes_book.apply(event)
+                elif asset_id == no_id:
+                    no_book.apply(event)
+            else:
+                # last_trade_price / tick_size_change — skip
+                continue
+
+            # ── Sample BBO state ──────────────────────────────────────
+            yes_ask_f = yes_book.best_ask
+            no_ask_f = no_book.best_ask
+            if yes_ask_f is None or no_ask_f is None:
+                continue
+
+            stats["ticks_with_both_bbo"] += 1
+            yes_ask = Decimal(str(yes_ask_f))
+            no_ask = Decimal(str(no_ask_f))
+            sum_ask = yes_ask + no_ask
+
+            if min_sum_ask is None or sum_ask < min_sum_ask:
+                min_sum_ask = sum_ask
+
+            # ── Depth check ───────────────────────────────────────────
+            yes_depth = _best_ask_size(yes_book)
+            no_depth = _best_ask_size(no_book)
+
+            if yes_depth is not None:
+                if min_yes_ask_size is None or yes_depth < min_yes_ask_size:
+                    min_yes_ask_size = yes_depth
+            if no_depth is not None:
+                if min_no_ask_size is None or no_depth < min_no_ask_size:
+                    min_no_ask_size = no_depth
+
+            depth_ok = (
+                yes_depth is not None
+                and yes_depth >= max_size
+                and no_depth is not None
+                and no_depth >= max_size
+            )
+            if depth_ok:
+                stats["ticks_with_depth_ok"] += 1
+
+            # ── Edge check ────────────────────────────────────────────
+            edge_ok = sum_ask < threshold
+            if edge_ok:
+                stats["ticks_with_edge_ok"] += 1
+
+            if depth_ok and edge_ok:
+                stats["ticks_with_depth_and_edge"] += 1
 
     except OSError as exc:
         return EligibilityResult(
@@ -322,6 +324,24 @@ def check_binary_arb_tape_eligibility(
 # ---------------------------------------------------------------------------
 
 
+def _iter_tape_events(
+    events_path: Path, tape_cache_dir: Optional[Path]
+) -> Iterator[Any]:
+    """Yield decoded tape events in file order, skipping malformed lines."""
+    if tape_cache_dir is not None:
+        yield from load_tape(events_path, cache_dir=tape_cache_dir).events
+        return
+    with open(events_path, encoding="utf-8") as fh:
+        for raw_line in fh:
+            raw_line = raw_line.strip()
+            if not raw_line:
+                continue
+            try:
+                yield json.loads(raw_line)
+            except json.JSONDecodeError:
+                continue
+
+
 def _best_ask_size(book: L2Book) -> Optional[Decimal]:
     """Return the size at the best ask level of *book*, or None if empty."""
     asks: dict[str, Decimal] = getattr(book, "_asks", {})
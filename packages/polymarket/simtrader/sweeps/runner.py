@@ -5,8 +5,10 @@ from __future__ import annotations
 import copy
 import hashlib
 import json
+import logging
 import re
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
@@ -23,6 +25,7 @@ from ..strategy.facade import (
     run_strategy,
     validate_mark_method,
 )
+from ..tape.cache import default_tape_cache_dir, sha256_file, warm_tape_cache
 
 # SweepEligibilityError (subclass of SweepConfigError) is defined in
 # eligibility.py and imported lazily inside run_sweep() to avoid a
@@ -30,6 +33,8 @@ from ..strategy.facade import (
 #   from packages.polymarket.simtrader.sweeps.eligibility import SweepEligibilityError
 # The existing ``except SweepConfigError`` in the CLI catches it automatically.
 
+logger = logging.getLogger(__name__)
+
 _SLUG_RE = re.compile(r"[^a-z0-9]+")
 _ALLOWED_OVERRIDE_KEYS = frozenset(
     {
@@ -51,6 +56,26 @@ class SweepConfigError(ValueError):
     """Raised when sweep config or overrides are invalid."""
 
 
+class SweepScenarioError(RuntimeError):
+    """Raised after a sweep finishes with one or more failed scenarios.
+
+    Sweep artifacts are still written for the scenarios that completed;
+    ``result`` holds that partial :class:`SweepRunResult` and ``failures``
+    lists ``{scenario_id, scenario_name, error}`` for each failed scenario.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        result: "SweepRunResult",
+        failures: list[dict[str, Any]],
+    ) -> None:
+        super().__init__(message)
+        self.result = result
+        self.failures = failures
+
+
 @dataclass(frozen=True)
 class SweepRunParams:
     """Base parameters for a scenario sweep."""
@@ -71,6 +96,9 @@ class SweepRunParams:
     artifacts_root: Path = Path("artifacts/simtrader")
     strategy_preset: Optional[str] = None
     market_slug: Optional[str] = None
+    # Scenarios run in a process pool when > 1; results are identical to the
+    # sequential path and keep the same scenario ordering.
+    workers: int = 1
 
 
 @dataclass(frozen=True)
@@ -112,7 +140,16 @@ def parse_sweep_config_json(raw: str) -> dict[str, Any]:
 
 
 def run_sweep(params: SweepRunParams, sweep_config: dict[str, Any]) -> SweepRunResult:
-    """Run all sweep scenarios and write sweep-level artifacts."""
+    """Run all sweep scenarios and write sweep-level artifacts.
+
+    Scenarios share the read-only tape and write to separate run dirs, so
+    with ``params.workers > 1`` they run concurrently in a process pool.
+    Summary and manifest ordering is always the normalized scenario order.
+
+    If any scenario fails, the remaining scenarios still run, artifacts are
+    written for those that completed (with a ``failed_scenarios`` list in the
+    summary) and :class:`SweepScenarioError` is raised.
+    """
     if not params.events_path.exists():
         raise SweepConfigError(f"tape file not found: {params.events_path}")
     if not isinstance(params.strategy_config, dict):
@@ -128,6 +165,8 @@ def run_sweep(params: SweepRunParams, sweep_config: dict[str, Any]) -> SweepRunR
         raise SweepConfigError("fee_rate_bps must be non-negative")
     if params.latency_submit_ticks < 0 or params.latency_cancel_ticks < 0:
         raise SweepConfigError("latency tick values must be non-negative")
+    if params.workers < 1:
+        raise SweepConfigError("workers must be >= 1")
     try:
         validate_mark_method(params.mark_method)
     except StrategyRunConfigError as exc:
@@ -136,8 +175,20 @@ def run_sweep(params: SweepRunParams, sweep_config: dict[str, Any]) -> SweepRunR
     # Pre-sweep eligibility check — fast-fail before running 24 scenarios on a
     # tape that can never produce a single order.  Import lazily to avoid a
     # circular-import cycle (eligibility.py imports SweepConfigError from here).
+    #
+    # The tape is decoded once into the shared tape cache here; the
+    # eligibility scan and every scenario (in-process or in a pool worker)
+    # then load the cached form instead of re-parsing JSON.
+    tape_cache_dir = default_tape_cache_dir(params.artifacts_root)
+    warm_tape_cache(params.events_path, tape_cache_dir)
+
     from .eligibility import check_sweep_eligibility  # noqa: PLC0415
-    check_sweep_eligibility(params.events_path, params.strategy_name, params.strategy_config)
+    check_sweep_eligibility(
+        params.events_path,
+        params.strategy_name,
+        params.strategy_config,
+        tape_cache_dir=tape_cache_dir,
+    )
 
     scenarios = _normalize_scenarios(sweep_config)
     sweep_id = params.sweep_id or _derive_sweep_id(params, scenarios)
@@ -145,8 +196,9 @@ def run_sweep(params: SweepRunParams, sweep_config: dict[str, Any]) -> SweepRunR
     runs_dir = sweep_dir / "runs"
     runs_dir.mkdir(parents=True, exist_ok=True)
 
-    scenario_rows: list[dict[str, Any]] = []
-    scenario_stats: list[_ScenarioRunStats] = []
+    # Resolve every scenario's run params up front so override errors fail
+    # fast, before any worker is started.
+    jobs: list[tuple[_ScenarioDef, StrategyRunParams]] = []
     for scenario in scenarios:
         (
             scenario_strategy_config,
@@ -161,40 +213,52 @@ def run_sweep(params: SweepRunParams, sweep_config: dict[str, Any]) -> SweepRunR
         run_dir = runs_dir / scenario.scenario_id
         if run_dir.exists():
             shutil.rmtree(run_dir)
-        run_result = run_strategy(
-            StrategyRunParams(
-                events_path=params.events_path,
-                run_dir=run_dir,
-                strategy_name=params.strategy_name,
-                strategy_config=scenario_strategy_config,
-                asset_id=params.asset_id,
-                starting_cash=params.starting_cash,
-                fee_rate_bps=scenario_fee_rate_bps,
-                mark_method=scenario_mark_method,
-                fee_category=scenario_fee_category,
-                fee_role=scenario_fee_role,
-                latency_submit_ticks=scenario_submit_ticks,
-                latency_cancel_ticks=scenario_cancel_ticks,
-                strict=params.strict,
-                strategy_preset=params.strategy_preset,
-                market_slug=params.market_slug,
+        jobs.append(
+            (
+                scenario,
+                StrategyRunParams(
+                    events_path=params.events_path,
+                    run_dir=run_dir,
+                    strategy_name=params.strategy_name,
+                    strategy_config=scenario_strategy_config,
+                    asset_id=params.asset_id,
+                    starting_cash=params.starting_cash,
+                    fee_rate_bps=scenario_fee_rate_bps,
+                    mark_method=scenario_mark_method,
+                    fee_category=scenario_fee_category,
+                    fee_role=scenario_fee_role,
+                    latency_submit_ticks=scenario_submit_ticks,
+                    latency_cancel_ticks=scenario_cancel_ticks,
+                    strict=params.strict,
+                    strategy_preset=params.strategy_preset,
+                    market_slug=params.market_slug,
+                    tape_cache_dir=tape_cache_dir,
+                ),
             )
         )
 
-        scenario_rows.append(
-            {
-                "scenario_id": scenario.scenario_id,
-                "scenario_name": scenario.name or scenario.scenario_id,
-                "run_id": run_result.run_id,
-                "net_profit": run_result.metrics["net_profit"],
-                "realized_pnl": run_result.metrics["realized_pnl"],
-                "unrealized_pnl": run_result.metrics["unrealized_pnl"],
-                "total_fees": run_result.metrics["total_fees"],
-                "warnings_count": run_result.warnings_count,
-                "artifact_path": run_result.run_dir.as_posix(),
-            }
-        )
-        scenario_stats.append(_read_scenario_run_stats(run_result.run_dir))
+    outcomes = _execute_scenarios(jobs, workers=min(params.workers, len(jobs)))
+
+    # Outcomes are indexed by scenario position, so summary ordering does not
+    # depend on which worker finished first.
+    scenario_rows: list[dict[str, Any]] = []
+    scenario_stats: list[_ScenarioRunStats] = []
+    failures: list[dict[str, Any]] = []
+    first_exc: Optional[BaseException] = None
+    for (scenario, _), outcome in zip(jobs, outcomes):
+        if isinstance(outcome, BaseException):
+            first_exc = first_exc or outcome
+            failures.append(
+                {
+                    "scenario_id": scenario.scenario_id,
+                    "scenario_name": scenario.name or scenario.scenario_id,
+                    "error": f"{type(outcome).__name__}: {outcome}",
+                }
+            )
+            continue
+        row, stats = outcome
+        scenario_rows.append(row)
+        scenario_stats.append(stats)
 
     aggregate = _build_aggregate_summary(scenario_rows, scenario_stats)
     scenario_order = [row["scenario_id"] for row in scenario_rows]
@@ -207,6 +271,8 @@ def run_sweep(params: SweepRunParams, sweep_config: dict[str, Any]) -> SweepRunR
         "scenarios": scenario_rows,
         "aggregate": aggregate,
     }
+    if failures:
+        summary["failed_scenarios"] = failures
 
     manifest: dict[str, Any] = {
         "sweep_id": sweep_id,
@@ -252,12 +318,84 @@ def run_sweep(params: SweepRunParams, sweep_config: dict[str, Any]) -> SweepRunR
     _write_json(sweep_dir / "sweep_manifest.json", manifest)
     _write_json(sweep_dir / "sweep_summary.json", summary)
 
-    return SweepRunResult(
+    result = SweepRunResult(
         sweep_id=sweep_id,
         sweep_dir=sweep_dir,
         summary=summary,
         manifest=manifest,
     )
+    if failures:
+        failed_ids = ", ".join(row["scenario_id"] for row in failures)
+        raise SweepScenarioError(
+            f"{len(failures)} of {len(jobs)} scenario(s) failed ({failed_ids}); "
+            f"partial results written to {sweep_dir}",
+            result=result,
+            failures=failures,
+        ) from first_exc
+    return result
+
+
+def _run_scenario(
+    scenario: _ScenarioDef, run_params: StrategyRunParams
+) -> tuple[dict[str, Any], _ScenarioRunStats]:
+    """Run one scenario and return its summary row and activity stats.
+
+    Module-level so it can be pickled into a process-pool worker.
+    """
+    run_result = run_strategy(run_params)
+    row = {
+        "scenario_id": scenario.scenario_id,
+        "scenario_name": scenario.name or scenario.scenario_id,
+        "run_id": run_result.run_id,
+        "net_profit": run_result.metrics["net_profit"],
+        "realized_pnl": run_result.metrics["realized_pnl"],
+        "unrealized_pnl": run_result.metrics["unrealized_pnl"],
+        "total_fees": run_result.metrics["total_fees"],
+        "warnings_count": run_result.warnings_count,
+        "artifact_path": run_result.run_dir.as_posix(),
+    }
+    return row, _read_scenario_run_stats(run_result.run_dir)
+
+
+def _execute_scenarios(
+    jobs: list[tuple[_ScenarioDef, StrategyRunParams]],
+    *,
+    workers: int,
+) -> list[Any]:
+    """Run *jobs* and return one outcome per job, in job order.
+
+    Each outcome is either the ``(row, stats)`` tuple from
+    :func:`_run_scenario` or the exception the scenario raised.  A failing
+    scenario never discards its siblings' results.  With ``workers > 1``
+    scenarios are fanned out over a process pool; if a worker process dies
+    the pool is broken and every scenario still pending reports
+    ``BrokenProcessPool``, while already-finished scenarios are kept.
+    """
+    outcomes: list[Any] = [None] * len(jobs)
+    if workers <= 1:
+        for idx, (scenario, run_params) in enumerate(jobs):
+            try:
+                outcomes[idx] = _run_scenario(scenario, run_params)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("sweep scenario %s failed: %s", scenario.scenario_id, exc)
+                outcomes[idx] = exc
+        return outcomes
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        future_to_idx = {
+            executor.submit(_run_scenario, scenario, run_params): idx
+            for idx, (scenario, run_params) in enumerate(jobs)
+        }
+        for future in as_completed(future_to_idx):
+            idx = future_to_idx[future]
+            try:
+                outcomes[idx] = future.result()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "sweep scenario %s failed: %s", jobs[idx][0].scenario_id, exc
+                )
+                outcomes[idx] = exc
+    return outcomes
 
 
 def _normalize_scenarios(sweep_config: dict[str, Any]) -> list[_ScenarioDef]:
@@ -489,7 +627,7 @@ def _read_scenario_run_stats(run_dir: Path) -> _ScenarioRunStats:
 
 
 def _derive_sweep_id(params: SweepRunParams, scenarios: list[_ScenarioDef]) -> str:
-    tape_hash = _sha256_file(params.events_path)
+    tape_hash = sha256_file(params.events_path)
     payload = {
         "tape_path": params.events_path.as_posix(),
         "tape_sha256": tape_hash,
@@ -527,17 +665,6 @@ def _derive_sweep_id(params: SweepRunParams, scenarios: list[_ScenarioDef]) -> s
     )
 
 
-def _sha256_file(path: Path) -> str:
-    hasher = hashlib.sha256()
-    with open(path, "rb") as fh:
-        while True:
-            chunk = fh.read(1024 * 1024)
-            if not chunk:
-                break
-            hasher.update(chunk)
-    return hasher.hexdigest()
-
-
 def _slugify(name: Optional[str]) -> str:
     if not name:
         return "scenario"
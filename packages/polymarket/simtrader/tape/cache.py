@@ -0,0 +1,246 @@
+"""Parse-once tape cache keyed by the tape's content hash.
+
+A sweep replays the same ``events.jsonl`` once per scenario, and the
+pre-sweep eligibility check and batch tape stats read it again beforehand.
+JSON decoding dominates short scenario runs, so :func:`load_tape` decodes a
+tape once and keeps the result:
+
+  * in process memory (a small LRU of pickle blobs keyed by sha256), so
+    repeated loads in one process -- and forked pool workers -- skip JSON
+    entirely, and
+  * optionally on disk as ``<cache_dir>/<sha256>.v2.ctape``, the columnar
+    tape format (JSON header plus fixed-width arrays, see ``columnar.py``),
+    which other processes memory-map instead of re-parsing.  Nothing on disk
+    is ever unpickled.  The directory keeps at most
+    ``_DISK_CACHE_MAX_ENTRIES`` entries; the least recently used are evicted.
+
+Every load returns freshly built event dicts, so callers may sort or mutate
+them without affecting other readers.  Columnar tapes are already in the
+on-disk format and are never copied into *cache_dir*.
+
+Public API
+----------
+- ``sha256_file(path)``            -- streamed content hash (memoized on stat).
+- ``load_tape(path, cache_dir=)``  -- ``ParsedTape`` for a tape file.
+- ``warm_tape_cache(path, cache_dir)`` -- ensure the disk entry exists.
+- ``default_tape_cache_dir(artifacts_root)``
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from .columnar import ColumnarTape, is_columnar_tape, iter_columnar_events, write_columnar_tape
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk entry layout changes; old files are ignored and evicted.
+_CACHE_FORMAT_VERSION = 2
+# Number of tape blobs kept in process memory.
+_MEMORY_CACHE_MAX = 4
+# Number of tape entries kept in a cache directory.
+_DISK_CACHE_MAX_ENTRIES = 8
+
+_lock = threading.Lock()
+_memory_blobs: "OrderedDict[str, bytes]" = OrderedDict()
+_hash_by_stat: dict[tuple[str, int, int], str] = {}
+
+
+@dataclass(frozen=True)
+class ParsedTape:
+    """Decoded tape contents.
+
+    Attributes:
+        sha256:    Hex digest of the tape file.
+        events:    Decoded events in file order (not sorted by ``seq``).
+        malformed: ``(lineno, error message)`` for each undecodable line.
+    """
+
+    sha256: str
+    events: list[Any]
+    malformed: list[tuple[int, str]]
+
+
+def default_tape_cache_dir(artifacts_root: Path) -> Path:
+    """Return the shared on-disk cache directory under *artifacts_root*."""
+    return artifacts_root / "tape_cache"
+
+
+def sha256_file(path: Path) -> str:
+    """Return the sha256 hex digest of *path*, memoized on (path, size, mtime)."""
+    st = os.stat(path)
+    stat_key = (str(Path(path).resolve()), st.st_size, st.st_mtime_ns)
+    with _lock:
+        cached = _hash_by_stat.get(stat_key)
+    if cached is not None:
+        return cached
+
+    hasher = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(1024 * 1024)
+            if not chunk:
+                break
+            hasher.update(chunk)
+    digest = hasher.hexdigest()
+    with _lock:
+        _hash_by_stat[stat_key] = digest
+    return digest
+
+
+def load_tape(path: Path, *, cache_dir: Optional[Path] = None) -> ParsedTape:
+    """Return the decoded contents of the tape at *path*.
+
+    Looks in process memory first, then in *cache_dir* (when given), and
+    only falls back to JSON decoding on a miss -- in which case the result is
+    stored in memory and, when *cache_dir* is set, written to disk.
+    """
+    digest = sha256_file(path)
+
+    with _lock:
+        blob = _memory_blobs.get(digest)
+        if blob is not None:
+            _memory_blobs.move_to_end(digest)
+    if blob is not None:
+        events, malformed = pickle.loads(blob)
+        return ParsedTape(sha256=digest, events=events, malformed=malformed)
+
+    if cache_dir is not None:
+        loaded = _read_disk_entry(_cache_file(cache_dir, digest))
+        if loaded is not None:
+            events, malformed = loaded
+            _remember(digest, pickle.dumps((events, malformed), protocol=pickle.HIGHEST_PROTOCOL))
+            return ParsedTape(sha256=digest, events=events, malformed=malformed)
+
+    events, malformed = _parse_jsonl(path)
+    _remember(digest, pickle.dumps((events, malformed), protocol=pickle.HIGHEST_PROTOCOL))
+    if cache_dir is not None and not is_columnar_tape(path):
+        _write_disk_entry(_cache_file(cache_dir, digest), events, malformed)
+    return ParsedTape(sha256=digest, events=events, malformed=malformed)
+
+
+def warm_tape_cache(path: Path, cache_dir: Path) -> str:
+    """Make sure *path* is decoded and present in *cache_dir*; return its sha256.
+
+    Call this in the parent before starting worker processes so that each
+    worker maps the cached file instead of decoding the tape itself.
+    """
+    digest = sha256_file(path)
+    if is_columnar_tape(path):
+        return digest
+    target = _cache_file(cache_dir, digest)
+    if target.exists():
+        return digest
+    with _lock:
+        blob = _memory_blobs.get(digest)
+    if blob is None:
+        load_tape(path, cache_dir=cache_dir)
+    else:
+        events, malformed = pickle.loads(blob)
+        _write_disk_entry(target, events, malformed)
+    return digest
+
+
+def clear_memory_cache() -> None:
+    """Drop all in-process cached blobs and memoized hashes."""
+    with _lock:
+        _memory_blobs.clear()
+        _hash_by_stat.clear()
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _cache_file(cache_dir: Path, digest: str) -> Path:
+    return cache_dir / f"{digest}.v{_CACHE_FORMAT_VERSION}.ctape"
+
+
+def _parse_jsonl(path: Path) -> tuple[list[Any], list[tuple[int, str]]]:
+    if is_columnar_tape(path):
+        return list(iter_columnar_events(path)), []
+    events: list[Any] = []
+    malformed: list[tuple[int, str]] = []
+    with open(path, encoding="utf-8") as fh:
+        for lineno, line in enumerate(fh, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError as exc:
+                malformed.append((lineno, str(exc)))
+    return events, malformed
+
+
+def _remember(digest: str, blob: bytes) -> None:
+    with _lock:
+        _memory_blobs[digest] = blob
+        _memory_blobs.move_to_end(digest)
+        while len(_memory_blobs) > _MEMORY_CACHE_MAX:
+            _memory_blobs.popitem(last=False)
+
+
+def _read_disk_entry(target: Path) -> Optional[tuple[list[Any], list[tuple[int, str]]]]:
+    try:
+        with ColumnarTape(target) as tape:
+            events = list(tape.iter_events())
+            malformed = [(int(lineno), str(msg)) for lineno, msg in tape.header.get("malformed", [])]
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Ignoring unreadable tape cache entry %s: %s", target, exc)
+        return None
+    try:
+        os.utime(target)  # recency for eviction
+    except OSError:
+        pass
+    return events, malformed
+
+
+def _write_disk_entry(
+    target: Path, events: list[Any], malformed: list[tuple[int, str]]
+) -> None:
+    """Write a columnar entry atomically, then evict down to the size bound."""
+    try:
+        write_columnar_tape(
+            events,
+            target,
+            extra_header={"malformed": [list(item) for item in malformed]},
+        )
+    except OSError as exc:
+        logger.warning("Could not write tape cache entry %s: %s", target, exc)
+        return
+    _evict_disk_entries(target.parent, keep=target)
+
+
+def _evict_disk_entries(cache_dir: Path, *, keep: Path) -> None:
+    """Remove older-format entries and all but the newest ``_DISK_CACHE_MAX_ENTRIES``."""
+    current = f".v{_CACHE_FORMAT_VERSION}.ctape"
+    entries: list[tuple[int, Path]] = []
+    try:
+        for entry in cache_dir.iterdir():
+            name = entry.name
+            if name.endswith(".pickle"):
+                entry.unlink(missing_ok=True)
+            elif name.endswith(current) and entry != keep:
+                entries.append((entry.stat().st_mtime_ns, entry))
+    except OSError as exc:
+        logger.warning("Could not prune tape cache %s: %s", cache_dir, exc)
+        return
+    entries.sort(reverse=True)
+    for _, entry in entries[_DISK_CACHE_MAX_ENTRIES - 1:]:
+        try:
+            entry.unlink()
+        except OSError:
+            pass
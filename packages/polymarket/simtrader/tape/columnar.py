@@ -0,0 +1,649 @@
+"""Columnar binary tape format (``events.ctape``) alongside ``events.jsonl``.
+
+``events.jsonl`` repeats every key name and price/size string on every line.
+A ``.ctape`` file stores the same events as fixed-width little-endian columns
+that are memory-mapped on open, so it is smaller on disk and single columns
+(``seq``, ``ts_recv``, asset ids) can be read without decoding any events.
+
+It is not a faster way to replay.  ``iter_events()`` rebuilds one dict per
+event from the columns, which costs about as much as ``json.loads`` on the
+JSONL line; replay, run, trade and sweep consume those dicts, so their load
+time is roughly the same for either format.
+
+Event table (one row per event)
+  ``seq`` int64, ``ts_recv`` float64, ``event_type`` string ref, ``lists``
+  bitmask of which level lists are present, ``level_start`` int64 offsets
+  into the level table (``n_events + 1`` entries), ``rest`` (JSON of any
+  non-string extra fields) and ``raw`` (the whole event as JSON, for events
+  that do not fit the columnar shape).  Every top-level string field --
+  ``asset_id``, ``market``, ``hash``, ``timestamp``, ... -- gets its own
+  ``e.<key>`` string-ref column.
+
+Level table (one row per book level or price change)
+  ``group`` (0 bids, 1 asks, 2 changes, 3 price_changes), ``rest`` and one
+  ``l.<key>`` string-ref column per string field (``price``, ``size``,
+  ``side``, ``asset_id``, ``best_bid``, ...).
+
+All strings live once in a dictionary and are referenced by int32 index
+(-1 = absent).  Prices and sizes are kept as their original strings, so
+replaying a ``.ctape`` through :class:`L2Book` is byte-identical to replaying
+the JSONL tape.
+
+Conversion is lossless: events with an unexpected envelope (non-int ``seq``,
+non-float ``ts_recv``, non-list level lists, ...) fall back to the ``raw``
+column.  Malformed JSONL lines are dropped and counted in the header.  Key
+order inside rebuilt events is normalised (envelope, string fields, other
+fields, level lists).
+
+Public API
+----------
+- ``is_columnar_tape(path)`` / ``default_columnar_path(events_path)``
+- ``resolve_tape_events_path(tape_dir)`` -- ``events.jsonl`` or ``events.ctape``
+- ``convert_jsonl_tape(events_path, out_path=None)`` -> ``ConversionResult``
+- ``write_columnar_tape(events, out_path)``
+- ``ColumnarTape(path)`` -- mmap reader with ``iter_events()``, ``column()``,
+  ``asset_ids()`` and ``book_asset_ids()``
+- ``iter_columnar_events(path)``
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+COLUMNAR_SUFFIX = ".ctape"
+_MAGIC = b"PMCTAPE\x01"
+_FORMAT_VERSION = 1
+_ALIGN = 8
+
+# Level-list keys, in group-code order.
+_LIST_KEYS = ("bids", "asks", "changes", "price_changes")
+_ENVELOPE_KEYS = frozenset({"seq", "ts_recv", "event_type", *_LIST_KEYS})
+
+_EVENT_PREFIX = "e."
+_LEVEL_PREFIX = "l."
+
+
+@dataclass(frozen=True)
+class ConversionResult:
+    """Outcome of :func:`convert_jsonl_tape`."""
+
+    out_path: Path
+    events: int
+    levels: int
+    raw_events: int
+    malformed_lines: int
+    source_bytes: int
+    output_bytes: int
+
+
+def is_columnar_tape(path: Path) -> bool:
+    """Return True if *path* is a ``.ctape`` file (checked by magic bytes)."""
+    try:
+        with open(path, "rb") as fh:
+            return fh.read(len(_MAGIC)) == _MAGIC
+    except OSError:
+        return False
+
+
+def default_columnar_path(events_path: Path) -> Path:
+    """``.../events.jsonl`` -> ``.../events.ctape``."""
+    return events_path.with_suffix(COLUMNAR_SUFFIX)
+
+
+def resolve_tape_events_path(tape_dir: Path, name: str = "events.jsonl") -> Optional[Path]:
+    """Return ``tape_dir/name``, else its ``.ctape`` sibling, else None.
+
+    Lets tape-directory tools accept directories that only carry a converted
+    ``events.ctape``.  JSONL wins when both exist.
+    """
+    events_path = Path(tape_dir) / name
+    if events_path.exists():
+        return events_path
+    columnar = default_columnar_path(events_path)
+    if columnar.exists():
+        return columnar
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+
+class _RefColumns:
+    """Growable set of string-ref columns, one per field name."""
+
+    def __init__(self) -> None:
+        self.columns: dict[str, array] = {}
+        self.rows = 0
+
+    def append(self, values: dict[str, int]) -> None:
+        for key, ref in values.items():
+            col = self.columns.get(key)
+            if col is None:
+                col = self.columns[key] = array("i", [-1]) * self.rows
+            col.append(ref)
+        self.rows += 1
+        for col in self.columns.values():
+            if len(col) < self.rows:
+                col.append(-1)
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self._index: dict[str, int] = {}
+        self.seq = array("q")
+        self.ts_recv = array("d")
+        self.event_type = array("i")
+        self.lists = array("B")
+        self.rest = array("i")
+        self.raw = array("i")
+        self.level_start = array("q", [0])
+        self.event_fields = _RefColumns()
+        self.group = array("B")
+        self.level_rest = array("i")
+        self.level_fields = _RefColumns()
+        self.raw_events = 0
+
+    @property
+    def n_events(self) -> int:
+        return len(self.seq)
+
+    @property
+    def n_levels(self) -> int:
+        return len(self.group)
+
+    def ref(self, value: str) -> int:
+        idx = self._index.get(value)
+        if idx is None:
+            idx = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return idx
+
+    def _split(self, obj: dict, skip: frozenset[str]) -> tuple[dict[str, int], int]:
+        refs: dict[str, int] = {}
+        rest: dict[str, Any] = {}
+        for key, value in obj.items():
+            if key in skip:
+                continue
+            if isinstance(value, str):
+                refs[key] = self.ref(value)
+            else:
+                rest[key] = value
+        return refs, (self.ref(_dump(rest)) if rest else -1)
+
+    def add(self, event: Any) -> None:
+        level_rows = _level_rows(event)
+        if level_rows is None:
+            self._add_raw(event)
+            return
+        mask = 0
+        for group, key in enumerate(_LIST_KEYS):
+            if key in event:
+                mask |= 1 << group
+        refs, rest_ref = self._split(event, _ENVELOPE_KEYS)
+        self.seq.append(event["seq"])
+        self.ts_recv.append(event["ts_recv"])
+        self.event_type.append(self.ref(event["event_type"]))
+        self.lists.append(mask)
+        self.rest.append(rest_ref)
+        self.raw.append(-1)
+        self.event_fields.append(refs)
+        for group, level in level_rows:
+            level_refs, level_rest_ref = self._split(level, frozenset())
+            self.group.append(group)
+            self.level_rest.append(level_rest_ref)
+            self.level_fields.append(level_refs)
+        self.level_start.append(self.n_levels)
+
+    def _add_raw(self, event: Any) -> None:
+        self.raw_events += 1
+        seq = event.get("seq") if isinstance(event, dict) else None
+        ts = event.get("ts_recv") if isinstance(event, dict) else None
+        self.seq.append(seq if _is_int(seq) else 0)
+        self.ts_recv.append(float(ts) if _is_number(ts) else 0.0)
+        self.event_type.append(-1)
+        self.lists.append(0)
+        self.rest.append(-1)
+        self.raw.append(self.ref(_dump(event)))
+        self.event_fields.append({})
+        self.level_start.append(self.n_levels)
+
+    def sections(self) -> list[tuple[str, str, bytes]]:
+        encoded = [s.encode("utf-8", "surrogatepass") for s in self.strings]
+        string_offsets = array("q", [0])
+        for blob in encoded:
+            string_offsets.append(string_offsets[-1] + len(blob))
+        out = [
+            ("seq", "q", _to_le_bytes(self.seq)),
+            ("ts_recv", "d", _to_le_bytes(self.ts_recv)),
+            ("event_type", "i", _to_le_bytes(self.event_type)),
+            ("lists", "B", self.lists.tobytes()),
+            ("rest", "i", _to_le_bytes(self.rest)),
+            ("raw", "i", _to_le_bytes(self.raw)),
+            ("level_start", "q", _to_le_bytes(self.level_start)),
+            ("group", "B", self.group.tobytes()),
+            ("level_rest", "i", _to_le_bytes(self.level_rest)),
+        ]
+        for key, col in self.event_fields.columns.items():
+            out.append((_EVENT_PREFIX + key, "i", _to_le_bytes(col)))
+        for key, col in self.level_fields.columns.items():
+            out.append((_LEVEL_PREFIX + key, "i", _to_le_bytes(col)))
+        out.append(("string_offsets", "q", _to_le_bytes(string_offsets)))
+        out.append(("string_data", "B", b"".join(encoded)))
+        return out
+
+
+def _level_rows(event: Any) -> Optional[list[tuple[int, dict]]]:
+    """Return ``[(group, level), ...]`` for *event*, or None if not columnar."""
+    if not isinstance(event, dict):
+        return None
+    if not _is_int(event.get("seq")) or type(event.get("ts_recv")) is not float:
+        return None
+    if not isinstance(event.get("event_type"), str):
+        return None
+    rows: list[tuple[int, dict]] = []
+    for group, key in enumerate(_LIST_KEYS):
+        if key not in event:
+            continue
+        levels = event[key]
+        if not isinstance(levels, list):
+            return None
+        for level in levels:
+            if not isinstance(level, dict):
+                return None
+            rows.append((group, level))
+    return rows
+
+
+def _is_int(value: Any) -> bool:
+    return type(value) is int and -(1 << 63) <= value < (1 << 63)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _dump(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _to_le_bytes(arr: array) -> bytes:
+    if sys.byteorder == "big" and arr.itemsize > 1:
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def write_columnar_tape(
+    events: Iterable[Any],
+    out_path: Path,
+    *,
+    extra_header: Optional[dict[str, Any]] = None,
+) -> tuple[int, int, int]:
+    """Encode *events* (in order) into a ``.ctape`` file at *out_path*.
+
+    Returns ``(events, levels, raw_events)``.  The file is written atomically.
+    """
+    enc = _Encoder()
+    for event in events:
+        enc.add(event)
+    _write_encoded(enc, out_path, extra_header or {})
+    return enc.n_events, enc.n_levels, enc.raw_events
+
+
+def _write_encoded(enc: _Encoder, out_path: Path, extra_header: dict[str, Any]) -> None:
+    sections = enc.sections()
+    header: dict[str, Any] = {
+        **extra_header,
+        "format_version": _FORMAT_VERSION,
+        "n_events": enc.n_events,
+        "n_levels": enc.n_levels,
+        "n_strings": len(enc.strings),
+        "raw_events": enc.raw_events,
+    }
+
+    # Column offsets depend on the header length, so lay out relative
+    # offsets first and then shift them past the (8-byte aligned) header.
+    relative: list[tuple[str, str, int, int]] = []
+    cursor = 0
+    for name, code, payload in sections:
+        relative.append((name, code, cursor, len(payload)))
+        cursor = _align(cursor + len(payload))
+    base = 0
+    while True:
+        header["columns"] = {
+            name: [base + off, code, nbytes] for name, code, off, nbytes in relative
+        }
+        header_bytes = json.dumps(header, sort_keys=True).encode("utf-8")
+        needed = _align(len(_MAGIC) + 8 + len(header_bytes))
+        if needed <= base:
+            break
+        base = needed
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=out_path.name + ".", dir=out_path.parent)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(_MAGIC)
+            fh.write(struct.pack("<Q", len(header_bytes)))
+            fh.write(header_bytes)
+            for (_, _, payload), (_, _, off, _) in zip(sections, relative):
+                fh.write(b"\0" * (base + off - fh.tell()))
+                fh.write(payload)
+        os.replace(tmp_name, out_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def convert_jsonl_tape(
+    events_path: Path, out_path: Optional[Path] = None
+) -> ConversionResult:
+    """Convert an ``events.jsonl`` tape into a ``.ctape`` file next to it."""
+    from ..replay.stream import iter_tape_events  # noqa: PLC0415
+
+    out_path = out_path or default_columnar_path(events_path)
+    malformed = 0
+
+    def _on_malformed(lineno: int, exc: json.JSONDecodeError) -> None:
+        nonlocal malformed
+        malformed += 1
+
+    enc = _Encoder()
+    for event in iter_tape_events(events_path, on_malformed=_on_malformed):
+        enc.add(event)
+    _write_encoded(
+        enc,
+        out_path,
+        {"source": events_path.name, "malformed_lines": malformed},
+    )
+    return ConversionResult(
+        out_path=out_path,
+        events=enc.n_events,
+        levels=enc.n_levels,
+        raw_events=enc.raw_events,
+        malformed_lines=malformed,
+        source_bytes=events_path.stat().st_size,
+        output_bytes=out_path.stat().st_size,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+
+class ColumnarTape:
+    """Memory-mapped reader for a ``.ctape`` file.
+
+    Columns are exposed zero-copy through :meth:`column`; :meth:`iter_events`
+    rebuilds event dicts equal to the source JSONL events.  Use as a context
+    manager (or call :meth:`close`) to release the mapping.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._fh = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._fh.close()
+            raise
+        if self._mm[: len(_MAGIC)] != _MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a columnar tape")
+        (hlen,) = struct.unpack_from("<Q", self._mm, len(_MAGIC))
+        start = len(_MAGIC) + 8
+        self.header: dict[str, Any] = json.loads(self._mm[start : start + hlen])
+        if self.header.get("format_version") != _FORMAT_VERSION:
+            self.close()
+            raise ValueError(
+                f"{self.path}: unsupported columnar tape version "
+                f"{self.header.get('format_version')!r}"
+            )
+        self._strings: Optional[list[str]] = None
+
+    def __enter__(self) -> "ColumnarTape":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        try:
+            self._mm.close()
+        except BufferError:
+            pass  # a column view is still referenced; GC unmaps it later
+        self._fh.close()
+
+    @property
+    def n_events(self) -> int:
+        return int(self.header["n_events"])
+
+    @property
+    def n_levels(self) -> int:
+        return int(self.header["n_levels"])
+
+    @property
+    def event_fields(self) -> list[str]:
+        """Names of the per-event string columns (without prefix)."""
+        return _prefixed(self.header["columns"], _EVENT_PREFIX)
+
+    @property
+    def level_fields(self) -> list[str]:
+        """Names of the per-level string columns (without prefix)."""
+        return _prefixed(self.header["columns"], _LEVEL_PREFIX)
+
+    def column(self, name: str) -> Any:
+        """Return column *name* as a typed, host-endian sequence.
+
+        String-ref columns are addressed as ``"e.<key>"`` / ``"l.<key>"``;
+        their values index into :attr:`strings`.
+        """
+        offset, code, nbytes = self.header["columns"][name]
+        view = memoryview(self._mm)[offset : offset + nbytes]
+        if code == "B":
+            return view
+        if sys.byteorder == "big":
+            arr = array(code, view.tobytes())
+            arr.byteswap()
+            return arr
+        return view.cast(code)
+
+    @property
+    def strings(self) -> list[str]:
+        if self._strings is None:
+            offsets = self.column("string_offsets").tolist()
+            data = bytes(self.column("string_data"))
+            self._strings = [
+                data[offsets[i] : offsets[i + 1]].decode("utf-8", "surrogatepass")
+                for i in range(len(offsets) - 1)
+            ]
+        return self._strings
+
+    def asset_ids(self) -> set[str]:
+        """Every asset id referenced by an event or level, without decoding events."""
+        strings = self.strings
+        ids: set[str] = set()
+        for name in (_EVENT_PREFIX + "asset_id", _LEVEL_PREFIX + "asset_id"):
+            if name in self.header["columns"]:
+                ids.update(
+                    strings[i] for i in set(self.column(name).tolist()) if i >= 0
+                )
+        ids.discard("")
+        for raw_idx in self.column("raw").tolist():
+            if raw_idx >= 0:
+                ids.update(_raw_asset_ids(json.loads(strings[raw_idx])))
+        return ids
+
+    def book_asset_ids(self, limit: Optional[int] = None) -> list[str]:
+        """Asset ids of ``book`` events and batched ``price_changes[]`` entries, first-seen order.
+
+        This is the YES/NO discovery rule used by the tape tools, answered
+        from the event-type, level-group and asset-id ref columns without
+        building event dicts.  Stops once *limit* ids have been found.
+        """
+        strings = self.strings
+        columns = self.header["columns"]
+        try:
+            book_ref = strings.index("book")
+        except ValueError:
+            book_ref = -2
+        try:
+            change_ref = strings.index("price_change")
+        except ValueError:
+            change_ref = -2
+        etypes = self.column("event_type")
+        raws = self.column("raw")
+        lists = self.column("lists")
+        starts = self.column("level_start")
+        groups = self.column("group")
+        e_asset = self.column(_EVENT_PREFIX + "asset_id") if _EVENT_PREFIX + "asset_id" in columns else None
+        l_asset = self.column(_LEVEL_PREFIX + "asset_id") if _LEVEL_PREFIX + "asset_id" in columns else None
+        batched = 1 << _LIST_KEYS.index("price_changes")
+        batched_group = _LIST_KEYS.index("price_changes")
+
+        seen: list[str] = []
+
+        def _add(aid: str) -> bool:
+            if aid and aid not in seen:
+                seen.append(aid)
+            return limit is not None and len(seen) >= limit
+
+        for i in range(self.n_events):
+            if raws[i] >= 0:
+                event = json.loads(strings[raws[i]])
+                if not isinstance(event, dict):
+                    continue
+                if event.get("event_type") == "book":
+                    if _add(str(event.get("asset_id") or "")):
+                        return seen
+                elif event.get("event_type") == "price_change":
+                    for entry in event.get("price_changes", []) or []:
+                        if isinstance(entry, dict) and _add(str(entry.get("asset_id") or "")):
+                            return seen
+                continue
+            etype = etypes[i]
+            if etype == book_ref and e_asset is not None and e_asset[i] >= 0:
+                if _add(strings[e_asset[i]]):
+                    return seen
+            elif etype == change_ref and lists[i] & batched and l_asset is not None:
+                for j in range(starts[i], starts[i + 1]):
+                    if groups[j] == batched_group and l_asset[j] >= 0:
+                        if _add(strings[l_asset[j]]):
+                            return seen
+        return seen
+
+    def iter_events(self) -> Iterator[Any]:
+        """Yield events in file order as freshly built dicts."""
+        strings = self.strings
+        seqs = self.column("seq").tolist()
+        ts = self.column("ts_recv").tolist()
+        etypes = self.column("event_type").tolist()
+        lists = self.column("lists").tolist()
+        rests = self.column("rest").tolist()
+        raws = self.column("raw").tolist()
+        starts = self.column("level_start").tolist()
+        groups = self.column("group").tolist()
+        l_rests = self.column("level_rest").tolist()
+        e_cols = [
+            (key, self.column(_EVENT_PREFIX + key).tolist()) for key in self.event_fields
+        ]
+        l_cols = [
+            (key, self.column(_LEVEL_PREFIX + key).tolist()) for key in self.level_fields
+        ]
+        rest_of = _RestDecoder(strings)
+        n_groups = len(_LIST_KEYS)
+
+        for i in range(len(seqs)):
+            if raws[i] >= 0:
+                yield json.loads(strings[raws[i]])
+                continue
+            event: dict[str, Any] = {
+                "seq": seqs[i],
+                "ts_recv": ts[i],
+                "event_type": strings[etypes[i]],
+            }
+            for key, col in e_cols:
+                ref = col[i]
+                if ref >= 0:
+                    event[key] = strings[ref]
+            if rests[i] >= 0:
+                event.update(rest_of(rests[i]))
+            mask = lists[i]
+            if mask:
+                buckets: list[Optional[list]] = [
+                    [] if mask & (1 << g) else None for g in range(n_groups)
+                ]
+                for j in range(starts[i], starts[i + 1]):
+                    level: dict[str, Any] = {}
+                    for key, col in l_cols:
+                        ref = col[j]
+                        if ref >= 0:
+                            level[key] = strings[ref]
+                    if l_rests[j] >= 0:
+                        level.update(rest_of(l_rests[j]))
+                    buckets[groups[j]].append(level)  # type: ignore[union-attr]
+                for g, key in enumerate(_LIST_KEYS):
+                    if buckets[g] is not None:
+                        event[key] = buckets[g]
+            yield event
+
+
+def iter_columnar_events(path: Path) -> Iterator[Any]:
+    """Yield every event of the ``.ctape`` file at *path*."""
+    with ColumnarTape(path) as tape:
+        yield from tape.iter_events()
+
+
+class _RestDecoder:
+    """Decode ``rest`` JSON refs, memoizing those holding only scalar values.
+
+    Scalar-only dicts (e.g. ``{"parser_version": 1}``) repeat on nearly every
+    row; callers merge them with ``dict.update`` so sharing is safe.  Anything
+    nested is decoded fresh each time so events never alias mutable state.
+    """
+
+    def __init__(self, strings: list[str]) -> None:
+        self._strings = strings
+        self._scalar: dict[int, dict[str, Any]] = {}
+
+    def __call__(self, ref: int) -> dict[str, Any]:
+        cached = self._scalar.get(ref)
+        if cached is not None:
+            return cached
+        value = json.loads(self._strings[ref])
+        if all(not isinstance(v, (dict, list)) for v in value.values()):
+            self._scalar[ref] = value
+        return value
+
+
+def _prefixed(columns: dict[str, Any], prefix: str) -> list[str]:
+    return [name[len(prefix):] for name in columns if name.startswith(prefix)]
+
+
+def _raw_asset_ids(event: Any) -> set[str]:
+    ids: set[str] = set()
+    if not isinstance(event, dict):
+        return ids
+    if event.get("asset_id"):
+        ids.add(str(event["asset_id"]))
+    for entry in event.get("price_changes", []) or []:
+        if isinstance(entry, dict) and entry.get("asset_id"):
+            ids.add(str(entry["asset_id"]))
+    return ids
@@ -0,0 +1,681 @@
+"""Persistent tape index sidecar: byte offsets, seq/ts arrays, book checkpoints.
+
+Studio sessions used to JSON-decode every line of ``events.jsonl`` each time
+they opened a tape, and batch replays could only start at the first event.
+:func:`load_tape_index` indexes a tape once and stores a sidecar next to it
+(``events.jsonl.idx``) holding:
+
+  * the byte offset, ``seq`` and ``ts_recv`` of every event, in ``seq`` order
+    (ties keep file order), as compact ``array`` columns, and
+  * a :class:`BookCheckpoint` every ``checkpoint_every`` events: the
+    ``L2Book`` state of every asset plus the last trade price at that cursor.
+
+The sidecar is a small binary container: a magic/version header, a JSON
+header (source size, mtime and sha256, asset ids, column lengths and the
+price/size string dictionary) and raw little-endian columns -- the
+``offsets`` / ``seqs`` / ``timestamps`` of every event, one row per
+checkpoint, one row per checkpointed book and one row per book level.
+Nothing in it is executable, so a sidecar copied along with a tape is safe
+to open.  It is only used when the tape's current size and mtime match the
+header; anything else (edited or re-copied tape, old or foreign file)
+triggers a rebuild.
+
+Building reads the tape twice and never holds its events in memory: the
+first pass records offsets, ``seq`` and ``ts_recv``, the second replays the
+events in ``seq`` order by offset to take the checkpoints.  Checkpoints
+describe the tape alone -- no orders -- so the ``SimBroker`` /
+``PortfolioLedger`` state that goes with them is simply the initial one;
+callers rebuild it from their own parameters.
+
+:func:`open_tape_window` uses the index for ``start_ts`` / ``end_ts``
+windowed replay: books are restored from the nearest checkpoint, the few
+events between it and the window start are replayed into the books only,
+and the window itself is read by byte offset.  Columnar ``.ctape`` tapes
+have no line offsets and are scanned instead.
+
+Cursor convention: cursor *n* is the state after applying the first *n*
+events in ``seq`` order (cursor 0 = empty books).
+
+Public API
+----------
+- ``TapeIndex``            -- offsets / seqs / timestamps / checkpoints.
+- ``BookCheckpoint``       -- book state at a cursor.
+- ``load_tape_index(events_path)`` -- load the sidecar or build and store it.
+- ``default_index_path(events_path)``
+- ``open_tape_window(events_path, start_ts, end_ts)`` -> ``TapeWindow``
+- ``apply_event_to_books(event, books)``
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator, Optional
+
+from ..orderbook.l2book import L2Book
+from .cache import sha256_file
+from .columnar import ColumnarTape, is_columnar_tape, iter_columnar_events
+from .schema import EVENT_TYPE_LAST_TRADE_PRICE, EVENT_TYPE_PRICE_CHANGE
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+# Sidecar layout: _INDEX_MAGIC, then a little-endian (version, header_len)
+# pair, then header_len bytes of UTF-8 JSON, then the columns below in order.
+_INDEX_MAGIC = b"PTTAPEIX"
+_INDEX_PREAMBLE = struct.Struct("<II")
+# Bump when the sidecar layout changes; old sidecars are rebuilt.  Version 1
+# was a pickle and version 2 kept checkpoints in the JSON header.
+_INDEX_FORMAT_VERSION = 3
+# (name, typecode, table).  Row counts per table: "events" = count,
+# "checkpoints" = n_checkpoints, "books" = n_checkpoints * len(asset_ids)
+# (asset_ids order within each checkpoint), "book_bounds" = books + 1 offsets
+# into the level table, "levels" = n_levels.  Absent checkpoint seqs are
+# flagged in cp_has_seq; absent floats are NaN.  Level prices and sizes
+# index into the header's "strings"; level_side is 0 for bids, 1 for asks.
+_INDEX_COLUMNS = (
+    ("offsets", "q", "events"),
+    ("seqs", "q", "events"),
+    ("timestamps", "d", "events"),
+    ("cp_cursor", "q", "checkpoints"),
+    ("cp_seq", "q", "checkpoints"),
+    ("cp_ts_recv", "d", "checkpoints"),
+    ("cp_last_trade_price", "d", "checkpoints"),
+    ("cp_has_seq", "B", "checkpoints"),
+    ("book_level_start", "q", "book_bounds"),
+    ("book_initialized", "B", "books"),
+    ("level_price", "i", "levels"),
+    ("level_size", "i", "levels"),
+    ("level_side", "B", "levels"),
+)
+_EVENT_COLUMNS = ("offsets", "seqs", "timestamps")
+DEFAULT_CHECKPOINT_EVERY = 2000
+
+
+def default_index_path(events_path: Path) -> Path:
+    """Return the sidecar path for *events_path* (``events.jsonl.idx``)."""
+    return events_path.with_name(events_path.name + INDEX_SUFFIX)
+
+
+def apply_event_to_books(event: dict, books: dict[str, L2Book]) -> set[str]:
+    """Apply *event* to the matching books; return the asset ids it touched.
+
+    This is the book update step of ``StrategyRunner.run``, shared with the
+    index builder so checkpoints match a full replay: batched
+    ``price_changes[]`` entries go to their own asset's book, everything else
+    is applied to the book of the top-level ``asset_id``.  Assets without a
+    book in *books* are ignored.
+    """
+    touched: set[str] = set()
+    if event.get("event_type") == EVENT_TYPE_PRICE_CHANGE and "price_changes" in event:
+        for entry in event.get("price_changes", []):
+            entry_asset = str(entry.get("asset_id") or "")
+            if entry_asset and entry_asset in books:
+                books[entry_asset].apply_single_delta(entry)
+                touched.add(entry_asset)
+        return touched
+    asset_id = event.get("asset_id", "")
+    if asset_id in books:
+        books[asset_id].apply(event)
+        touched.add(asset_id)
+    return touched
+
+
+@dataclass(frozen=True)
+class BookCheckpoint:
+    """Tape-only replay state after the first ``cursor`` events.
+
+    ``books`` maps asset_id to ``L2Book.snapshot_state()`` output without the
+    ``strict`` flag, so restoring keeps the target book's own strictness.
+    ``seq`` / ``ts_recv`` are those of the last applied event (None if absent).
+    """
+
+    cursor: int
+    seq: Optional[int]
+    ts_recv: Optional[float]
+    last_trade_price: Optional[float]
+    books: dict[str, dict[str, Any]]
+
+    def restore_into(self, books: dict[str, L2Book]) -> None:
+        """Restore the checkpointed state of every asset present in *books*."""
+        for asset_id, book in books.items():
+            state = self.books.get(asset_id)
+            if state is not None:
+                book.restore_state(state)
+
+
+@dataclass(frozen=True)
+class TapeIndex:
+    """Event offsets and sparse book checkpoints for one JSONL tape.
+
+    ``offsets`` / ``seqs`` / ``timestamps`` are parallel arrays in replay
+    (``seq``) order.  ``malformed`` lists ``(lineno, error)`` for lines that
+    were skipped because they are not a JSON object.
+    """
+
+    events_path: Path
+    sha256: str
+    offsets: array
+    seqs: array
+    timestamps: array
+    asset_ids: tuple[str, ...]
+    checkpoints: tuple[BookCheckpoint, ...] = ()
+    malformed: tuple[tuple[int, str], ...] = ()
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY
+    _checkpoint_cursors: tuple[int, ...] = field(default=(), repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_checkpoint_cursors", tuple(cp.cursor for cp in self.checkpoints)
+        )
+
+    @classmethod
+    def build(
+        cls,
+        events_path: Path,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    ) -> "TapeIndex":
+        """Index *events_path* and return it (nothing is written).
+
+        The tape is streamed twice rather than loaded: once for offsets,
+        ``seq`` and ``ts_recv``, then once more in ``seq`` order to take the
+        book checkpoints.
+        """
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be >= 1")
+        digest = sha256_file(events_path)
+
+        file_offsets = array("q")
+        file_seqs = array("q")
+        file_timestamps = array("d")
+        malformed: list[tuple[int, str]] = []
+        asset_ids: list[str] = []
+        seen_assets: set[str] = set()
+
+        with open(events_path, "rb") as fh:
+            lineno = 0
+            while True:
+                offset = fh.tell()
+                raw_line = fh.readline()
+                if not raw_line:
+                    break
+                lineno += 1
+                raw_line = raw_line.strip()
+                if not raw_line:
+                    continue
+                try:
+                    event = json.loads(raw_line.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                    malformed.append((lineno, str(exc)))
+                    continue
+                if not isinstance(event, dict):
+                    malformed.append((lineno, "event is not a JSON object"))
+                    continue
+                file_seqs.append(int(event.get("seq", len(file_offsets))))
+                file_offsets.append(offset)
+                file_timestamps.append(float(event.get("ts_recv", 0.0)))
+                _collect_asset_ids(event, asset_ids, seen_assets)
+
+        if all(a <= b for a, b in zip(file_seqs, file_seqs[1:])):
+            offsets, seqs, timestamps = file_offsets, file_seqs, file_timestamps
+        else:
+            # sorted() is stable, so equal seqs keep file order.
+            order = sorted(range(len(file_seqs)), key=file_seqs.__getitem__)
+            offsets = array("q", (file_offsets[i] for i in order))
+            seqs = array("q", (file_seqs[i] for i in order))
+            timestamps = array("d", (file_timestamps[i] for i in order))
+
+        index = cls(
+            events_path=events_path,
+            sha256=digest,
+            offsets=offsets,
+            seqs=seqs,
+            timestamps=timestamps,
+            asset_ids=tuple(asset_ids),
+            malformed=tuple(malformed),
+            checkpoint_every=checkpoint_every,
+        )
+        return replace(index, checkpoints=tuple(_take_checkpoints(index)))
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def start_ts(self) -> Optional[float]:
+        if not self.timestamps:
+            return None
+        return self.timestamps[0]
+
+    @property
+    def end_ts(self) -> Optional[float]:
+        if not self.timestamps:
+            return None
+        return self.timestamps[-1]
+
+    def cursor_for_timestamp(self, timestamp: float) -> int:
+        """Return the replay cursor after applying all events at or before *timestamp*."""
+        if not self.timestamps:
+            return 0
+        return bisect_right(self.timestamps, float(timestamp))
+
+    def window(
+        self,
+        start_ts: Optional[float] = None,
+        end_ts: Optional[float] = None,
+    ) -> tuple[int, int]:
+        """Return ``(start_cursor, end_cursor)`` for events with start_ts <= ts <= end_ts."""
+        start = 0 if start_ts is None else bisect_left(self.timestamps, float(start_ts))
+        end = len(self) if end_ts is None else bisect_right(self.timestamps, float(end_ts))
+        return start, max(start, end)
+
+    def checkpoint_at_or_before(self, cursor: int) -> Optional[BookCheckpoint]:
+        """Return the latest checkpoint with ``checkpoint.cursor <= cursor``."""
+        idx = bisect_right(self._checkpoint_cursors, cursor)
+        return self.checkpoints[idx - 1] if idx else None
+
+    def read_event(self, fh: BinaryIO, index: int) -> dict[str, Any]:
+        """Decode the *index*-th event (replay order) from the open tape *fh*."""
+        offset = self.offsets[index]
+        if fh.tell() != offset:
+            fh.seek(offset)
+        raw_line = fh.readline()
+        if not raw_line:
+            raise IndexError(f"tape event missing at index {index}")
+        raw_line = raw_line.strip()
+        if not raw_line:
+            raise ValueError(f"blank tape line at index {index}")
+        return json.loads(raw_line.decode("utf-8"))
+
+    def iter_events(self, start: int = 0, stop: Optional[int] = None) -> Iterator[dict]:
+        """Yield events ``start <= index < stop`` in replay order by byte offset."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return
+        with open(self.events_path, "rb") as fh:
+            for index in range(start, stop):
+                yield self.read_event(fh, index)
+
+
+def load_tape_index(
+    events_path: Path,
+    *,
+    index_path: Optional[Path] = None,
+    checkpoint_every: Optional[int] = None,
+) -> TapeIndex:
+    """Return the index for *events_path*, building and storing it on a miss.
+
+    The sidecar at *index_path* (default :func:`default_index_path`) is used
+    when its header matches the tape's current size, mtime and
+    *checkpoint_every*; otherwise the index is rebuilt and the sidecar
+    rewritten.  A sidecar that cannot be written (read-only tape directory)
+    is logged and skipped.  *checkpoint_every* defaults to
+    ``DEFAULT_CHECKPOINT_EVERY``.
+    """
+    if checkpoint_every is None:
+        checkpoint_every = DEFAULT_CHECKPOINT_EVERY
+    events_path = Path(events_path)
+    target = index_path or default_index_path(events_path)
+    stat = events_path.stat()
+
+    index = _read_sidecar(target, events_path, stat, checkpoint_every)
+    if index is not None:
+        return index
+
+    index = TapeIndex.build(events_path, checkpoint_every=checkpoint_every)
+    _write_sidecar(target, index, stat)
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Windowed replay
+# ---------------------------------------------------------------------------
+
+
+class TapeWindow:
+    """Event source for replaying only ``start_ts <= ts_recv <= end_ts``.
+
+    Usage: restore :attr:`checkpoint` (if any) into the replay books, pass
+    every event from :meth:`warmup` to the book-only update, then replay
+    :meth:`events`.  ``warmup`` must be exhausted before ``events`` is used.
+    """
+
+    def __init__(
+        self,
+        events_path: Path,
+        start_ts: Optional[float],
+        end_ts: Optional[float],
+    ) -> None:
+        self.events_path = events_path
+        self.start_ts = start_ts
+        self.end_ts = end_ts
+        self.checkpoint: Optional[BookCheckpoint] = None
+        self.warnings: list[str] = []
+        self._index: Optional[TapeIndex] = None
+        self._scan: Optional[Iterator[dict]] = None
+        self._pending: Optional[dict] = None
+
+        if is_columnar_tape(events_path):
+            self._scan = iter_columnar_events(events_path)
+            with ColumnarTape(events_path) as tape:
+                self.asset_ids: set[str] = tape.asset_ids()
+            return
+
+        index = load_tape_index(events_path)
+        self._index = index
+        self.asset_ids = set(index.asset_ids)
+        self.warnings.extend(
+            f"Skipping malformed line {lineno}: {msg}" for lineno, msg in index.malformed
+        )
+        self._start, self._stop = index.window(start_ts, end_ts)
+        self.checkpoint = index.checkpoint_at_or_before(self._start)
+
+    def __len__(self) -> int:
+        """Number of events in the window (indexed tapes only)."""
+        if self._index is None:
+            raise TypeError("window length is unknown for columnar tapes")
+        return self._stop - self._start
+
+    def warmup(self) -> Iterator[dict]:
+        """Yield the events between the checkpoint and the window start."""
+        if self._index is not None:
+            first = self.checkpoint.cursor if self.checkpoint is not None else 0
+            yield from self._index.iter_events(first, self._start)
+            return
+        assert self._scan is not None
+        for event in self._scan:
+            if self.start_ts is None or float(event.get("ts_recv", 0.0)) >= self.start_ts:
+                self._pending = event
+                return
+            yield event
+
+    def events(self) -> Iterator[dict]:
+        """Yield the events inside the window in replay order."""
+        if self._index is not None:
+            yield from self._index.iter_events(self._start, self._stop)
+            return
+        assert self._scan is not None
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            if self.end_ts is not None and float(pending.get("ts_recv", 0.0)) > self.end_ts:
+                return
+            yield pending
+        for event in self._scan:
+            if self.end_ts is not None and float(event.get("ts_recv", 0.0)) > self.end_ts:
+                return
+            yield event
+
+
+def open_tape_window(
+    events_path: Path,
+    start_ts: Optional[float] = None,
+    end_ts: Optional[float] = None,
+) -> TapeWindow:
+    """Return a :class:`TapeWindow` over *events_path* (see its docstring)."""
+    if start_ts is not None and end_ts is not None and end_ts < start_ts:
+        raise ValueError(f"end_ts ({end_ts}) is before start_ts ({start_ts})")
+    return TapeWindow(Path(events_path), start_ts, end_ts)
+
+
+def prime_books(
+    window: TapeWindow,
+    books: dict[str, L2Book],
+    apply: Optional[Callable[[dict], Any]] = None,
+) -> int:
+    """Bring *books* to the window start; return the number of warm-up events.
+
+    Restores the window's checkpoint into *books*, then feeds each warm-up
+    event to *apply* (default: :func:`apply_event_to_books` on *books*).
+    """
+    if window.checkpoint is not None:
+        window.checkpoint.restore_into(books)
+    if apply is None:
+        apply = lambda event: apply_event_to_books(event, books)  # noqa: E731
+    count = 0
+    for event in window.warmup():
+        apply(event)
+        count += 1
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _collect_asset_ids(event: dict, ordered: list[str], seen: set[str]) -> None:
+    asset_id = event.get("asset_id")
+    if asset_id and str(asset_id) not in seen:
+        ordered.append(str(asset_id))
+        seen.add(str(asset_id))
+
+    for entry in event.get("price_changes", []):
+        entry_asset_id = entry.get("asset_id")
+        if entry_asset_id and str(entry_asset_id) not in seen:
+            ordered.append(str(entry_asset_id))
+            seen.add(str(entry_asset_id))
+
+
+def _portable_state(book: L2Book) -> dict[str, Any]:
+    state = book.snapshot_state()
+    state.pop("strict", None)
+    return state
+
+
+def _take_checkpoints(index: TapeIndex) -> Iterator[BookCheckpoint]:
+    """Replay *index* by offset and yield a checkpoint every ``checkpoint_every`` events."""
+    books = {aid: L2Book(aid, strict=False) for aid in index.asset_ids}
+    last_trade_price: Optional[float] = None
+    total = len(index)
+
+    for cursor, event in enumerate(index.iter_events(), start=1):
+        apply_event_to_books(event, books)
+        if event.get("event_type") == EVENT_TYPE_LAST_TRADE_PRICE:
+            try:
+                last_trade_price = float(event["price"])
+            except (KeyError, TypeError, ValueError):
+                pass
+
+        if cursor % index.checkpoint_every == 0 and cursor < total:
+            yield BookCheckpoint(
+                cursor=cursor,
+                seq=int(event["seq"]) if event.get("seq") is not None else None,
+                ts_recv=float(event["ts_recv"]) if event.get("ts_recv") is not None else None,
+                last_trade_price=last_trade_price,
+                books={aid: _portable_state(book) for aid, book in books.items()},
+            )
+
+
+def _optional_float(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def _checkpoint_columns(index: TapeIndex) -> tuple[dict[str, array], list[str]]:
+    """Flatten ``index.checkpoints`` into sidecar columns plus their string dictionary."""
+    columns = {name: array(typecode) for name, typecode, _ in _INDEX_COLUMNS}
+    strings: list[str] = []
+    refs: dict[str, int] = {}
+
+    def _ref(value: str) -> int:
+        ref = refs.get(value)
+        if ref is None:
+            ref = refs[value] = len(strings)
+            strings.append(value)
+        return ref
+
+    nan = float("nan")
+    columns["book_level_start"].append(0)
+    for cp in index.checkpoints:
+        columns["cp_cursor"].append(cp.cursor)
+        columns["cp_seq"].append(cp.seq if cp.seq is not None else 0)
+        columns["cp_has_seq"].append(cp.seq is not None)
+        columns["cp_ts_recv"].append(cp.ts_recv if cp.ts_recv is not None else nan)
+        columns["cp_last_trade_price"].append(
+            cp.last_trade_price if cp.last_trade_price is not None else nan
+        )
+        for aid in index.asset_ids:
+            state = cp.books[aid]
+            columns["book_initialized"].append(bool(state.get("initialized")))
+            for side, key in enumerate(("bids", "asks")):
+                for price, size in state.get(key, {}).items():
+                    columns["level_price"].append(_ref(price))
+                    columns["level_size"].append(_ref(size))
+                    columns["level_side"].append(side)
+            columns["book_level_start"].append(len(columns["level_side"]))
+    return columns, strings
+
+
+def _checkpoints_from_columns(
+    columns: dict[str, array],
+    asset_ids: tuple[str, ...],
+    strings: list[str],
+) -> tuple[BookCheckpoint, ...]:
+    """Rebuild the :class:`BookCheckpoint` tuple from :func:`_checkpoint_columns` output."""
+    level_start = columns["book_level_start"]
+    prices = columns["level_price"]
+    sizes = columns["level_size"]
+    sides = columns["level_side"]
+    checkpoints = []
+    book_row = 0
+    for row, cursor in enumerate(columns["cp_cursor"]):
+        books: dict[str, dict[str, Any]] = {}
+        for aid in asset_ids:
+            levels: tuple[dict[str, str], dict[str, str]] = ({}, {})
+            for j in range(level_start[book_row], level_start[book_row + 1]):
+                levels[sides[j]][strings[prices[j]]] = strings[sizes[j]]
+            books[aid] = {
+                "asset_id": aid,
+                "initialized": bool(columns["book_initialized"][book_row]),
+                "bids": levels[0],
+                "asks": levels[1],
+            }
+            book_row += 1
+        checkpoints.append(
+            BookCheckpoint(
+                cursor=cursor,
+                seq=columns["cp_seq"][row] if columns["cp_has_seq"][row] else None,
+                ts_recv=_optional_float(columns["cp_ts_recv"][row]),
+                last_trade_price=_optional_float(columns["cp_last_trade_price"][row]),
+                books=books,
+            )
+        )
+    return tuple(checkpoints)
+
+
+def _column_lengths(header: dict[str, Any]) -> dict[str, int]:
+    count = int(header["count"])
+    n_checkpoints = int(header["n_checkpoints"])
+    n_books = n_checkpoints * len(header["asset_ids"])
+    return {
+        "events": count,
+        "checkpoints": n_checkpoints,
+        "books": n_books,
+        "book_bounds": n_books + 1,
+        "levels": int(header["n_levels"]),
+    }
+
+
+def _read_sidecar(
+    target: Path,
+    events_path: Path,
+    stat: os.stat_result,
+    checkpoint_every: int,
+) -> Optional[TapeIndex]:
+    """Return the index stored at *target* if it is valid for the tape, else None."""
+    try:
+        with open(target, "rb") as fh:
+            if fh.read(len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+                raise ValueError("not a tape index")
+            version, header_len = _INDEX_PREAMBLE.unpack(fh.read(_INDEX_PREAMBLE.size))
+            if version != _INDEX_FORMAT_VERSION:
+                return None
+            header = json.loads(fh.read(header_len).decode("utf-8"))
+            if (
+                header.get("source_size") != stat.st_size
+                or header.get("source_mtime_ns") != stat.st_mtime_ns
+                or header.get("checkpoint_every") != checkpoint_every
+            ):
+                return None
+            lengths = _column_lengths(header)
+            columns: dict[str, array] = {}
+            for name, typecode, table in _INDEX_COLUMNS:
+                column = array(typecode)
+                size = lengths[table] * column.itemsize
+                data = fh.read(size)
+                if len(data) != size:
+                    raise ValueError(f"truncated {name} column")
+                column.frombytes(data)
+                if sys.byteorder != "little":
+                    column.byteswap()
+                columns[name] = column
+            if fh.read(1):
+                raise ValueError("trailing data after columns")
+        asset_ids = tuple(str(aid) for aid in header["asset_ids"])
+        return TapeIndex(
+            events_path=events_path,
+            sha256=str(header["sha256"]),
+            offsets=columns["offsets"],
+            seqs=columns["seqs"],
+            timestamps=columns["timestamps"],
+            asset_ids=asset_ids,
+            checkpoints=_checkpoints_from_columns(
+                columns, asset_ids, [str(value) for value in header["strings"]]
+            ),
+            malformed=tuple((int(lineno), str(err)) for lineno, err in header["malformed"]),
+            checkpoint_every=checkpoint_every,
+        )
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Ignoring unreadable tape index %s: %s", target, exc)
+        return None
+
+
+def _write_sidecar(target: Path, index: TapeIndex, stat: os.stat_result) -> None:
+    """Write the sidecar atomically so concurrent readers never see a partial file."""
+    columns, strings = _checkpoint_columns(index)
+    for name in _EVENT_COLUMNS:
+        columns[name] = getattr(index, name)
+    header = json.dumps(
+        {
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "sha256": index.sha256,
+            "checkpoint_every": index.checkpoint_every,
+            "count": len(index),
+            "asset_ids": list(index.asset_ids),
+            "n_checkpoints": len(index.checkpoints),
+            "n_levels": len(columns["level_side"]),
+            "strings": strings,
+            "malformed": [list(row) for row in index.malformed],
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=target.name + ".", suffix=".tmp", dir=target.parent
+        )
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(_INDEX_MAGIC)
+                fh.write(_INDEX_PREAMBLE.pack(_INDEX_FORMAT_VERSION, len(header)))
+                fh.write(header)
+                for name, typecode, _ in _INDEX_COLUMNS:
+                    column = array(typecode, columns[name])
+                    if sys.byteorder != "little":
+                        column.byteswap()
+                    fh.write(column.tobytes())
+            os.replace(tmp_name, target)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError as exc:
+        logger.warning("Could not write tape index %s: %s", target, exc)
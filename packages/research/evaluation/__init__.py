@@ -20,6 +20,7 @@ from packages.research.evaluation.dedup import (
     compute_shingles,
     jaccard_similarity,
 )
+from packages.research.evaluation.near_dup_index import NearDuplicateIndex
 from packages.research.evaluation.artifacts import (
     EvalArtifact,
     persist_eval_artifact,
@@ -46,6 +47,7 @@ __all__ = [
     "compute_content_hash",
     "compute_shingles",
     "jaccard_similarity",
+    "NearDuplicateIndex",
     # Artifacts
     "EvalArtifact",
     "persist_eval_artifact",
@@ -4,19 +4,23 @@ Provides:
 - compute_content_hash(body) -> SHA256 hex of normalized body
 - compute_shingles(body, shingle_size) -> frozenset of word n-gram tuples
 - jaccard_similarity(a, b) -> float 0.0..1.0
-- check_near_duplicate(doc, existing_hashes, existing_shingles, threshold) -> NearDuplicateResult
+- check_near_duplicate(doc, existing_hashes, existing_shingles, threshold, index) -> NearDuplicateResult
 
-All functions are pure; no network calls, no I/O.
+All functions are pure; no network calls, no I/O.  For large corpora pass a
+persistent ``NearDuplicateIndex`` (near_dup_index.py) instead of shingle lists.
 """
 
 from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from packages.research.evaluation.types import EvalDocument
 
+if TYPE_CHECKING:
+    from packages.research.evaluation.near_dup_index import NearDuplicateIndex
+
 
 @dataclass
 class NearDuplicateResult:
@@ -105,21 +109,29 @@ def check_near_duplicate(
     existing_hashes: set[str],
     existing_shingles: list[tuple[str, frozenset]],
     threshold: float = 0.85,
+    index: Optional["NearDuplicateIndex"] = None,
+    exclude_doc_id: Optional[str] = None,
 ) -> NearDuplicateResult:
     """Check whether a document is an exact or near-duplicate of known documents.
 
     Algorithm:
     1. If body is empty/None, return not-duplicate (no data to compare).
     2. Compute content hash. If it matches any existing hash, return exact duplicate.
-    3. Compute shingles. If Jaccard similarity > threshold against any existing
+    3. If an index is given, look the body up there (content hash, then LSH
+       candidates confirmed by exact Jaccard).
+    4. Compute shingles. If Jaccard similarity > threshold against any existing
        shingle set, return near-duplicate with the matching doc_id and similarity.
-    4. Otherwise return not-duplicate.
+    5. Otherwise return not-duplicate.
 
     Args:
         doc: Document to check.
         existing_hashes: Set of content hashes from previously seen documents.
         existing_shingles: List of (doc_id, shingle_frozenset) pairs.
         threshold: Jaccard similarity threshold for near-duplicate detection (default 0.85).
+        index: Optional persistent NearDuplicateIndex of previously ingested bodies.
+        exclude_doc_id: doc_id the document is stored under, if any.  Matches
+            against this id are ignored so re-ingesting an unchanged document
+            does not count as a duplicate of itself.
 
     Returns:
         NearDuplicateResult indicating whether a duplicate was found.
@@ -138,9 +150,20 @@ def check_near_duplicate(
             similarity=1.0,
         )
 
-    # Step 2: near-duplicate check via Jaccard
+    # Step 2: persistent MinHash/LSH index (sub-linear in corpus size)
+    if index is not None:
+        index_result = index.query(body, threshold=threshold, exclude_doc_id=exclude_doc_id)
+        if index_result.is_duplicate:
+            return index_result
+
+    if not existing_shingles:
+        return NearDuplicateResult(is_duplicate=False)
+
+    # Step 3: near-duplicate check via Jaccard
     doc_shingles = compute_shingles(body)
     for candidate_id, candidate_shingles in existing_shingles:
+        if exclude_doc_id is not None and candidate_id == exclude_doc_id:
+            continue
         sim = jaccard_similarity(doc_shingles, candidate_shingles)
         if sim > threshold:
             return NearDuplicateResult(
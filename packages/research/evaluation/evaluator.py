@@ -94,6 +94,9 @@ class DocumentEvaluator:
             If None or empty, dedup check is skipped.
         existing_shingles: List of (doc_id, shingle_frozenset) pairs for
             near-duplicate detection. If None, shingle comparison is skipped.
+        near_dup_index: Persistent NearDuplicateIndex (MinHash/LSH) of known
+            document bodies. When set, the dedup check runs even without
+            existing_hashes.
         priority_tier: Priority tier for gate thresholds (default: config default).
         routing_mode: "direct" (default) uses provider only. "route" escalates
             yellow-band REVIEW results to escalation_provider.
@@ -114,25 +117,29 @@ class DocumentEvaluator:
         routing_mode: str = "direct",
         escalation_provider: Optional[EvalProvider] = None,
         budget_tracker_path: Optional[Path] = None,
+        near_dup_index=None,  # Optional[NearDuplicateIndex]
     ):
         from packages.research.evaluation.providers import ManualProvider
         self._provider = provider if provider is not None else ManualProvider()
         self._artifacts_dir = Path(artifacts_dir) if artifacts_dir is not None else None
         self._existing_hashes: set = existing_hashes if existing_hashes is not None else set()
         self._existing_shingles: list = existing_shingles if existing_shingles is not None else []
+        self._near_dup_index = near_dup_index
         # priority_tier: None means use the config default (resolved at evaluation time)
         self._priority_tier = priority_tier
         self._routing_mode = routing_mode
         self._escalation_provider = escalation_provider
         self._budget_tracker_path = Path(budget_tracker_path) if budget_tracker_path is not None else None
 
-    def evaluate(self, doc: EvalDocument) -> GateDecision:
+    def evaluate(
+        self, doc: EvalDocument, exclude_doc_id: Optional[str] = None
+    ) -> GateDecision:
         """Evaluate a document through the quality gate.
 
         Steps:
         1. Hard stops — if any fail, return REJECT immediately (no scoring).
-        2. Near-duplicate check — if existing_hashes provided and match found,
-           return REJECT with dedup hard_stop (no scoring).
+        2. Near-duplicate check — if existing_hashes or near_dup_index provided
+           and a match is found, return REJECT with dedup hard_stop (no scoring).
         3. Feature extraction — extract per-family features (always runs).
         4. LLM scoring — score with provider, with optional routing escalation.
         5. Artifact persistence — if artifacts_dir is set, write JSONL record.
@@ -143,6 +150,8 @@ class DocumentEvaluator:
 
         Args:
             doc: The document to evaluate.
+            exclude_doc_id: Store doc_id the document will be ingested under;
+                its own near_dup_index entry is not treated as a duplicate.
 
         Returns:
             GateDecision with gate (ACCEPT|REVIEW|REJECT), scores, and metadata.
@@ -187,11 +196,15 @@ class DocumentEvaluator:
                 persist_eval_artifact(artifact, self._artifacts_dir)
             return decision
 
-        # Step 2: near-duplicate check (only if we have existing hashes to compare)
+        # Step 2: near-duplicate check (only if we have known documents to compare)
         near_dup_result = None
-        if self._existing_hashes:
+        if self._existing_hashes or self._near_dup_index is not None:
             near_dup_result = check_near_duplicate(
-                doc, self._existing_hashes, self._existing_shingles
+                doc,
+                self._existing_hashes,
+                self._existing_shingles,
+                index=self._near_dup_index,
+                exclude_doc_id=exclude_doc_id,
             )
             if near_dup_result.is_duplicate:
                 dedup_stop = HardStopResult(
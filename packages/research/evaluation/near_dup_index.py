@@ -0,0 +1,401 @@
+"""RIS near-duplicate index — persistent MinHash signatures with banded LSH.
+
+``check_near_duplicate`` compares a new document against every known shingle
+set, which is O(corpus) per document and needs all shingle sets in memory.
+``NearDuplicateIndex`` replaces that scan for large corpora:
+
+- Each document's word shingles (same ``compute_shingles`` as dedup.py) are
+  hashed to 32-bit values and summarised by a MinHash signature.
+- The signature is split into bands; documents sharing any band bucket are
+  candidates (sub-linear lookup through an indexed SQLite table).
+- Candidates whose signature agreement is plausible are confirmed with an
+  exact Jaccard over the stored shingle-hash sets.  Equal to the Jaccard of
+  the raw shingles up to 32-bit hash collisions.
+- Exact duplicates are caught first via the normalized content hash.
+
+The index lives in its own SQLite file next to the KnowledgeStore DB
+(``kb/rag/knowledge/near_dup.sqlite3`` by default).  numpy is used to
+vectorise signature computation when installed; the pure-Python fallback
+produces identical signatures.
+
+Usage::
+
+    from packages.research.evaluation.near_dup_index import NearDuplicateIndex
+
+    index = NearDuplicateIndex()                 # next to knowledge.sqlite3
+    result = index.query(doc.body, threshold=0.85)
+    if not result.is_duplicate:
+        index.add(doc_id, doc.body)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import sqlite3
+import zlib
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+from packages.polymarket.rag.knowledge_store import DEFAULT_KNOWLEDGE_DB_PATH
+from packages.research.evaluation.dedup import (
+    NearDuplicateResult,
+    compute_content_hash,
+    compute_shingles,
+    jaccard_similarity,
+)
+
+NEAR_DUP_DB_FILENAME = "near_dup.sqlite3"
+DEFAULT_NEAR_DUP_DB_PATH = DEFAULT_KNOWLEDGE_DB_PATH.parent / NEAR_DUP_DB_FILENAME
+
+DEFAULT_NUM_PERM = 128
+# 32 bands x 4 rows: a pair with Jaccard 0.85 shares a bucket with
+# probability ~1.0; at 0.3 it is ~0.23 (then rejected by confirmation).
+DEFAULT_BANDS = 32
+DEFAULT_SHINGLE_SIZE = 5
+DEFAULT_SEED = 1
+
+_MERSENNE_31 = (1 << 31) - 1
+# Candidates whose signature-estimated Jaccard is below threshold minus this
+# slack (~5 standard errors at 128 permutations) skip exact confirmation.
+_ESTIMATE_SLACK = 0.15
+# Columns per numpy block when hashing very long documents.
+_NUMPY_BLOCK = 4096
+
+
+def near_dup_db_path_for(knowledge_db_path: "str | Path") -> "str | Path":
+    """Index path stored next to a KnowledgeStore DB (``:memory:`` stays in memory)."""
+    if str(knowledge_db_path) == ":memory:":
+        return ":memory:"
+    return Path(knowledge_db_path).parent / NEAR_DUP_DB_FILENAME
+
+
+def _utcnow_iso() -> str:
+    return datetime.now(tz=timezone.utc).isoformat()
+
+
+def shingle_hashes(body: str, shingle_size: int = DEFAULT_SHINGLE_SIZE) -> list[int]:
+    """Sorted, de-duplicated 32-bit hashes of the body's word shingles."""
+    if not body or not body.strip():
+        return []
+    return sorted({
+        zlib.crc32(" ".join(shingle).encode("utf-8"))
+        for shingle in compute_shingles(body, shingle_size)
+    })
+
+
+def _permutations(num_perm: int, seed: int) -> tuple[list[int], list[int]]:
+    rng = random.Random(seed)
+    a = [rng.randrange(1, _MERSENNE_31) for _ in range(num_perm)]
+    b = [rng.randrange(0, _MERSENNE_31) for _ in range(num_perm)]
+    return a, b
+
+
+def _minhash(hashes: Sequence[int], a: Sequence[int], b: Sequence[int]) -> list[int]:
+    """MinHash signature of *hashes* under ``(a*x + b) mod (2^31 - 1)``."""
+    try:
+        import numpy as np
+    except ImportError:
+        np = None  # type: ignore[assignment]
+
+    if np is not None:
+        values = np.asarray(hashes, dtype=np.uint64) % np.uint64(_MERSENNE_31)
+        a_col = np.asarray(a, dtype=np.uint64)[:, None]
+        b_col = np.asarray(b, dtype=np.uint64)[:, None]
+        signature = np.full(len(a), _MERSENNE_31, dtype=np.uint64)
+        for start in range(0, len(values), _NUMPY_BLOCK):
+            block = (a_col * values[None, start : start + _NUMPY_BLOCK] + b_col) % np.uint64(_MERSENNE_31)
+            np.minimum(signature, block.min(axis=1), out=signature)
+        return signature.tolist()
+
+    values = [h % _MERSENNE_31 for h in hashes]
+    return [min((ai * v + bi) % _MERSENNE_31 for v in values) for ai, bi in zip(a, b)]
+
+
+def _pack_shingles(hashes: Sequence[int]) -> bytes:
+    """Delta-encode sorted hashes and zlib-compress them."""
+    deltas = array("I")
+    previous = 0
+    for value in hashes:
+        deltas.append(value - previous)
+        previous = value
+    return zlib.compress(deltas.tobytes())
+
+
+def _unpack_shingles(blob: bytes) -> frozenset:
+    deltas = array("I")
+    deltas.frombytes(zlib.decompress(blob))
+    values = []
+    running = 0
+    for delta in deltas:
+        running += delta
+        values.append(running)
+    return frozenset(values)
+
+
+class NearDuplicateIndex:
+    """SQLite-backed MinHash/LSH index of ingested document bodies.
+
+    Parameters
+    ----------
+    db_path:
+        SQLite file for the index, or ``":memory:"``.  Parent directories
+        are created for disk-backed paths.
+    num_perm, bands:
+        Signature length and LSH band count (``num_perm`` must be a multiple
+        of ``bands``).  Persisted on first use; reopening an index with
+        different parameters raises ``ValueError``.
+    shingle_size:
+        Words per shingle (matches ``compute_shingles``).
+    seed:
+        Seed for the MinHash permutations.
+    """
+
+    def __init__(
+        self,
+        db_path: "str | Path" = DEFAULT_NEAR_DUP_DB_PATH,
+        *,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        seed: int = DEFAULT_SEED,
+    ) -> None:
+        if num_perm <= 0 or bands <= 0 or num_perm % bands:
+            raise ValueError("num_perm must be a positive multiple of bands")
+        self._db_path = str(db_path)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self._a, self._b = _permutations(num_perm, seed)
+
+        if self._db_path != ":memory:":
+            Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self._db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._ensure_schema()
+
+    # ------------------------------------------------------------------
+    # Schema
+    # ------------------------------------------------------------------
+
+    def _ensure_schema(self) -> None:
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS minhash_meta (
+                key   TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS minhash_docs (
+                doc_id       TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                signature    BLOB NOT NULL,
+                shingles     BLOB NOT NULL,
+                added_at     TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_minhash_docs_content_hash
+                ON minhash_docs (content_hash);
+
+            CREATE TABLE IF NOT EXISTS minhash_bands (
+                band   INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                doc_id TEXT NOT NULL,
+                PRIMARY KEY (band, bucket, doc_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_minhash_bands_doc_id
+                ON minhash_bands (doc_id);
+        """)
+        params = {
+            "num_perm": str(self.num_perm),
+            "bands": str(self.bands),
+            "shingle_size": str(self.shingle_size),
+            "seed": str(self.seed),
+        }
+        stored = dict(self._conn.execute("SELECT key, value FROM minhash_meta").fetchall())
+        if stored:
+            mismatched = sorted(k for k, v in params.items() if stored.get(k) != v)
+            if mismatched:
+                raise ValueError(
+                    f"near-duplicate index {self._db_path} was built with different "
+                    f"parameters ({', '.join(mismatched)}); rebuild it or pass matching values"
+                )
+        else:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO minhash_meta (key, value) VALUES (?, ?)", params.items()
+                )
+
+    # ------------------------------------------------------------------
+    # Signatures
+    # ------------------------------------------------------------------
+
+    def signature(self, hashes: Sequence[int]) -> list[int]:
+        """MinHash signature of a sorted shingle-hash list."""
+        return _minhash(hashes, self._a, self._b)
+
+    def _band_buckets(self, signature: Sequence[int]) -> list[tuple[int, int]]:
+        buckets = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows : (band + 1) * self.rows]
+            digest = hashlib.blake2b(array("I", rows).tobytes(), digest_size=8).digest()
+            buckets.append((band, int.from_bytes(digest, "big", signed=True)))
+        return buckets
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add(self, doc_id: str, body: str) -> bool:
+        """Index *body* under *doc_id* (replacing any earlier entry).
+
+        Returns False (nothing stored) when the body has no text.
+        """
+        with self._conn:
+            return self._add(doc_id, body)
+
+    def add_many(self, items: Iterable[tuple[str, str]], *, batch_size: int = 500) -> int:
+        """Index ``(doc_id, body)`` pairs, committing every *batch_size* documents.
+
+        Returns the number of documents stored.
+        """
+        added = 0
+        pending = 0
+        try:
+            for doc_id, body in items:
+                if self._add(doc_id, body):
+                    added += 1
+                    pending += 1
+                if pending >= batch_size:
+                    self._conn.commit()
+                    pending = 0
+        finally:
+            self._conn.commit()
+        return added
+
+    def _add(self, doc_id: str, body: str) -> bool:
+        hashes = shingle_hashes(body, self.shingle_size)
+        if not hashes:
+            return False
+        signature = self.signature(hashes)
+        self._conn.execute("DELETE FROM minhash_bands WHERE doc_id = ?", (doc_id,))
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO minhash_docs
+                (doc_id, content_hash, signature, shingles, added_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                doc_id,
+                compute_content_hash(body),
+                array("I", signature).tobytes(),
+                _pack_shingles(hashes),
+                _utcnow_iso(),
+            ),
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO minhash_bands (band, bucket, doc_id) VALUES (?, ?, ?)",
+            [(band, bucket, doc_id) for band, bucket in self._band_buckets(signature)],
+        )
+        return True
+
+    def remove(self, doc_id: str) -> bool:
+        """Drop *doc_id* from the index.  Returns True if it was present."""
+        with self._conn:
+            self._conn.execute("DELETE FROM minhash_bands WHERE doc_id = ?", (doc_id,))
+            cursor = self._conn.execute("DELETE FROM minhash_docs WHERE doc_id = ?", (doc_id,))
+        return cursor.rowcount > 0
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def __contains__(self, doc_id: object) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM minhash_docs WHERE doc_id = ?", (doc_id,)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM minhash_docs").fetchone()[0])
+
+    def candidates(self, signature: Sequence[int]) -> dict[str, int]:
+        """Doc IDs sharing at least one LSH bucket, with their band-hit counts."""
+        hits: dict[str, int] = {}
+        for band, bucket in self._band_buckets(signature):
+            for (doc_id,) in self._conn.execute(
+                "SELECT doc_id FROM minhash_bands WHERE band = ? AND bucket = ?",
+                (band, bucket),
+            ):
+                hits[doc_id] = hits.get(doc_id, 0) + 1
+        return hits
+
+    def query(
+        self,
+        body: str,
+        threshold: float = 0.85,
+        exclude_doc_id: Optional[str] = None,
+    ) -> NearDuplicateResult:
+        """Check *body* against the index.
+
+        Same contract as ``check_near_duplicate``: an exact content-hash hit
+        returns ``duplicate_type="exact"``; otherwise the best candidate with
+        confirmed Jaccard ``> threshold`` returns ``duplicate_type="near"``.
+        Entries stored under *exclude_doc_id* are never reported as matches.
+        """
+        if not body:
+            return NearDuplicateResult(is_duplicate=False)
+
+        row = self._conn.execute(
+            "SELECT doc_id FROM minhash_docs WHERE content_hash = ? AND doc_id != ? LIMIT 1",
+            (compute_content_hash(body), exclude_doc_id or ""),
+        ).fetchone()
+        if row is not None:
+            return NearDuplicateResult(
+                is_duplicate=True,
+                duplicate_type="exact",
+                matched_doc_id=row[0],
+                similarity=1.0,
+            )
+
+        hashes = shingle_hashes(body, self.shingle_size)
+        if not hashes:
+            return NearDuplicateResult(is_duplicate=False)
+        signature = self.signature(hashes)
+        hits = self.candidates(signature)
+        if not hits:
+            return NearDuplicateResult(is_duplicate=False)
+
+        doc_shingles = frozenset(hashes)
+        best_id: Optional[str] = None
+        best_sim = 0.0
+        for doc_id in sorted(hits, key=lambda d: (-hits[d], d)):
+            if doc_id == exclude_doc_id:
+                continue
+            stored = self._conn.execute(
+                "SELECT signature, shingles FROM minhash_docs WHERE doc_id = ?", (doc_id,)
+            ).fetchone()
+            if stored is None:
+                continue
+            other_signature = array("I")
+            other_signature.frombytes(stored[0])
+            agree = sum(1 for x, y in zip(signature, other_signature) if x == y)
+            if agree / self.num_perm < threshold - _ESTIMATE_SLACK:
+                continue
+            sim = jaccard_similarity(doc_shingles, _unpack_shingles(stored[1]))
+            if sim > threshold and sim > best_sim:
+                best_id, best_sim = doc_id, sim
+
+        if best_id is None:
+            return NearDuplicateResult(is_duplicate=False)
+        return NearDuplicateResult(
+            is_duplicate=True,
+            duplicate_type="near",
+            matched_doc_id=best_id,
+            similarity=best_sim,
+        )
+
+    def close(self) -> None:
+        self._conn.close()
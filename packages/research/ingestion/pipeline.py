@@ -78,6 +78,10 @@ class IngestPipeline:
     evaluator:
         ``DocumentEvaluator`` instance for eval gating.  Pass ``None`` to skip
         eval gating entirely (equivalent to ``--no-eval``).
+    near_dup_index:
+        Optional ``NearDuplicateIndex``.  Every stored document body is
+        registered so later ingests can be checked against it (pass the same
+        index to the evaluator to reject near-duplicates).
     """
 
     def __init__(
@@ -85,10 +89,12 @@ class IngestPipeline:
         store: KnowledgeStore,
         extractor: Optional[Extractor] = None,
         evaluator=None,  # Optional[DocumentEvaluator] -- avoid circular import
+        near_dup_index=None,  # Optional[NearDuplicateIndex]
     ) -> None:
         self._store = store
         self._extractor = extractor if extractor is not None else PlainTextExtractor()
         self._evaluator = evaluator
+        self._near_dup_index = near_dup_index
 
     def ingest(
         self,
@@ -143,10 +149,17 @@ class IngestPipeline:
                 reject_reason=hard_stop.reason or hard_stop.stop_type or "hard stop failed",
             )
 
-        # Step 4: Optional eval gate
+        # Step 4: Optional eval gate.  The store ID is deterministic, so pass
+        # it along to keep a re-ingest from matching its own dedup entry.
+        content_hash = extracted.metadata.get("content_hash") or _sha256_hex(extracted.body)
         gate_decision: Optional[GateDecision] = None
         if self._evaluator is not None:
-            gate_decision = self._evaluator.evaluate(eval_doc)
+            gate_decision = self._evaluator.evaluate(
+                eval_doc,
+                exclude_doc_id=self._store.source_document_id(
+                    extracted.source_url, content_hash
+                ),
+            )
             if gate_decision.gate == "REJECT":
                 reason = (
                     gate_decision.hard_stop.reason
@@ -166,7 +179,6 @@ class IngestPipeline:
         chunk_count = len(chunks)
 
         # Step 6: Store source document
-        content_hash = extracted.metadata.get("content_hash") or _sha256_hex(extracted.body)
         doc_id = self._store.add_source_document(
             title=extracted.title,
             source_url=extracted.source_url,
@@ -178,6 +190,8 @@ class IngestPipeline:
             confidence_tier=None,
             metadata_json=json.dumps(extracted.metadata),
         )
+        if self._near_dup_index is not None and doc_id:
+            self._near_dup_index.add(doc_id, extracted.body)
 
         # Step 7: Optional post-ingest claim extraction
         if post_ingest_extract and doc_id:
@@ -293,10 +307,17 @@ class IngestPipeline:
                 reject_reason=hard_stop.reason or hard_stop.stop_type or "hard stop failed",
             )
 
-        # Step 4: Optional eval gate
+        # Step 4: Optional eval gate.  The store ID is deterministic, so pass
+        # it along to keep a re-ingest from matching its own dedup entry.
+        content_hash = extracted.metadata.get("content_hash") or _sha256_hex(extracted.body)
         gate_decision: Optional[GateDecision] = None
         if self._evaluator is not None:
-            gate_decision = self._evaluator.evaluate(eval_doc)
+            gate_decision = self._evaluator.evaluate(
+                eval_doc,
+                exclude_doc_id=self._store.source_document_id(
+                    extracted.source_url, content_hash
+                ),
+            )
             if gate_decision.gate == "REJECT":
                 reason = (
                     gate_decision.hard_stop.reason
@@ -316,7 +337,6 @@ class IngestPipeline:
         chunk_count = len(chunks)
 
         # Step 6: Store source document
-        content_hash = extracted.metadata.get("content_hash") or _sha256_hex(extracted.body)
         doc_id = self._store.add_source_document(
             title=extracted.title,
             source_url=extracted.source_url,
@@ -328,6 +348,8 @@ class IngestPipeline:
             confidence_tier=None,
             metadata_json=json.dumps(extracted.metadata),
         )
+        if self._near_dup_index is not None and doc_id:
+            self._near_dup_index.add(doc_id, extracted.body)
 
         # Step 7: Optional post-ingest claim extraction (same pattern as ingest())
         if post_ingest_extract and doc_id:
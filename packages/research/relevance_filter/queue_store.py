@@ -7,16 +7,26 @@ for future SVM training data.
 Artifact paths (gitignored under artifacts/**):
   - Review queue: artifacts/research/prefetch_review_queue/review_queue.jsonl
   - Label store:  artifacts/research/svm_filter_labels/labels.jsonl
+
+The JSONL files stay the source of truth.  Each one has a SQLite sidecar
+(``<name>.jsonl.idx.sqlite3``) holding candidate IDs and running counts, kept
+in step by applying only the bytes appended since the last sync.  Dedup and
+stats therefore cost O(1) per call instead of a full reparse.  A missing
+sidecar (e.g. a pre-existing queue) is built on first use.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import os
+import sqlite3
 import sys
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import IO, Iterator, Optional
 
 
 _REPO_ROOT = Path(__file__).resolve().parents[3]
@@ -55,11 +65,251 @@ def _read_jsonl(path: Path) -> list[dict]:
     return records
 
 
+# ---------------------------------------------------------------------------
+# SQLite sidecar index
+# ---------------------------------------------------------------------------
+
+_INDEX_SUFFIX = ".idx.sqlite3"
+# Leading bytes fingerprinted to detect a JSONL file that was replaced or
+# rewritten in place rather than appended to.
+_HEAD_BYTES = 4096
+
+_BASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jsonl_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS counters (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def index_path_for(jsonl_path: Path) -> Path:
+    """Return the SQLite sidecar path for a JSONL store file."""
+    jsonl_path = Path(jsonl_path)
+    return jsonl_path.with_name(jsonl_path.name + _INDEX_SUFFIX)
+
+
+def _head_hash(fh: IO[bytes], length: int) -> str:
+    fh.seek(0)
+    return hashlib.sha256(fh.read(length)).hexdigest()
+
+
+class _JsonlIndex(ABC):
+    """SQLite sidecar mirroring an append-only JSONL file.
+
+    The sidecar records how many bytes of the JSONL have been applied.  Every
+    session first syncs: unchanged files (same size and mtime) cost one
+    ``stat``; appended files are read from the stored offset only; a file that
+    shrank or whose leading bytes changed is re-indexed from scratch.  Writers
+    run inside ``BEGIN IMMEDIATE`` so concurrent processes serialise on the
+    sidecar rather than racing on the JSONL.
+
+    Subclasses provide ``_SCHEMA``, ``_TABLES`` and ``_apply``.
+    """
+
+    _SCHEMA = ""
+    _TABLES: tuple[str, ...] = ()
+
+    def __init__(self, jsonl_path: Path) -> None:
+        self.jsonl_path = Path(jsonl_path)
+        self.path = index_path_for(self.jsonl_path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def exists(self) -> bool:
+        return self.jsonl_path.exists() or self.path.exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_BASE_SCHEMA + self._SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @contextmanager
+    def session(self, attach: Optional[dict[str, Path]] = None) -> Iterator[sqlite3.Connection]:
+        """Yield a synced connection inside a write transaction.
+
+        *attach* maps schema names to other sidecar files to ATTACH for joins.
+        """
+        conn = self._connect()
+        for name, path in (attach or {}).items():
+            conn.execute(f"ATTACH DATABASE ? AS {name}", (str(path),))
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.sync(conn)
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            for name in attach or {}:
+                conn.execute(f"DETACH DATABASE {name}")
+
+    def append(self, conn: sqlite3.Connection, record: dict) -> None:
+        """Append *record* to the JSONL file and apply it to the index."""
+        self.jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.jsonl_path.open("ab") as fh:
+            # Never glue a new record onto an unterminated final line.
+            prefix = b""
+            if fh.tell() > 0:
+                with self.jsonl_path.open("rb") as rh:
+                    rh.seek(-1, os.SEEK_END)
+                    if rh.read(1) != b"\n":
+                        prefix = b"\n"
+            fh.write(prefix + json.dumps(record).encode("utf-8") + b"\n")
+        self.sync(conn)
+
+    def counter(self, conn: sqlite3.Connection, name: str) -> int:
+        row = conn.execute("SELECT value FROM counters WHERE name = ?", (name,)).fetchone()
+        return int(row[0]) if row else 0
+
+    def _bump(self, conn: sqlite3.Connection, name: str, amount: int = 1) -> None:
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    @abstractmethod
+    def _apply(self, conn: sqlite3.Connection, record: dict, line_offset: int) -> None:
+        """Apply one decoded JSONL *record* (starting at *line_offset*) to the index."""
+
+    def _clear(self, conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM counters")
+        conn.execute("DELETE FROM jsonl_state")
+        for table in self._TABLES:
+            conn.execute(f"DELETE FROM {table}")
+
+    def sync(self, conn: sqlite3.Connection) -> None:
+        """Apply any JSONL bytes not yet reflected in the index."""
+        state = dict(conn.execute("SELECT key, value FROM jsonl_state").fetchall())
+        offset = int(state.get("offset", 0))
+        lineno = int(state.get("lines", 0))
+        head_len = int(state.get("head_len", 0))
+
+        try:
+            st = os.stat(self.jsonl_path)
+        except FileNotFoundError:
+            if state:
+                self._clear(conn)
+            return
+
+        if (
+            state
+            and st.st_size == int(state["size"])
+            and st.st_mtime_ns == int(state["mtime_ns"])
+        ):
+            return
+
+        with self.jsonl_path.open("rb") as fh:
+            if state and (st.st_size < offset or _head_hash(fh, head_len) != state["head_hash"]):
+                self._clear(conn)
+                offset = lineno = 0
+            fh.seek(offset)
+            for raw in fh:
+                complete = raw.endswith(b"\n")
+                line = raw.strip()
+                if line:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError as exc:
+                        if not complete:
+                            # Possibly a write still in progress; retry next sync.
+                            break
+                        print(
+                            f"WARNING: malformed JSONL in {self.jsonl_path} "
+                            f"at line {lineno + 1}: {exc}",
+                            file=sys.stderr,
+                        )
+                    else:
+                        if isinstance(record, dict):
+                            self._bump(conn, "records")
+                            self._apply(conn, record, offset)
+                offset += len(raw)
+                lineno += 1
+            head_len = min(offset, _HEAD_BYTES)
+            head_hash = _head_hash(fh, head_len)
+
+        conn.executemany(
+            "INSERT OR REPLACE INTO jsonl_state (key, value) VALUES (?, ?)",
+            [
+                ("offset", str(offset)),
+                ("lines", str(lineno)),
+                ("size", str(st.st_size)),
+                ("mtime_ns", str(st.st_mtime_ns)),
+                ("head_len", str(head_len)),
+                ("head_hash", head_hash),
+            ],
+        )
+
+
+class _QueueIndex(_JsonlIndex):
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS queue_records (
+        candidate_id TEXT PRIMARY KEY,
+        line_offset  INTEGER NOT NULL
+    );
+    """
+    _TABLES = ("queue_records",)
+
+    def _apply(self, conn: sqlite3.Connection, record: dict, line_offset: int) -> None:
+        candidate_id = record.get("candidate_id")
+        if candidate_id:
+            conn.execute(
+                "INSERT OR IGNORE INTO queue_records (candidate_id, line_offset) VALUES (?, ?)",
+                (str(candidate_id), line_offset),
+            )
+
+
+class _LabelIndex(_JsonlIndex):
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS label_counts (
+        candidate_id TEXT PRIMARY KEY,
+        allow        INTEGER NOT NULL DEFAULT 0,
+        reject       INTEGER NOT NULL DEFAULT 0
+    );
+    """
+    _TABLES = ("label_counts",)
+
+    def _apply(self, conn: sqlite3.Connection, record: dict, line_offset: int) -> None:
+        label = record.get("label")
+        allow = 1 if label == "allow" else 0
+        reject = 1 if label == "reject" else 0
+        if allow:
+            self._bump(conn, "allow")
+        if reject:
+            self._bump(conn, "reject")
+        conn.execute(
+            "INSERT INTO label_counts (candidate_id, allow, reject) VALUES (?, ?, ?) "
+            "ON CONFLICT(candidate_id) DO UPDATE SET "
+            "allow = allow + excluded.allow, reject = reject + excluded.reject",
+            (str(record.get("candidate_id", "")), allow, reject),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Public stores
+# ---------------------------------------------------------------------------
+
+
 class ReviewQueueStore:
     """File-backed JSONL queue for REVIEW-decision candidates.
 
     Append-only. Idempotent: a record with the same candidate_id is never
-    written twice.
+    written twice (checked against the sidecar index, not by rereading).
 
     Record schema (all fields):
         candidate_id    sha256(source_url)
@@ -79,6 +329,7 @@ class ReviewQueueStore:
 
     def __init__(self, queue_path: Optional[Path] = None) -> None:
         self._path = Path(queue_path) if queue_path else _DEFAULT_QUEUE_PATH
+        self._index = _QueueIndex(self._path)
 
     def enqueue(self, record: dict) -> bool:
         """Append a record to the queue if not already present.
@@ -97,27 +348,57 @@ class ReviewQueueStore:
         source_url = record.get("source_url", "")
         candidate_id = record.get("candidate_id") or candidate_id_from_url(source_url)
 
-        existing_ids = {r.get("candidate_id") for r in _read_jsonl(self._path)}
-        if candidate_id in existing_ids:
-            return False
-
-        out = dict(record)
-        out["candidate_id"] = candidate_id
-        out.setdefault("created_at", _utcnow_iso())
+        with self._index.session() as conn:
+            if conn.execute(
+                "SELECT 1 FROM queue_records WHERE candidate_id = ?", (candidate_id,)
+            ).fetchone():
+                return False
 
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        with self._path.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(out) + "\n")
+            out = dict(record)
+            out["candidate_id"] = candidate_id
+            out.setdefault("created_at", _utcnow_iso())
+            self._index.append(conn, out)
 
         return True
 
+    def close(self) -> None:
+        """Close the sidecar index connection (reopened on next use)."""
+        self._index.close()
+
     def all_records(self) -> list[dict]:
         """Return all queue records."""
         return _read_jsonl(self._path)
 
+    def find(self, candidate_id_prefix: str) -> list[dict]:
+        """Return queue records whose candidate_id starts with *candidate_id_prefix*.
+
+        Uses the sidecar index to seek straight to the matching lines.
+        """
+        if not self._index.exists():
+            return []
+        with self._index.session() as conn:
+            offsets = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT line_offset FROM queue_records "
+                    "WHERE candidate_id >= ? AND candidate_id < ? ORDER BY line_offset",
+                    (candidate_id_prefix, candidate_id_prefix + "\U0010ffff"),
+                )
+            ]
+            records: list[dict] = []
+            if offsets:
+                with self._path.open("rb") as fh:
+                    for offset in offsets:
+                        fh.seek(offset)
+                        records.append(json.loads(fh.readline()))
+        return records
+
     def pending_count(self) -> int:
         """Return total number of queued records (labeled or not)."""
-        return len(_read_jsonl(self._path))
+        if not self._index.exists():
+            return 0
+        with self._index.session() as conn:
+            return self._index.counter(conn, "records")
 
     def queue_stats(self, label_store: "LabelStore | None" = None) -> dict:
         """Return joined counts across queue and label store.
@@ -137,25 +418,28 @@ class ReviewQueueStore:
             labeled_allow      -- label records with label='allow' for queued items
             labeled_reject     -- label records with label='reject' for queued items
         """
-        records = _read_jsonl(self._path)
-        total_queued = len(records)
-        queued_ids = {r.get("candidate_id") for r in records}
-
-        labeled_ids: set[str] = set()
-        labeled_allow: int = 0
-        labeled_reject: int = 0
-
-        if label_store is not None:
-            for lr in label_store.all_labels():
-                cid = lr.get("candidate_id", "")
-                if cid in queued_ids:
-                    labeled_ids.add(cid)
-                    if lr.get("label") == "allow":
-                        labeled_allow += 1
-                    elif lr.get("label") == "reject":
-                        labeled_reject += 1
-
-        labeled_total = len(labeled_ids)
+        total_queued = 0
+        labeled_total = 0
+        labeled_allow = 0
+        labeled_reject = 0
+
+        if self._index.exists():
+            attach: dict[str, Path] = {}
+            if label_store is not None and label_store._index.exists():
+                # Bring the label sidecar up to date before joining against it.
+                with label_store._index.session():
+                    pass
+                attach["labels"] = label_store._index.path
+
+            with self._index.session(attach=attach) as conn:
+                total_queued = self._index.counter(conn, "records")
+                if attach:
+                    labeled_total, labeled_allow, labeled_reject = conn.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(l.allow), 0), COALESCE(SUM(l.reject), 0) "
+                        "FROM labels.label_counts AS l "
+                        "JOIN queue_records AS q ON q.candidate_id = l.candidate_id"
+                    ).fetchone()
+
         pending_unlabeled = total_queued - labeled_total
 
         return {
@@ -171,6 +455,7 @@ class LabelStore:
     """File-backed JSONL store for operator-assigned filter labels.
 
     Append-only. Each record is one labeled training example for a future SVM.
+    Totals and per-candidate label counts are kept in a sidecar index.
 
     Label record schema:
         candidate_id  sha256(source_url)
@@ -183,6 +468,7 @@ class LabelStore:
 
     def __init__(self, label_path: Optional[Path] = None) -> None:
         self._path = Path(label_path) if label_path else _DEFAULT_LABEL_PATH
+        self._index = _LabelIndex(self._path)
 
     def append_label(
         self,
@@ -229,23 +515,26 @@ class LabelStore:
             "labeled_at": _utcnow_iso(),
         }
 
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        with self._path.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(record) + "\n")
+        with self._index.session() as conn:
+            self._index.append(conn, record)
 
         return record
 
+    def close(self) -> None:
+        """Close the sidecar index connection (reopened on next use)."""
+        self._index.close()
+
     def all_labels(self) -> list[dict]:
         """Return all label records."""
         return _read_jsonl(self._path)
 
     def counts(self) -> dict:
         """Return {'total': N, 'allow': N, 'reject': N}."""
-        records = _read_jsonl(self._path)
-        allow_count = sum(1 for r in records if r.get("label") == "allow")
-        reject_count = sum(1 for r in records if r.get("label") == "reject")
-        return {
-            "total": len(records),
-            "allow": allow_count,
-            "reject": reject_count,
-        }
+        if not self._index.exists():
+            return {"total": 0, "allow": 0, "reject": 0}
+        with self._index.session() as conn:
+            return {
+                "total": self._index.counter(conn, "records"),
+                "allow": self._index.counter(conn, "allow"),
+                "reject": self._index.counter(conn, "reject"),
+            }
@@ -21,12 +21,15 @@ Usage:
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass, field
 from typing import Optional
 
 from packages.research.synthesis.query_planner import QueryPlan, plan_queries
 from packages.research.synthesis.hyde import HydeResult, expand_hyde
 
+logger = logging.getLogger(__name__)
+
 
 # ---------------------------------------------------------------------------
 # Deferred import for query_index to avoid import-time Chroma dependency
@@ -34,9 +37,32 @@ from packages.research.synthesis.hyde import HydeResult, expand_hyde
 
 
 def query_index(**kwargs):
-    """Thin wrapper around the real query_index that allows monkeypatching in tests."""
+    """Thin wrapper around the real query_index that allows monkeypatching in tests.
+
+    Sub-queries for one topic share warm index handles.  When the kwargs
+    carry no live embedder/reranker object and a ``polytool rag-serve``
+    URL is configured, the query is answered by the resident service.
+    """
     from packages.polymarket.rag.query import query_index as _qi
-    return _qi(**kwargs)
+    from packages.polymarket.rag.service import (
+        RagServiceTimeout,
+        RagServiceUnavailable,
+        default_resources,
+        query_service,
+        resolve_service_url,
+    )
+
+    service_url = resolve_service_url()
+    if service_url and kwargs.get("embedder") is None and kwargs.get("reranker") is None:
+        request = {key: value for key, value in kwargs.items() if key not in ("embedder", "reranker")}
+        try:
+            return query_service(request, url=service_url)
+        except RagServiceUnavailable:
+            pass
+        except RagServiceTimeout as exc:
+            logger.warning("%s; sub-query skipped", exc)
+            raise
+    return _qi(resources=default_resources(), **kwargs)
 
 
 # ---------------------------------------------------------------------------
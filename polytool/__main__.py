@@ -53,6 +53,7 @@ tape_manifest_main = _command_entrypoint("tools.cli.tape_manifest")
 gate2_preflight_main = _command_entrypoint("tools.cli.gate2_preflight")
 historical_import_main = _command_entrypoint("tools.cli.historical_import")
 smoke_historical_main = _command_entrypoint("tools.cli.smoke_historical")
+index_historical_main = _command_entrypoint("tools.cli.index_historical")
 fetch_price_2min_main = _command_entrypoint("tools.cli.fetch_price_2min")
 reconstruct_silver_main = _command_entrypoint("tools.cli.reconstruct_silver")
 batch_reconstruct_silver_main = _command_entrypoint("tools.cli.batch_reconstruct_silver")
@@ -76,6 +77,7 @@ rag_index_main = _command_entrypoint("tools.cli.rag_index")
 rag_eval_main = _command_entrypoint("tools.cli.rag_eval")
 rag_query_main = _command_entrypoint("tools.cli.rag_query")
 rag_run_main = _command_entrypoint("tools.cli.rag_run")
+rag_serve_main = _command_entrypoint("tools.cli.rag_serve")
 scan_main = _command_entrypoint("tools.cli.scan")
 simtrader_main = _command_entrypoint("tools.cli.simtrader")
 research_eval_main = _command_entrypoint("tools.cli.research_eval")
@@ -90,6 +92,7 @@ research_acquire_main = _command_entrypoint("tools.cli.research_acquire")
 research_report_main = _command_entrypoint("tools.cli.research_report")
 research_scheduler_main = _command_entrypoint("tools.cli.research_scheduler")
 research_stats_main = _command_entrypoint("tools.cli.research_stats")
+research_dedup_main = _command_entrypoint("tools.cli.research_dedup")
 research_health_main = _command_entrypoint("tools.cli.research_health")
 research_review_main = _command_entrypoint("tools.cli.research_review")
 research_dossier_extract_main = _command_entrypoint("tools.cli.research_dossier_extract")
@@ -123,6 +126,7 @@ _COMMAND_HANDLER_NAMES = {
     "rag-index": "rag_index_main",
     "rag-query": "rag_query_main",
     "rag-run": "rag_run_main",
+    "rag-serve": "rag_serve_main",
     "scan": "scan_main",
     "scan-gate2-candidates": "scan_gate2_candidates_main",
     "simtrader": "simtrader_main",
@@ -131,6 +135,7 @@ _COMMAND_HANDLER_NAMES = {
     "wallet-scan": "wallet_scan_main",
     "import-historical": "historical_import_main",
     "smoke-historical": "smoke_historical_main",
+    "index-historical": "index_historical_main",
     "fetch-price-2min": "fetch_price_2min_main",
     "reconstruct-silver": "reconstruct_silver_main",
     "batch-reconstruct-silver": "batch_reconstruct_silver_main",
@@ -159,6 +164,7 @@ _COMMAND_HANDLER_NAMES = {
     "research-report": "research_report_main",
     "research-scheduler": "research_scheduler_main",
     "research-stats": "research_stats_main",
+    "research-dedup": "research_dedup_main",
     "research-health": "research_health_main",
     "research-review": "research_review_main",
     "research-dossier-extract": "research_dossier_extract_main",
@@ -211,6 +217,7 @@ def print_usage() -> None:
     print("  rag-refresh           Rebuild the local RAG index (one-command, use this first)")
     print("  rag-index             Build or rebuild the RAG index (full control)")
     print("  rag-query             Query the local RAG index")
+    print("  rag-serve             Keep RAG models + index handles warm for rag-query/MCP")
     print("  rag-run               Re-execute bundle rag_queries.json and write results back")
     print("  rag-eval              Evaluate retrieval quality")
     print("  cache-source          Cache a trusted web source for RAG indexing")
@@ -230,6 +237,7 @@ def print_usage() -> None:
     print("  research-report           Save, list, search reports and generate weekly digests")
     print("  research-scheduler        Manage the RIS background ingestion scheduler")
     print("  research-stats            Operator metrics snapshot and local-first export for RIS pipeline")
+    print("  research-dedup            Backfill/inspect the MinHash near-duplicate index for RIS sources")
     print("  research-health           Print RIS health status summary from stored run data")
     print("  research-review           Inspect and resolve RIS review-queue items")
     print("  research-dossier-extract  Parse dossier artifacts -> KnowledgeStore (source_family=dossier_report)")
@@ -261,6 +269,7 @@ def print_usage() -> None:
     print("--- Data Import (Phase 1 / Bulk Historical Foundation) ----------------")
     print("  import-historical     Validate and document local historical dataset layout")
     print("  smoke-historical      DuckDB smoke - validate pmxt/Jon raw files directly (no ClickHouse)")
+    print("  index-historical      Build/refresh per-file token+timestamp catalogs for pmxt/Jon raw files")
     print("  fetch-price-2min      Fetch 2-min price history from CLOB API -> polytool.price_2min (ClickHouse)")
     print("  reconstruct-silver    Reconstruct a Silver tape (pmxt anchor + Jon fills + price_2min midpoint guide)")
     print("  batch-reconstruct-silver Batch-reconstruct Silver tapes for multiple tokens over one window")
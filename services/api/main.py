@@ -5,8 +5,11 @@ import json
 import logging
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import StreamingResponse
@@ -19,6 +22,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "packages
 from polymarket.gamma import GammaClient, MarketToken
 from polymarket.data_api import DataApiClient
 from polymarket.clob import ClobClient
+from polymarket.http_client import set_host_rate_limit
 from polymarket.features import (
     compute_daily_features_sql,
     compute_features_sql,
@@ -27,11 +31,11 @@ from polymarket.features import (
 )
 from polymarket.detectors import DetectorRunner, get_insert_columns as get_detector_columns
 from polymarket.backfill import backfill_missing_mappings
+from polymarket.market_tokens_cache import MarketTokenMetadataCache
 from polymarket.pnl import compute_user_pnl_buckets
 from polymarket.arb import compute_arb_feasibility_buckets, get_insert_columns as get_arb_columns
 from polymarket.orderbook_snapshots import (
-    OrderbookSnapshot,
-    snapshot_from_book,
+    snapshot_books_concurrently,
     get_insert_columns as get_snapshot_columns,
 )
 from polymarket.opportunities import get_opportunity_bucket_start, normalize_bucket_type
@@ -81,7 +85,9 @@ BOOK_SNAPSHOT_MAX_TOKENS = int(os.getenv("BOOK_SNAPSHOT_MAX_TOKENS", "200"))
 BOOK_SNAPSHOT_MIN_OK_TARGET = int(os.getenv("BOOK_SNAPSHOT_MIN_OK_TARGET", "5"))
 BOOK_SNAPSHOT_404_TTL_HOURS = int(os.getenv("BOOK_SNAPSHOT_404_TTL_HOURS", "24"))
 BOOK_SNAPSHOT_MAX_PREFLIGHT = int(os.getenv("BOOK_SNAPSHOT_MAX_PREFLIGHT", "200"))
+BOOK_SNAPSHOT_FETCH_CONCURRENCY = int(os.getenv("BOOK_SNAPSHOT_FETCH_CONCURRENCY", "8"))
 ORDERBOOK_SNAPSHOT_MAX_AGE_SECONDS = int(os.getenv("ORDERBOOK_SNAPSHOT_MAX_AGE_SECONDS", "3600"))
+MARKET_TOKENS_CACHE_REFRESH_SECONDS = float(os.getenv("MARKET_TOKENS_CACHE_REFRESH_SECONDS", "60"))
 OPPORTUNITY_TRADE_LOOKBACK_DAYS = int(os.getenv("OPPORTUNITY_TRADE_LOOKBACK_DAYS", "90"))
 OPPORTUNITY_SNAPSHOT_MAX_AGE_SECONDS = int(
     os.getenv("OPPORTUNITY_SNAPSHOT_MAX_AGE_SECONDS", str(ORDERBOOK_SNAPSHOT_MAX_AGE_SECONDS))
@@ -94,6 +100,15 @@ CLICKHOUSE_USER = os.getenv("CLICKHOUSE_USER", "polytool_admin")
 CLICKHOUSE_PASSWORD = os.getenv("CLICKHOUSE_PASSWORD", "polytool_admin")
 CLICKHOUSE_DATABASE = os.getenv("CLICKHOUSE_DATABASE", "polytool")
 
+# Blocking work (ClickHouse, Gamma/Data/CLOB HTTP) runs off the event loop.
+API_BLOCKING_WORKERS = int(os.getenv("API_BLOCKING_WORKERS", "16"))
+API_ENDPOINT_CONCURRENCY_DEFAULT = int(os.getenv("API_ENDPOINT_CONCURRENCY_DEFAULT", "4"))
+# Per-endpoint overrides, e.g. "snapshot_books=2,compute_pnl=2".
+API_ENDPOINT_CONCURRENCY = os.getenv("API_ENDPOINT_CONCURRENCY", "")
+# Requests per second to each Polymarket API host, shared by all endpoints and
+# therefore by every wallet-scan worker calling this server (0 = unthrottled).
+POLYMARKET_API_RATE_PER_SECOND = float(os.getenv("POLYMARKET_API_RATE_PER_SECOND", "20"))
+
 # Initialize FastAPI
 app = FastAPI(
     title="PolyTool API",
@@ -103,9 +118,185 @@ app = FastAPI(
 studio_session_manager = StudioSessionManager()
 
 # Initialize clients
+if POLYMARKET_API_RATE_PER_SECOND > 0:
+    for _api_base in (GAMMA_API_BASE, DATA_API_BASE, CLOB_API_BASE):
+        set_host_rate_limit(_api_base, POLYMARKET_API_RATE_PER_SECOND)
 gamma_client = GammaClient(base_url=GAMMA_API_BASE, timeout=HTTP_TIMEOUT_SECONDS)
 data_api_client = DataApiClient(base_url=DATA_API_BASE, timeout=HTTP_TIMEOUT_SECONDS)
 clob_client = ClobClient(base_url=CLOB_API_BASE, timeout=PNL_HTTP_TIMEOUT_SECONDS)
+market_token_cache = MarketTokenMetadataCache(
+    refresh_interval_seconds=MARKET_TOKENS_CACHE_REFRESH_SECONDS,
+)
+
+
+def _parse_endpoint_concurrency(raw: str) -> dict[str, int]:
+    limits: dict[str, int] = {}
+    for item in raw.split(","):
+        name, sep, value = item.partition("=")
+        if not sep:
+            continue
+        try:
+            limits[name.strip()] = max(int(value), 1)
+        except ValueError:
+            logger.warning(f"Ignoring invalid API_ENDPOINT_CONCURRENCY entry: {item!r}")
+    return limits
+
+
+class BlockingWorkPool:
+    """Run blocking endpoint bodies on a dedicated executor.
+
+    Each endpoint gets its own concurrency limit, so a burst of wallet scans
+    cannot take every worker, and /health keeps answering because the event
+    loop never blocks. Queue depth and latency are tracked per endpoint.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        default_limit: int,
+        endpoint_limits: Optional[dict[str, int]] = None,
+    ):
+        self.max_workers = max(int(max_workers), 1)
+        self.default_limit = max(int(default_limit), 1)
+        self.endpoint_limits = dict(endpoint_limits or {})
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="api-blocking",
+        )
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, endpoint: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop is not self._semaphore_loop:
+            self._semaphores = {}
+            self._semaphore_loop = loop
+        semaphore = self._semaphores.get(endpoint)
+        if semaphore is None:
+            limit = self.endpoint_limits.get(endpoint, self.default_limit)
+            semaphore = asyncio.Semaphore(limit)
+            self._semaphores[endpoint] = semaphore
+        return semaphore
+
+    def _stat(self, endpoint: str) -> dict[str, float]:
+        stat = self._stats.get(endpoint)
+        if stat is None:
+            stat = {
+                "queued": 0,
+                "running": 0,
+                "completed": 0,
+                "failed": 0,
+                "cancelled_queued": 0,
+                "cancelled_running": 0,
+                "queue_wait_seconds_total": 0.0,
+                "latency_seconds_total": 0.0,
+                "latency_seconds_max": 0.0,
+            }
+            self._stats[endpoint] = stat
+        return stat
+
+    async def run(self, endpoint: str, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """Run ``func(*args, **kwargs)`` in the pool under ``endpoint``'s limit.
+
+        The endpoint permit is held until the worker thread returns, even if
+        the awaiting request is cancelled first: a thread cannot be
+        interrupted, so releasing early would let the endpoint exceed its
+        limit.
+        """
+        enqueued_at = time.monotonic()
+        semaphore = self._semaphore(endpoint)
+        with self._lock:
+            self._stat(endpoint)["queued"] += 1
+        try:
+            await semaphore.acquire()
+        except BaseException:
+            with self._lock:
+                stat = self._stat(endpoint)
+                stat["queued"] -= 1
+                stat["cancelled_queued"] += 1
+            raise
+
+        started_at = time.monotonic()
+        with self._lock:
+            stat = self._stat(endpoint)
+            stat["queued"] -= 1
+            stat["running"] += 1
+            stat["queue_wait_seconds_total"] += started_at - enqueued_at
+
+        caller_cancelled = False
+
+        def _finished(fut: "asyncio.Future[Any]") -> None:
+            semaphore.release()
+            failed = fut.cancelled() or fut.exception() is not None
+            if caller_cancelled:
+                outcome = "cancelled_running"
+            else:
+                outcome = "failed" if failed else "completed"
+            elapsed = time.monotonic() - started_at
+            with self._lock:
+                stat = self._stat(endpoint)
+                stat["running"] -= 1
+                stat[outcome] += 1
+                stat["latency_seconds_total"] += elapsed
+                stat["latency_seconds_max"] = max(stat["latency_seconds_max"], elapsed)
+
+        loop = asyncio.get_running_loop()
+        try:
+            fut = loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
+        except BaseException:
+            semaphore.release()
+            with self._lock:
+                stat = self._stat(endpoint)
+                stat["running"] -= 1
+                stat["failed"] += 1
+            raise
+        fut.add_done_callback(_finished)
+        try:
+            return await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            if not fut.done():
+                caller_cancelled = True
+            raise
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return queue depth and latency counters for every endpoint seen so far."""
+        endpoints: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for endpoint, stat in sorted(self._stats.items()):
+                finished = stat["completed"] + stat["failed"] + stat["cancelled_running"]
+                endpoints[endpoint] = {
+                    "limit": self.endpoint_limits.get(endpoint, self.default_limit),
+                    "queued": int(stat["queued"]),
+                    "running": int(stat["running"]),
+                    "completed": int(stat["completed"]),
+                    "failed": int(stat["failed"]),
+                    "cancelled": int(stat["cancelled_queued"] + stat["cancelled_running"]),
+                    "cancelled_queued": int(stat["cancelled_queued"]),
+                    "cancelled_running": int(stat["cancelled_running"]),
+                    "avg_queue_wait_seconds": (
+                        stat["queue_wait_seconds_total"] / finished if finished else 0.0
+                    ),
+                    "avg_latency_seconds": (
+                        stat["latency_seconds_total"] / finished if finished else 0.0
+                    ),
+                    "max_latency_seconds": stat["latency_seconds_max"],
+                }
+        return {
+            "max_workers": self.max_workers,
+            "default_endpoint_limit": self.default_limit,
+            "queued_total": sum(item["queued"] for item in endpoints.values()),
+            "running_total": sum(item["running"] for item in endpoints.values()),
+            "endpoints": endpoints,
+        }
+
+
+_blocking_work = BlockingWorkPool(
+    max_workers=API_BLOCKING_WORKERS,
+    default_limit=API_ENDPOINT_CONCURRENCY_DEFAULT,
+    endpoint_limits=_parse_endpoint_concurrency(API_ENDPOINT_CONCURRENCY),
+)
 
 
 DOSSIER_REQUIRED_SCHEMA_OBJECTS = (
@@ -361,23 +552,6 @@ def _assert_dossier_export_schema(client) -> None:
         )
 
 
-def _extract_error_message_from_response(response) -> Optional[str]:
-    try:
-        payload = response.json()
-    except ValueError:
-        text = response.text.strip()
-        return text or None
-
-    if isinstance(payload, dict):
-        for key in ("error", "message", "detail"):
-            value = payload.get(key)
-            if value:
-                return str(value)
-    if isinstance(payload, str):
-        return payload
-    return None
-
-
 def _is_wallet_address(value: str) -> bool:
     value = value.strip()
     return value.startswith("0x") and len(value) >= 40
@@ -448,32 +622,6 @@ def _upsert_user_profile(client, profile, input_value: str) -> None:
     )
 
 
-def _build_basic_snapshot(
-    token_id: str,
-    snapshot_ts: datetime,
-    status: str,
-    reason: Optional[str],
-) -> OrderbookSnapshot:
-    return OrderbookSnapshot(
-        token_id=token_id,
-        snapshot_ts=snapshot_ts,
-        best_bid=None,
-        best_ask=None,
-        mid_price=None,
-        spread_bps=None,
-        depth_bid_usd_50bps=None,
-        depth_ask_usd_50bps=None,
-        slippage_buy_bps_100=None,
-        slippage_sell_bps_100=None,
-        slippage_buy_bps_500=None,
-        slippage_sell_bps_500=None,
-        levels_captured=0,
-        book_timestamp=None,
-        status=status,
-        reason=reason,
-    )
-
-
 def _resolve_candidate_tokens(client, candidates: list[dict]) -> tuple[list[str], dict[str, str]]:
     if not candidates:
         return [], {}
@@ -686,15 +834,13 @@ async def health_check():
     return {"status": "healthy", "service": "polytool-api"}
 
 
-@app.post("/api/resolve", response_model=ResolveResponse)
-async def resolve_user(request: ResolveRequest):
-    """
-    Resolve a username or wallet address to a Polymarket profile.
+@app.get("/api/metrics/blocking")
+async def blocking_work_metrics():
+    """Queue depth and latency of endpoint work running off the event loop."""
+    return _blocking_work.snapshot()
 
-    - If input starts with '@', strips it for search
-    - If input is a wallet address (0x...), attempts lookup
-    - Returns proxy wallet, username, and full profile
-    """
+
+def _resolve_user_blocking(request: ResolveRequest):
     logger.info(f"Resolving user: {request.input}")
 
     profile = gamma_client.resolve(request.input)
@@ -722,16 +868,19 @@ async def resolve_user(request: ResolveRequest):
     )
 
 
-@app.post("/api/ingest/trades", response_model=IngestTradesResponse)
-async def ingest_trades(request: IngestTradesRequest):
+@app.post("/api/resolve", response_model=ResolveResponse)
+async def resolve_user(request: ResolveRequest):
     """
-    Ingest trades for a user into ClickHouse.
+    Resolve a username or wallet address to a Polymarket profile.
 
-    - Resolves username to proxy wallet if needed
-    - Fetches trades from Data API (up to max_pages)
-    - Inserts into ClickHouse with idempotent deduplication
-    - Returns ingestion metrics
+    - If input starts with '@', strips it for search
+    - If input is a wallet address (0x...), attempts lookup
+    - Returns proxy wallet, username, and full profile
     """
+    return await _blocking_work.run("resolve_user", _resolve_user_blocking, request=request)
+
+
+def _ingest_trades_blocking(request: IngestTradesRequest):
     logger.info(f"Ingesting trades for: {request.user}, max_pages={request.max_pages}")
 
     # First resolve the user to get proxy wallet
@@ -831,16 +980,20 @@ async def ingest_trades(request: IngestTradesRequest):
     )
 
 
-@app.post("/api/ingest/activity", response_model=IngestActivityResponse)
-async def ingest_activity(request: IngestActivityRequest):
+@app.post("/api/ingest/trades", response_model=IngestTradesResponse)
+async def ingest_trades(request: IngestTradesRequest):
     """
-    Ingest activity for a user into ClickHouse.
+    Ingest trades for a user into ClickHouse.
 
     - Resolves username to proxy wallet if needed
-    - Fetches activity from Data API (up to max_pages)
+    - Fetches trades from Data API (up to max_pages)
     - Inserts into ClickHouse with idempotent deduplication
     - Returns ingestion metrics
     """
+    return await _blocking_work.run("ingest_trades", _ingest_trades_blocking, request=request)
+
+
+def _ingest_activity_blocking(request: IngestActivityRequest):
     logger.info(f"Ingesting activity for: {request.user}, max_pages={request.max_pages}")
 
     profile = gamma_client.resolve(request.user)
@@ -923,15 +1076,20 @@ async def ingest_activity(request: IngestActivityRequest):
     )
 
 
-@app.post("/api/ingest/positions", response_model=IngestPositionsResponse)
-async def ingest_positions(request: IngestPositionsRequest):
+@app.post("/api/ingest/activity", response_model=IngestActivityResponse)
+async def ingest_activity(request: IngestActivityRequest):
     """
-    Ingest current positions snapshot for a user into ClickHouse.
+    Ingest activity for a user into ClickHouse.
 
     - Resolves username to proxy wallet if needed
-    - Fetches current positions from Data API
-    - Writes a snapshot each call
+    - Fetches activity from Data API (up to max_pages)
+    - Inserts into ClickHouse with idempotent deduplication
+    - Returns ingestion metrics
     """
+    return await _blocking_work.run("ingest_activity", _ingest_activity_blocking, request=request)
+
+
+def _ingest_positions_blocking(request: IngestPositionsRequest):
     logger.info(f"Ingesting positions for: {request.user}")
 
     profile = gamma_client.resolve(request.user)
@@ -994,13 +1152,19 @@ async def ingest_positions(request: IngestPositionsRequest):
     )
 
 
-@app.post("/api/enrich/resolutions", response_model=EnrichResolutionsResponse)
-async def enrich_resolutions(request: EnrichResolutionsRequest):
+@app.post("/api/ingest/positions", response_model=IngestPositionsResponse)
+async def ingest_positions(request: IngestPositionsRequest):
     """
-    Enrich market resolutions for a user and cache results into market_resolutions.
+    Ingest current positions snapshot for a user into ClickHouse.
 
-    Chain: ClickHouse cache -> OnChain CTF -> Subgraph -> Gamma.
+    - Resolves username to proxy wallet if needed
+    - Fetches current positions from Data API
+    - Writes a snapshot each call
     """
+    return await _blocking_work.run("ingest_positions", _ingest_positions_blocking, request=request)
+
+
+def _enrich_resolutions_blocking(request: EnrichResolutionsRequest):
     logger.info(
         "Enriching resolutions for user=%s max_candidates=%s batch_size=%s max_concurrency=%s",
         request.user,
@@ -1069,9 +1233,21 @@ async def enrich_resolutions(request: EnrichResolutionsRequest):
         raise HTTPException(status_code=500, detail=f"Resolution enrichment failed: {exc}")
 
 
-@app.get("/api/users")
-async def list_users():
-    """List all ingested users."""
+@app.post("/api/enrich/resolutions", response_model=EnrichResolutionsResponse)
+async def enrich_resolutions(request: EnrichResolutionsRequest):
+    """
+    Enrich market resolutions for a user and cache results into market_resolutions.
+
+    Chain: ClickHouse cache -> OnChain CTF -> Subgraph -> Gamma.
+    """
+    return await _blocking_work.run(
+        "enrich_resolutions",
+        _enrich_resolutions_blocking,
+        request=request,
+    )
+
+
+def _list_users_blocking():
     try:
         client = get_clickhouse_client()
         result = client.query(
@@ -1101,9 +1277,13 @@ async def list_users():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/users/{proxy_wallet}/trades/stats")
-async def get_user_trade_stats(proxy_wallet: str):
-    """Get trade statistics for a user."""
+@app.get("/api/users")
+async def list_users():
+    """List all ingested users."""
+    return await _blocking_work.run("list_users", _list_users_blocking)
+
+
+def _get_user_trade_stats_blocking(proxy_wallet: str):
     try:
         client = get_clickhouse_client()
 
@@ -1145,6 +1325,16 @@ async def get_user_trade_stats(proxy_wallet: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/users/{proxy_wallet}/trades/stats")
+async def get_user_trade_stats(proxy_wallet: str):
+    """Get trade statistics for a user."""
+    return await _blocking_work.run(
+        "get_user_trade_stats",
+        _get_user_trade_stats_blocking,
+        proxy_wallet=proxy_wallet,
+    )
+
+
 class IngestMarketsRequest(BaseModel):
     """Request body for /api/ingest/markets endpoint."""
 
@@ -1357,6 +1547,9 @@ class SnapshotBooksResponse(BaseModel):
     snapshot_ts: datetime
     # Diagnostic reason if no OK snapshots
     no_ok_reason: Optional[str] = None
+    # Fetch timing diagnostics
+    fetch_wall_ms: float = 0.0
+    token_timings: list[dict] = []
 
 
 class ExportUserDossierRequest(BaseModel):
@@ -1421,15 +1614,7 @@ class ExportUserDossierHistoryResponse(BaseModel):
     rows: list[ExportUserDossierHistoryRow]
 
 
-@app.post("/api/ingest/markets", response_model=IngestMarketsResponse)
-async def ingest_markets(request: IngestMarketsRequest):
-    """
-    Fetch and ingest market metadata from Gamma API.
-
-    - Fetches markets with optional active_only filter
-    - Extracts market_tokens mapping (token_id -> outcome)
-    - Stores in market_tokens and markets tables
-    """
+def _ingest_markets_blocking(request: IngestMarketsRequest):
     logger.info(f"Ingesting markets: active_only={request.active_only}, max_pages={request.max_pages}")
 
     result = gamma_client.fetch_all_markets(
@@ -1465,6 +1650,7 @@ async def ingest_markets(request: IngestMarketsRequest):
                 column_names=token_insert_columns,
             )
             tokens_written = len(rows)
+            market_token_cache.invalidate()
             logger.info(f"Inserted {tokens_written} market tokens")
 
         if result.token_aliases:
@@ -1548,18 +1734,19 @@ async def ingest_markets(request: IngestMarketsRequest):
     )
 
 
-@app.post("/api/run/detectors", response_model=RunDetectorsResponse)
-async def run_detectors(request: RunDetectorsRequest):
+@app.post("/api/ingest/markets", response_model=IngestMarketsResponse)
+async def ingest_markets(request: IngestMarketsRequest):
     """
-    Run strategy detectors for a user.
+    Fetch and ingest market metadata from Gamma API.
 
-    - Resolves username to wallet
-    - Optionally backfills missing market token mappings
-    - Fetches trades from ClickHouse
-    - Optionally recomputes bucket features
-    - Runs all 4 detectors for each bucket
-    - Stores results in detector_results table
+    - Fetches markets with optional active_only filter
+    - Extracts market_tokens mapping (token_id -> outcome)
+    - Stores in market_tokens and markets tables
     """
+    return await _blocking_work.run("ingest_markets", _ingest_markets_blocking, request=request)
+
+
+def _run_detectors_blocking(request: RunDetectorsRequest):
     logger.info(f"Running detectors for: {request.user}, bucket={request.bucket}")
 
     # Resolve user
@@ -1583,6 +1770,7 @@ async def run_detectors(request: RunDetectorsRequest):
                 proxy_wallet=proxy_wallet,
                 max_missing=500,
             )
+            market_token_cache.refresh(client)
             logger.info(f"Backfill complete: {backfill_stats}")
 
         # Fetch trades
@@ -1617,18 +1805,8 @@ async def run_detectors(request: RunDetectorsRequest):
 
         logger.info(f"Fetched {len(trades)} trades for {proxy_wallet}")
 
-        # Fetch market_tokens map (after potential backfill)
-        tokens_result = client.query(
-            "SELECT token_id, condition_id, outcome_index, outcome_name, category FROM market_tokens"
-        )
-        market_tokens_map = {}
-        for row in tokens_result.result_rows:
-            market_tokens_map[row[0]] = {
-                "condition_id": row[1],
-                "outcome_index": row[2],
-                "outcome_name": row[3],
-                "category": row[4],
-            }
+        # Fetch metadata for traded tokens only (after potential backfill)
+        market_tokens_map = market_token_cache.lookup(client, [t["token_id"] for t in trades])
 
         logger.info(f"Loaded {len(market_tokens_map)} market tokens for mapping")
 
@@ -1712,11 +1890,22 @@ async def run_detectors(request: RunDetectorsRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/compute/pnl", response_model=ComputePnlResponse)
-async def compute_pnl(request: ComputePnlRequest):
+@app.post("/api/run/detectors", response_model=RunDetectorsResponse)
+async def run_detectors(request: RunDetectorsRequest):
     """
-    Compute realized + conservative MTM PnL and exposure series for a user.
+    Run strategy detectors for a user.
+
+    - Resolves username to wallet
+    - Optionally backfills missing market token mappings
+    - Fetches trades from ClickHouse
+    - Optionally recomputes bucket features
+    - Runs all 4 detectors for each bucket
+    - Stores results in detector_results table
     """
+    return await _blocking_work.run("run_detectors", _run_detectors_blocking, request=request)
+
+
+def _compute_pnl_blocking(request: ComputePnlRequest):
     logger.info(f"Computing PnL for: {request.user}, bucket={request.bucket}")
 
     bucket = request.bucket.lower()
@@ -1851,17 +2040,15 @@ async def compute_pnl(request: ComputePnlRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/compute/arb_feasibility", response_model=ComputeArbFeasibilityResponse)
-async def compute_arb_feasibility(request: ComputeArbFeasibilityRequest):
+@app.post("/api/compute/pnl", response_model=ComputePnlResponse)
+async def compute_pnl(request: ComputePnlRequest):
     """
-    Compute arb feasibility with dynamic fees and slippage estimates.
-
-    - Identifies arb-like events (buying both outcomes, closing within 24h)
-    - Fetches fee rates from CLOB API for each token
-    - Estimates slippage by simulating execution through orderbook
-    - Computes total costs and break-even notional
-    - Stores results in arb_feasibility_bucket table
+    Compute realized + conservative MTM PnL and exposure series for a user.
     """
+    return await _blocking_work.run("compute_pnl", _compute_pnl_blocking, request=request)
+
+
+def _compute_arb_feasibility_blocking(request: ComputeArbFeasibilityRequest):
     logger.info(
         f"Computing arb feasibility for: {request.user}, "
         f"bucket={request.bucket}, max_tokens={request.max_tokens}"
@@ -1913,18 +2100,8 @@ async def compute_arb_feasibility(request: ComputeArbFeasibilityRequest):
 
         logger.info(f"Fetched {len(trades)} trades for {proxy_wallet}")
 
-        # Fetch market_tokens map
-        tokens_result = client.query(
-            "SELECT token_id, condition_id, outcome_index, outcome_name, category FROM market_tokens"
-        )
-        market_tokens_map = {}
-        for row in tokens_result.result_rows:
-            market_tokens_map[row[0]] = {
-                "condition_id": row[1],
-                "outcome_index": row[2],
-                "outcome_name": row[3],
-                "category": row[4],
-            }
+        # Fetch metadata for traded tokens only
+        market_tokens_map = market_token_cache.lookup(client, [t["token_id"] for t in trades])
 
         logger.info(f"Loaded {len(market_tokens_map)} market tokens for mapping")
 
@@ -2004,11 +2181,25 @@ async def compute_arb_feasibility(request: ComputeArbFeasibilityRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/compute/opportunities", response_model=ComputeOpportunitiesResponse)
-async def compute_opportunities(request: ComputeOpportunitiesRequest):
+@app.post("/api/compute/arb_feasibility", response_model=ComputeArbFeasibilityResponse)
+async def compute_arb_feasibility(request: ComputeArbFeasibilityRequest):
     """
-    Compute low-cost, tradeable opportunity candidates for a user.
+    Compute arb feasibility with dynamic fees and slippage estimates.
+
+    - Identifies arb-like events (buying both outcomes, closing within 24h)
+    - Fetches fee rates from CLOB API for each token
+    - Estimates slippage by simulating execution through orderbook
+    - Computes total costs and break-even notional
+    - Stores results in arb_feasibility_bucket table
     """
+    return await _blocking_work.run(
+        "compute_arb_feasibility",
+        _compute_arb_feasibility_blocking,
+        request=request,
+    )
+
+
+def _compute_opportunities_blocking(request: ComputeOpportunitiesRequest):
     logger.info(
         f"Computing opportunities for: {request.user}, "
         f"bucket={request.bucket}, limit={request.limit}"
@@ -2171,18 +2362,19 @@ async def compute_opportunities(request: ComputeOpportunitiesRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/snapshot/books", response_model=SnapshotBooksResponse)
-async def snapshot_books(request: SnapshotBooksRequest):
+@app.post("/api/compute/opportunities", response_model=ComputeOpportunitiesResponse)
+async def compute_opportunities(request: ComputeOpportunitiesRequest):
     """
-    Snapshot orderbook metrics for tokens the user has traded.
-
-    - Resolves user -> proxy_wallet
-    - Gets candidate token_ids from user_trades + user_positions_snapshots (within lookback_days)
-    - Filters to active markets only (if require_active_market=True)
-    - Snapshots each token's orderbook (best bid/ask, spread, depth, slippage)
-    - Writes to token_orderbook_snapshots table
-    - Returns snapshot statistics with diagnostics
+    Compute low-cost, tradeable opportunity candidates for a user.
     """
+    return await _blocking_work.run(
+        "compute_opportunities",
+        _compute_opportunities_blocking,
+        request=request,
+    )
+
+
+def _snapshot_books_blocking(request: SnapshotBooksRequest):
     logger.info(
         f"Snapshotting books for: {request.user}, max_tokens={request.max_tokens}, "
         f"lookback_days={request.lookback_days}, require_active={request.require_active_market}, "
@@ -2376,6 +2568,7 @@ async def snapshot_books(request: SnapshotBooksRequest):
                     candidate_condition_ids=candidate_condition_ids,
                     candidate_token_ids=candidate_token_ids,
                 )
+                market_token_cache.refresh(client)
                 logger.info(f"Backfill complete: {backfill_stats}")
 
                 # Re-resolve candidate tokens after backfill (aliases/markets may now be present)
@@ -2513,7 +2706,6 @@ async def snapshot_books(request: SnapshotBooksRequest):
         snapshot_ts = datetime.utcnow()
         max_tokens_attempted = min(request.max_tokens, BOOK_SNAPSHOT_MAX_PREFLIGHT)
 
-        tokens_skipped_no_orderbook_ttl = 0
         skip_no_orderbook: set[str] = set()
         if BOOK_SNAPSHOT_404_TTL_HOURS > 0 and final_tokens:
             ttl_cutoff = snapshot_ts - timedelta(hours=BOOK_SNAPSHOT_404_TTL_HOURS)
@@ -2536,108 +2728,25 @@ async def snapshot_books(request: SnapshotBooksRequest):
             except Exception as exc:
                 logger.warning(f"Failed to load no_orderbook TTL cache: {exc}")
 
-        snapshots: list[OrderbookSnapshot] = []
-        tokens_attempted = 0
-        tokens_ok = 0
-        tokens_empty = 0
-        tokens_one_sided = 0
-        tokens_no_orderbook = 0
-        tokens_error = 0
-        tokens_http_429 = 0
-        tokens_http_5xx = 0
-        tokens_skipped_limit: list[str] = []
-
-        remaining_start = None
-        for idx, token_id in enumerate(final_tokens):
-            if token_id in skip_no_orderbook:
-                tokens_skipped_no_orderbook_ttl += 1
-                continue
-            if tokens_attempted >= max_tokens_attempted or tokens_ok >= BOOK_SNAPSHOT_MIN_OK_TARGET:
-                remaining_start = idx
-                break
-
-            tokens_attempted += 1
-            try:
-                response = clob_client.fetch_book_response(token_id)
-            except Exception as exc:
-                snapshots.append(
-                    _build_basic_snapshot(
-                        token_id=token_id,
-                        snapshot_ts=snapshot_ts,
-                        status="error",
-                        reason=str(exc),
-                    )
-                )
-                tokens_error += 1
-                continue
-
-            status_code = response.status_code
-            if status_code == 200:
-                try:
-                    book = response.json()
-                except ValueError:
-                    snapshots.append(
-                        _build_basic_snapshot(
-                            token_id=token_id,
-                            snapshot_ts=snapshot_ts,
-                            status="error",
-                            reason="Invalid JSON response",
-                        )
-                    )
-                    tokens_error += 1
-                    continue
-
-                snapshot = snapshot_from_book(
-                    token_id=token_id,
-                    book=book,
-                    snapshot_ts=snapshot_ts,
-                    depth_band_bps=BOOK_SNAPSHOT_DEPTH_BAND_BPS,
-                    notional_sizes=BOOK_SNAPSHOT_NOTIONALS,
-                )
-                snapshots.append(snapshot)
-                if snapshot.status == "ok":
-                    tokens_ok += 1
-                elif snapshot.status == "empty":
-                    tokens_empty += 1
-                elif snapshot.status == "one_sided":
-                    tokens_one_sided += 1
-                else:
-                    tokens_error += 1
-                continue
-
-            error_message = _extract_error_message_from_response(response)
-            if status_code == 404 and error_message and "No orderbook exists" in error_message:
-                snapshots.append(
-                    _build_basic_snapshot(
-                        token_id=token_id,
-                        snapshot_ts=snapshot_ts,
-                        status="no_orderbook",
-                        reason=error_message,
-                    )
-                )
-                tokens_no_orderbook += 1
-                continue
-
-            if status_code == 429:
-                tokens_http_429 += 1
-            elif 500 <= status_code <= 599:
-                tokens_http_5xx += 1
-
-            snapshots.append(
-                _build_basic_snapshot(
-                    token_id=token_id,
-                    snapshot_ts=snapshot_ts,
-                    status="error",
-                    reason=error_message or f"HTTP {status_code}",
-                )
-            )
-            tokens_error += 1
-
-        if remaining_start is not None:
-            tokens_skipped_limit = [
-                token_id for token_id in final_tokens[remaining_start:]
-                if token_id not in skip_no_orderbook
-            ]
+        tokens_to_fetch = [token_id for token_id in final_tokens if token_id not in skip_no_orderbook]
+        tokens_skipped_no_orderbook_ttl = len(final_tokens) - len(tokens_to_fetch)
+        batch = snapshot_books_concurrently(
+            tokens_to_fetch,
+            clob_client,
+            snapshot_ts=snapshot_ts,
+            max_attempts=max_tokens_attempted,
+            min_ok_target=BOOK_SNAPSHOT_MIN_OK_TARGET,
+            max_concurrency=BOOK_SNAPSHOT_FETCH_CONCURRENCY,
+            depth_band_bps=BOOK_SNAPSHOT_DEPTH_BAND_BPS,
+            notional_sizes=BOOK_SNAPSHOT_NOTIONALS,
+        )
+        snapshots = batch.snapshots
+        tokens_attempted = batch.tokens_attempted
+        tokens_ok = batch.tokens_ok
+        tokens_empty = batch.tokens_empty
+        tokens_one_sided = batch.tokens_one_sided
+        tokens_no_orderbook = batch.tokens_no_orderbook
+        tokens_error = batch.tokens_error
 
         # Write to ClickHouse
         if snapshots:
@@ -2683,12 +2792,14 @@ async def snapshot_books(request: SnapshotBooksRequest):
             tokens_one_sided=tokens_one_sided,
             tokens_no_orderbook=tokens_no_orderbook,
             tokens_error=tokens_error,
-            tokens_http_429=tokens_http_429,
-            tokens_http_5xx=tokens_http_5xx,
+            tokens_http_429=batch.tokens_http_429,
+            tokens_http_5xx=batch.tokens_http_5xx,
             tokens_skipped_no_orderbook_ttl=tokens_skipped_no_orderbook_ttl,
-            tokens_skipped_limit=tokens_skipped_limit,
+            tokens_skipped_limit=batch.tokens_skipped_limit,
             snapshot_ts=snapshot_ts,
             no_ok_reason=no_ok_reason,
+            fetch_wall_ms=batch.fetch_wall_ms,
+            token_timings=batch.token_timings,
         )
 
     except HTTPException:
@@ -2698,15 +2809,22 @@ async def snapshot_books(request: SnapshotBooksRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/export/user_dossier", response_model=ExportUserDossierResponse)
-async def export_user_dossier_api(request: ExportUserDossierRequest):
+@app.post("/api/snapshot/books", response_model=SnapshotBooksResponse)
+async def snapshot_books(request: SnapshotBooksRequest):
     """
-    Export a deterministic user dossier + research memo for later LLM review.
+    Snapshot orderbook metrics for tokens the user has traded.
 
-    - Resolves user to proxy wallet
-    - Builds dossier JSON and memo template
-    - Writes artifacts and stores export in ClickHouse
+    - Resolves user -> proxy_wallet
+    - Gets candidate token_ids from user_trades + user_positions_snapshots (within lookback_days)
+    - Filters to active markets only (if require_active_market=True)
+    - Snapshots each token's orderbook (best bid/ask, spread, depth, slippage)
+    - Writes to token_orderbook_snapshots table
+    - Returns snapshot statistics with diagnostics
     """
+    return await _blocking_work.run("snapshot_books", _snapshot_books_blocking, request=request)
+
+
+def _export_user_dossier_api_blocking(request: ExportUserDossierRequest):
     logger.info(
         f"Exporting user dossier for: {request.user}, days={request.days}, max_trades={request.max_trades}"
     )
@@ -2760,18 +2878,27 @@ async def export_user_dossier_api(request: ExportUserDossierRequest):
     )
 
 
-@app.get("/api/export/user_dossier/history", response_model=ExportUserDossierHistoryResponse)
-async def export_user_dossier_history(
+@app.post("/api/export/user_dossier", response_model=ExportUserDossierResponse)
+async def export_user_dossier_api(request: ExportUserDossierRequest):
+    """
+    Export a deterministic user dossier + research memo for later LLM review.
+
+    - Resolves user to proxy wallet
+    - Builds dossier JSON and memo template
+    - Writes artifacts and stores export in ClickHouse
+    """
+    return await _blocking_work.run(
+        "export_user_dossier_api",
+        _export_user_dossier_api_blocking,
+        request=request,
+    )
+
+
+def _export_user_dossier_history_blocking(
     user: str,
     limit: int = 20,
     include_body: bool = False,
 ):
-    """
-    Fetch export history rows for a user.
-
-    - Returns summary rows by default
-    - include_body=true returns full JSON/memo fields
-    """
     if limit <= 0:
         raise HTTPException(status_code=400, detail="limit must be positive")
     if limit > 200:
@@ -2858,6 +2985,27 @@ async def export_user_dossier_history(
     return ExportUserDossierHistoryResponse(proxy_wallet=proxy_wallet, rows=rows)
 
 
+@app.get("/api/export/user_dossier/history", response_model=ExportUserDossierHistoryResponse)
+async def export_user_dossier_history(
+    user: str,
+    limit: int = 20,
+    include_body: bool = False,
+):
+    """
+    Fetch export history rows for a user.
+
+    - Returns summary rows by default
+    - include_body=true returns full JSON/memo fields
+    """
+    return await _blocking_work.run(
+        "export_user_dossier_history",
+        _export_user_dossier_history_blocking,
+        user=user,
+        limit=limit,
+        include_body=include_body,
+    )
+
+
 class StudioSessionStartRequest(BaseModel):
     """Request body for starting a Studio-managed SimTrader session."""
 
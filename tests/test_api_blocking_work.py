@@ -0,0 +1,152 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytestmark = pytest.mark.optional_dep
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.api import main
+
+
+class BlockingWorkPoolTests(unittest.TestCase):
+    def test_blocking_work_does_not_stall_event_loop(self):
+        pool = main.BlockingWorkPool(max_workers=2, default_limit=2)
+        release = threading.Event()
+
+        async def _scenario():
+            slow = asyncio.ensure_future(pool.run("slow_scan", release.wait, 5))
+            started = time.monotonic()
+            health = await main.health_check()
+            health_latency = time.monotonic() - started
+            release.set()
+            await slow
+            return health, health_latency
+
+        health, health_latency = asyncio.run(_scenario())
+        self.assertEqual(health["status"], "healthy")
+        self.assertLess(health_latency, 1.0)
+
+    def test_endpoint_limit_queues_excess_calls_and_reports_metrics(self):
+        pool = main.BlockingWorkPool(
+            max_workers=4,
+            default_limit=4,
+            endpoint_limits={"snapshot_books": 1},
+        )
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def _work():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return "ok"
+
+        async def _scenario():
+            return await asyncio.gather(*(pool.run("snapshot_books", _work) for _ in range(3)))
+
+        self.assertEqual(asyncio.run(_scenario()), ["ok", "ok", "ok"])
+        self.assertEqual(peak, 1)
+
+        snapshot = pool.snapshot()
+        stats = snapshot["endpoints"]["snapshot_books"]
+        self.assertEqual(stats["limit"], 1)
+        self.assertEqual(stats["completed"], 3)
+        self.assertEqual(stats["queued"], 0)
+        self.assertEqual(stats["running"], 0)
+        self.assertGreater(stats["avg_queue_wait_seconds"], 0.0)
+        self.assertGreaterEqual(stats["max_latency_seconds"], 0.02)
+
+    def test_failures_propagate_and_are_counted(self):
+        pool = main.BlockingWorkPool(max_workers=1, default_limit=1)
+
+        def _boom():
+            raise main.HTTPException(status_code=404, detail="nope")
+
+        with self.assertRaises(main.HTTPException):
+            asyncio.run(pool.run("resolve_user", _boom))
+        self.assertEqual(pool.snapshot()["endpoints"]["resolve_user"]["failed"], 1)
+
+    def test_cancellation_keeps_limit_and_counters_consistent(self):
+        pool = main.BlockingWorkPool(max_workers=4, default_limit=1)
+        release = threading.Event()
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def _work():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            release.wait(5)
+            with lock:
+                active -= 1
+            return "ok"
+
+        async def _wait_for(predicate):
+            for _ in range(200):
+                if predicate():
+                    return
+                await asyncio.sleep(0.01)
+            self.fail("condition not reached")
+
+        def _stats():
+            return pool.snapshot()["endpoints"]["scan"]
+
+        async def _scenario():
+            running = asyncio.ensure_future(pool.run("scan", _work))
+            await _wait_for(lambda: active == 1)
+            queued = asyncio.ensure_future(pool.run("scan", _work))
+            await _wait_for(lambda: _stats()["queued"] == 1)
+
+            queued.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await queued
+            self.assertEqual(_stats()["queued"], 0)
+            self.assertEqual(_stats()["cancelled_queued"], 1)
+
+            running.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await running
+            # The worker thread is still busy, so the permit must still be held.
+            self.assertEqual(_stats()["running"], 1)
+            follow_up = asyncio.ensure_future(pool.run("scan", _work))
+            await asyncio.sleep(0.05)
+            self.assertEqual(active, 1)
+            self.assertEqual(_stats()["queued"], 1)
+
+            release.set()
+            return await follow_up
+
+        self.assertEqual(asyncio.run(_scenario()), "ok")
+        self.assertEqual(peak, 1)
+        stats = _stats()
+        self.assertEqual(stats["queued"], 0)
+        self.assertEqual(stats["running"], 0)
+        self.assertEqual(stats["completed"], 1)
+        self.assertEqual(stats["failed"], 0)
+        self.assertEqual(stats["cancelled_queued"], 1)
+        self.assertEqual(stats["cancelled_running"], 1)
+        self.assertEqual(stats["cancelled"], 2)
+
+    def test_parse_endpoint_concurrency(self):
+        self.assertEqual(
+            main._parse_endpoint_concurrency("snapshot_books=2, compute_pnl=0,bad,x=y"),
+            {"snapshot_books": 2, "compute_pnl": 1},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -446,6 +446,33 @@ class TestRunBatchFromTargets:
         assert result["skip_count"] == 1
         assert result["failure_count"] == 1
 
+    def test_real_reconstructor_prefetches_valid_targets_once(self, tmp_path):
+        from packages.polymarket.silver_reconstructor import SilverTarget
+
+        good = _make_target(token_id="0x0000000000000001")
+        bad_window = _make_target(token_id="0x0000000000000002", window_start="bad")
+        other = _make_target(token_id="0x0000000000000003")
+        fake = _FakeReconstructor(None)
+        fake.prefetch = MagicMock()
+
+        with patch(
+            "tools.cli.batch_reconstruct_silver.SilverReconstructor", return_value=fake
+        ) as cls:
+            result = run_batch_from_targets(
+                targets=[good, bad_window, "not-a-dict", other],
+                out_root=tmp_path,
+                skip_metadata=True,
+            )
+
+        cls.assert_called_once()
+        (prefetched,), _ = fake.prefetch.call_args
+        assert prefetched == [
+            SilverTarget("0x0000000000000001", 1704067200.0, 1704074400.0),
+            SilverTarget("0x0000000000000003", 1704067200.0, 1704074400.0),
+        ]
+        assert result["tapes_created"] == 2
+        assert result["skip_count"] == 2
+
 
 # ---------------------------------------------------------------------------
 # TestBenchmarkRefreshHook
@@ -0,0 +1,124 @@
+"""Offline tests for the background batching ClickHouse writer."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from decimal import Decimal
+
+from packages.polymarket.clickhouse_buffer import BufferedClickHouseWriter
+
+
+class _RecordingClient:
+    def __init__(self):
+        self.calls: list[tuple[str, list[str], list[list]]] = []
+        self.fail = False
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def insert_rows(self, table, column_names, rows):
+        self.started.set()
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("ClickHouse unavailable")
+        self.calls.append((table, list(column_names), [list(row) for row in rows]))
+        return len(rows)
+
+
+def test_submit_batches_rows_per_table_on_flush():
+    client = _RecordingClient()
+    writer = BufferedClickHouseWriter(client, batch_size=100, flush_interval_s=60)
+
+    writer.submit("events", ["a", "b"], [[1, "x"], [2, "y"]])
+    writer.submit("events", ["a", "b"], [[3, "z"]])
+    writer.submit("other", ["c"], [[4]])
+    assert writer.flush(timeout=5)
+
+    assert client.calls == [
+        ("events", ["a", "b"], [[1, "x"], [2, "y"], [3, "z"]]),
+        ("other", ["c"], [[4]]),
+    ]
+    metrics = writer.metrics()
+    assert metrics["queue_depth"] == 0
+    assert metrics["rows_written"] == 4
+    assert metrics["flush_count"] == 2
+    assert metrics["last_flush_latency_ms"] is not None
+    writer.close(timeout=5)
+
+
+def test_submit_does_not_block_on_slow_insert():
+    client = _RecordingClient()
+    client.release.clear()
+    writer = BufferedClickHouseWriter(client, batch_size=1, flush_interval_s=60)
+
+    writer.submit("events", ["a"], [[1]])
+    assert client.started.wait(5)
+    # The insert is stuck; further submits still return immediately.
+    writer.submit("events", ["a"], [[2]])
+    assert writer.metrics()["queue_depth"] == 2
+
+    client.release.set()
+    assert writer.flush(timeout=5)
+    assert [row for _, _, rows in client.calls for row in rows] == [[1], [2]]
+    writer.close(timeout=5)
+
+
+def test_failed_insert_spills_to_journal_and_replays_on_recovery(tmp_path):
+    client = _RecordingClient()
+    client.fail = True
+    writer = BufferedClickHouseWriter(
+        client,
+        batch_size=100,
+        flush_interval_s=60,
+        spill_dir=tmp_path,
+        retry_interval_s=0,
+    )
+    ts = datetime(2026, 3, 1, 12, 30)
+
+    writer.submit("events", ["ts", "price"], [[ts, Decimal("0.45")]])
+    assert writer.flush(timeout=5) is False
+    metrics = writer.metrics()
+    assert metrics["rows_spilled"] == 1
+    assert metrics["journal_files"] == 1
+    assert metrics["last_error"] == "ClickHouse unavailable"
+
+    client.fail = False
+    writer.submit("events", ["ts", "price"], [[ts, Decimal("0.55")]])
+    assert writer.flush(timeout=5)
+
+    rows = [row for _, _, batch in client.calls for row in batch]
+    # Spilled rows are replayed before the batch that follows them.
+    assert rows == [[ts, Decimal("0.45")], [ts, Decimal("0.55")]]
+    assert writer.metrics()["rows_replayed"] == 1
+    assert writer.metrics()["journal_files"] == 0
+    writer.close(timeout=5)
+
+
+def test_journal_from_previous_process_is_replayed(tmp_path):
+    down = _RecordingClient()
+    down.fail = True
+    first = BufferedClickHouseWriter(down, spill_dir=tmp_path, retry_interval_s=60)
+    first.submit("events", ["a"], [[1]])
+    first.close(timeout=5)
+    assert first.metrics()["journal_files"] == 1
+
+    client = _RecordingClient()
+    second = BufferedClickHouseWriter(client, spill_dir=tmp_path)
+    assert second.replay_journal() == 1
+    assert client.calls == [("events", ["a"], [[1]])]
+
+
+def test_queue_overflow_spills_or_drops(tmp_path):
+    client = _RecordingClient()
+    client.release.clear()
+    writer = BufferedClickHouseWriter(
+        client, batch_size=1000, flush_interval_s=60, max_queue_rows=2, spill_dir=tmp_path
+    )
+    assert writer.submit("events", ["a"], [[1], [2], [3]]) == 3
+    assert writer.metrics()["rows_spilled"] == 1
+
+    no_journal = BufferedClickHouseWriter(client, batch_size=1000, flush_interval_s=60, max_queue_rows=2)
+    assert no_journal.submit("events", ["a"], [[1], [2], [3]]) == 2
+    assert no_journal.metrics()["rows_dropped"] == 1
+    client.release.set()
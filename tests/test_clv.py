@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import itertools
 
 import requests
 
@@ -29,12 +30,17 @@ from packages.polymarket.clv import (
     classify_movement_direction,
     enrich_position_with_clv,
     enrich_position_with_dual_clv,
+    enrich_positions_with_clv,
+    enrich_positions_with_dual_clv,
     format_prices_history_error_detail,
     normalize_prices_fidelity_minutes,
     resolve_close_ts_settlement,
     resolve_close_ts_pre_event,
     resolve_entry_price_context,
     resolve_closing_price,
+    resolve_history_windows_bulk,
+    history_window_request,
+    build_bulk_cache_lookup_sql,
     select_last_price_le_anchor,
     select_last_price_le_close,
     warm_clv_snapshot_cache,
@@ -55,6 +61,20 @@ class _FakeClickHouse:
 
     def query(self, query: str, parameters=None):
         self.queries.append(query)
+        if parameters and "token_ids" in parameters:
+            # Bulk lookup: serve the same cached points for every requested key.
+            keys = itertools.product(
+                parameters["token_ids"],
+                parameters["kinds"],
+                parameters["close_ts_values"],
+                parameters["sources"],
+                parameters["query_window_seconds_values"],
+                parameters["intervals"],
+                parameters["fidelities"],
+            )
+            return _QueryResult(
+                result_rows=[tuple(key) + tuple(row) for key in keys for row in self.rows]
+            )
         return _QueryResult(result_rows=list(self.rows))
 
     def insert(self, table, rows, column_names=None):
@@ -801,3 +821,95 @@ def test_enrich_position_with_dual_clv_preserves_existing_clv_fields():
     # Variant fields must be present too
     assert "clv_pct_settlement" in enriched
     assert "clv_pct_pre_event" in enriched
+
+
+def test_bulk_cache_lookup_sql_contract_filters_on_key_arrays():
+    sql = build_bulk_cache_lookup_sql()
+    assert "FROM polytool.market_price_snapshots" in sql
+    assert "token_id IN {token_ids:Array(String)}" in sql
+    assert "close_ts IN {close_ts_values:Array(DateTime64(3))}" in sql
+
+
+def test_resolve_history_windows_bulk_batches_lookups_and_single_insert():
+    clickhouse = _FakeClickHouse(rows=[])
+    clob = _FakeClob(payload={"history": [{"t": int(_utc(day=19, hour=11, minute=58).timestamp()), "p": 0.55}]})
+    window_requests = [
+        history_window_request(
+            token_id=f"tok-{i}",
+            anchor_ts=_utc(day=19, hour=12),
+            query_window_seconds=24 * 60 * 60,
+            kind="closing",
+        )
+        for i in range(5)
+    ]
+
+    resolved = resolve_history_windows_bulk(
+        window_requests + window_requests[:2],
+        clickhouse_client=clickhouse,
+        clob_client=clob,
+        lookup_batch_size=2,
+        max_concurrent_fetches=3,
+    )
+
+    assert len(resolved) == 5
+    assert len(clickhouse.queries) == 3
+    assert clob.calls == 5
+    assert len(clickhouse.inserts) == 1
+    assert len(clickhouse.inserts[0][1]) == 5
+    assert all(r.network_call_made and r.cache_points_written == 1 for r in resolved.values())
+
+
+def test_enrich_positions_with_clv_resolves_cache_in_one_query():
+    positions = [
+        {
+            "resolved_token_id": f"tok-{i}",
+            "entry_price": 0.40,
+            "resolved_at": "2026-02-19T12:00:00Z",
+        }
+        for i in range(20)
+    ]
+    clickhouse = _FakeClickHouse(rows=[(_utc(day=19, hour=11, minute=58), 0.50)])
+    clob = _FakeClob(payload={"history": []})
+
+    summary = enrich_positions_with_clv(
+        positions,
+        clickhouse_client=clickhouse,
+        clob_client=clob,
+        allow_online=True,
+    )
+
+    assert summary["clv_present_count"] == 20
+    assert len(clickhouse.queries) == 1
+    assert clob.calls == 0
+    assert positions[0]["closing_price"] == 0.5
+
+
+def test_enrich_positions_with_dual_clv_fetches_shared_window_once():
+    positions = [
+        {
+            "resolved_token_id": "tok-shared",
+            "entry_price": 0.40,
+            "gamma_closedTime": "2026-02-19T12:00:00Z",
+        },
+        {
+            "resolved_token_id": "tok-shared",
+            "entry_price": 0.45,
+            "gamma_closedTime": "2026-02-19T12:00:00Z",
+        },
+    ]
+    clickhouse = _FakeClickHouse(rows=[])
+    clob = _FakeClob(payload={"history": [{"t": int(_utc(day=19, hour=11, minute=58).timestamp()), "p": 0.55}]})
+
+    summary = enrich_positions_with_dual_clv(
+        positions,
+        clickhouse_client=clickhouse,
+        clob_client=clob,
+        allow_online=True,
+    )
+
+    assert summary["clv_present_count"] == 2
+    assert summary["pre_event_present_count"] == 2
+    assert summary["settlement_missing_count"] == 2
+    assert clob.calls == 1
+    assert len(clickhouse.inserts) == 1
+    assert positions[1]["closing_price_pre_event"] == 0.55
@@ -315,3 +315,84 @@ class TestIsReadyAndAge:
         tick[0] = 101.0
         age = client.get_book_age_ms("T1")
         assert age == 1000, f"Expected age=1000ms after 1s, got {age}"
+
+
+# ---------------------------------------------------------------------------
+# Test 7: Sorted book store and direct event apply
+# ---------------------------------------------------------------------------
+
+class TestSortedBookStore:
+    def test_removing_best_level_falls_back_to_next_price(self):
+        """Removing the best bid/ask exposes the next level from the sorted index."""
+        events = [
+            _book_event("T1", bids=[(0.45, 10), (0.48, 50), (0.47, 5)], asks=[(0.55, 1), (0.52, 100)]),
+            _delta_event("T1", [
+                ("BUY", 0.48, 0),
+                ("SELL", 0.52, 0),
+                ("SELL", 0.53, 20),
+            ]),
+        ]
+        client = _make_client(events)
+        client.subscribe("T1")
+        _start_and_drain(client)
+
+        assert client.get_best_bid_ask("T1") == (0.47, 0.53)
+
+    def test_dict_events_are_applied_without_json_round_trip(self, monkeypatch):
+        """Event-source dicts go straight to the book without json.dumps/json.loads."""
+        import packages.polymarket.crypto_pairs.clob_stream as clob_stream
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("unexpected JSON round-trip")
+
+        monkeypatch.setattr(clob_stream.json, "dumps", _fail)
+        monkeypatch.setattr(clob_stream.json, "loads", _fail)
+
+        events = [_book_event("T1", bids=[(0.48, 50)], asks=[(0.52, 100)])]
+        client = _make_client(events)
+        client.subscribe("T1")
+        _start_and_drain(client)
+
+        assert client.get_best_bid_ask("T1") == (0.48, 0.52)
+
+    def test_raw_batched_message_applies_each_event(self):
+        """A raw JSON array of events is decoded once and applied per event."""
+        client = ClobStreamClient()
+        client.subscribe("T1")
+        client.subscribe("T2")
+        client._apply_message(json.dumps([
+            _book_event("T1", bids=[(0.40, 1)], asks=[(0.60, 1)]),
+            _book_event("T2", bids=[(0.30, 1)], asks=[(0.70, 1)]),
+        ]))
+
+        assert client.get_best_bid_ask("T1") == (0.40, 0.60)
+        assert client.get_best_bid_ask("T2") == (0.30, 0.70)
+
+    def test_readers_see_consistent_top_during_writes(self):
+        """Concurrent readers never observe a crossed or half-updated top-of-book."""
+        client = ClobStreamClient()
+        client.subscribe("T1")
+        client._apply_event(_book_event("T1", bids=[(0.40, 1)], asks=[(0.60, 1)]))
+
+        stop = threading.Event()
+        bad: list[tuple] = []
+
+        def _reader():
+            while not stop.is_set():
+                top = client.get_best_bid_ask("T1")
+                if top is None or top[0] >= top[1]:
+                    bad.append(top)
+
+        readers = [threading.Thread(target=_reader) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for i in range(2000):
+            bid = 0.41 + (i % 9) / 100.0
+            client._apply_event(_delta_event("T1", [("BUY", bid, 5), ("SELL", bid + 0.01, 5)]))
+            client._apply_event(_delta_event("T1", [("SELL", bid + 0.01, 0), ("BUY", bid, 0)]))
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+        assert bad == []
+        assert client.get_best_bid_ask("T1") == (0.40, 0.60)
@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Optional
 from unittest.mock import MagicMock
 
+import pytest
+
 from packages.polymarket.clob import OrderBookTop
 from packages.polymarket.crypto_pairs.clickhouse_sink import (
     ClickHouseWriteResult,
@@ -779,3 +781,99 @@ def test_write_event_enabled_sink_delegates() -> None:
     assert len(insert_calls) == 1
     _, _, rows = insert_calls[0]
     assert len(rows) == 1
+
+
+def test_buffered_sink_queues_write_event_and_flushes_on_write_events(tmp_path: Path) -> None:
+    """Buffered sink: write_event only queues; write_events flushes everything in one insert."""
+    from packages.polymarket.crypto_pairs.event_models import OpportunityObservedEvent
+
+    insert_calls: list = []
+
+    class _TrackingClient:
+        def insert_rows(self, table, columns, rows):
+            insert_calls.append((table, columns, rows))
+            return len(rows)
+
+    obs = _make_paper_obs()
+    evt = OpportunityObservedEvent.from_observation(obs, mode="paper")
+
+    config = CryptoPairClickHouseSinkConfig(
+        enabled=True,
+        buffered=True,
+        flush_interval_s=60.0,
+        spill_dir=str(tmp_path / "spill"),
+    )
+    sink = CryptoPairClickHouseSink(config, client=_TrackingClient())
+
+    queued = sink.write_event(evt)
+    assert queued.skipped_reason == "queued"
+    assert queued.error == ""
+    assert queued.written_rows == 0
+
+    flushed = sink.write_events([evt])
+    assert flushed.written_rows == 1
+    assert flushed.error == ""
+    assert len(insert_calls) == 1
+    assert len(insert_calls[0][2]) == 2
+    assert sink.buffer_metrics()["queue_depth"] == 0
+    assert sink.close(timeout=5)
+
+
+def test_buffered_sink_spills_when_clickhouse_down(tmp_path: Path) -> None:
+    """Buffered sink reports spilled_to_journal (not write_failed) when inserts fail."""
+    from packages.polymarket.crypto_pairs.event_models import OpportunityObservedEvent
+
+    class _FailingClient:
+        def insert_rows(self, table, columns, rows):
+            raise RuntimeError("CH down")
+
+    config = CryptoPairClickHouseSinkConfig(
+        enabled=True,
+        buffered=True,
+        spill_dir=str(tmp_path / "spill"),
+    )
+    sink = CryptoPairClickHouseSink(config, client=_FailingClient())
+    evt = OpportunityObservedEvent.from_observation(_make_paper_obs(), mode="paper")
+
+    result = sink.write_events([evt])
+
+    assert result.written_rows == 0
+    assert result.skipped_reason == "spilled_to_journal"
+    assert sink.buffer_metrics()["rows_spilled"] == 1
+    assert list((tmp_path / "spill").glob("*.jsonl"))
+
+
+def test_buffered_sink_honours_soft_fail_and_fail_limit(tmp_path: Path) -> None:
+    """Buffered write_events raises without soft_fail and stops waiting once the limit is hit."""
+    from packages.polymarket.crypto_pairs.event_models import OpportunityObservedEvent
+
+    class _FailingClient:
+        def insert_rows(self, table, columns, rows):
+            raise RuntimeError("CH down")
+
+    evt = OpportunityObservedEvent.from_observation(_make_paper_obs(), mode="paper")
+
+    strict = CryptoPairClickHouseSink(
+        CryptoPairClickHouseSinkConfig(
+            enabled=True, buffered=True, soft_fail=False, spill_dir=str(tmp_path / "strict")
+        ),
+        client=_FailingClient(),
+    )
+    with pytest.raises(RuntimeError, match="CH down"):
+        strict.write_events([evt])
+    strict.close(timeout=5)
+
+    sink = CryptoPairClickHouseSink(
+        CryptoPairClickHouseSinkConfig(
+            enabled=True, buffered=True, spill_dir=str(tmp_path / "soft")
+        ),
+        client=_FailingClient(),
+        max_consecutive_failures=2,
+    )
+    assert sink.write_events([evt]).skipped_reason == "spilled_to_journal"
+    assert sink.write_events([evt]).skipped_reason == "spilled_to_journal"
+    tripped = sink.write_events([evt])
+    assert tripped.skipped_reason == "consecutive_fail_limit"
+    assert tripped.written_rows == 0
+    sink.close(timeout=5)
+    assert sink.buffer_metrics()["rows_spilled"] == 3
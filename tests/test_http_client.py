@@ -0,0 +1,246 @@
+"""Offline unit tests for the async HTTP client and shared per-host rate limits."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+import requests
+
+from packages.polymarket import http_client as http_client_module
+from packages.polymarket.http_client import (
+    AsyncHttpClient,
+    HttpClient,
+    TokenBucket,
+    _retry_after_seconds,
+    get_host_rate_limiter,
+    set_host_rate_limit,
+)
+
+
+def _response(status: int, body: bytes = b"{}", headers: dict | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    return response
+
+
+class _ScriptedTransport:
+    """Returns queued responses (or raises queued exceptions) per URL."""
+
+    def __init__(self, script: dict[str, list]):
+        self.script = {url: list(items) for url, items in script.items()}
+        self.calls: list[tuple[str, dict | None]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def get(self, url, params, headers, timeout):
+        self.calls.append((url, params))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            item = self.script[url].pop(0)
+        finally:
+            self.in_flight -= 1
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    async def _fast_sleep(_delay):
+        return None
+
+    monkeypatch.setattr(http_client_module.asyncio, "sleep", _fast_sleep)
+    monkeypatch.setattr(http_client_module.random, "uniform", lambda a, b: 0.0)
+
+
+def test_token_bucket_allows_burst_then_paces_at_rate():
+    now = [0.0]
+    bucket = TokenBucket(rate_per_second=2.0, burst=2, clock=lambda: now[0])
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+    now[0] = 2.0
+    assert bucket.reserve() == 0.0
+
+
+def test_host_rate_limiter_is_shared_per_host():
+    bucket = set_host_rate_limit("https://shared.example.test/api", 100.0, burst=10)
+
+    assert get_host_rate_limiter("https://shared.example.test/other") is bucket
+    assert HttpClient("https://shared.example.test").rate_limiter is bucket
+    client = AsyncHttpClient("https://shared.example.test", transport=_ScriptedTransport({}))
+    assert client.rate_limiter is bucket
+
+
+def test_retry_after_accepts_seconds_and_defaults():
+    assert _retry_after_seconds({"Retry-After": "2.5"}) == 2.5
+    assert _retry_after_seconds({}) == 5.0
+    assert _retry_after_seconds({"Retry-After": "not-a-date"}) == 5.0
+
+
+def test_async_get_json_retries_429_and_server_errors():
+    url = "https://retry.example.test/markets"
+    transport = _ScriptedTransport(
+        {
+            url: [
+                _response(429, headers={"Retry-After": "1"}),
+                _response(503),
+                requests.exceptions.Timeout("slow"),
+                _response(200, b'[{"id": 1}]'),
+            ]
+        }
+    )
+
+    async def _run():
+        async with AsyncHttpClient("https://retry.example.test", transport=transport) as client:
+            return await client.get_json("/markets")
+
+    assert asyncio.run(_run()) == [{"id": 1}]
+    assert len(transport.calls) == 4
+    assert transport.closed
+
+
+def test_async_get_raises_retry_error_when_exhausted():
+    url = "https://exhaust.example.test/x"
+    transport = _ScriptedTransport({url: [_response(500) for _ in range(6)]})
+    client = AsyncHttpClient("https://exhaust.example.test", max_retries=2, transport=transport)
+
+    with pytest.raises(requests.exceptions.RetryError):
+        asyncio.run(client.get("x"))
+    # get_response hands back the last response instead of raising.
+    assert asyncio.run(client.get_response("x")).status_code == 500
+    assert len(transport.calls) == 6
+
+
+def test_get_json_many_preserves_order_and_bounds_concurrency():
+    base = "https://many.example.test"
+    transport = _ScriptedTransport(
+        {f"{base}/page/{i}": [_response(200, str(i).encode())] for i in range(8)}
+    )
+    client = AsyncHttpClient(base, transport=transport)
+
+    results = asyncio.run(
+        client.get_json_many([(f"page/{i}", None) for i in range(8)], max_concurrency=3)
+    )
+
+    assert results == list(range(8))
+    assert transport.max_in_flight <= 3
+
+
+def test_unconfigured_host_is_not_throttled(monkeypatch):
+    client = HttpClient("https://unthrottled.example.test")
+    assert client.rate_limiter is None
+    assert AsyncHttpClient("https://unthrottled.example.test", transport=_ScriptedTransport({})).rate_limiter is None
+
+    calls = []
+    monkeypatch.setattr(client.session, "get", lambda url, **kw: calls.append(url) or _response(200, b"[]"))
+    assert [client.get_json("x") for _ in range(3)] == [[], [], []]
+    assert len(calls) == 3
+
+
+def test_default_host_rate_limit_is_opt_in():
+    try:
+        http_client_module.set_default_host_rate_limit(5.0, burst=2)
+        bucket = get_host_rate_limiter("https://defaulted.example.test")
+        assert bucket is not None and bucket.rate_per_second == 5.0
+    finally:
+        http_client_module.set_default_host_rate_limit(None)
+    assert get_host_rate_limiter("https://other-default.example.test") is None
+
+
+def test_sync_get_json_many_reuses_one_async_client(monkeypatch):
+    base = "https://reuse.example.test"
+    transport = _ScriptedTransport(
+        {f"{base}/page/{i}": [_response(200, str(i).encode()) for _ in range(2)] for i in range(4)}
+    )
+    created = []
+
+    def _transport(max_connections, http2):
+        created.append(max_connections)
+        return transport
+
+    monkeypatch.setattr(http_client_module, "_default_transport", _transport)
+    client = HttpClient(base, max_connections=4)
+    calls = [(f"page/{i}", None) for i in range(4)]
+
+    assert client.get_json_many(calls) == [0, 1, 2, 3]
+
+    async def _from_running_loop():
+        return client.get_json_many(calls, max_concurrency=2)
+
+    assert asyncio.run(_from_running_loop()) == [0, 1, 2, 3]
+    assert created == [4]
+    thread = client._async_thread
+    client.close()
+    assert transport.closed
+    assert not thread.is_alive()
+
+
+class _OffsetPagesTransport:
+    """Serves ``rows[offset:offset + limit]`` as a JSON list for any URL."""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.offsets: list[int] = []
+
+    async def get(self, url, params, headers, timeout):
+        self.offsets.append(params["offset"])
+        page = self.rows[params["offset"]:params["offset"] + params["limit"]]
+        return _response(200, json.dumps(page).encode())
+
+    async def aclose(self):
+        pass
+
+
+def test_data_api_paginates_over_get_json_many(monkeypatch):
+    from packages.polymarket.data_api import DataApiClient
+
+    rows = [{"id": f"t{i}", "timestamp": 1_700_000_000 + i, "size": 1, "price": 0.5} for i in range(5)]
+    transport = _OffsetPagesTransport(rows)
+    monkeypatch.setattr(http_client_module, "_default_transport", lambda max_connections, http2: transport)
+
+    client = DataApiClient(base_url="https://data.example.test", page_window=2)
+    try:
+        result = client.fetch_all_trades("0xwallet", max_pages=10, page_size=2)
+        streamed = [trade.trade_uid for trade in client.iter_trades("0xwallet", max_pages=10, page_size=2)]
+    finally:
+        client.client.close()
+
+    assert [trade.trade_uid for trade in result.trades] == [f"t{i}" for i in range(5)]
+    assert streamed == [f"t{i}" for i in range(5)]
+    assert result.pages_fetched == 3
+    # Two windows of two pages each; the short third page ends pagination.
+    assert transport.offsets[:4] == [0, 2, 4, 6]
+    assert len(transport.offsets) == 8
+
+
+def _drain_shared_bucket(bucket, count):
+    for _ in range(count):
+        bucket.reserve()
+
+
+def test_shared_token_bucket_budget_spans_processes():
+    import multiprocessing
+
+    from packages.polymarket.http_client import SharedTokenBucket
+
+    bucket = SharedTokenBucket(rate_per_second=0.01, burst=3)
+    child = multiprocessing.Process(target=_drain_shared_bucket, args=(bucket, 3))
+    child.start()
+    child.join(10)
+
+    assert child.exitcode == 0
+    # The child used the whole burst, so this process has to wait.
+    assert bucket.reserve() > 1.0
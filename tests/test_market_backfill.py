@@ -67,6 +67,21 @@ class _FakeGamma:
         return []
 
 
+class _GetJsonManyMixin:
+    """Serve ``get_json_many`` from a fake's ``get_json``, as HttpClient would."""
+
+    def get_json_many(self, calls, headers=None, max_concurrency=None, return_exceptions=False):
+        results = []
+        for path, params in calls:
+            try:
+                results.append(self.get_json(path, params=params))
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                results.append(exc)
+        return results
+
+
 def _market_from_payload() -> Market:
     payload = {
         "conditionId": "0xabc",
@@ -252,7 +267,7 @@ class MarketBackfillTests(unittest.TestCase):
         self.assertEqual(market.subcategory_source, "none")
 
     def test_fetch_all_markets_backfills_taxonomy_from_events_endpoint(self):
-        class _FakeHttp:
+        class _FakeHttp(_GetJsonManyMixin):
             def __init__(self):
                 self.calls = []
                 self.base_url = "https://gamma-api.polymarket.com"
@@ -293,6 +308,117 @@ class MarketBackfillTests(unittest.TestCase):
         self.assertEqual(result.markets[0].category_source, "event")
         self.assertEqual(result.markets[0].subcategory_source, "event")
 
+    def test_fetch_all_markets_prefetches_pages_in_order_and_stops_on_short_page(self):
+        import threading
+
+        class _PagedHttp(_GetJsonManyMixin):
+            def __init__(self):
+                self.offsets = []
+                self.lock = threading.Lock()
+                self.base_url = "https://gamma-api.polymarket.com"
+
+            def get_json(self, path, params=None):
+                offset = int(params["offset"])
+                with self.lock:
+                    self.offsets.append(offset)
+                count = 2 if offset < 6 else 1
+                return [
+                    {
+                        "conditionId": f"0xpage{offset + i}",
+                        "slug": f"page-{offset + i}",
+                        "question": "Paged?",
+                        "category": "Sports",
+                        "outcomes": '["Yes", "No"]',
+                        "clobTokenIds": f'["y{offset + i}", "n{offset + i}"]',
+                    }
+                    for i in range(count)
+                ]
+
+        gamma = GammaClient()
+        gamma.client = _PagedHttp()
+        result = gamma.fetch_all_markets(max_pages=10, page_size=2, prefetch_pages=3)
+
+        self.assertEqual(result.pages_fetched, 4)
+        self.assertEqual(
+            [m.market_slug for m in result.markets],
+            ["page-0", "page-1", "page-2", "page-3", "page-4", "page-5", "page-6"],
+        )
+        # Pages past the short one may already be in flight but never exceed the window.
+        self.assertLessEqual(max(gamma.client.offsets), 6 + 2 * 3)
+
+    def test_hydrate_chunks_event_lookups_instead_of_truncating(self):
+        class _EventsHttp(_GetJsonManyMixin):
+            def __init__(self):
+                self.id_chunks = []
+                self.base_url = "https://gamma-api.polymarket.com"
+
+            def get_json(self, path, params=None):
+                if "id" not in params:
+                    return []
+                self.id_chunks.append(len(params["id"]))
+                return [
+                    {"id": event_id, "category": "Crypto", "subcategory": "BTC"}
+                    for event_id in params["id"]
+                ]
+
+        markets = []
+        for i in range(450):
+            market = GammaClient()._parse_market(
+                {
+                    "conditionId": f"0xevt{i}",
+                    "slug": f"evt-market-{i}",
+                    "question": "Event?",
+                    "events": [{"id": f"evt-{i}"}],
+                    "outcomes": '["Yes", "No"]',
+                    "clobTokenIds": f'["ey{i}", "en{i}"]',
+                }
+            )
+            markets.append(market)
+
+        gamma = GammaClient()
+        gamma.client = _EventsHttp()
+        gamma._hydrate_markets_with_event_taxonomy(markets)
+
+        self.assertEqual(sorted(gamma.client.id_chunks), [50, 200, 200])
+        self.assertTrue(all(m.category == "Crypto" for m in markets))
+
+    def test_hydrate_caps_event_lookups_per_pass(self):
+        import polymarket.gamma as gamma_module
+
+        class _EventsHttp(_GetJsonManyMixin):
+            def __init__(self):
+                self.ids = []
+                self.base_url = "https://gamma-api.polymarket.com"
+
+            def get_json(self, path, params=None):
+                if "id" not in params:
+                    return []
+                self.ids.extend(params["id"])
+                return [{"id": event_id, "category": "Crypto"} for event_id in params["id"]]
+
+        total = gamma_module.MAX_EVENT_LOOKUPS_PER_PASS + 150
+        markets = [
+            GammaClient()._parse_market(
+                {
+                    "conditionId": f"0xcap{i}",
+                    "slug": f"cap-market-{i}",
+                    "question": "Event?",
+                    "events": [{"id": f"evt-{i}"}],
+                    "outcomes": '["Yes", "No"]',
+                    "clobTokenIds": f'["cy{i}", "cn{i}"]',
+                }
+            )
+            for i in range(total)
+        ]
+
+        gamma = GammaClient()
+        gamma.client = _EventsHttp()
+        gamma._hydrate_markets_with_event_taxonomy(markets)
+
+        self.assertEqual(len(gamma.client.ids), gamma_module.MAX_EVENT_LOOKUPS_PER_PASS)
+        self.assertEqual(markets[0].category, "Crypto")
+        self.assertEqual(markets[-1].category_source, "none")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,104 @@
+"""Offline tests for the shared market_tokens metadata cache."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from packages.polymarket.market_tokens_cache import MarketTokenMetadataCache
+
+
+class _Result:
+    def __init__(self, rows):
+        self.result_rows = rows
+
+
+class _FakeMarketTokens:
+    """Minimal market_tokens table: token_id -> (metadata tuple, ingested_at)."""
+
+    def __init__(self):
+        self.rows: dict[str, tuple[tuple, datetime]] = {}
+        self.queries: list[tuple[str, dict | None]] = []
+
+    def put(self, token_id, condition_id, ingested_at, category="Sports"):
+        self.rows[token_id] = ((condition_id, 0, "Yes", category), ingested_at)
+
+    def query(self, sql, parameters=None):
+        self.queries.append((sql, parameters))
+        if "SELECT max(ingested_at)" in sql:
+            latest = max((at for _, at in self.rows.values()), default=None)
+            return _Result([(latest,)])
+        if "token_id IN" in sql:
+            return _Result(
+                [
+                    (token_id, *self.rows[token_id][0])
+                    for token_id in parameters["tokens"]
+                    if token_id in self.rows
+                ]
+            )
+        if "ingested_at >=" in sql:
+            return _Result(
+                [
+                    (token_id, *meta, at)
+                    for token_id, (meta, at) in self.rows.items()
+                    if at >= parameters["watermark"]
+                ]
+            )
+        raise AssertionError(sql)
+
+
+def _clock(now):
+    return lambda: now[0]
+
+
+def test_lookup_loads_only_requested_tokens_and_caches_them():
+    table = _FakeMarketTokens()
+    for i in range(100):
+        table.put(f"tok-{i}", f"0xc{i}", datetime(2026, 1, 1))
+    cache = MarketTokenMetadataCache()
+
+    first = cache.lookup(table, ["tok-1", "tok-2", "tok-missing"])
+    assert set(first) == {"tok-1", "tok-2"}
+    assert first["tok-1"]["condition_id"] == "0xc1"
+    in_queries = [p for sql, p in table.queries if "token_id IN" in sql]
+    assert in_queries == [{"tokens": ["tok-1", "tok-2", "tok-missing"]}]
+
+    table.queries.clear()
+    again = cache.lookup(table, ["tok-2", "tok-missing"])
+    assert set(again) == {"tok-2"}
+    assert table.queries == []
+
+
+def test_refresh_applies_rows_since_watermark_and_fills_missing_tokens():
+    now = [0.0]
+    table = _FakeMarketTokens()
+    table.put("tok-a", "0xold", datetime(2026, 1, 1))
+    cache = MarketTokenMetadataCache(refresh_interval_seconds=30, clock=_clock(now))
+    cache.lookup(table, ["tok-a", "tok-b"])
+    version = cache.version
+
+    table.put("tok-a", "0xnew", datetime(2026, 1, 2))
+    table.put("tok-b", "0xb", datetime(2026, 1, 2))
+    table.put("tok-unrelated", "0xu", datetime(2026, 1, 2))
+
+    now[0] = 10.0
+    assert cache.lookup(table, ["tok-a"])["tok-a"]["condition_id"] == "0xold"
+
+    now[0] = 31.0
+    refreshed = cache.lookup(table, ["tok-a", "tok-b"])
+    assert refreshed["tok-a"]["condition_id"] == "0xnew"
+    assert refreshed["tok-b"]["condition_id"] == "0xb"
+    assert cache.version > version
+    assert len(cache) == 2
+
+
+def test_invalidate_drops_entries_and_reloads():
+    table = _FakeMarketTokens()
+    table.put("tok-a", "0xold", datetime(2026, 1, 1))
+    cache = MarketTokenMetadataCache()
+    cache.lookup(table, ["tok-a"])
+
+    table.put("tok-a", "0xnew", datetime(2026, 1, 1))
+    cache.invalidate()
+
+    assert len(cache) == 0
+    assert cache.lookup(table, ["tok-a"])["tok-a"]["condition_id"] == "0xnew"
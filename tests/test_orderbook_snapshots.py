@@ -0,0 +1,118 @@
+"""Offline tests for the concurrent orderbook snapshot engine."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime
+
+from packages.polymarket.orderbook_snapshots import snapshot_books_concurrently, snapshot_tokens
+
+
+class _Response:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = ""
+
+    def json(self):
+        if isinstance(self._payload, Exception):
+            raise self._payload
+        return self._payload
+
+
+_OK_BOOK = {
+    "bids": [{"price": "0.49", "size": "1000"}],
+    "asks": [{"price": "0.51", "size": "1000"}],
+}
+
+
+class _FakeClob:
+    def __init__(self, responses, delay=0.0):
+        self.responses = responses
+        self.delay = delay
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def fetch_book_response(self, token_id):
+        with self._lock:
+            self.calls.append(token_id)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            response = self.responses.get(token_id, _Response(200, _OK_BOOK))
+            if isinstance(response, Exception):
+                raise response
+            return response
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def test_classifies_responses_in_input_order_with_timings():
+    clob = _FakeClob({
+        "t2": _Response(404, {"error": "No orderbook exists for the requested token id"}),
+        "t3": _Response(429, {"error": "Too many requests"}),
+        "t4": _Response(503, "unavailable"),
+        "t5": RuntimeError("connection reset"),
+        "t6": _Response(200, {"bids": [], "asks": []}),
+    })
+    snapshot_ts = datetime(2026, 1, 1)
+
+    result = snapshot_books_concurrently(
+        ["t1", "t2", "t3", "t4", "t5", "t6", "t1"],
+        clob,
+        snapshot_ts=snapshot_ts,
+        max_concurrency=4,
+    )
+
+    assert [s.token_id for s in result.snapshots] == ["t1", "t2", "t3", "t4", "t5", "t6"]
+    assert [s.status for s in result.snapshots] == [
+        "ok", "no_orderbook", "error", "error", "error", "empty",
+    ]
+    assert all(s.snapshot_ts == snapshot_ts for s in result.snapshots)
+    assert result.tokens_attempted == 6
+    assert (result.tokens_ok, result.tokens_no_orderbook, result.tokens_empty) == (1, 1, 1)
+    assert (result.tokens_error, result.tokens_http_429, result.tokens_http_5xx) == (3, 1, 1)
+    assert result.snapshots[4].reason == "connection reset"
+    assert [t["token_id"] for t in result.token_timings] == ["t1", "t2", "t3", "t4", "t5", "t6"]
+    assert [t["http_status"] for t in result.token_timings] == [200, 404, 429, 503, None, 200]
+    assert all(t["fetch_ms"] >= 0 for t in result.token_timings)
+
+
+def test_fetches_run_concurrently_up_to_limit():
+    tokens = [f"t{i}" for i in range(8)]
+    clob = _FakeClob({}, delay=0.05)
+
+    result = snapshot_books_concurrently(tokens, clob, max_concurrency=4)
+
+    assert result.tokens_ok == 8
+    assert clob.max_in_flight == 4
+
+
+def test_ok_target_attempts_same_prefix_as_sequential_loop():
+    not_found = _Response(404, {"error": "No orderbook exists for the requested token id"})
+    responses = {"t0": not_found, "t2": not_found}
+    tokens = [f"t{i}" for i in range(10)]
+    clob = _FakeClob(responses, delay=0.01)
+
+    result = snapshot_books_concurrently(tokens, clob, min_ok_target=3, max_concurrency=8)
+
+    # Sequentially: t0 miss, t1 ok, t2 miss, t3 ok, t4 ok -> stop.
+    assert sorted(clob.calls) == ["t0", "t1", "t2", "t3", "t4"]
+    assert result.tokens_attempted == 5
+    assert result.tokens_ok == 3
+    assert result.tokens_skipped_limit == tokens[5:]
+
+
+def test_snapshot_tokens_respects_max_tokens():
+    clob = _FakeClob({})
+
+    result = snapshot_tokens(["a", "b", "c"], clob, max_tokens=2)
+
+    assert result.tokens_attempted == 2
+    assert result.tokens_skipped_limit == ["c"]
+    assert [s.status for s in result.snapshots] == ["ok", "ok"]
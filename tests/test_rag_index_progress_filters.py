@@ -61,9 +61,9 @@ class _FakeCollection:
 
 
 class _FakePersistentClient:
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, collections: dict | None = None) -> None:
         self._path = path
-        self._collections: dict[str, _FakeCollection] = {}
+        self._collections: dict[str, _FakeCollection] = {} if collections is None else collections
 
     def delete_collection(self, name: str) -> None:
         self._collections.pop(name, None)
@@ -210,5 +210,124 @@ class RagIndexProgressFilterTests(unittest.TestCase):
             self.assertFalse(stale_file.exists())
 
 
+class _CountingEmbedder(_FakeEmbedder):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[int] = []
+
+    def embed_texts(self, texts):
+        texts = list(texts)
+        self.calls.append(len(texts))
+        return super().embed_texts(texts)
+
+
+class RagIncrementalIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.repo_root = Path(self._tmp.name)
+        self.collections: dict[str, _FakeCollection] = {}
+        for name in ("a", "b", "c"):
+            self._write(f"kb/users/alice/{name}.md", f"{name} alpha beta gamma delta epsilon zeta eta theta")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write(self, rel_path: str, text: str) -> None:
+        abs_path = self.repo_root / rel_path
+        abs_path.parent.mkdir(parents=True, exist_ok=True)
+        abs_path.write_text(text, encoding="utf-8")
+
+    def _index(self, embedder, **kwargs):
+        collections = self.collections
+        chromadb = types.SimpleNamespace(
+            PersistentClient=lambda path: _FakePersistentClient(path, collections)
+        )
+        options = dict(chunk_size=8, overlap=2, rebuild=False)
+        options.update(kwargs)
+        with patch("polymarket.rag.index._resolve_repo_root", lambda: self.repo_root), patch.dict(
+            sys.modules, {"chromadb": chromadb}
+        ):
+            return build_index(
+                roots=[(self.repo_root / "kb").as_posix()],
+                embedder=embedder,
+                persist_directory=self.repo_root / "_index",
+                collection_name="test_incremental",
+                manifest_path=self.repo_root / "manifest.json",
+                lexical_db_path=self.repo_root / "lexical.sqlite3",
+                **options,
+            )
+
+    def _lexical_paths(self) -> set[str]:
+        from polymarket.rag.lexical import list_indexed_file_paths, open_lexical_db
+
+        conn = open_lexical_db(self.repo_root / "lexical.sqlite3")
+        try:
+            return list_indexed_file_paths(conn)
+        finally:
+            conn.close()
+
+    def test_chunks_from_many_files_share_one_embedding_batch(self) -> None:
+        embedder = _CountingEmbedder()
+
+        summary = self._index(embedder, rebuild=True)
+
+        self.assertEqual(summary.files_indexed, 3)
+        self.assertEqual(embedder.calls, [summary.chunks_indexed])
+        self.assertEqual(len(self.collections["test_incremental"]._rows), summary.chunks_indexed)
+        self.assertEqual(len(self._lexical_paths()), 3)
+
+    def test_small_embed_batches_index_the_same_chunks(self) -> None:
+        embedder = _CountingEmbedder()
+
+        summary = self._index(embedder, rebuild=True, embed_batch_size=1, prefetch_files=0)
+
+        self.assertEqual(summary.files_indexed, 3)
+        self.assertEqual(len(embedder.calls), 3)
+        self.assertEqual(sum(embedder.calls), summary.chunks_indexed)
+
+    def test_incremental_skips_unchanged_files(self) -> None:
+        self._index(_CountingEmbedder(), rebuild=True)
+        rows_before = len(self.collections["test_incremental"]._rows)
+        self._write("kb/users/alice/b.md", "b changed text with several more words than before it had")
+
+        embedder = _CountingEmbedder()
+        summary = self._index(embedder, incremental=True)
+
+        self.assertEqual(summary.scanned_files, 3)
+        self.assertEqual(summary.skipped_unchanged, 2)
+        self.assertEqual(summary.files_indexed, 1)
+        self.assertEqual(embedder.calls, [summary.chunks_indexed])
+        rows = self.collections["test_incremental"]._rows.values()
+        b_texts = [row["document"] for row in rows if row["metadata"]["file_path"].endswith("b.md")]
+        self.assertTrue(b_texts)
+        self.assertFalse(any("alpha" in text for text in b_texts))
+        self.assertEqual(len(rows), rows_before - 2 + len(b_texts))
+
+        unchanged = self._index(_CountingEmbedder(), incremental=True)
+        self.assertEqual((unchanged.skipped_unchanged, unchanged.files_indexed), (3, 0))
+
+    def test_incremental_reindexes_when_chunking_settings_change(self) -> None:
+        self._index(_CountingEmbedder(), rebuild=True)
+
+        summary = self._index(_CountingEmbedder(), incremental=True, chunk_size=5, overlap=1)
+
+        self.assertEqual(summary.skipped_unchanged, 0)
+        self.assertEqual(summary.files_indexed, 3)
+
+    def test_incremental_reindexes_files_missing_from_lexical_db(self) -> None:
+        self._index(_CountingEmbedder(), rebuild=True)
+        from polymarket.rag.lexical import delete_file_chunks, open_lexical_db
+
+        conn = open_lexical_db(self.repo_root / "lexical.sqlite3")
+        delete_file_chunks(conn, "kb/users/alice/a.md")
+        conn.commit()
+        conn.close()
+
+        summary = self._index(_CountingEmbedder(), incremental=True)
+
+        self.assertEqual((summary.skipped_unchanged, summary.files_indexed), (2, 1))
+        self.assertIn("kb/users/alice/a.md", self._lexical_paths())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,381 @@
+"""Tests for the resident RAG query service (packages/polymarket/rag/service.py)."""
+
+import os
+import socket
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "packages"))
+
+from polymarket.rag.embedder import BaseEmbedder
+from polymarket.rag.lexical import insert_chunks, open_lexical_db
+from polymarket.rag.manifest import bump_index_generation, read_index_generation
+from polymarket.rag.query import query_index
+from polymarket.rag.service import (
+    CachingQueryEmbedder,
+    RagQueryServer,
+    RagServiceTimeout,
+    RagServiceUnavailable,
+    WarmRagResources,
+    query_service,
+    run_query,
+)
+
+
+class _CountingEmbedder(BaseEmbedder):
+    def __init__(self, model_name: str = "fake-embedder") -> None:
+        self.model_name = model_name
+        self.dimension = 3
+        self.query_calls: list[str] = []
+
+    def embed_texts(self, texts):
+        return np.array([[float(len(t)), 1.0, 0.0] for t in texts], dtype="float32")
+
+    def embed_query(self, text):
+        self.query_calls.append(text)
+        return super().embed_query(text)
+
+
+class _FakeCollection:
+    def __init__(self) -> None:
+        self.queries: list[dict] = []
+
+    def query(self, **kwargs):
+        self.queries.append(kwargs)
+        return {
+            "ids": [["c1"]],
+            "documents": [["warm vector hit"]],
+            "metadatas": [[{"file_path": "kb/notes.md", "chunk_index": 0, "doc_id": "d1"}]],
+            "distances": [[0.25]],
+        }
+
+
+class _FakeChromaModule:
+    def __init__(self, collections: dict) -> None:
+        self.collections = collections
+        self.clients_created = 0
+
+    def PersistentClient(self, path: str):  # noqa: N802 (chromadb API name)
+        self.clients_created += 1
+        collections = self.collections
+
+        def get_collection(name):
+            if name not in collections:
+                raise ValueError(f"Collection {name} does not exist.")
+            return collections[name]
+
+        return types.SimpleNamespace(path=path, get_collection=get_collection)
+
+
+def _lexical_db(root: Path) -> Path:
+    lex_path = root / "lexical" / "lexical.sqlite3"
+    conn = open_lexical_db(lex_path)
+    insert_chunks(conn, [{
+        "chunk_id": "lex_1",
+        "doc_id": "d_lex",
+        "file_path": "kb/notes/spreads.md",
+        "chunk_index": 0,
+        "doc_type": "kb",
+        "is_private": True,
+        "chunk_text": "market maker spreads widen near resolution",
+    }])
+    conn.commit()
+    conn.close()
+    return lex_path
+
+
+class CachingQueryEmbedderTests(unittest.TestCase):
+    def test_repeated_queries_hit_cache(self) -> None:
+        inner = _CountingEmbedder()
+        embedder = CachingQueryEmbedder(inner, max_entries=8)
+
+        first = embedder.embed_query("spreads")
+        second = embedder.embed_query("spreads")
+
+        self.assertEqual(inner.query_calls, ["spreads"])
+        np.testing.assert_array_equal(first, second)
+        self.assertFalse(second.flags.writeable)
+        self.assertEqual(embedder.cache_info()["hits"], 1)
+        self.assertEqual(embedder.cache_info()["misses"], 1)
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        inner = _CountingEmbedder()
+        embedder = CachingQueryEmbedder(inner, max_entries=2)
+
+        embedder.embed_query("a")
+        embedder.embed_query("b")
+        embedder.embed_query("a")  # refresh "a"; "b" is now oldest
+        embedder.embed_query("c")
+        embedder.embed_query("a")
+        embedder.embed_query("b")
+
+        self.assertEqual(inner.query_calls, ["a", "b", "c", "b"])
+        self.assertEqual(embedder.cache_info()["size"], 2)
+
+
+class WarmRagResourcesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.root = Path(self._tmp.name)
+        self.collection = _FakeCollection()
+        self.chroma = _FakeChromaModule({"polytool_rag": self.collection})
+        self.loaded: list[str] = []
+
+        def factory(model_name, device):
+            self.loaded.append(model_name)
+            return _CountingEmbedder(model_name)
+
+        self.resources = WarmRagResources(embedder_factory=factory)
+
+    def tearDown(self) -> None:
+        self.resources.close()
+        self._tmp.cleanup()
+
+    def _request(self, **overrides) -> dict:
+        request = {
+            "question": "spreads near resolution",
+            "k": 3,
+            "persist_directory": str(self.root / "index"),
+            "collection_name": "polytool_rag",
+            "lexical_db_path": str(self.lex_path),
+            "private_only": False,
+            "embed_model": "fake-embedder",
+        }
+        request.update(overrides)
+        return request
+
+    def test_models_and_handles_are_reused_across_queries(self) -> None:
+        self.lex_path = _lexical_db(self.root)
+        with patch.dict(sys.modules, {"chromadb": self.chroma}):
+            for _ in range(3):
+                results = self.resources.query(self._request(hybrid=True))
+
+        self.assertEqual(self.loaded, ["fake-embedder"])
+        self.assertEqual(self.chroma.clients_created, 1)
+        self.assertEqual(len(self.collection.queries), 3)
+        self.assertEqual({r["chunk_id"] for r in results}, {"c1", "lex_1"})
+
+        stats = self.resources.stats()
+        self.assertEqual(stats["queries_served"], 3)
+        self.assertEqual(stats["embedders"]["fake-embedder@auto"]["hits"], 2)
+        self.assertEqual(len(stats["lexical_dbs"]), 1)
+
+    def test_collection_reopens_when_index_generation_changes(self) -> None:
+        self.lex_path = _lexical_db(self.root)
+        persist = self.root / "index"
+        self.assertIsNone(read_index_generation(persist))
+        with patch.dict(sys.modules, {"chromadb": self.chroma}):
+            self.resources.query(self._request())
+            self.resources.query(self._request())
+            self.assertEqual(self.chroma.clients_created, 1)
+
+            # An incremental rag-index run updates chroma.sqlite3 in place
+            # and bumps the generation stamp.
+            stamp = bump_index_generation(persist)
+            self.assertEqual(read_index_generation(persist), stamp)
+            self.resources.query(self._request())
+            self.assertEqual(self.chroma.clients_created, 2)
+
+            (persist / "chroma.sqlite3").write_bytes(b"rewritten")
+            self.resources.query(self._request())
+            self.assertEqual(self.chroma.clients_created, 3)
+            self.resources.query(self._request())
+            self.assertEqual(self.chroma.clients_created, 3)
+
+    def test_missing_collection_is_not_cached(self) -> None:
+        self.lex_path = _lexical_db(self.root)
+        with patch.dict(sys.modules, {"chromadb": self.chroma}):
+            self.assertEqual(self.resources.query(self._request(collection_name="later")), [])
+            self.chroma.collections["later"] = self.collection
+            results = self.resources.query(self._request(collection_name="later"))
+
+        self.assertEqual([r["chunk_id"] for r in results], ["c1"])
+
+    @unittest.skipIf(os.name == "nt", "cannot unlink an open SQLite file on Windows")
+    def test_lexical_connection_reopens_after_db_is_replaced(self) -> None:
+        self.lex_path = _lexical_db(self.root)
+        first = self.resources.query(self._request(lexical_only=True))
+        self.assertEqual([r["chunk_id"] for r in first], ["lex_1"])
+
+        # Simulate a rebuild replacing the file while the old handle is open.
+        self.lex_path.unlink()
+        for suffix in ("-wal", "-shm"):
+            Path(str(self.lex_path) + suffix).unlink(missing_ok=True)
+        conn = open_lexical_db(self.lex_path)
+        insert_chunks(conn, [{
+            "chunk_id": "lex_2",
+            "doc_id": "d_lex2",
+            "file_path": "kb/notes/rebuilt.md",
+            "chunk_index": 0,
+            "doc_type": "kb",
+            "is_private": True,
+            "chunk_text": "rebuilt index: spreads near resolution",
+        }])
+        conn.commit()
+        conn.close()
+
+        second = self.resources.query(self._request(lexical_only=True))
+        self.assertEqual([r["chunk_id"] for r in second], ["lex_2"])
+
+    def test_query_index_without_resources_is_unchanged(self) -> None:
+        self.lex_path = _lexical_db(self.root)
+        results = query_index(
+            question="spreads",
+            lexical_only=True,
+            lexical_db_path=self.lex_path,
+            private_only=False,
+        )
+        self.assertEqual([r["chunk_id"] for r in results], ["lex_1"])
+
+    def test_unknown_request_fields_are_rejected(self) -> None:
+        with self.assertRaisesRegex(ValueError, "unknown query request fields: embedder"):
+            self.resources.query({"question": "x", "embedder": "nope"})
+        with self.assertRaisesRegex(ValueError, "question is required"):
+            self.resources.query({"k": 3})
+
+
+class RagQueryServerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.lex_path = _lexical_db(Path(self._tmp.name))
+        self.resources = WarmRagResources(embedder_factory=lambda model, device: _CountingEmbedder(model))
+        self.server = RagQueryServer("127.0.0.1", 0, resources=self.resources, repo_root=self._tmp.name)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.resources.close()
+        self._tmp.cleanup()
+
+    def test_query_round_trip(self) -> None:
+        request = {
+            "question": "spreads",
+            "lexical_only": True,
+            "lexical_db_path": str(self.lex_path),
+            "private_only": False,
+        }
+        results = query_service(request, url=self.server.url, timeout=10)
+        self.assertEqual([r["chunk_id"] for r in results], ["lex_1"])
+        self.assertEqual(self.resources.queries_served, 1)
+
+    def test_bad_request_raises_value_error(self) -> None:
+        with self.assertRaisesRegex(ValueError, "question is required"):
+            query_service({"k": 1}, url=self.server.url, timeout=10)
+
+    def test_non_json_content_type_is_rejected(self) -> None:
+        import urllib.error
+        import urllib.request
+
+        http_request = urllib.request.Request(
+            self.server.url + "/query",
+            data=b'{"question": "spreads"}',
+            headers={"Content-Type": "text/plain"},
+            method="POST",
+        )
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            urllib.request.urlopen(http_request, timeout=10)
+        self.assertEqual(ctx.exception.code, 415)
+        self.assertEqual(self.resources.queries_served, 0)
+
+    def test_paths_outside_repo_root_are_rejected(self) -> None:
+        outside = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.addCleanup(outside.cleanup)
+        target = Path(outside.name) / "made" / "lexical.sqlite3"
+        for lexical_db_path in (str(target), "../" + Path(outside.name).name + "/lexical.sqlite3"):
+            with self.assertRaisesRegex(ValueError, "lexical_db_path must be inside the repo root"):
+                query_service(
+                    {"question": "spreads", "lexical_only": True, "lexical_db_path": lexical_db_path},
+                    url=self.server.url,
+                    timeout=10,
+                )
+        self.assertFalse(target.parent.exists())
+
+        # Relative paths resolve under the repo root.
+        request = {
+            "question": "spreads",
+            "lexical_only": True,
+            "lexical_db_path": self.lex_path.relative_to(self._tmp.name).as_posix(),
+            "private_only": False,
+        }
+        results = query_service(request, url=self.server.url, timeout=10)
+        self.assertEqual([r["chunk_id"] for r in results], ["lex_1"])
+
+    def test_only_configured_models_are_served(self) -> None:
+        request = {
+            "question": "spreads",
+            "lexical_db_path": str(self.lex_path),
+            "embed_model": "someone/huge-model",
+        }
+        with self.assertRaisesRegex(ValueError, "embed_model not served here"):
+            query_service(request, url=self.server.url, timeout=10)
+        with self.assertRaisesRegex(ValueError, "rerank_model not served here"):
+            query_service(
+                dict(request, embed_model=None, rerank=True, rerank_model="other/cross-encoder"),
+                url=self.server.url,
+                timeout=10,
+            )
+        with self.assertRaisesRegex(ValueError, "unsupported device"):
+            query_service(dict(request, embed_model=None, device="tpu:7"), url=self.server.url, timeout=10)
+        self.assertEqual(self.resources.stats()["embedders"], {})
+
+    def test_run_query_falls_back_in_process_when_service_is_down(self) -> None:
+        port = self.server.server_address[1]
+        self.server.shutdown()
+        self.server.server_close()
+        url = f"http://127.0.0.1:{port}"
+        request = {
+            "question": "spreads",
+            "lexical_only": True,
+            "lexical_db_path": str(self.lex_path),
+            "private_only": False,
+        }
+        with self.assertRaises(RagServiceUnavailable):
+            query_service(request, url=url, timeout=2)
+
+        fallback = WarmRagResources()
+        try:
+            results = run_query(request, service_url=url, resources=fallback, timeout=2)
+        finally:
+            fallback.close()
+        self.assertEqual([r["chunk_id"] for r in results], ["lex_1"])
+        self.assertEqual(fallback.queries_served, 1)
+        self.server = RagQueryServer("127.0.0.1", 0, resources=self.resources, repo_root=self._tmp.name)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def test_timeout_is_reported_not_answered_in_process(self) -> None:
+        # Accepts connections (kernel backlog) but never answers.
+        silent = socket.socket()
+        silent.bind(("127.0.0.1", 0))
+        silent.listen(4)
+        url = "http://127.0.0.1:%d" % silent.getsockname()[1]
+        request = {
+            "question": "spreads",
+            "lexical_only": True,
+            "lexical_db_path": str(self.lex_path),
+            "private_only": False,
+        }
+        fallback = WarmRagResources()
+        try:
+            with self.assertRaises(RagServiceTimeout):
+                query_service(request, url=url, timeout=0.2)
+            with self.assertRaises(RagServiceTimeout):
+                run_query(request, service_url=url, resources=fallback, timeout=0.2)
+        finally:
+            fallback.close()
+            silent.close()
+        self.assertEqual(fallback.queries_served, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
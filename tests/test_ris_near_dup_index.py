@@ -0,0 +1,285 @@
+"""Tests for the RIS MinHash/LSH near-duplicate index.
+
+Covers the persistent index (exact/near/no match, persistence, parameter
+guard, numpy vs pure-Python signatures), its wiring into
+check_near_duplicate / DocumentEvaluator / IngestPipeline, and the
+research-dedup backfill command.
+
+All tests are offline and deterministic.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+from unittest.mock import patch
+
+import pytest
+
+
+def _body(seed: int, words: int = 300) -> str:
+    rng = random.Random(seed)
+    vocab = [f"term{i}" for i in range(2000)]
+    return " ".join(rng.choice(vocab) for _ in range(words))
+
+
+def _near_copy(body: str, edits: int = 3) -> str:
+    words = body.split()
+    for i in range(edits):
+        words[(i + 1) * len(words) // (edits + 1)] = f"edited{i}"
+    return " ".join(words)
+
+
+def _make_doc(body: str, doc_id: str = "candidate"):
+    from packages.research.evaluation.types import EvalDocument
+
+    return EvalDocument(
+        doc_id=doc_id,
+        title="Near duplicate test",
+        author="Tester",
+        source_type="manual",
+        source_url="https://example.com/near-dup",
+        source_publish_date=None,
+        body=body,
+        metadata={},
+    )
+
+
+@pytest.fixture
+def index(tmp_path):
+    from packages.research.evaluation.near_dup_index import NearDuplicateIndex
+
+    idx = NearDuplicateIndex(tmp_path / "near_dup.sqlite3")
+    yield idx
+    idx.close()
+
+
+# ---------------------------------------------------------------------------
+# Index behaviour
+# ---------------------------------------------------------------------------
+
+
+class TestNearDuplicateIndex:
+    def test_exact_match(self, index):
+        body = _body(1)
+        assert index.add("doc_a", body) is True
+
+        result = index.query(body)
+        assert result.is_duplicate is True
+        assert result.duplicate_type == "exact"
+        assert result.matched_doc_id == "doc_a"
+        assert result.similarity == 1.0
+
+    def test_near_match_among_many(self, index):
+        index.add_many((f"doc_{i}", _body(i)) for i in range(50))
+
+        result = index.query(_near_copy(_body(17)))
+        assert result.is_duplicate is True
+        assert result.duplicate_type == "near"
+        assert result.matched_doc_id == "doc_17"
+        assert 0.85 < result.similarity < 1.0
+
+    def test_distinct_document_is_not_duplicate(self, index):
+        index.add_many((f"doc_{i}", _body(i)) for i in range(20))
+
+        result = index.query(_body(999))
+        assert result.is_duplicate is False
+        assert result.matched_doc_id is None
+
+    def test_empty_body_is_not_indexed(self, index):
+        assert index.add("empty", "") is False
+        assert "empty" not in index
+        assert index.query("").is_duplicate is False
+
+    def test_readd_and_remove(self, index):
+        from packages.research.evaluation.near_dup_index import shingle_hashes
+
+        index.add("doc_a", _body(1))
+        index.add("doc_a", _body(2))
+        assert len(index) == 1
+        assert index.query(_body(1)).is_duplicate is False
+        assert index.query(_body(2)).matched_doc_id == "doc_a"
+
+        assert index.remove("doc_a") is True
+        assert index.remove("doc_a") is False
+        assert len(index) == 0
+        assert index.candidates(index.signature(shingle_hashes(_body(2)))) == {}
+
+    def test_persists_across_reopen(self, tmp_path):
+        from packages.research.evaluation.near_dup_index import NearDuplicateIndex
+
+        path = tmp_path / "near_dup.sqlite3"
+        first = NearDuplicateIndex(path)
+        first.add("doc_a", _body(5))
+        first.close()
+
+        second = NearDuplicateIndex(path)
+        try:
+            assert "doc_a" in second
+            assert second.query(_near_copy(_body(5))).matched_doc_id == "doc_a"
+        finally:
+            second.close()
+
+    def test_reopen_with_different_parameters_raises(self, tmp_path):
+        from packages.research.evaluation.near_dup_index import NearDuplicateIndex
+
+        path = tmp_path / "near_dup.sqlite3"
+        NearDuplicateIndex(path).close()
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(path, num_perm=64, bands=16)
+
+    def test_num_perm_must_divide_into_bands(self, tmp_path):
+        from packages.research.evaluation.near_dup_index import NearDuplicateIndex
+
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(tmp_path / "x.sqlite3", num_perm=100, bands=32)
+
+    def test_pure_python_signature_matches_numpy(self, index):
+        pytest.importorskip("numpy")
+        from packages.research.evaluation.near_dup_index import shingle_hashes
+
+        hashes = shingle_hashes(_body(3))
+        with_numpy = index.signature(hashes)
+        with patch.dict(sys.modules, {"numpy": None}):
+            pure = index.signature(hashes)
+        assert with_numpy == pure
+
+    def test_db_path_sits_next_to_knowledge_db(self, tmp_path):
+        from packages.research.evaluation.near_dup_index import (
+            NEAR_DUP_DB_FILENAME,
+            near_dup_db_path_for,
+        )
+
+        assert near_dup_db_path_for(tmp_path / "knowledge.sqlite3") == tmp_path / NEAR_DUP_DB_FILENAME
+        assert near_dup_db_path_for(":memory:") == ":memory:"
+
+
+# ---------------------------------------------------------------------------
+# Gate / pipeline wiring
+# ---------------------------------------------------------------------------
+
+
+class TestIndexWiring:
+    def test_check_near_duplicate_uses_index(self, index):
+        from packages.research.evaluation.dedup import check_near_duplicate
+
+        index.add("doc_a", _body(8))
+        result = check_near_duplicate(_make_doc(_near_copy(_body(8))), set(), [], index=index)
+        assert result.is_duplicate is True
+        assert result.matched_doc_id == "doc_a"
+
+    def test_evaluator_rejects_via_index(self, index):
+        from packages.research.evaluation.evaluator import DocumentEvaluator
+
+        index.add("doc_a", _body(9))
+        evaluator = DocumentEvaluator(near_dup_index=index)
+
+        decision = evaluator.evaluate(_make_doc(_near_copy(_body(9))))
+        assert decision.gate == "REJECT"
+        assert decision.hard_stop is not None
+        assert decision.hard_stop.stop_type == "near_duplicate"
+
+    def test_pipeline_registers_ingested_bodies(self, tmp_path, index):
+        from packages.polymarket.rag.knowledge_store import KnowledgeStore
+        from packages.research.ingestion.pipeline import IngestPipeline
+
+        store = KnowledgeStore(tmp_path / "knowledge.sqlite3")
+        try:
+            source = tmp_path / "doc.md"
+            source.write_text(_body(11), encoding="utf-8")
+            pipeline = IngestPipeline(store=store, near_dup_index=index)
+            result = pipeline.ingest(source)
+            assert result.doc_id
+            assert result.doc_id in index
+            assert index.query(_near_copy(_body(11))).matched_doc_id == result.doc_id
+        finally:
+            store.close()
+
+    def test_reingesting_same_file_is_idempotent(self, tmp_path, index):
+        from packages.polymarket.rag.knowledge_store import KnowledgeStore
+        from packages.research.evaluation.evaluator import DocumentEvaluator
+        from packages.research.ingestion.pipeline import IngestPipeline
+
+        store = KnowledgeStore(tmp_path / "knowledge.sqlite3")
+        try:
+            source = tmp_path / "doc.md"
+            source.write_text(_body(12), encoding="utf-8")
+            pipeline = IngestPipeline(
+                store=store,
+                evaluator=DocumentEvaluator(near_dup_index=index),
+                near_dup_index=index,
+            )
+            first = pipeline.ingest(source)
+            second = pipeline.ingest(source)
+            assert first.rejected is False
+            assert second.rejected is False
+            assert second.doc_id == first.doc_id
+            assert len(index) == 1
+
+            copy = tmp_path / "copy.md"
+            copy.write_text(_body(12), encoding="utf-8")
+            third = pipeline.ingest(copy)
+            assert third.rejected is True
+            assert "exact duplicate" in third.reject_reason
+        finally:
+            store.close()
+
+
+# ---------------------------------------------------------------------------
+# research-dedup backfill
+# ---------------------------------------------------------------------------
+
+
+class TestBackfillCommand:
+    def test_backfill_indexes_existing_sources(self, tmp_path, capsys):
+        from packages.polymarket.rag.knowledge_store import KnowledgeStore
+        from packages.research.evaluation.near_dup_index import NearDuplicateIndex
+        from tools.cli.research_dedup import main
+
+        db_path = tmp_path / "knowledge.sqlite3"
+        body_file = tmp_path / "paper.txt"
+        body_file.write_text(_body(21), encoding="utf-8")
+
+        store = KnowledgeStore(db_path)
+        meta_id = store.add_source_document(
+            title="Meta body",
+            source_url="https://example.com/a",
+            content_hash="h1",
+            metadata_json=json.dumps({"body": _body(20)}),
+        )
+        file_id = store.add_source_document(
+            title="File body",
+            source_url=body_file.as_uri(),
+            content_hash="h2",
+        )
+        store.add_source_document(
+            title="No body",
+            source_url="https://example.com/c",
+            content_hash="h3",
+        )
+        store.close()
+
+        assert main(["backfill", "--db", str(db_path), "--batch-size", "2", "--json"]) == 0
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["scanned"] == 3
+        assert summary["indexed"] == 2
+        assert summary["skipped_no_body"] == 1
+        assert summary["index_size"] == 2
+
+        assert main(["backfill", "--db", str(db_path), "--json"]) == 0
+        again = json.loads(capsys.readouterr().out)
+        assert again["indexed"] == 0
+        assert again["skipped_existing"] == 2
+
+        idx = NearDuplicateIndex(tmp_path / "near_dup.sqlite3")
+        try:
+            assert meta_id in idx and file_id in idx
+            assert idx.query(_near_copy(_body(20))).matched_doc_id == meta_id
+        finally:
+            idx.close()
+
+    def test_backfill_missing_db_is_error(self, tmp_path):
+        from tools.cli.research_dedup import main
+
+        assert main(["backfill", "--db", str(tmp_path / "missing.sqlite3")]) == 1
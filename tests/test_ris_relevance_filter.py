@@ -893,3 +893,117 @@ class TestCountsCommand:
         assert data["pending_unlabeled"] == 0
         assert data["labeled_allow"] == 1
         assert data["labeled_reject"] == 0
+
+
+# ---------------------------------------------------------------------------
+# TestStoreSidecarIndex
+# ---------------------------------------------------------------------------
+
+class TestStoreSidecarIndex:
+    """Sidecar SQLite index: migration, external appends, rewrites, lookups."""
+
+    def test_existing_jsonl_is_indexed_on_first_use(self, tmp_path):
+        from packages.research.relevance_filter.queue_store import (
+            ReviewQueueStore, candidate_id_from_url, index_path_for,
+        )
+        queue_path = tmp_path / "queue.jsonl"
+        lines = [
+            json.dumps({"source_url": f"https://a.com/{i}",
+                        "candidate_id": candidate_id_from_url(f"https://a.com/{i}")})
+            for i in range(5)
+        ]
+        queue_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        assert not index_path_for(queue_path).exists()
+
+        q = ReviewQueueStore(queue_path)
+        assert q.pending_count() == 5
+        assert q.enqueue({"source_url": "https://a.com/3"}) is False
+        assert q.enqueue({"source_url": "https://a.com/9"}) is True
+        assert q.pending_count() == 6
+        assert index_path_for(queue_path).exists()
+
+    def test_external_appends_are_picked_up(self, tmp_path):
+        from packages.research.relevance_filter.queue_store import (
+            ReviewQueueStore, LabelStore, candidate_id_from_url,
+        )
+        queue_path = tmp_path / "queue.jsonl"
+        label_path = tmp_path / "labels.jsonl"
+        q = ReviewQueueStore(queue_path)
+        ls = LabelStore(label_path)
+        q.enqueue({"source_url": "https://a.com/1"})
+        ls.append_label(candidate_id_from_url("https://a.com/1"), "https://a.com/1", "A", "allow")
+
+        # Another process (or a second store instance) appends to both files.
+        ReviewQueueStore(queue_path).enqueue({"source_url": "https://a.com/2"})
+        with label_path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps({"candidate_id": candidate_id_from_url("https://a.com/2"),
+                                 "label": "reject"}) + "\n")
+
+        assert q.enqueue({"source_url": "https://a.com/2"}) is False
+        assert ls.counts() == {"total": 2, "allow": 1, "reject": 1}
+        stats = q.queue_stats(ls)
+        assert stats["total_queued"] == 2
+        assert stats["pending_unlabeled"] == 0
+        assert stats["labeled_allow"] == 1
+        assert stats["labeled_reject"] == 1
+
+    def test_rewritten_file_triggers_rebuild(self, tmp_path):
+        from packages.research.relevance_filter.queue_store import ReviewQueueStore
+        queue_path = tmp_path / "queue.jsonl"
+        q = ReviewQueueStore(queue_path)
+        for i in range(3):
+            q.enqueue({"source_url": f"https://a.com/{i}"})
+
+        # Operator prunes the queue by hand, keeping only the last record.
+        kept = queue_path.read_text(encoding="utf-8").splitlines()[-1]
+        queue_path.write_text(kept + "\n", encoding="utf-8")
+
+        assert q.pending_count() == 1
+        assert q.enqueue({"source_url": "https://a.com/0"}) is True
+        assert q.enqueue({"source_url": "https://a.com/2"}) is False
+
+    def test_deleted_file_resets_index(self, tmp_path):
+        from packages.research.relevance_filter.queue_store import ReviewQueueStore
+        queue_path = tmp_path / "queue.jsonl"
+        q = ReviewQueueStore(queue_path)
+        q.enqueue({"source_url": "https://a.com/1"})
+        queue_path.unlink()
+
+        assert q.pending_count() == 0
+        assert q.enqueue({"source_url": "https://a.com/1"}) is True
+
+    def test_find_by_prefix(self, tmp_path):
+        from packages.research.relevance_filter.queue_store import (
+            ReviewQueueStore, candidate_id_from_url,
+        )
+        q = ReviewQueueStore(tmp_path / "queue.jsonl")
+        for i in range(4):
+            q.enqueue({"source_url": f"https://a.com/{i}", "title": f"P{i}"})
+        cid = candidate_id_from_url("https://a.com/2")
+
+        matched = q.find(cid[:10])
+        assert [r["title"] for r in matched] == ["P2"]
+        assert len(q.find("")) == 4
+        assert ReviewQueueStore(tmp_path / "missing.jsonl").find(cid) == []
+
+    def test_unterminated_last_line_is_not_corrupted_by_append(self, tmp_path):
+        from packages.research.relevance_filter.queue_store import ReviewQueueStore
+        queue_path = tmp_path / "queue.jsonl"
+        queue_path.write_text(json.dumps({"source_url": "https://a.com/1",
+                                          "candidate_id": "abc"}), encoding="utf-8")
+        q = ReviewQueueStore(queue_path)
+        assert q.enqueue({"source_url": "https://a.com/2"}) is True
+
+        records = q.all_records()
+        assert [r["source_url"] for r in records] == ["https://a.com/1", "https://a.com/2"]
+        assert q.pending_count() == 2
+
+    def test_read_only_calls_do_not_create_files(self, tmp_path):
+        from packages.research.relevance_filter.queue_store import ReviewQueueStore, LabelStore
+        q = ReviewQueueStore(tmp_path / "q" / "queue.jsonl")
+        ls = LabelStore(tmp_path / "l" / "labels.jsonl")
+        assert q.pending_count() == 0
+        assert ls.counts() == {"total": 0, "allow": 0, "reject": 0}
+        assert q.queue_stats(ls)["total_queued"] == 0
+        assert not (tmp_path / "q").exists()
+        assert not (tmp_path / "l").exists()
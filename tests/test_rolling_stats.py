@@ -0,0 +1,141 @@
+"""Tests for the O(1) windowed statistics used by market makers and risk signals."""
+
+from __future__ import annotations
+
+import math
+import random
+from statistics import pvariance
+
+import pytest
+
+from packages.polymarket.simtrader.rolling_stats import (
+    EWMA,
+    ArrivalRateCounter,
+    RollingMoments,
+    RollingWindow,
+    TimeWindowedSeries,
+)
+
+
+def _window_changes(samples, t_now, window):
+    kept = [value for ts, value in samples if ts >= t_now - window]
+    return [curr - prev for prev, curr in zip(kept, kept[1:])]
+
+
+class TestRollingMoments:
+    def test_add_and_remove_match_pvariance(self) -> None:
+        moments = RollingMoments()
+        values = [0.5, 0.52, 0.49, 0.61, 0.58, 0.40]
+        for value in values:
+            moments.add(value)
+        moments.remove(values[0])
+        moments.remove(values[1])
+
+        assert moments.count == 4
+        assert moments.mean == pytest.approx(sum(values[2:]) / 4)
+        assert moments.variance == pytest.approx(pvariance(values[2:]))
+
+    def test_removing_last_value_resets(self) -> None:
+        moments = RollingMoments()
+        moments.add(3.0)
+        moments.remove(3.0)
+        assert (moments.count, moments.mean, moments.variance) == (0, 0.0, 0.0)
+
+
+class TestTimeWindowedSeries:
+    def test_change_variance_tracks_full_recompute(self) -> None:
+        rng = random.Random(7)
+        window = 30.0
+        series = TimeWindowedSeries(window)
+        samples = []
+        ts, mid = 0.0, 0.5
+        for _ in range(2000):
+            ts += rng.uniform(0.0, 2.0)
+            mid = min(0.99, max(0.01, mid + rng.gauss(0.0, 0.01)))
+            samples.append((ts, mid))
+            series.add(ts, mid)
+
+            changes = _window_changes(samples, ts, window)
+            assert len(series) == len(changes) + 1
+            if len(changes) >= 2:
+                assert series.change_variance() == pytest.approx(pvariance(changes), rel=1e-6, abs=1e-12)
+
+    def test_deque_compatible_surface(self) -> None:
+        series = TimeWindowedSeries(60.0, [(1.0, 0.4), (2.0, 0.5)])
+        series.append((3.0, 0.7))
+
+        assert len(series) == 3
+        assert series[0] == (1.0, 0.4)
+        assert series[-1] == (3.0, 0.7)
+        assert [ts for ts, _ in series] == [1.0, 2.0, 3.0]
+        assert series.change_count == 2
+
+        series.clear()
+        assert not series
+        assert series.change_variance() == 0.0
+
+    def test_evict_drops_samples_before_cutoff(self) -> None:
+        series = TimeWindowedSeries(10.0, [(0.0, 1.0), (5.0, 2.0), (12.0, 4.0), (14.0, 7.0)])
+
+        series.evict(15.0)
+
+        assert [ts for ts, _ in series] == [5.0, 12.0, 14.0]
+        assert series.change_variance() == pytest.approx(pvariance([2.0, 3.0]))
+
+
+class TestArrivalRateCounter:
+    def test_count_and_rate_over_window(self) -> None:
+        counter = ArrivalRateCounter(60.0)
+        for i in range(10):
+            counter.record(950.0 + i)
+
+        assert counter.count(1000.0) == 10
+        assert counter.rate(1000.0) == pytest.approx(10 / 60.0)
+        assert counter.count(1015.0) == 5
+        assert counter[0] == 955.0
+
+
+class TestRollingWindow:
+    def test_total_and_mean_over_last_values(self) -> None:
+        window = RollingWindow(3, [1, -1, 1, 1])
+
+        assert list(window) == [-1, 1, 1]
+        assert window.total == 1
+        assert window.mean == pytest.approx(1 / 3)
+
+    def test_float_total_stays_close_over_long_runs(self) -> None:
+        rng = random.Random(3)
+        window = RollingWindow(30)
+        for _ in range(10_000):
+            window.append(rng.uniform(0.0, 1000.0) / 7.0)
+        assert window.total == pytest.approx(math.fsum(window), rel=1e-12)
+
+    def test_rejects_empty_window(self) -> None:
+        with pytest.raises(ValueError, match="maxlen"):
+            RollingWindow(0)
+
+
+class TestEWMA:
+    def test_fixed_alpha(self) -> None:
+        ewma = EWMA(alpha=0.5)
+        assert ewma.update(1.0) == 1.0
+        assert ewma.update(3.0) == 2.0
+        assert ewma.update(3.0) == 2.5
+        assert ewma.count == 3
+
+    def test_half_life_weights_by_elapsed_time(self) -> None:
+        ewma = EWMA(half_life_seconds=10.0)
+        ewma.update(0.0, ts=0.0)
+        assert ewma.update(1.0, ts=10.0) == pytest.approx(0.5)
+        # No elapsed time -> no weight on the new value.
+        assert ewma.update(100.0, ts=10.0) == pytest.approx(0.5)
+
+    def test_requires_exactly_one_weighting(self) -> None:
+        with pytest.raises(ValueError):
+            EWMA()
+        with pytest.raises(ValueError):
+            EWMA(alpha=0.5, half_life_seconds=1.0)
+        with pytest.raises(ValueError, match="ts is required"):
+            ewma = EWMA(half_life_seconds=1.0)
+            ewma.update(1.0)
+            ewma.update(2.0)
@@ -7,6 +7,8 @@ Covers:
     and an OR query is issued instead of failing with token_col=None.
   - Silver close-benchmark path smoke: SilverReconstructor with all three sources
     stubbed returns a valid result with no error.
+  - Batched pmxt/Jon fetches (one scan for many targets) split per target and
+    match the single-token fetches.
 """
 from __future__ import annotations
 
@@ -29,8 +31,14 @@ if str(_project_root) not in sys.path:
 from packages.polymarket.silver_reconstructor import (
     ReconstructConfig,
     SilverReconstructor,
+    SilverTarget,
     _real_fetch_jon_fills,
+    _real_fetch_jon_fills_batch,
+    _real_fetch_pmxt_anchor,
+    _real_fetch_pmxt_anchors_batch,
     _real_fetch_price_2min,
+    index_jon_dataset,
+    index_pmxt_dataset,
 )
 
 _TOKEN = "0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
@@ -274,6 +282,187 @@ class TestJonMakerTakerSchema:
         assert result == []
 
 
+# ---------------------------------------------------------------------------
+# Batched pmxt / Jon fetches
+# ---------------------------------------------------------------------------
+
+
+def _write_parquet(duckdb_mod, path: Path, select_sql: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = duckdb_mod.connect()
+    try:
+        conn.execute(f"COPY ({select_sql}) TO '{path.as_posix()}' (FORMAT PARQUET)")
+    finally:
+        conn.close()
+
+
+class TestBatchedSourceFetch:
+    _TOKENS = [_TOKEN, "0x" + "b" * 64, "0x" + "c" * 64]
+    _TARGETS = [
+        SilverTarget(_TOKEN, _WIN_START, _WIN_END),
+        SilverTarget("0x" + "b" * 64, _WIN_START + 3600, _WIN_END + 3600),
+        SilverTarget("0x" + "c" * 64, _WIN_START, _WIN_END),  # no data at all
+        SilverTarget(_TOKEN, _WIN_START + 5400, _WIN_END + 5400),
+    ]
+
+    def test_pmxt_batch_matches_single_token_fetch(self, tmp_path):
+        duckdb = pytest.importorskip("duckdb", reason="duckdb not installed")
+        _write_parquet(
+            duckdb,
+            tmp_path / "Polymarket" / "2023" / "snap.parquet",
+            f"""
+            SELECT token_id, snapshot_ts, best_bid FROM (VALUES
+              ('{_TOKEN}', {int(_WIN_START) - 60}, 0.40),
+              ('{_TOKEN}', {int(_WIN_START) + 3000}, 0.45),
+              ('{_TOKEN}', {int(_WIN_START) + 9000}, 0.50),
+              ('{self._TOKENS[1]}', {int(_WIN_START) + 100}, 0.30)
+            ) AS v(token_id, snapshot_ts, best_bid)
+            """,
+        )
+
+        batched = _real_fetch_pmxt_anchors_batch(str(tmp_path), self._TARGETS)
+        single = [
+            _real_fetch_pmxt_anchor(str(tmp_path), t.token_id, t.window_start)
+            for t in self._TARGETS
+        ]
+        assert batched == single
+        assert [float(row["best_bid"]) if row else None for row in batched] == [
+            0.40, 0.30, None, 0.45,
+        ]
+
+    def test_jon_batch_maker_taker_matches_single_token_fetch(self, tmp_path):
+        duckdb = pytest.importorskip("duckdb", reason="duckdb not installed")
+        b = self._TOKENS[1]
+        _write_parquet(
+            duckdb,
+            tmp_path / "data" / "polymarket" / "trades" / "fills.parquet",
+            f"""
+            SELECT * FROM (VALUES
+              ('h1', '{_TOKEN}', '{b}', {int(_WIN_START) + 10}),
+              ('h2', '{b}', '{_TOKEN}', {int(_WIN_START) + 20}),
+              ('h3', '{b}', '{b}', {int(_WIN_START) + 3700}),
+              ('h4', '{_TOKEN}', '{b}', {int(_WIN_START) + 6000}),
+              ('h5', '{_TOKEN}', '{b}', {int(_WIN_END) + 99999})
+            ) AS v(order_hash, maker_asset_id, taker_asset_id, timestamp)
+            """,
+        )
+
+        batched = _real_fetch_jon_fills_batch(str(tmp_path), self._TARGETS)
+        single = [
+            _real_fetch_jon_fills(str(tmp_path), t.token_id, t.window_start, t.window_end)
+            for t in self._TARGETS
+        ]
+        assert batched == single
+        assert [[r["order_hash"] for r in rows] for rows in batched] == [
+            ["h1", "h2", "h4"], ["h3", "h4"], [], ["h4"],
+        ]
+
+    def test_missing_dataset_returns_none(self, tmp_path):
+        (tmp_path / "data" / "polymarket" / "trades").mkdir(parents=True)
+        assert _real_fetch_jon_fills_batch(str(tmp_path), self._TARGETS) is None
+
+
+class TestCatalogPrunedFetch:
+    """Indexed datasets return the same rows while reading fewer files."""
+
+    _B = "0x" + "b" * 64
+    _TARGETS = TestBatchedSourceFetch._TARGETS
+
+    def _files_read(self, fetch, root):
+        from packages.polymarket import duckdb_helper
+
+        with patch.object(
+            duckdb_helper, "read_expr_for_files", wraps=duckdb_helper.read_expr_for_files
+        ) as spy:
+            result = fetch(str(root), self._TARGETS)
+        read = {Path(f).name for call in spy.call_args_list for f in call.args[0]}
+        return result, read
+
+    def test_pmxt_catalog_reads_only_candidate_files(self, tmp_path):
+        duckdb = pytest.importorskip("duckdb", reason="duckdb not installed")
+        ws = int(_WIN_START)
+        base = tmp_path / "Polymarket"
+        for name, rows in {
+            # Older than the newest <= ws snapshot in mid.parquet: skippable.
+            "old.parquet": [(_TOKEN, ws - 7200, 0.10), (self._B, ws - 7200, 0.20)],
+            "mid.parquet": [(_TOKEN, ws - 60, 0.40), (_TOKEN, ws + 3000, 0.45)],
+            "late.parquet": [(_TOKEN, ws + 90000, 0.99), (self._B, ws + 100, 0.30)],
+            "other.parquet": [("0x" + "d" * 64, ws, 0.50)],
+        }.items():
+            values = ", ".join(f"('{t}', {ts}, {bid})" for t, ts, bid in rows)
+            _write_parquet(
+                duckdb, base / name,
+                f"SELECT * FROM (VALUES {values}) AS v(token_id, snapshot_ts, best_bid)",
+            )
+
+        unindexed = _real_fetch_pmxt_anchors_batch(str(tmp_path), self._TARGETS)
+        refresh = index_pmxt_dataset(str(tmp_path))
+        assert refresh is not None and refresh.files_scanned == 4
+
+        indexed, read = self._files_read(_real_fetch_pmxt_anchors_batch, tmp_path)
+        assert indexed == unindexed
+        assert [float(r["best_bid"]) if r else None for r in indexed] == [
+            0.40, 0.30, None, 0.45,
+        ]
+        assert read == {"mid.parquet", "late.parquet"}
+
+        # A file added after indexing is read even though the catalog lacks it.
+        _write_parquet(
+            duckdb, base / "new.parquet",
+            f"SELECT '{_TOKEN}' AS token_id, {ws - 1} AS snapshot_ts, 0.41 AS best_bid",
+        )
+        fresh, read = self._files_read(_real_fetch_pmxt_anchors_batch, tmp_path)
+        assert float(fresh[0]["best_bid"]) == 0.41
+        assert "new.parquet" in read
+
+    def test_jon_catalog_indexes_maker_and_taker(self, tmp_path):
+        duckdb = pytest.importorskip("duckdb", reason="duckdb not installed")
+        ws, we = int(_WIN_START), int(_WIN_END)
+        base = tmp_path / "data" / "polymarket" / "trades"
+        for name, rows in {
+            "early.parquet": [("h0", _TOKEN, self._B, ws - 50000)],
+            "window.parquet": [
+                ("h1", _TOKEN, self._B, ws + 10),
+                ("h2", self._B, _TOKEN, ws + 20),
+            ],
+            "taker.parquet": [("h3", "0x" + "d" * 64, self._B, ws + 3700)],
+            "after.parquet": [("h5", _TOKEN, self._B, we + 99999)],
+        }.items():
+            values = ", ".join(f"('{h}', '{m}', '{t}', {ts})" for h, m, t, ts in rows)
+            _write_parquet(
+                duckdb, base / name,
+                f"SELECT * FROM (VALUES {values}) "
+                "AS v(order_hash, maker_asset_id, taker_asset_id, timestamp)",
+            )
+
+        unindexed = _real_fetch_jon_fills_batch(str(tmp_path), self._TARGETS)
+        refresh = index_jon_dataset(str(tmp_path))
+        assert refresh is not None
+        assert refresh.catalog.token_cols == ["maker_asset_id", "taker_asset_id"]
+
+        indexed, read = self._files_read(_real_fetch_jon_fills_batch, tmp_path)
+        assert indexed == unindexed
+        assert [[r["order_hash"] for r in rows] for rows in indexed] == [
+            ["h1", "h2"], ["h3"], [], [],
+        ]
+        assert read == {"window.parquet", "taker.parquet"}
+
+    def test_cli_indexes_both_sources(self, tmp_path, capsys):
+        duckdb = pytest.importorskip("duckdb", reason="duckdb not installed")
+        from tools.cli.index_historical import main
+
+        _write_parquet(
+            duckdb, tmp_path / "pmxt" / "Polymarket" / "snap.parquet",
+            f"SELECT '{_TOKEN}' AS token_id, {int(_WIN_START)} AS snapshot_ts",
+        )
+        assert main(["--pmxt-root", str(tmp_path / "pmxt"),
+                     "--jon-root", str(tmp_path / "jon")]) == 0
+        out = capsys.readouterr().out
+        assert "DONE - 1/2 source(s) indexed" in out
+        assert "SKIPPED" in out
+        assert (tmp_path / "pmxt" / "Polymarket" / "_catalog" / "catalog.json").exists()
+
+
 # ---------------------------------------------------------------------------
 # Silver close-benchmark path smoke
 # ---------------------------------------------------------------------------
@@ -24,6 +24,7 @@ Test coverage:
   - CLI smoke: window_end <= window_start -> nonzero
   - CLI smoke: out-dir written when provided
   - CLI smoke: ISO timestamp string accepted
+  - prefetch / reconstruct_many: batched fetches consumed per target
 """
 
 from __future__ import annotations
@@ -40,6 +41,7 @@ from packages.polymarket.silver_reconstructor import (
     SILVER_SCHEMA_VERSION,
     ReconstructConfig,
     SilverReconstructor,
+    SilverTarget,
     SourceInputs,
     _compute_confidence,
     _detect_col,
@@ -531,6 +533,83 @@ class TestErrorPath:
         assert not result.ok
 
 
+# ---------------------------------------------------------------------------
+# prefetch / reconstruct_many
+# ---------------------------------------------------------------------------
+
+
+class TestPrefetch:
+    _OTHER = "0x" + "b" * 64
+
+    def _batch_reconstructor(self, calls: List[str]) -> SilverReconstructor:
+        def pmxt_batch(root, targets):
+            calls.append("pmxt_batch")
+            return [
+                dict(_PMXT_ROW, token_id=t.token_id) if t.token_id == _TOKEN else None
+                for t in targets
+            ]
+
+        def jon_batch(root, targets):
+            calls.append("jon_batch")
+            return [list(_JON_ROWS) if t.token_id == _TOKEN else [] for t in targets]
+
+        def per_target(*args):
+            calls.append("per_target")
+            raise AssertionError("per-target fetch used after prefetch")
+
+        return SilverReconstructor(
+            ReconstructConfig(pmxt_root="/fake/pmxt", jon_root="/fake/jon"),
+            _pmxt_fetch_fn=per_target,
+            _jon_fetch_fn=per_target,
+            _price_2min_fetch_fn=_make_price_fn(_PRICE_ROWS),
+            _pmxt_batch_fetch_fn=pmxt_batch,
+            _jon_batch_fetch_fn=jon_batch,
+        )
+
+    def test_reconstruct_many_uses_one_batched_fetch_per_source(self):
+        calls: List[str] = []
+        rec = self._batch_reconstructor(calls)
+        results = rec.reconstruct_many(
+            [
+                SilverTarget(_TOKEN, _WIN_START, _WIN_END),
+                SilverTarget(self._OTHER, _WIN_START, _WIN_END),
+            ],
+            dry_run=True,
+        )
+        assert calls == ["pmxt_batch", "jon_batch"]
+        assert [r.reconstruction_confidence for r in results] == ["high", "low"]
+        assert results[0].fill_count == len(_JON_ROWS)
+        assert results[1].source_inputs.pmxt_anchor_found is False
+
+    def test_prefetched_matches_per_target_output(self):
+        batched = self._batch_reconstructor([])
+        batched.prefetch([SilverTarget(_TOKEN, _WIN_START, _WIN_END)])
+        got = batched.reconstruct(_TOKEN, _WIN_START, _WIN_END, dry_run=True)
+        expected = _make_reconstructor().reconstruct(
+            _TOKEN, _WIN_START, _WIN_END, dry_run=True
+        )
+        assert got.to_dict() | {"run_id": None} == expected.to_dict() | {"run_id": None}
+
+    def test_failed_batch_falls_back_to_per_target_fetch(self):
+        rec = SilverReconstructor(
+            ReconstructConfig(pmxt_root="/fake/pmxt", jon_root="/fake/jon",
+                              skip_price_2min=True),
+            _pmxt_fetch_fn=_make_pmxt_fn(_PMXT_ROW),
+            _jon_fetch_fn=_make_jon_fn(_JON_ROWS),
+            _pmxt_batch_fetch_fn=lambda root, targets: None,
+            _jon_batch_fetch_fn=lambda root, targets: None,
+        )
+        rec.prefetch([SilverTarget(_TOKEN, _WIN_START, _WIN_END)])
+        result = rec.reconstruct(_TOKEN, _WIN_START, _WIN_END, dry_run=True)
+        assert result.source_inputs.pmxt_anchor_found
+        assert result.fill_count == len(_JON_ROWS)
+
+    def test_out_dirs_length_mismatch_raises(self):
+        rec = self._batch_reconstructor([])
+        with pytest.raises(ValueError, match="one entry per target"):
+            rec.reconstruct_many([SilverTarget(_TOKEN, _WIN_START, _WIN_END)], out_dirs=[])
+
+
 # ---------------------------------------------------------------------------
 # CLI smoke (monkeypatching module-level real fetch functions)
 # ---------------------------------------------------------------------------
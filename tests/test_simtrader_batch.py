@@ -548,6 +548,103 @@ class TestBatchIdempotency:
         assert sweep_called[0], "run_sweep was NOT called despite --rerun"
 
 
+# ---------------------------------------------------------------------------
+# Parallel batch tests
+# ---------------------------------------------------------------------------
+
+
+SLUG_3 = "will-event-c-happen"
+QUESTION_3 = "Will event C happen?"
+NET_PROFIT_BY_SLUG = {SLUG_1: "1.5", SLUG_2: "-0.5", SLUG_3: "0.25"}
+
+
+def _fake_run_sweep_by_slug(sweep_params, sweep_config):
+    """Deterministic per-market sweep; safe to call from forked workers."""
+    slug = sweep_params.market_slug
+    sweep_id = f"sweep_{slug}"
+    sweep_dir = sweep_params.artifacts_root / "sweeps" / sweep_id
+    return _make_sweep_result(sweep_id, sweep_dir, NET_PROFIT_BY_SLUG[slug])
+
+
+class TestParallelBatch:
+    def _run(self, tmp_path, workers, **overrides):
+        from packages.polymarket.simtrader.batch.runner import BatchRunParams, run_batch
+
+        resolved_markets = [
+            _make_resolved(SLUG_1, YES_TOKEN_1, NO_TOKEN_1, QUESTION_1),
+            _make_resolved(SLUG_2, YES_TOKEN_2, NO_TOKEN_2, QUESTION_2),
+            _make_resolved(SLUG_3, "aaa3" * 15, "bbb3" * 15, QUESTION_3),
+        ]
+        picker_mock = MagicMock()
+        picker_mock.auto_pick_many.return_value = resolved_markets
+        fixed_now = MagicMock()
+        fixed_now.now.return_value.strftime.return_value = "20260101T000000Z"
+
+        params = BatchRunParams(
+            num_markets=3,
+            preset="quick",
+            duration=1.0,
+            starting_cash=Decimal("1000"),
+            artifacts_root=tmp_path / "sim",
+            batch_id="parallel-batch",
+            rerun=True,
+            workers=workers,
+            **overrides,
+        )
+        with (
+            patch(
+                "packages.polymarket.simtrader.batch.runner.MarketPicker",
+                return_value=picker_mock,
+            ),
+            patch(
+                "packages.polymarket.simtrader.batch.runner.TapeRecorder",
+                side_effect=_fake_tape_recorder,
+            ),
+            patch(
+                "packages.polymarket.simtrader.batch.runner.run_sweep",
+                side_effect=_fake_run_sweep_by_slug,
+            ),
+            patch("packages.polymarket.simtrader.batch.runner.datetime", fixed_now),
+        ):
+            return run_batch(
+                params=params,
+                gamma_client=MagicMock(),
+                clob_client=MagicMock(),
+                sweep_config_factory=lambda: {"scenarios": [{"name": "s1", "overrides": {}}]},
+            )
+
+    def test_parallel_summary_matches_sequential(self, tmp_path):
+        """workers=3 writes the same summary JSON and CSV as workers=1."""
+        sequential = self._run(tmp_path, workers=1)
+        seq_json = (sequential.batch_dir / "batch_summary.json").read_bytes()
+        seq_csv = (sequential.batch_dir / "batch_summary.csv").read_bytes()
+
+        parallel = self._run(tmp_path, workers=3)
+        assert parallel.summary["aggregate"]["markets_ok"] == 3
+        assert [m["slug"] for m in parallel.summary["markets"]] == [SLUG_1, SLUG_2, SLUG_3]
+        assert (parallel.batch_dir / "batch_summary.json").read_bytes() == seq_json
+        assert (parallel.batch_dir / "batch_summary.csv").read_bytes() == seq_csv
+
+    def test_parallel_time_budget_skips_unlaunched_markets(self, tmp_path, capsys):
+        """Budget is checked per launch: two markets start, the third is skipped."""
+        with patch(
+            "packages.polymarket.simtrader.batch.runner._budget_exhausted",
+            side_effect=[None, None, 11.0],
+        ):
+            result = self._run(tmp_path, workers=2, time_budget_seconds=10.0)
+
+        statuses = [m["status"] for m in result.summary["markets"]]
+        assert statuses == ["ok", "ok", "skipped"]
+        assert result.summary["markets"][2]["error_msg"] == "time_budget_exceeded"
+        assert "skipping 1 remaining market(s)" in capsys.readouterr().err
+
+    def test_invalid_workers_raises(self, tmp_path):
+        from packages.polymarket.simtrader.batch.runner import BatchRunError
+
+        with pytest.raises(BatchRunError, match="workers must be >= 1"):
+            self._run(tmp_path, workers=0)
+
+
 # ---------------------------------------------------------------------------
 # Leaderboard aggregation stability tests
 # ---------------------------------------------------------------------------
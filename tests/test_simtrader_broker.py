@@ -27,7 +27,11 @@ from pathlib import Path
 
 import pytest
 
-from packages.polymarket.simtrader.broker.fill_engine import try_fill
+from packages.polymarket.simtrader.broker.fill_engine import (
+    has_competitive_levels,
+    iter_competitive_levels,
+    try_fill,
+)
 from packages.polymarket.simtrader.broker.latency import LatencyConfig, ZERO_LATENCY
 from packages.polymarket.simtrader.broker.rules import FillRecord, Order, OrderStatus, Side
 from packages.polymarket.simtrader.broker.sim_broker import SimBroker
@@ -290,6 +294,55 @@ class TestFillEngineWalkTheBook:
         assert because["levels_consumed"][0]["price"] == "0.42"
 
 
+class TestFillEngineSortedWalk:
+    """Level selection walks the book's sorted sides and stops at the limit."""
+
+    def test_walk_stops_at_buy_limit(self):
+        book = _initialized_book(
+            asks=[{"price": f"0.{40 + i}", "size": "10"} for i in range(20)]
+        )
+        levels = list(iter_competitive_levels(book, Side.BUY, _D("0.42")))
+        assert [p for p, _ in levels] == ["0.40", "0.41", "0.42"]
+
+    def test_walk_stops_at_sell_limit(self):
+        book = _initialized_book(
+            bids=[{"price": f"0.{40 + i}", "size": "10"} for i in range(20)]
+        )
+        levels = list(iter_competitive_levels(book, Side.SELL, _D("0.57")))
+        assert [p for p, _ in levels] == ["0.59", "0.58", "0.57"]
+
+    def test_off_grid_limits_never_admit_worse_levels(self):
+        book = _initialized_book(
+            bids=[{"price": "0.42", "size": "10"}],
+            asks=[{"price": "0.42", "size": "10"}],
+        )
+        assert list(iter_competitive_levels(book, Side.BUY, _D("0.4199999"))) == []
+        assert list(iter_competitive_levels(book, Side.SELL, _D("0.4200001"))) == []
+        assert len(list(iter_competitive_levels(book, Side.BUY, _D("0.4200001")))) == 1
+
+    def test_has_competitive_levels(self):
+        book = _initialized_book(asks=[{"price": "0.42", "size": "10"}])
+        assert has_competitive_levels(book, _make_order(side=Side.BUY, limit="0.42"))
+        assert not has_competitive_levels(book, _make_order(side=Side.BUY, limit="0.41"))
+        assert not has_competitive_levels(
+            L2Book("tok1", strict=False), _make_order(side=Side.BUY, limit="0.99")
+        )
+
+    def test_rejected_fill_keeps_because_context(self):
+        book = _initialized_book(
+            bids=[{"price": "0.38", "size": "100"}],
+            asks=[{"price": "0.45", "size": "100"}],
+        )
+        fill = try_fill(_make_order(limit="0.42"), book, eval_seq=3, ts_recv=1.0)
+        assert fill.reject_reason == "no_competitive_levels"
+        assert fill.because == {
+            "eval_seq": 3,
+            "book_best_bid": pytest.approx(0.38),
+            "book_best_ask": pytest.approx(0.45),
+            "levels_consumed": [],
+        }
+
+
 # ===========================================================================
 # SimBroker — order lifecycle
 # ===========================================================================
@@ -760,3 +813,117 @@ class TestSimBrokerCancelAllImmediate:
         assert count == 1
         assert broker.get_order(oid_active).status == OrderStatus.CANCELLED
         assert broker.get_order(oid_cancelled).status == OrderStatus.CANCELLED  # unchanged
+
+
+class TestSimBrokerDrain:
+    """drain_* hand out new history once and keep run-wide counters intact."""
+
+    def test_drain_returns_new_rows_once(self):
+        broker = SimBroker()
+        book = _initialized_book(asks=[{"price": "0.42", "size": "100"}])
+        broker.submit_order("tok1", Side.BUY, _D("0.42"), _D("10"), submit_seq=0)
+        broker.step(_book_event(seq=0, asks=[{"price": "0.42", "size": "100"}]), book)
+
+        events = broker.drain_order_events()
+        fills = broker.drain_fills()
+        assert [e["event"] for e in events] == ["submitted", "activated", "fill"]
+        assert len(fills) == 1
+        assert broker.drain_order_events() == []
+        assert broker.drain_fills() == []
+        assert broker.order_event_count == 3
+        assert broker.fill_count == 1
+
+    def test_order_events_since_is_run_relative_after_drain(self):
+        broker = SimBroker()
+        broker.submit_order("tok1", Side.BUY, _D("0.42"), _D("10"), submit_seq=0)
+        broker.drain_order_events()
+        start = broker.order_event_count
+        broker.submit_order("tok1", Side.BUY, _D("0.41"), _D("10"), submit_seq=1)
+        assert [e["seq"] for e in broker.order_events_since(start)] == [1]
+
+
+class TestSimBrokerActiveOrderIndex:
+    """step() only visits live orders but keeps submission-order semantics."""
+
+    def test_step_events_follow_submission_order_across_partitions(self):
+        broker = SimBroker(latency=LatencyConfig(submit_ticks=1, cancel_ticks=1))
+        asks = [{"price": "0.44", "size": "100"}]
+        book = _initialized_book(asks=asks)
+        broker.submit_order("tok1", Side.BUY, _D("0.40"), _D("10"), submit_seq=0, order_id="o1")
+        broker.submit_order("tok1", Side.BUY, _D("0.45"), _D("10"), submit_seq=1, order_id="o2")
+        broker.step(_book_event(seq=1, asks=[{"price": "0.50", "size": "100"}]), book)
+        broker.cancel_order("o1", cancel_seq=1)
+        start = broker.order_event_count
+
+        book.apply(_book_event(seq=2, asks=asks))
+        broker.step(_book_event(seq=2, asks=asks), book)
+
+        # o1 (submitted first) cancels before o2 activates and fills.
+        assert [(e["event"], e["order_id"]) for e in broker.order_events_since(start)] == [
+            ("cancelled", "o1"),
+            ("activated", "o2"),
+            ("fill", "o2"),
+        ]
+        assert broker.open_order_count == 0
+
+    def test_fill_filter_only_touches_stepped_asset(self):
+        broker = SimBroker()
+        asks = [{"price": "0.40", "size": "100"}]
+        broker.submit_order("tok1", Side.BUY, _D("0.45"), _D("10"), submit_seq=0, order_id="a")
+        broker.submit_order("tok2", Side.BUY, _D("0.45"), _D("10"), submit_seq=0, order_id="b")
+        book2 = _initialized_book(asks=asks, asset_id="tok2")
+
+        fills = broker.step(_book_event(seq=1, asset_id="tok2", asks=asks), book2, fill_asset_id="tok2")
+
+        assert [f.order_id for f in fills] == ["b"]
+        assert [o.order_id for o in broker.open_orders()] == ["a"]
+        assert broker.open_orders("tok2") == []
+        assert broker.get_order("a").status == OrderStatus.ACTIVE
+
+    def test_terminal_orders_leave_live_indexes(self):
+        broker = SimBroker()
+        asks = [{"price": "0.40", "size": "1000"}]
+        book = _initialized_book(asks=asks)
+        for i in range(50):
+            broker.submit_order("tok1", Side.BUY, _D("0.45"), _D("1"), submit_seq=i, order_id=f"o{i}")
+            broker.step(_book_event(seq=i, asks=asks), book)
+
+        assert broker.fill_count == 50
+        assert broker.open_order_count == 0
+        assert broker._step_candidates(51, True, None) == []
+
+    def test_fills_since_returns_only_new_tail(self):
+        broker = SimBroker()
+        asks = [{"price": "0.40", "size": "1000"}]
+        book = _initialized_book(asks=asks)
+        broker.submit_order("tok1", Side.BUY, _D("0.45"), _D("1"), submit_seq=0)
+        broker.step(_book_event(seq=0, asks=asks), book)
+        cursor = broker.fill_count
+        broker.submit_order("tok1", Side.BUY, _D("0.45"), _D("2"), submit_seq=1)
+        broker.step(_book_event(seq=1, asks=asks), book)
+
+        new_fills = broker.fills_since(cursor)
+        assert [f.fill_size for f in new_fills] == [_D("2")]
+        assert broker.fills_since(broker.fill_count) == []
+        broker.drain_fills()
+        assert broker.fills_since(0) == []
+
+    def test_restore_state_rebuilds_indexes(self):
+        broker = SimBroker(latency=LatencyConfig(submit_ticks=2, cancel_ticks=0))
+        broker.submit_order("tok1", Side.BUY, _D("0.45"), _D("5"), submit_seq=0, order_id="p")
+        broker.submit_order("tok1", Side.BUY, _D("0.30"), _D("5"), submit_seq=0, order_id="r")
+        broker.cancel_order("r", cancel_seq=3)
+
+        restored = SimBroker()
+        restored.restore_state(broker.snapshot_state())
+        asks = [{"price": "0.40", "size": "100"}]
+        book = _initialized_book(asks=asks)
+        restored.step(_book_event(seq=3, asks=asks), book)
+
+        assert [(e["event"], e["order_id"]) for e in restored.order_events] == [
+            ("activated", "p"),
+            ("fill", "p"),
+            ("activated", "r"),
+            ("cancelled", "r"),
+        ]
+        assert restored.open_order_count == 0
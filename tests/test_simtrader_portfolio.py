@@ -903,6 +903,19 @@ class TestLedgerDeterminism:
         s2 = "\n".join(json.dumps(r) for r in e2)
         assert s1 == s2
 
+    def test_iter_process_matches_process(self):
+        """Streaming merge yields the same rows as the buffered process()."""
+        snapshots, equity_curve, summary = self._run()
+        # Duplicate-seq timeline rows: process() keeps only the last one.
+        timeline = self._make_timeline()
+        timeline.insert(1, _tl_row(1, best_bid=0.10, best_ask=0.90))
+
+        ledger = PortfolioLedger(_D("1000"), fee_rate_bps=_D("200"), mark_method=MARK_BID)
+        streamed = list(ledger.iter_process(iter(self._make_events()), iter(timeline)))
+        assert [row for kind, row in streamed if kind == "ledger"] == snapshots
+        assert [row for kind, row in streamed if kind == "equity"] == equity_curve
+        assert ledger.summary("r1", final_best_bid=0.43, final_best_ask=0.45) == summary
+
 
 # ===========================================================================
 # CLI — end-to-end portfolio artifacts
@@ -419,6 +419,69 @@ class TestL2BookSingleDelta:
         assert book.best_bid is None
 
 
+# ---------------------------------------------------------------------------
+# L2Book: integer-tick sorted levels
+# ---------------------------------------------------------------------------
+
+
+class TestL2BookTickLevels:
+    def _deep_book(self) -> L2Book:
+        book = L2Book("tok1")
+        book.apply(
+            _book_event(
+                bids=[
+                    {"price": "0.52", "size": "10"},
+                    {"price": "0.55", "size": "20"},
+                    {"price": "0.53", "size": "30"},
+                ],
+                asks=[
+                    {"price": "0.60", "size": "40"},
+                    {"price": "0.57", "size": "50"},
+                    {"price": "0.58", "size": "60"},
+                ],
+            )
+        )
+        return book
+
+    def test_top_levels_are_sorted_best_first(self):
+        book = self._deep_book()
+        assert [lvl["price"] for lvl in book.top_bids(5)] == [0.55, 0.53, 0.52]
+        assert [lvl["price"] for lvl in book.top_asks(2)] == [0.57, 0.58]
+        assert book.top_asks(1) == [{"price": 0.57, "size": 50.0}]
+
+    def test_equivalent_price_strings_share_one_level(self):
+        book = self._deep_book()
+        book.apply_single_delta({"side": "BUY", "price": "0.550", "size": "0"})
+        assert book.best_bid == pytest.approx(0.53)
+        assert len(book.bids) == 2
+
+    def test_invalid_price_is_skipped(self):
+        book = self._deep_book()
+        book.apply_single_delta({"side": "SELL", "price": "abc", "size": "5"})
+        assert len(book.asks) == 3
+        assert book.best_ask == pytest.approx(0.57)
+
+    def test_items_yield_original_price_strings_best_first(self):
+        book = self._deep_book()
+        assert [p for p, _ in book.asks.items()] == ["0.57", "0.58", "0.60"]
+        assert [p for p, _ in book.bids.items()] == ["0.55", "0.53", "0.52"]
+
+    def test_snapshot_restore_round_trip(self):
+        book = self._deep_book()
+        book.apply_single_delta({"side": "BUY", "price": "0.56", "size": "7"})
+        state = book.snapshot_state()
+        assert state["bids"]["0.56"] == "7"
+        assert json.loads(json.dumps(state)) == state
+
+        restored = L2Book("other")
+        restored.restore_state(state)
+        assert restored.asset_id == "tok1"
+        assert restored.best_bid == pytest.approx(0.56)
+        assert restored.best_ask == pytest.approx(0.57)
+        assert restored.top_bids(10) == book.top_bids(10)
+        assert restored.snapshot_state() == state
+
+
 # ---------------------------------------------------------------------------
 # ReplayRunner: modern batched price_changes[] format
 # ---------------------------------------------------------------------------
@@ -521,3 +584,41 @@ class TestReplayRunnerBatchedPriceChange:
         # The unknown-tok book is lazily created; strict=False means no raise.
         yes_rows = [r for r in rows if r["asset_id"] == self._YES]
         assert yes_rows[-1]["best_bid"] == pytest.approx(0.45)
+
+
+# ---------------------------------------------------------------------------
+# ReplayRunner: streaming mode
+# ---------------------------------------------------------------------------
+
+
+class TestReplayRunnerStream:
+    def _events(self) -> list[dict]:
+        return [
+            _book_event(seq=0),
+            _price_change(1, changes=[{"side": "BUY", "price": "0.56", "size": "75"}]),
+            {"seq": 2, "ts_recv": 1002.0, "event_type": "last_trade_price", "asset_id": "tok1"},
+            _price_change(3, changes=[{"side": "SELL", "price": "0.57", "size": "0"}]),
+        ]
+
+    @pytest.mark.parametrize("output_format", ["jsonl", "csv"])
+    def test_stream_output_matches_buffered(self, tmp_path, output_format):
+        events_path = tmp_path / "events.jsonl"
+        _write_events(events_path, self._events())
+        outputs = []
+        for stream in (False, True):
+            run_dir = tmp_path / f"stream_{stream}"
+            out = ReplayRunner(
+                events_path, run_dir, output_format=output_format, stream=stream
+            ).run()
+            outputs.append((out.read_bytes(), (run_dir / "meta.json").read_bytes()))
+        assert outputs[0] == outputs[1]
+
+    def test_stream_warns_on_out_of_order_seq(self, tmp_path):
+        events_path = tmp_path / "events.jsonl"
+        events = self._events()
+        _write_events(events_path, [events[0], events[3], events[1]])
+        ReplayRunner(events_path, tmp_path / "run", strict=False, stream=True).run()
+        meta = json.loads((tmp_path / "run" / "meta.json").read_text())
+        assert meta["run_quality"] == "warnings"
+        assert any("seq went backwards" in w for w in meta["warnings"])
+
@@ -10,6 +10,7 @@ Test categories
 from __future__ import annotations
 
 import json
+import re
 from decimal import Decimal
 from pathlib import Path
 from types import SimpleNamespace
@@ -2368,3 +2369,86 @@ def test_cli_sweep_fee_label_category_aware(
     err = capsys.readouterr().err
     assert "category-aware (crypto/taker)" in err
     assert "default (200)" not in err
+
+
+# ---------------------------------------------------------------------------
+# Streaming mode
+# ---------------------------------------------------------------------------
+
+_STREAM_ARTIFACTS = (
+    "best_bid_ask.jsonl",
+    "orders.jsonl",
+    "fills.jsonl",
+    "ledger.jsonl",
+    "equity_curve.jsonl",
+    "decisions.jsonl",
+    "summary.json",
+    "meta.json",
+)
+
+
+@pytest.mark.parametrize(
+    "trades",
+    [
+        [
+            {"seq": 1, "side": "BUY", "limit_price": "0.50", "size": "50", "trade_id": "t1"},
+            {"seq": 3, "side": "BUY", "limit_price": "0.50", "size": "50", "trade_id": "t2"},
+            {"seq": 4, "side": "SELL", "limit_price": "0.40", "size": "30", "trade_id": "t3"},
+        ],
+        [],
+    ],
+    ids=["trades", "no_trades"],
+)
+def test_stream_mode_artifacts_match_buffered_run(tmp_path: Path, trades: list) -> None:
+    """stream=True writes byte-identical artifacts to the default buffered run."""
+    from packages.polymarket.simtrader.strategy.runner import StrategyRunner
+    from packages.polymarket.simtrader.strategies.copy_wallet_replay import CopyWalletReplay
+
+    tape_path = tmp_path / "events.jsonl"
+    trades_path = tmp_path / "trades.jsonl"
+    _write_tape(tape_path)
+    _write_trades(trades_path, trades)
+
+    run_dirs = {}
+    for stream in (False, True):
+        run_dir = tmp_path / ("stream" if stream else "buffered") / "run"
+        StrategyRunner(
+            events_path=tape_path,
+            run_dir=run_dir,
+            strategy=CopyWalletReplay(trades_path=trades_path, signal_delay_ticks=0),
+            starting_cash=Decimal("1000"),
+            fee_rate_bps=Decimal("200"),
+            stream=stream,
+        ).run()
+        run_dirs[stream] = run_dir
+
+    def _artifact(run_dir: Path, fname: str) -> str:
+        # Broker order ids are random; everything else must match exactly.
+        text = (run_dir / fname).read_text(encoding="utf-8")
+        return re.sub(r'"[0-9a-f]{8}"', '"*"', text)
+
+    for fname in _STREAM_ARTIFACTS:
+        assert _artifact(run_dirs[True], fname) == _artifact(run_dirs[False], fname), fname
+    buffered_manifest = _read_manifest(run_dirs[False])
+    stream_manifest = _read_manifest(run_dirs[True])
+    for key in ("fills_count", "decisions_count", "timeline_rows", "net_profit"):
+        assert stream_manifest[key] == buffered_manifest[key]
+
+
+def test_stream_mode_empty_tape_raises(tmp_path: Path) -> None:
+    from packages.polymarket.simtrader.strategy.runner import StrategyRunner
+    from packages.polymarket.simtrader.strategies.copy_wallet_replay import CopyWalletReplay
+
+    tape_path = tmp_path / "events.jsonl"
+    tape_path.write_text("\n", encoding="utf-8")
+    trades_path = tmp_path / "trades.jsonl"
+    _write_trades(trades_path, [])
+    runner = StrategyRunner(
+        events_path=tape_path,
+        run_dir=tmp_path / "run",
+        strategy=CopyWalletReplay(trades_path=trades_path),
+        asset_id=ASSET_ID,
+        stream=True,
+    )
+    with pytest.raises(ValueError, match="No events found"):
+        runner.run()
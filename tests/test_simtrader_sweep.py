@@ -399,3 +399,105 @@ def test_sweep_summary_activity_and_rejection_aggregates_offline(
     }
     for row in result.summary["scenarios"]:
         assert expected_scenario_fields.issubset(set(row))
+
+
+def _sweep_params(tape_path: Path, trades_path: Path, artifacts_root: Path, **kwargs):
+    from packages.polymarket.simtrader.sweeps.runner import SweepRunParams
+
+    return SweepRunParams(
+        events_path=tape_path,
+        strategy_name="copy_wallet_replay",
+        strategy_config={"trades_path": str(trades_path), "signal_delay_ticks": 0},
+        starting_cash=Decimal("1000"),
+        fee_rate_bps=Decimal("100"),
+        artifacts_root=artifacts_root,
+        **kwargs,
+    )
+
+
+def test_sweep_workers_match_sequential_results_and_order(tmp_path: Path) -> None:
+    from packages.polymarket.simtrader.sweeps.runner import run_sweep
+
+    tape_path = tmp_path / "events.jsonl"
+    trades_path = tmp_path / "trades.jsonl"
+    _write_tape(tape_path)
+    _write_trades(trades_path)
+
+    sweep_config = {
+        "scenarios": [
+            {"name": "fees_high", "overrides": {"fee_rate_bps": 300}},
+            {"name": "base", "overrides": {}},
+            {
+                "name": "delay_more",
+                "overrides": {"strategy_config": {"signal_delay_ticks": 2}},
+            },
+            {"name": "mid", "overrides": {"mark_method": "midpoint"}},
+        ]
+    }
+
+    sequential = run_sweep(
+        _sweep_params(tape_path, trades_path, tmp_path / "seq", sweep_id="s"),
+        sweep_config=sweep_config,
+    )
+    parallel = run_sweep(
+        _sweep_params(tape_path, trades_path, tmp_path / "par", sweep_id="s", workers=3),
+        sweep_config=sweep_config,
+    )
+
+    def _comparable(summary: dict) -> str:
+        text = json.dumps(summary, sort_keys=True)
+        return text.replace((tmp_path / "seq").as_posix(), "<root>").replace(
+            (tmp_path / "par").as_posix(), "<root>"
+        )
+
+    assert parallel.summary["scenario_order"] == [
+        "base", "delay-more", "fees-high", "mid"
+    ]
+    assert _comparable(parallel.summary) == _comparable(sequential.summary)
+    assert parallel.manifest["scenario_order"] == sequential.manifest["scenario_order"]
+    # The tape is decoded once into the shared cache that workers read from.
+    assert list((tmp_path / "par" / "tape_cache").glob("*.ctape"))
+
+
+def test_sweep_failed_scenario_keeps_partial_results(tmp_path: Path) -> None:
+    import pytest
+
+    from packages.polymarket.simtrader.sweeps.runner import (
+        SweepScenarioError,
+        run_sweep,
+    )
+
+    tape_path = tmp_path / "events.jsonl"
+    trades_path = tmp_path / "trades.jsonl"
+    _write_tape(tape_path)
+    _write_trades(trades_path)
+
+    sweep_config = {
+        "scenarios": [
+            {"name": "base", "overrides": {}},
+            {
+                "name": "broken",
+                "overrides": {
+                    "strategy_config": {"trades_path": str(tmp_path / "missing.jsonl")}
+                },
+            },
+            {"name": "fees_high", "overrides": {"fee_rate_bps": 300}},
+        ]
+    }
+
+    with pytest.raises(SweepScenarioError) as excinfo:
+        run_sweep(
+            _sweep_params(
+                tape_path, trades_path, tmp_path / "artifacts",
+                sweep_id="partial", workers=2,
+            ),
+            sweep_config=sweep_config,
+        )
+
+    err = excinfo.value
+    assert [row["scenario_id"] for row in err.failures] == ["broken"]
+    summary_path = err.result.sweep_dir / "sweep_summary.json"
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    assert summary["scenario_order"] == ["base", "fees-high"]
+    assert [row["scenario_id"] for row in summary["failed_scenarios"]] == ["broken"]
+    assert (err.result.sweep_dir / "sweep_manifest.json").exists()
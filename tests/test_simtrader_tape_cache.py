@@ -0,0 +1,120 @@
+"""Tests for the parse-once SimTrader tape cache."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from packages.polymarket.simtrader.tape import cache as tape_cache
+from packages.polymarket.simtrader.tape.columnar import is_columnar_tape
+from packages.polymarket.simtrader.tape.cache import (
+    clear_memory_cache,
+    load_tape,
+    sha256_file,
+    warm_tape_cache,
+)
+
+
+EVENTS = [
+    {"seq": 1, "event_type": "price_change", "asset_id": "a", "changes": []},
+    {"seq": 0, "event_type": "book", "asset_id": "a", "bids": [], "asks": []},
+]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_memory_cache()
+    yield
+    clear_memory_cache()
+
+
+def _write_tape(path: Path) -> None:
+    lines = [json.dumps(EVENTS[0]), "", "{not json", json.dumps(EVENTS[1])]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _fail_parse(path):
+    raise AssertionError("tape should have been served from the cache")
+
+
+class TestLoadTape:
+    def test_decodes_in_file_order_and_reports_malformed_lines(self, tmp_path):
+        tape = tmp_path / "events.jsonl"
+        _write_tape(tape)
+
+        parsed = load_tape(tape)
+
+        assert parsed.events == EVENTS
+        assert [lineno for lineno, _ in parsed.malformed] == [3]
+        assert parsed.sha256 == sha256_file(tape)
+
+    def test_memory_hit_returns_independent_copies(self, tmp_path, monkeypatch):
+        tape = tmp_path / "events.jsonl"
+        _write_tape(tape)
+
+        first = load_tape(tape)
+        first.events.sort(key=lambda e: e["seq"])
+        first.events[0]["mutated"] = True
+
+        monkeypatch.setattr(tape_cache, "_parse_jsonl", _fail_parse)
+        second = load_tape(tape)
+        assert second.events == EVENTS
+
+    def test_disk_entry_is_reused_by_a_fresh_process_state(self, tmp_path, monkeypatch):
+        tape = tmp_path / "events.jsonl"
+        cache_dir = tmp_path / "tape_cache"
+        _write_tape(tape)
+
+        digest = warm_tape_cache(tape, cache_dir)
+        (entry,) = cache_dir.glob(f"{digest}.*")
+        # Header + arrays, never pickle: the entry is a columnar tape.
+        assert is_columnar_tape(entry)
+
+        # Simulates a spawned worker: nothing in memory, only the disk entry.
+        clear_memory_cache()
+        monkeypatch.setattr(tape_cache, "_parse_jsonl", _fail_parse)
+        parsed = load_tape(tape, cache_dir=cache_dir)
+        assert parsed.events == EVENTS
+        assert [lineno for lineno, _ in parsed.malformed] == [3]
+
+    def test_modified_tape_is_reparsed(self, tmp_path):
+        tape = tmp_path / "events.jsonl"
+        cache_dir = tmp_path / "tape_cache"
+        _write_tape(tape)
+        load_tape(tape, cache_dir=cache_dir)
+
+        tape.write_text(json.dumps(EVENTS[1]) + "\n", encoding="utf-8")
+        assert load_tape(tape, cache_dir=cache_dir).events == [EVENTS[1]]
+
+    def test_corrupt_disk_entry_falls_back_to_parsing(self, tmp_path):
+        tape = tmp_path / "events.jsonl"
+        cache_dir = tmp_path / "tape_cache"
+        _write_tape(tape)
+        digest = warm_tape_cache(tape, cache_dir)
+        for entry in cache_dir.glob(f"{digest}.*.ctape"):
+            entry.write_bytes(b"garbage")
+
+        clear_memory_cache()
+        assert load_tape(tape, cache_dir=cache_dir).events == EVENTS
+
+    def test_disk_cache_is_bounded_and_drops_legacy_pickles(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(tape_cache, "_DISK_CACHE_MAX_ENTRIES", 2)
+        cache_dir = tmp_path / "tape_cache"
+        cache_dir.mkdir()
+        legacy = cache_dir / ("0" * 64 + ".v1.pickle")
+        legacy.write_bytes(b"legacy")
+
+        digests = []
+        for i in range(4):
+            tape = tmp_path / f"events_{i}.jsonl"
+            tape.write_text(json.dumps(dict(EVENTS[1], seq=i)) + "\n", encoding="utf-8")
+            digests.append(warm_tape_cache(tape, cache_dir))
+            # Coarse filesystem clocks can tie; pin a strictly increasing mtime.
+            (entry,) = cache_dir.glob(f"{digests[-1]}.*")
+            os.utime(entry, ns=(i * 10**9, i * 10**9))
+
+        assert not legacy.exists()
+        assert sorted(p.name.split(".")[0] for p in cache_dir.iterdir()) == sorted(digests[-2:])
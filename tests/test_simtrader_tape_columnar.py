@@ -0,0 +1,261 @@
+"""Tests for the columnar (.ctape) tape format."""
+
+from __future__ import annotations
+
+import json
+import re
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from packages.polymarket.simtrader.replay.runner import ReplayRunner
+from packages.polymarket.simtrader.replay.stream import iter_tape_events, tape_asset_ids
+from packages.polymarket.simtrader.tape.columnar import (
+    ColumnarTape,
+    convert_jsonl_tape,
+    default_columnar_path,
+    is_columnar_tape,
+    resolve_tape_events_path,
+    write_columnar_tape,
+)
+
+ASSET = "tok-yes"
+
+EVENTS = [
+    {
+        "parser_version": 1,
+        "seq": 0,
+        "ts_recv": 1000.0,
+        "event_type": "book",
+        "asset_id": ASSET,
+        "market": "0xabc",
+        "bids": [{"price": "0.40", "size": "500"}, {"price": "0.39", "size": "10.50"}],
+        "asks": [{"price": "0.45", "size": "300"}],
+    },
+    {
+        "parser_version": 1,
+        "seq": 1,
+        "ts_recv": 1001.5,
+        "event_type": "price_change",
+        "asset_id": ASSET,
+        "changes": [{"side": "SELL", "price": "0.45", "size": "200"}],
+    },
+    {
+        "parser_version": 1,
+        "seq": 2,
+        "ts_recv": 1002.0,
+        "event_type": "price_change",
+        "price_changes": [
+            {"asset_id": ASSET, "side": "BUY", "price": "0.41", "size": "100",
+             "hash": "h1", "best_bid": "0.41"},
+            {"asset_id": "tok-no", "price": "0.55"},
+        ],
+    },
+    {
+        "parser_version": 1,
+        "seq": 3,
+        "ts_recv": 1003.0,
+        "event_type": "book",
+        "asset_id": ASSET,
+        "bids": [],
+        "asks": [{"price": "0.46", "size": "150", "extra": {"nested": [1, 2]}}],
+    },
+    {"parser_version": 1, "seq": 4, "ts_recv": 1004.0, "event_type": "last_trade_price",
+     "asset_id": ASSET, "price": "0.45", "size": "5", "fee_rate_bps": 0},
+]
+
+
+def _write_jsonl(path: Path, events: list) -> None:
+    path.write_text("".join(json.dumps(e) + "\n" for e in events), encoding="utf-8")
+
+
+class TestColumnarRoundTrip:
+    def test_events_round_trip_exactly(self, tmp_path):
+        src = tmp_path / "events.jsonl"
+        _write_jsonl(src, EVENTS)
+        result = convert_jsonl_tape(src)
+
+        assert result.out_path == default_columnar_path(src)
+        assert result.events == len(EVENTS)
+        assert result.raw_events == 0
+        assert is_columnar_tape(result.out_path)
+        assert not is_columnar_tape(src)
+        with ColumnarTape(result.out_path) as tape:
+            assert list(tape.iter_events()) == EVENTS
+
+    def test_unexpected_shapes_fall_back_to_raw_json(self, tmp_path):
+        odd = [
+            {"seq": 0, "event_type": "book"},  # missing ts_recv
+            {"seq": "1", "ts_recv": 1.0, "event_type": "book"},  # string seq
+            {"seq": 2, "ts_recv": 2, "event_type": "book"},  # int ts_recv
+            {"seq": 3, "ts_recv": 3.0, "event_type": "book", "bids": "nope"},
+            [1, 2, 3],
+            EVENTS[1],
+        ]
+        out = tmp_path / "odd.ctape"
+        n_events, _, raw_events = write_columnar_tape(odd, out)
+
+        assert (n_events, raw_events) == (6, 5)
+        assert list(iter_tape_events(out)) == odd
+
+    def test_malformed_lines_are_dropped_and_counted(self, tmp_path):
+        src = tmp_path / "events.jsonl"
+        src.write_text(json.dumps(EVENTS[0]) + "\n{broken\n\n", encoding="utf-8")
+        result = convert_jsonl_tape(src)
+
+        assert result.malformed_lines == 1
+        with ColumnarTape(result.out_path) as tape:
+            assert tape.header["malformed_lines"] == 1
+            assert list(tape.iter_events()) == [EVENTS[0]]
+
+    def test_columns_and_asset_ids_without_decoding(self, tmp_path):
+        src = tmp_path / "events.jsonl"
+        _write_jsonl(src, EVENTS)
+        out = convert_jsonl_tape(src).out_path
+
+        with ColumnarTape(out) as tape:
+            assert tape.column("seq").tolist() == [0, 1, 2, 3, 4]
+            assert tape.column("ts_recv").tolist()[1] == 1001.5
+            prices = [tape.strings[i] for i in tape.column("l.price").tolist()]
+            assert prices[:3] == ["0.40", "0.39", "0.45"]
+        assert tape_asset_ids(out) == {ASSET, "tok-no"}
+
+    def test_is_smaller_than_jsonl(self, tmp_path):
+        src = tmp_path / "events.jsonl"
+        _write_jsonl(src, [dict(EVENTS[1], seq=i) for i in range(2000)])
+        result = convert_jsonl_tape(src)
+        assert result.output_bytes * 2 < result.source_bytes
+
+
+class TestColumnarReplay:
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_replay_runner_output_matches_jsonl(self, tmp_path, stream):
+        src = tmp_path / "events.jsonl"
+        _write_jsonl(src, EVENTS)
+        ctape = convert_jsonl_tape(src).out_path
+
+        out_json = ReplayRunner(src, tmp_path / "json", strict=False, stream=stream).run()
+        out_col = ReplayRunner(ctape, tmp_path / "col", strict=False, stream=stream).run()
+        assert out_json.read_bytes() == out_col.read_bytes()
+
+    def test_strategy_run_matches_jsonl(self, tmp_path):
+        from packages.polymarket.simtrader.strategy.facade import (
+            StrategyRunParams,
+            run_strategy,
+        )
+
+        src = tmp_path / "events.jsonl"
+        _write_jsonl(src, EVENTS)
+        ctape = convert_jsonl_tape(src).out_path
+        trades = tmp_path / "trades.jsonl"
+        trades.write_text(
+            json.dumps({"seq": 1, "side": "BUY", "limit_price": "0.50",
+                        "size": "10", "trade_id": "t1"}) + "\n",
+            encoding="utf-8",
+        )
+
+        def _run(path: Path, name: str) -> Path:
+            return run_strategy(
+                StrategyRunParams(
+                    events_path=path,
+                    run_dir=tmp_path / name / "run",
+                    strategy_name="copy_wallet_replay",
+                    strategy_config={"trades_path": str(trades)},
+                    asset_id=ASSET,
+                    starting_cash=Decimal("1000"),
+                )
+            ).run_dir
+
+        json_dir = _run(src, "json")
+        col_dir = _run(ctape, "col")
+        for name in ("best_bid_ask.jsonl", "fills.jsonl", "ledger.jsonl",
+                     "equity_curve.jsonl", "decisions.jsonl", "summary.json"):
+            # Broker order ids are random; everything else must match exactly.
+            texts = [
+                re.sub(r'"[0-9a-f]{8}"', '"*"', (d / name).read_text(encoding="utf-8"))
+                for d in (json_dir, col_dir)
+            ]
+            assert texts[0] == texts[1], name
+
+
+def _ctape_only_dir(root: Path, name: str, events: list) -> Path:
+    tape_dir = root / name
+    tape_dir.mkdir()
+    _write_jsonl(tape_dir / "events.jsonl", events)
+    convert_jsonl_tape(tape_dir / "events.jsonl")
+    (tape_dir / "events.jsonl").unlink()
+    return tape_dir
+
+
+class TestColumnarTapeTools:
+    def test_resolve_tape_events_path_prefers_jsonl(self, tmp_path):
+        assert resolve_tape_events_path(tmp_path) is None
+        (tmp_path / "events.ctape").write_bytes(b"")
+        assert resolve_tape_events_path(tmp_path) == tmp_path / "events.ctape"
+        (tmp_path / "events.jsonl").write_text("", encoding="utf-8")
+        assert resolve_tape_events_path(tmp_path) == tmp_path / "events.jsonl"
+
+    def test_book_asset_ids_match_event_scan(self, tmp_path):
+        events = [
+            {"seq": 0, "event_type": "price_change", "asset_id": "tok-ignored",
+             "changes": [{"side": "BUY", "price": "0.1", "size": "1"}], "ts_recv": 1.0},
+            {"seq": 1, "event_type": "book"},  # raw fallback, no asset id
+            {"seq": 2, "event_type": "book", "asset_id": "tok-raw"},  # raw fallback
+        ] + EVENTS
+        out = tmp_path / "events.ctape"
+        write_columnar_tape(events, out)
+
+        with ColumnarTape(out) as tape:
+            assert tape.book_asset_ids() == ["tok-raw", ASSET, "tok-no"]
+            assert tape.book_asset_ids(limit=2) == ["tok-raw", ASSET]
+
+    def test_manifest_and_gate2_scan_read_ctape_only_dirs(self, tmp_path):
+        from tools.cli.scan_gate2_candidates import scan_tapes
+        from tools.cli.tape_manifest import _read_asset_ids, scan_one_tape
+
+        two_sided = [
+            EVENTS[0],
+            dict(EVENTS[0], seq=1, asset_id="tok-no", asks=[{"price": "0.50", "size": "100"}]),
+            EVENTS[2],
+        ]
+        json_root = tmp_path / "json"
+        col_root = tmp_path / "col"
+        json_root.mkdir()
+        col_root.mkdir()
+        (json_root / "tape").mkdir()
+        _write_jsonl(json_root / "tape" / "events.jsonl", two_sided)
+        tape_dir = _ctape_only_dir(col_root, "tape", two_sided)
+
+        assert _read_asset_ids(tape_dir) == (ASSET, "tok-no")
+        record = scan_one_tape(tape_dir)
+        assert record.reject_reason != "no events.jsonl found in tape directory"
+
+        json_results = scan_tapes(json_root)
+        col_results = scan_tapes(col_root)
+        assert len(col_results) == len(json_results) == 1
+        assert col_results[0].total_ticks == json_results[0].total_ticks
+        assert col_results[0].best_edge == json_results[0].best_edge
+
+    def test_integrity_audit_reads_ctape(self, tmp_path):
+        from tools.gates import tape_integrity_audit as audit
+
+        events = EVENTS + [{"seq": 5, "event_type": "book", "ts_recv": 1005}]  # raw fallback
+        tape_dir = _ctape_only_dir(tmp_path, "tape", events)
+        ctape = audit._find_events_file(tape_dir, "shadow")
+
+        assert ctape == tape_dir / "events.ctape"
+        assert audit._load_tape_events(ctape) == (events, [])
+        assert audit._load_ts_recv(ctape) == audit._extract_ts_recv(events)
+
+
+def test_tape_convert_cli(tmp_path, capsys):
+    from tools.cli.simtrader import main as simtrader_main
+
+    src = tmp_path / "events.jsonl"
+    _write_jsonl(src, EVENTS)
+    out = tmp_path / "converted.ctape"
+
+    assert simtrader_main(["tape-convert", "--tape", str(src), "--out", str(out)]) == 0
+    assert "Columnar tape written" in capsys.readouterr().out
+    assert list(iter_tape_events(out)) == EVENTS
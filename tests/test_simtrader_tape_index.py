@@ -0,0 +1,304 @@
+"""Tests for the persistent tape index sidecar and windowed replay."""
+
+from __future__ import annotations
+
+import json
+import random
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from packages.polymarket.simtrader.orderbook.l2book import L2Book
+from packages.polymarket.simtrader.replay.runner import ReplayRunner
+from packages.polymarket.simtrader.tape import index as tape_index
+from packages.polymarket.simtrader.tape.columnar import convert_jsonl_tape
+from packages.polymarket.simtrader.tape.index import (
+    TapeIndex,
+    apply_event_to_books,
+    default_index_path,
+    load_tape_index,
+)
+
+YES = "tok-yes"
+NO = "tok-no"
+
+
+def _tape_events(n: int, seed: int = 3) -> list[dict]:
+    """Two-asset tape: snapshots, legacy and batched deltas, trades; 1 event/s."""
+    rng = random.Random(seed)
+    events: list[dict] = [
+        {"seq": 0, "ts_recv": 1000.0, "event_type": "book", "asset_id": YES,
+         "bids": [{"price": "0.40", "size": "100"}],
+         "asks": [{"price": "0.45", "size": "100"}]},
+        {"seq": 1, "ts_recv": 1001.0, "event_type": "book", "asset_id": NO,
+         "bids": [{"price": "0.54", "size": "100"}],
+         "asks": [{"price": "0.58", "size": "100"}]},
+    ]
+    for seq in range(2, n):
+        ts = 1000.0 + seq
+        roll = rng.random()
+        if roll < 0.4:
+            side = rng.choice(("BUY", "SELL"))
+            price = rng.choice(("0.38", "0.39", "0.40")) if side == "BUY" else rng.choice(
+                ("0.45", "0.46", "0.47")
+            )
+            events.append(
+                {"seq": seq, "ts_recv": ts, "event_type": "price_change", "asset_id": YES,
+                 "changes": [{"side": side, "price": price,
+                              "size": str(rng.choice((0, 5, 50, 120)))}]}
+            )
+        elif roll < 0.8:
+            events.append(
+                {"seq": seq, "ts_recv": ts, "event_type": "price_change",
+                 "price_changes": [
+                     {"asset_id": NO, "side": "BUY", "price": rng.choice(("0.53", "0.54")),
+                      "size": str(rng.choice((0, 10, 80)))},
+                     {"asset_id": YES, "side": "SELL", "price": "0.44",
+                      "size": str(rng.choice((0, 25)))},
+                 ]}
+            )
+        else:
+            events.append(
+                {"seq": seq, "ts_recv": ts, "event_type": "last_trade_price",
+                 "asset_id": YES, "price": str(rng.choice(("0.41", "0.44")))}
+            )
+    return events
+
+
+def _write_jsonl(path: Path, events: list[dict], extra_lines: tuple[str, ...] = ()) -> Path:
+    lines = [json.dumps(e) for e in events] + list(extra_lines)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture()
+def small_checkpoints(monkeypatch):
+    monkeypatch.setattr(tape_index, "DEFAULT_CHECKPOINT_EVERY", 50)
+
+
+class TestTapeIndex:
+    def test_offsets_and_seq_order(self, tmp_path):
+        events = _tape_events(30)
+        shuffled = events[:2] + list(reversed(events[2:]))
+        path = _write_jsonl(tmp_path / "events.jsonl", shuffled, ("{not json",))
+
+        index = TapeIndex.build(path, checkpoint_every=10)
+        assert list(index.seqs) == list(range(30))
+        assert index.malformed and index.malformed[0][0] == 31
+        with open(path, "rb") as fh:
+            assert [index.read_event(fh, i) for i in range(len(index))] == events
+        assert set(index.asset_ids) == {YES, NO}
+        assert index.window(1005.0, 1009.5) == (5, 10)
+        assert index.cursor_for_timestamp(1005.0) == 6
+
+    def test_checkpoints_match_full_replay(self, tmp_path):
+        events = _tape_events(120)
+        path = _write_jsonl(tmp_path / "events.jsonl", events)
+        index = TapeIndex.build(path, checkpoint_every=25)
+
+        assert [cp.cursor for cp in index.checkpoints] == [25, 50, 75, 100]
+        books = {aid: L2Book(aid, strict=False) for aid in (YES, NO)}
+        for cursor, event in enumerate(events, start=1):
+            apply_event_to_books(event, books)
+            checkpoint = index.checkpoint_at_or_before(cursor)
+            if checkpoint is not None and checkpoint.cursor == cursor:
+                restored = {aid: L2Book(aid, strict=True) for aid in (YES, NO)}
+                checkpoint.restore_into(restored)
+                for aid in (YES, NO):
+                    assert restored[aid].strict is True
+                    assert restored[aid].snapshot_state() == {
+                        **books[aid].snapshot_state(), "strict": True
+                    }
+                assert checkpoint.seq == event["seq"]
+        assert index.checkpoint_at_or_before(24) is None
+
+    def test_sidecar_reused_until_tape_changes(self, tmp_path, monkeypatch):
+        path = _write_jsonl(tmp_path / "events.jsonl", _tape_events(40))
+        first = load_tape_index(path, checkpoint_every=10)
+        assert default_index_path(path).exists()
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("index rebuilt instead of loaded from sidecar")
+
+        monkeypatch.setattr(TapeIndex, "build", classmethod(_fail))
+        again = load_tape_index(path, checkpoint_every=10)
+        assert list(again.offsets) == list(first.offsets)
+        assert again.checkpoints == first.checkpoints
+        monkeypatch.undo()
+
+        _write_jsonl(path, _tape_events(45))
+        changed = load_tape_index(path, checkpoint_every=10)
+        assert len(changed) == 45
+        assert changed.sha256 != first.sha256
+
+    def test_sidecar_rebuilt_when_mtime_or_params_change(self, tmp_path, monkeypatch):
+        import os
+
+        path = _write_jsonl(tmp_path / "events.jsonl", _tape_events(40))
+        load_tape_index(path, checkpoint_every=10)
+        builds = []
+        real_build = TapeIndex.build.__func__
+
+        def _counting_build(cls, *args, **kwargs):
+            builds.append(1)
+            return real_build(cls, *args, **kwargs)
+
+        monkeypatch.setattr(TapeIndex, "build", classmethod(_counting_build))
+        load_tape_index(path, checkpoint_every=10)
+        assert builds == []
+
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        load_tape_index(path, checkpoint_every=10)
+        assert len(builds) == 1
+        load_tape_index(path, checkpoint_every=20)
+        assert len(builds) == 2
+
+    def test_sidecar_stores_checkpoints_as_columns(self, tmp_path, monkeypatch):
+        events = [{k: v for k, v in e.items() if k != "seq"} for e in _tape_events(40)]
+        path = _write_jsonl(tmp_path / "events.jsonl", events)
+        first = load_tape_index(path, checkpoint_every=10)
+        assert [cp.seq for cp in first.checkpoints] == [None, None, None]
+
+        raw = default_index_path(path).read_bytes()
+        preamble = tape_index._INDEX_PREAMBLE
+        start = len(tape_index._INDEX_MAGIC)
+        _, header_len = preamble.unpack(raw[start:start + preamble.size])
+        header = json.loads(raw[start + preamble.size:start + preamble.size + header_len])
+        assert "checkpoints" not in header
+        assert header["n_checkpoints"] == 3
+
+        monkeypatch.setattr(TapeIndex, "build", classmethod(lambda *a, **k: None))
+        again = load_tape_index(path, checkpoint_every=10)
+        assert again.checkpoints == first.checkpoints
+
+    def test_foreign_or_corrupt_sidecar_is_never_executed(self, tmp_path):
+        import pickle
+
+        path = _write_jsonl(tmp_path / "events.jsonl", _tape_events(40))
+        sidecar = default_index_path(path)
+        marker = tmp_path / "pwned"
+
+        class _Payload:
+            def __reduce__(self):
+                return (Path.touch, (marker,))
+
+        sidecar.write_bytes(pickle.dumps(_Payload()))
+        index = load_tape_index(path, checkpoint_every=10)
+        assert len(index) == 40
+        assert not marker.exists()
+        assert sidecar.read_bytes().startswith(tape_index._INDEX_MAGIC)
+
+        sidecar.write_bytes(sidecar.read_bytes()[:-8])
+        assert list(load_tape_index(path, checkpoint_every=10).offsets) == list(index.offsets)
+
+
+@pytest.mark.usefixtures("small_checkpoints")
+class TestWindowedReplay:
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_replay_window_matches_full_replay_rows(self, tmp_path, stream):
+        path = _write_jsonl(tmp_path / "events.jsonl", _tape_events(400))
+        full = ReplayRunner(path, tmp_path / "full", strict=False).run()
+        windowed = ReplayRunner(
+            path, tmp_path / "win", strict=False, stream=stream,
+            start_ts=1234.0, end_ts=1321.0,
+        ).run()
+
+        expected = [
+            line for line in full.read_text(encoding="utf-8").splitlines()
+            if 1234.0 <= json.loads(line)["ts_recv"] <= 1321.0
+        ]
+        assert windowed.read_text(encoding="utf-8").splitlines() == expected
+        meta = json.loads((tmp_path / "win" / "meta.json").read_text(encoding="utf-8"))
+        # Books start from the checkpoint at cursor 200, not from event 0.
+        assert meta["window"]["warmup_events"] == 34
+        assert meta["total_events"] == 88
+
+    def test_columnar_window_matches_jsonl_window(self, tmp_path):
+        path = _write_jsonl(tmp_path / "events.jsonl", _tape_events(300))
+        ctape = convert_jsonl_tape(path).out_path
+        kwargs = {"strict": False, "start_ts": 1100.5, "end_ts": 1250.0}
+        out_json = ReplayRunner(path, tmp_path / "json", **kwargs).run()
+        out_col = ReplayRunner(ctape, tmp_path / "col", **kwargs).run()
+        assert out_json.read_bytes() == out_col.read_bytes()
+
+    def test_empty_window_raises(self, tmp_path):
+        path = _write_jsonl(tmp_path / "events.jsonl", _tape_events(20))
+        with pytest.raises(ValueError, match="No events between"):
+            ReplayRunner(path, tmp_path / "run", start_ts=5000.0).run()
+
+    def test_strategy_window_timeline_matches_full_run(self, tmp_path):
+        from packages.polymarket.simtrader.strategy.facade import (
+            StrategyRunParams,
+            run_strategy,
+        )
+
+        path = _write_jsonl(tmp_path / "events.jsonl", _tape_events(400))
+        trades = tmp_path / "trades.jsonl"
+        trades.write_text(
+            json.dumps({"seq": 310, "side": "BUY", "limit_price": "0.50",
+                        "size": "10", "trade_id": "t1"}) + "\n",
+            encoding="utf-8",
+        )
+
+        def _run(name: str, **window) -> Path:
+            return run_strategy(
+                StrategyRunParams(
+                    events_path=path,
+                    run_dir=tmp_path / name,
+                    strategy_name="copy_wallet_replay",
+                    strategy_config={"trades_path": str(trades)},
+                    asset_id=YES,
+                    starting_cash=Decimal("1000"),
+                    **window,
+                )
+            ).run_dir
+
+        full_dir = _run("full")
+        win_dir = _run("win", start_ts=1260.0, end_ts=1350.0)
+
+        expected = [
+            line
+            for line in (full_dir / "best_bid_ask.jsonl").read_text(encoding="utf-8").splitlines()
+            if 1260.0 <= json.loads(line)["ts_recv"] <= 1350.0
+        ]
+        got = (win_dir / "best_bid_ask.jsonl").read_text(encoding="utf-8").splitlines()
+        assert got == expected
+        fills = (win_dir / "fills.jsonl").read_text(encoding="utf-8").splitlines()
+        assert fills, "order inside the window should fill"
+        manifest = json.loads((win_dir / "run_manifest.json").read_text(encoding="utf-8"))
+        assert manifest["window"]["start_ts"] == 1260.0
+
+    def test_cli_replay_window(self, tmp_path, monkeypatch, capsys):
+        from tools.cli import simtrader as simtrader_cli
+
+        path = _write_jsonl(tmp_path / "events.jsonl", _tape_events(120))
+        monkeypatch.setattr(simtrader_cli, "DEFAULT_ARTIFACTS_DIR", tmp_path / "artifacts")
+        rc = simtrader_cli.main(
+            ["replay", "--tape", str(path), "--run-id", "w",
+             "--start-ts", "1100", "--end-ts", "1110"]
+        )
+        assert rc == 0
+        out = tmp_path / "artifacts" / "runs" / "w" / "best_bid_ask.jsonl"
+        ts = [json.loads(line)["ts_recv"] for line in out.read_text().splitlines()]
+        assert ts and min(ts) >= 1100.0 and max(ts) <= 1110.0
+
+
+def test_ondemand_session_reuses_sidecar_checkpoints(tmp_path, small_checkpoints):
+    pytest.importorskip("fastapi", reason="fastapi not installed")
+    from packages.polymarket.simtrader.studio.ondemand import OnDemandSession
+
+    tape_dir = tmp_path / "tape"
+    tape_dir.mkdir()
+    _write_jsonl(tape_dir / "events.jsonl", _tape_events(180))
+
+    sess = OnDemandSession(str(tape_dir), Decimal("1000"))
+    assert [cp.cursor for cp in sess._checkpoints] == [0, 50, 100, 150]
+    assert default_index_path(tape_dir / "events.jsonl").exists()
+
+    baseline = OnDemandSession(str(tape_dir), Decimal("1000"))
+    expected = baseline.step(130)
+    sought = sess.seek_to(expected["ts_recv"])
+    for key in ("cursor", "seq", "ts_recv", "best_bid", "best_ask", "portfolio"):
+        assert sought.get(key) == expected.get(key), key
@@ -223,6 +223,87 @@ def test_scan_csv_no_files(tmp_path: Path):
     assert not summary.ok
 
 
+# ===========================================================================
+# File catalog tests
+# ===========================================================================
+
+
+def _build_catalog(conn, dataset_dir: Path, **kwargs):
+    from packages.polymarket.duckdb_helper import build_file_catalog
+
+    return build_file_catalog(
+        conn,
+        dataset_dir,
+        pattern="**/*.parquet",
+        token_cols=["token_id"],
+        ts_col="snapshot_ts",
+        **kwargs,
+    )
+
+
+@skip_no_duckdb
+def test_file_catalog_refreshes_incrementally(tmp_path: Path):
+    """Only new/modified files are rescanned; deleted files are dropped."""
+    import os
+
+    from packages.polymarket.duckdb_helper import connection, load_file_catalog
+
+    (tmp_path / "2024").mkdir()
+    _write_parquet(tmp_path / "a.parquet", rows=5)
+    _write_parquet(tmp_path / "2024" / "b.parquet", rows=3)
+
+    with connection() as conn:
+        first = _build_catalog(conn, tmp_path)
+        assert (first.files_scanned, first.files_reused, first.files_removed) == (2, 0, 0)
+        assert first.token_ranges == 8
+        assert first.catalog.files["2024/b.parquet"][2] == 3
+
+        _write_parquet(tmp_path / "c.parquet", rows=4)
+        os.remove(tmp_path / "a.parquet")
+        second = _build_catalog(conn, tmp_path)
+        assert (second.files_scanned, second.files_reused, second.files_removed) == (1, 1, 1)
+        assert sorted(second.catalog.files) == ["2024/b.parquet", "c.parquet"]
+
+        ranges = conn.execute(
+            f"SELECT file, token, row_count FROM {second.catalog.ranges_expr()} "
+            "WHERE token = 'token_2' ORDER BY file"
+        ).fetchall()
+        assert ranges == [("2024/b.parquet", "token_2", 1), ("c.parquet", "token_2", 1)]
+
+        rebuilt = _build_catalog(conn, tmp_path, rebuild=True)
+        assert (rebuilt.files_scanned, rebuilt.files_reused) == (2, 0)
+
+    loaded = load_file_catalog(tmp_path)
+    assert loaded is not None
+    assert loaded.files == rebuilt.catalog.files
+
+
+@skip_no_duckdb
+def test_scan_parquet_uses_catalog_until_files_change(tmp_path: Path):
+    """A covering catalog answers scans; unindexed files force a real scan."""
+    from packages.polymarket import duckdb_helper
+    from packages.polymarket.duckdb_helper import connection, scan_parquet
+
+    _write_parquet(tmp_path / "a.parquet", rows=20)
+    _write_parquet(tmp_path / "b.parquet", rows=30)
+    glob = str(tmp_path / "**" / "*.parquet")
+
+    with connection() as conn:
+        plain = scan_parquet(conn, glob, ts_candidates=["snapshot_ts"])
+        _build_catalog(conn, tmp_path)
+        cataloged = duckdb_helper._catalog_summary(
+            conn, glob, ["snapshot_ts", "token_id"], ["snapshot_ts"]
+        )
+        assert cataloged == plain
+        assert scan_parquet(conn, glob, ts_candidates=["snapshot_ts"]) == plain
+
+        _write_parquet(tmp_path / "c.parquet", rows=5)
+        assert duckdb_helper._catalog_summary(
+            conn, glob, ["snapshot_ts", "token_id"], ["snapshot_ts"]
+        ) is None
+        assert scan_parquet(conn, glob, ts_candidates=["snapshot_ts"]).row_count == 55
+
+
 # ===========================================================================
 # smoke-historical CLI tests
 # ===========================================================================
@@ -207,23 +207,16 @@ class TestDataclassFields:
 
 def _make_mock_leaderboard_client(pages: list[list[dict]]):
     """Build a mock HttpClient that returns leaderboard pages."""
-    call_count = [0]
 
-    def mock_get(path, params=None, headers=None):
-        offset = (params or {}).get("offset", 0)
-        page_index = offset // 50
-        if page_index >= len(pages):
-            page_data = []
-        else:
-            page_data = pages[page_index]
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = page_data
-        return mock_resp
+    def mock_get_json_many(calls, headers=None, max_concurrency=None, return_exceptions=False):
+        results = []
+        for _path, params in calls:
+            page_index = (params or {}).get("offset", 0) // 50
+            results.append(pages[page_index] if page_index < len(pages) else [])
+        return results
 
     client = MagicMock()
-    client.get = mock_get
+    client.get_json_many = mock_get_json_many
     return client
 
 
@@ -297,6 +290,18 @@ class TestLeaderboardFetcher:
         result = fetch_leaderboard(max_pages=2, page_size=50, http_client=mock_client)
         assert len(result) == 100  # Only 2 pages
 
+    def test_pagination_stops_at_failed_page(self):
+        """A failed page ends pagination; earlier pages are kept."""
+        from packages.polymarket.discovery.leaderboard_fetcher import fetch_leaderboard
+        pages = [self._build_page(1, 50), self._build_page(51, 50), self._build_page(101, 50)]
+        mock_client = MagicMock()
+        mock_client.get_json_many.return_value = [pages[0], RuntimeError("boom"), pages[2]]
+        result = fetch_leaderboard(max_pages=3, page_size=50, http_client=mock_client)
+        assert [r["rank"] for r in result] == list(range(1, 51))
+        (calls,), kwargs = mock_client.get_json_many.call_args
+        assert [params["offset"] for _path, params in calls] == [0, 50, 100]
+        assert kwargs["return_exceptions"] is True
+
 
 class TestToSnapshotRows:
     def test_converts_raw_to_typed_rows(self):
@@ -99,29 +99,18 @@ def _build_leaderboard_pages(num_pages: int = 3, page_size: int = 50) -> list[li
 
 
 def _build_mock_http_client(pages: list[list[dict]]) -> Any:
-    """Build a mock http_client that returns pages sequentially, then stops."""
-    call_count = [0]
-    num_pages = len(pages)
-
-    class _FakeResponse:
-        def __init__(self, data):
-            self.status_code = 200
-            self._data = data
-
-        def json(self):
-            return self._data
-
+    """Build a mock http_client that returns pages by offset, then empty pages."""
     client = MagicMock()
 
-    def _get(_path, params=None):
-        idx = call_count[0]
-        call_count[0] += 1
-        if idx < num_pages:
-            return _FakeResponse(pages[idx])
-        # Return empty to stop pagination
-        return _FakeResponse([])
+    def _get_json_many(calls, headers=None, max_concurrency=None, return_exceptions=False):
+        results = []
+        for _path, params in calls:
+            idx = params["offset"] // params["limit"]
+            # Return empty past the last page to stop pagination
+            results.append(pages[idx] if idx < len(pages) else [])
+        return results
 
-    client.get.side_effect = _get
+    client.get_json_many.side_effect = _get_json_many
     return client
 
 
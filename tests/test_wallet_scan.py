@@ -635,3 +635,241 @@ class TestWalletScannerDossierHook:
         parser = build_parser()
         args = parser.parse_args(["--input", "wallets.txt"])
         assert args.extract_dossier is False
+
+
+# ---------------------------------------------------------------------------
+# Parallel scanning (--concurrency)
+# ---------------------------------------------------------------------------
+
+
+def _timed_fake_scan(
+    run_roots: dict, marks_dir: str, expect_gate: bool, identifier: str, scan_flags: dict
+) -> str:
+    """Module-level (picklable) fake scan that records when it ran in its worker."""
+    import time
+
+    from packages.polymarket.http_client import SharedTokenBucket, get_host_rate_limiter
+    from packages.polymarket.gamma import DEFAULT_GAMMA_API_BASE
+    from tools.cli import scan
+
+    if not isinstance(get_host_rate_limiter(DEFAULT_GAMMA_API_BASE), SharedTokenBucket):
+        raise RuntimeError("shared upstream rate limiter not installed in worker")
+    if (scan._API_REQUEST_GATE is not None) != expect_gate:
+        raise RuntimeError(f"API request gate installed={scan._API_REQUEST_GATE is not None}")
+    started = time.monotonic()
+    print(f"scanning {identifier}")
+    time.sleep(0.3)
+    Path(marks_dir, identifier.lstrip("@")).write_text(
+        f"{started} {time.monotonic()}", encoding="utf-8"
+    )
+    if identifier not in run_roots:
+        raise RuntimeError(f"No fake scan result for {identifier!r}")
+    return run_roots[identifier]
+
+
+def _http_fake_scan(
+    run_roots: dict, base_url: str, requests_per_scan: int, identifier: str, scan_flags: dict
+) -> str:
+    """Module-level (picklable) fake scan that calls the Gamma host directly."""
+    from packages.polymarket.http_client import HttpClient
+
+    with HttpClient(base_url, max_retries=0) as client:
+        for _ in range(requests_per_scan):
+            client.get_json("/ping")
+    return run_roots[identifier]
+
+
+class TestWalletScannerParallel:
+    def _entries(self, names: list[str]) -> list[dict]:
+        return [{"identifier": f"@{name}", "kind": "handle"} for name in names]
+
+    def _run_roots(self, tmp_path: Path, names: list[str]) -> dict[str, str]:
+        return {
+            f"@{name}": _make_scan_run_root(
+                tmp_path / "runs", f"{name}_run", pnl_net=float(i)
+            ).as_posix()
+            for i, name in enumerate(names)
+        }
+
+    def test_parallel_results_match_sequential_order(self, tmp_path: Path) -> None:
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        names = ["Alice", "Bob", "Carol", "Dave", "Erin"]
+        run_roots = self._run_roots(tmp_path, names)
+        delays = {"@Alice": 0.05, "@Bob": 0.0, "@Carol": 0.03, "@Dave": 0.0, "@Erin": 0.01}
+        in_flight = {"now": 0, "max": 0}
+        lock = threading.Lock()
+
+        def slow_scan(identifier: str, scan_flags: dict) -> str:
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(delays[identifier])
+            with lock:
+                in_flight["now"] -= 1
+            if identifier == "@Carol":
+                raise RuntimeError("carol scan failed")
+            return run_roots[identifier]
+
+        outputs = {}
+        for label, concurrency in (("seq", 1), ("par", 3)):
+            scanner = WalletScanner(
+                scan_callable=slow_scan,
+                now_provider=lambda: FIXED_NOW,
+                executor_factory=lambda workers, api, rate: ThreadPoolExecutor(max_workers=workers),
+            )
+            paths = scanner.run(
+                entries=self._entries(names),
+                output_root=tmp_path / label,
+                run_id="run",
+                profile="lite",
+                input_file_path="wallets.txt",
+                concurrency=concurrency,
+            )
+            outputs[label] = paths
+
+        def _read_results(paths):
+            lines = Path(paths["per_user_results_jsonl"]).read_text(encoding="utf-8").splitlines()
+            return [json.loads(line) for line in lines]
+
+        seq_results = _read_results(outputs["seq"])
+        par_results = _read_results(outputs["par"])
+        assert [r["identifier"] for r in par_results] == [f"@{n}" for n in names]
+        assert par_results == seq_results
+        seq_board = json.loads(Path(outputs["seq"]["leaderboard_json"]).read_text(encoding="utf-8"))
+        par_board = json.loads(Path(outputs["par"]["leaderboard_json"]).read_text(encoding="utf-8"))
+        assert par_board["ranked"] == seq_board["ranked"]
+        assert in_flight["max"] > 1
+
+        par_root = Path(outputs["par"]["run_root"])
+        per_user = sorted(p.name for p in (par_root / "per_user").glob("*.json"))
+        assert per_user == [f"{i:05d}.json" for i in range(len(names))]
+        carol = json.loads((par_root / "per_user" / "00002.json").read_text(encoding="utf-8"))
+        assert carol["status"] == "failure"
+        manifest = json.loads(Path(outputs["par"]["wallet_scan_manifest_json"]).read_text(encoding="utf-8"))
+        assert manifest["concurrency"] == 3
+
+    def test_parallel_stops_on_error_when_not_continuing(self, tmp_path: Path) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        def failing_scan(identifier: str, scan_flags: dict) -> str:
+            raise ValueError(f"boom {identifier}")
+
+        scanner = WalletScanner(
+            scan_callable=failing_scan,
+            now_provider=lambda: FIXED_NOW,
+            executor_factory=lambda workers, api, rate: ThreadPoolExecutor(max_workers=workers),
+        )
+        with pytest.raises(ValueError, match="boom"):
+            scanner.run(
+                entries=self._entries(["Alice", "Bob", "Carol"]),
+                output_root=tmp_path / "out",
+                run_id="run",
+                profile="lite",
+                input_file_path="wallets.txt",
+                continue_on_error=False,
+                concurrency=2,
+            )
+
+    def _run_process_workers(self, tmp_path: Path, names: list[str], **run_kwargs) -> tuple:
+        import functools
+
+        run_roots = self._run_roots(tmp_path, names)
+        marks_dir = tmp_path / "marks"
+        marks_dir.mkdir()
+        expect_gate = run_kwargs.get("api_concurrency", run_kwargs["concurrency"]) < run_kwargs["concurrency"]
+        scanner = WalletScanner(
+            scan_callable=functools.partial(_timed_fake_scan, run_roots, str(marks_dir), expect_gate),
+            now_provider=lambda: FIXED_NOW,
+        )
+        paths = scanner.run(
+            entries=self._entries(names),
+            output_root=tmp_path / "out",
+            run_id="proc",
+            profile="lite",
+            input_file_path="wallets.txt",
+            **run_kwargs,
+        )
+        spans = [
+            tuple(float(x) for x in (marks_dir / name).read_text(encoding="utf-8").split())
+            for name in names
+        ]
+        return paths, spans
+
+    def test_process_workers_overlap_and_isolate_logs(self, tmp_path: Path) -> None:
+        names = ["Alice", "Bob", "Carol"]
+        paths, spans = self._run_process_workers(tmp_path, names, concurrency=3)
+
+        board = json.loads(Path(paths["leaderboard_json"]).read_text(encoding="utf-8"))
+        assert board["entries_succeeded"] == 3
+        assert [row["identifier"] for row in board["ranked"]] == ["@Carol", "@Bob", "@Alice"]
+        # All three scans were running at the same moment: no gate serialises them.
+        assert max(start for start, _ in spans) < min(end for _, end in spans)
+        log_text = (Path(paths["run_root"]) / "logs" / "00001.log").read_text(encoding="utf-8")
+        assert "scanning @Bob" in log_text
+
+    def test_api_concurrency_below_workers_installs_gate(self, tmp_path: Path) -> None:
+        names = ["Alice", "Bob"]
+        paths, _ = self._run_process_workers(tmp_path, names, concurrency=2, api_concurrency=1)
+
+        board = json.loads(Path(paths["leaderboard_json"]).read_text(encoding="utf-8"))
+        assert board["entries_succeeded"] == 2
+
+    def test_workers_share_upstream_rate_budget(self, tmp_path: Path, monkeypatch) -> None:
+        import functools
+        import threading
+        import time
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        arrivals: list[float] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                arrivals.append(time.monotonic())
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        monkeypatch.setenv("GAMMA_API_BASE", base_url)
+
+        names = ["Alice", "Bob", "Carol"]
+        per_scan = 4
+        rate = 5.0
+        scanner = WalletScanner(
+            scan_callable=functools.partial(
+                _http_fake_scan, self._run_roots(tmp_path, names), base_url, per_scan
+            ),
+            now_provider=lambda: FIXED_NOW,
+        )
+        try:
+            paths = scanner.run(
+                entries=self._entries(names),
+                output_root=tmp_path / "out",
+                run_id="throttled",
+                profile="lite",
+                input_file_path="wallets.txt",
+                concurrency=len(names),
+                api_rate=rate,
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        board = json.loads(Path(paths["leaderboard_json"]).read_text(encoding="utf-8"))
+        assert board["entries_succeeded"] == len(names)
+        assert len(arrivals) == len(names) * per_scan
+        # One bucket (burst == rate) for all workers: requests beyond the burst
+        # are spaced 1/rate apart no matter how many workers send them.
+        min_span = (len(arrivals) - int(rate)) / rate
+        assert max(arrivals) - min(arrivals) >= min_span * 0.9
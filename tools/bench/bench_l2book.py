@@ -0,0 +1,170 @@
+"""Microbenchmark: integer-tick L2Book vs the legacy dict-scan book.
+
+Replays a deep-book tape through both book implementations and reads
+``best_bid`` / ``best_ask`` for every asset after every event -- the same
+access pattern ``StrategyRunner.run`` uses to build ``_best_by_asset``.
+
+By default a synthetic tape is generated (one snapshot per asset with
+``--depth`` levels per side, followed by ``--events`` random price_change
+deltas).  Pass ``--events-path`` to benchmark against a recorded tape.
+
+Usage::
+
+    python tools/bench/bench_l2book.py [--depth 400] [--events 50000]
+    python tools/bench/bench_l2book.py --events-path artifacts/tapes/gold/X/events.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Optional
+
+# ---------------------------------------------------------------------------
+# Ensure repo root on sys.path so package imports work from any cwd.
+# ---------------------------------------------------------------------------
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from packages.polymarket.simtrader.orderbook.l2book import L2Book  # noqa: E402
+from packages.polymarket.simtrader.tape.schema import (  # noqa: E402
+    EVENT_TYPE_BOOK,
+    EVENT_TYPE_PRICE_CHANGE,
+)
+
+
+class _LegacyDictBook:
+    """Reference copy of the pre-tick L2Book hot path (dict + max/min scan)."""
+
+    def __init__(self, asset_id: str) -> None:
+        self.asset_id = asset_id
+        self._bids: dict[str, Decimal] = {}
+        self._asks: dict[str, Decimal] = {}
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        if not self._bids:
+            return None
+        return float(max(Decimal(p) for p in self._bids))
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        if not self._asks:
+            return None
+        return float(min(Decimal(p) for p in self._asks))
+
+    def apply(self, event: dict) -> bool:
+        event_type = event.get("event_type")
+        if event_type == EVENT_TYPE_BOOK:
+            self._bids = {
+                str(lvl["price"]): Decimal(str(lvl["size"])) for lvl in event["bids"]
+            }
+            self._asks = {
+                str(lvl["price"]): Decimal(str(lvl["size"])) for lvl in event["asks"]
+            }
+            return True
+        if event_type == EVENT_TYPE_PRICE_CHANGE:
+            for change in event.get("changes", []):
+                book = self._bids if change["side"] == "BUY" else self._asks
+                size = Decimal(str(change["size"]))
+                if size == 0:
+                    book.pop(str(change["price"]), None)
+                else:
+                    book[str(change["price"])] = size
+            return True
+        return False
+
+
+def _synthetic_tape(n_assets: int, depth: int, n_events: int, seed: int) -> list[dict]:
+    """Build a deep-book tape on a 0.001 tick grid."""
+    rng = random.Random(seed)
+    assets = [f"tok{i}" for i in range(n_assets)]
+    events: list[dict] = []
+    seq = 0
+    for asset_id in assets:
+        bids = [
+            {"price": f"{0.499 - i * 0.001:.3f}", "size": str(rng.randint(1, 500))}
+            for i in range(min(depth, 499))
+        ]
+        asks = [
+            {"price": f"{0.501 + i * 0.001:.3f}", "size": str(rng.randint(1, 500))}
+            for i in range(min(depth, 499))
+        ]
+        events.append(
+            {"seq": seq, "ts_recv": float(seq), "event_type": EVENT_TYPE_BOOK,
+             "asset_id": asset_id, "bids": bids, "asks": asks}
+        )
+        seq += 1
+    for _ in range(n_events):
+        side = rng.choice(("BUY", "SELL"))
+        offset = rng.randint(0, min(depth, 499) - 1) * 0.001
+        price = 0.499 - offset if side == "BUY" else 0.501 + offset
+        size = "0" if rng.random() < 0.2 else str(rng.randint(1, 500))
+        events.append(
+            {"seq": seq, "ts_recv": float(seq), "event_type": EVENT_TYPE_PRICE_CHANGE,
+             "asset_id": rng.choice(assets),
+             "changes": [{"side": side, "price": f"{price:.3f}", "size": size}]}
+        )
+        seq += 1
+    return events
+
+
+def _load_tape(path: Path) -> list[dict]:
+    with open(path, encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def _replay(book_cls: Any, events: list[dict]) -> tuple[float, list]:
+    books: dict[str, Any] = {}
+    tops: list = []
+    t0 = time.perf_counter()
+    for event in events:
+        asset_id = event.get("asset_id")
+        if not asset_id:
+            continue
+        book = books.get(asset_id)
+        if book is None:
+            book = books[asset_id] = book_cls(asset_id)
+        book.apply(event)
+        # Mirror StrategyRunner: read top-of-book for every asset per event.
+        tops.append(tuple((b.best_bid, b.best_ask) for b in books.values()))
+    return time.perf_counter() - t0, tops
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events-path", type=Path, default=None)
+    parser.add_argument("--assets", type=int, default=2)
+    parser.add_argument("--depth", type=int, default=400)
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    if args.events_path is not None:
+        events = _load_tape(args.events_path)
+        label = str(args.events_path)
+    else:
+        events = _synthetic_tape(args.assets, args.depth, args.events, args.seed)
+        label = f"synthetic assets={args.assets} depth={args.depth}"
+
+    legacy_s, legacy_tops = _replay(_LegacyDictBook, events)
+    tick_s, tick_tops = _replay(L2Book, events)
+    if legacy_tops != tick_tops:
+        print("ERROR: top-of-book mismatch between implementations", file=sys.stderr)
+        return 1
+
+    print(f"tape:        {label} ({len(events)} events)")
+    print(f"legacy dict: {legacy_s:8.3f}s")
+    print(f"tick L2Book: {tick_s:8.3f}s")
+    print(f"speedup:     {legacy_s / tick_s if tick_s else float('inf'):8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
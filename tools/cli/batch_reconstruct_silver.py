@@ -4,6 +4,10 @@ For each token, calls SilverReconstructor.reconstruct() and writes:
   silver_events.jsonl  — deterministic Silver tape events
   silver_meta.json     — reconstruction metadata
 
+pmxt anchors and Jon-Becker fills for all tokens are fetched up front in one
+DuckDB scan per source (SilverReconstructor.prefetch) rather than one full
+Parquet glob scan per token.
+
 After each reconstruction, persists tape_metadata to ClickHouse (or JSONL fallback).
 Emits a batch manifest JSON summarising all outcomes.
 
@@ -59,7 +63,11 @@ from typing import List, Optional
 # The try/except guard keeps the module importable even without all dependencies
 # installed (e.g. when running --help or in minimal test environments).
 try:
-    from packages.polymarket.silver_reconstructor import ReconstructConfig, SilverReconstructor
+    from packages.polymarket.silver_reconstructor import (
+        ReconstructConfig,
+        SilverReconstructor,
+        SilverTarget,
+    )
     from packages.polymarket.silver_tape_metadata import (
         build_from_silver_result,
         write_to_clickhouse,
@@ -68,6 +76,7 @@ try:
 except ImportError:
     ReconstructConfig = None  # type: ignore[assignment,misc]
     SilverReconstructor = None  # type: ignore[assignment,misc]
+    SilverTarget = None  # type: ignore[assignment,misc]
     build_from_silver_result = None  # type: ignore[assignment]
     write_to_clickhouse = None  # type: ignore[assignment]
     write_to_jsonl = None  # type: ignore[assignment]
@@ -246,14 +255,20 @@ def run_batch(
     metadata_jsonl_count = 0
     metadata_skip_count = 0
 
+    shared_reconstructor = _shared_reconstructor(
+        config,
+        [SilverTarget(token_id, window_start, window_end) for token_id in token_ids],
+        _reconstructor_factory,
+    )
+
     for token_id in token_ids:
         out_dir = None if dry_run else canonical_tape_dir(token_id, window_start, out_root)
 
         try:
-            if _reconstructor_factory is not None:
-                reconstructor = _reconstructor_factory(config)
+            if shared_reconstructor is not None:
+                reconstructor = shared_reconstructor
             else:
-                reconstructor = SilverReconstructor(config)
+                reconstructor = _reconstructor_factory(config)
 
             result = reconstructor.reconstruct(
                 token_id=token_id,
@@ -359,6 +374,62 @@ def run_batch(
     }
 
 
+def _shared_reconstructor(config, targets: list, reconstructor_factory):
+    """Return one prefetched SilverReconstructor for the batch, or None.
+
+    With the real reconstructor, all tokens share a single instance whose
+    pmxt anchors and Jon fills were fetched up front in one DuckDB scan per
+    source.  An injected factory (tests) is still called once per token, so
+    None is returned in that case.  Reconstructors without ``prefetch`` fall
+    back to fetching per token.
+    """
+    if reconstructor_factory is not None:
+        return None
+    reconstructor = SilverReconstructor(config)
+    prefetch = getattr(reconstructor, "prefetch", None)
+    if prefetch is not None:
+        prefetch(targets)
+    return reconstructor
+
+
+def _target_window(target: dict) -> tuple:
+    """Validate a gap-fill target's token and window.
+
+    Returns (window_start, window_end, skip_reason); skip_reason is None when
+    the target is valid, otherwise a human-readable reason to skip it.
+    """
+    token_id = target.get("token_id", "")
+    win_start_raw = target.get("window_start", "")
+    win_end_raw = target.get("window_end", "")
+
+    skip_reason = None
+    window_start_f: Optional[float] = None
+    window_end_f: Optional[float] = None
+
+    if not token_id:
+        skip_reason = "missing token_id"
+    else:
+        try:
+            window_start_f = _parse_ts(win_start_raw) if win_start_raw else None
+            if window_start_f is None:
+                skip_reason = "missing or unparseable window_start"
+        except (ValueError, TypeError) as exc:
+            skip_reason = f"invalid window_start: {exc}"
+
+    if skip_reason is None:
+        try:
+            window_end_f = _parse_ts(win_end_raw) if win_end_raw else None
+            if window_end_f is None:
+                skip_reason = "missing or unparseable window_end"
+        except (ValueError, TypeError) as exc:
+            skip_reason = f"invalid window_end: {exc}"
+
+    if skip_reason is None and window_end_f <= window_start_f:
+        skip_reason = "window_end must be after window_start"
+
+    return window_start_f, window_end_f, skip_reason
+
+
 def load_targets_manifest(path: Path) -> tuple:
     """Load and validate a benchmark_gap_fill_v1 targets manifest.
 
@@ -436,6 +507,20 @@ def run_batch_from_targets(
     metadata_jsonl_count = 0
     metadata_skip_count = 0
 
+    prefetch_targets = []
+    if _reconstructor_factory is None:
+        for target in targets:
+            if not isinstance(target, dict):
+                continue
+            window_start_f, window_end_f, skip_reason = _target_window(target)
+            if skip_reason is None:
+                prefetch_targets.append(
+                    SilverTarget(target["token_id"], window_start_f, window_end_f)
+                )
+    shared_reconstructor = _shared_reconstructor(
+        config, prefetch_targets, _reconstructor_factory
+    )
+
     for target in targets:
         if not isinstance(target, dict):
             skip_count += 1
@@ -470,30 +555,7 @@ def run_batch_from_targets(
         win_end_raw = target.get("window_end", "")
 
         # Validate required fields; skip cleanly on any issue
-        skip_reason = None
-        window_start_f: Optional[float] = None
-        window_end_f: Optional[float] = None
-
-        if not token_id:
-            skip_reason = "missing token_id"
-        else:
-            try:
-                window_start_f = _parse_ts(win_start_raw) if win_start_raw else None
-                if window_start_f is None:
-                    skip_reason = "missing or unparseable window_start"
-            except (ValueError, TypeError) as exc:
-                skip_reason = f"invalid window_start: {exc}"
-
-        if skip_reason is None:
-            try:
-                window_end_f = _parse_ts(win_end_raw) if win_end_raw else None
-                if window_end_f is None:
-                    skip_reason = "missing or unparseable window_end"
-            except (ValueError, TypeError) as exc:
-                skip_reason = f"invalid window_end: {exc}"
-
-        if skip_reason is None and window_end_f <= window_start_f:
-            skip_reason = "window_end must be after window_start"
+        window_start_f, window_end_f, skip_reason = _target_window(target)
 
         if skip_reason is not None:
             skip_count += 1
@@ -523,10 +585,10 @@ def run_batch_from_targets(
         out_dir = None if dry_run else canonical_tape_dir(token_id, window_start_f, out_root)
 
         try:
-            if _reconstructor_factory is not None:
-                reconstructor = _reconstructor_factory(config)
+            if shared_reconstructor is not None:
+                reconstructor = shared_reconstructor
             else:
-                reconstructor = SilverReconstructor(config)
+                reconstructor = _reconstructor_factory(config)
 
             result = reconstructor.reconstruct(
                 token_id=token_id,
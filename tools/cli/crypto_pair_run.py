@@ -521,6 +521,10 @@ def run_crypto_pair_runner(
         clickhouse_port=clickhouse_port,
         clickhouse_user=clickhouse_user,
         clickhouse_password=clickhouse_password,
+        # Streaming writes go through the background writer so ClickHouse
+        # latency never lands on the trading loop.
+        buffered=settings.sink_flush_mode == "streaming",
+        spill_dir=str(Path(settings.artifact_base_dir) / "clickhouse_spill"),
     )
     sink = build_clickhouse_sink(sink_config)
 
@@ -573,7 +577,12 @@ def run_crypto_pair_runner(
             verbose=verbose,
             clob_stream=clob_stream,
         )
-    manifest = runner.run()
+    try:
+        manifest = runner.run()
+    finally:
+        close_sink = getattr(sink, "close", None)
+        if callable(close_sink):
+            close_sink()
 
     if auto_report and not live:
         auto_report_payload = {
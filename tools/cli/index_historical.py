@@ -0,0 +1,134 @@
+"""Build or refresh the token/timestamp file catalogs for raw historical data.
+
+CLI: python -m polytool index-historical [options]
+
+For each source, writes ``<dataset_dir>/_catalog/`` recording, per file, the
+tokens it contains and their min/max timestamp.  Silver reconstruction and
+smoke-historical use the catalog automatically when present: token/window
+lookups read only the files that can match instead of the whole dataset.
+
+Re-running is incremental -- only new or modified files are rescanned and
+deleted files are dropped.  Files added after the last run are still read
+(unpruned) until the next refresh, so a stale catalog never hides data.
+
+Sources:
+  pmxt_archive  <root>/Polymarket/**/*.parquet          -> Polymarket/_catalog/
+  jon_becker    <root>/data/polymarket/trades/**/*.parquet (or *.csv)
+                                                        -> trades/_catalog/
+
+Examples::
+
+    python -m polytool index-historical \\
+        --pmxt-root D:/PolyToolData/raw/pmxt_archive \\
+        --jon-root  D:/PolyToolData/raw/jon_becker
+
+    python -m polytool index-historical --jon-root /data/raw/jon_becker --rebuild
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import List, Optional
+
+
+def _report(label: str, refresh) -> str:  # type: ignore[no-untyped-def]
+    if refresh is None:
+        return (
+            f"[index-historical] {label}\n"
+            f"  status:  SKIPPED - no readable files or token/timestamp columns\n"
+        )
+    catalog = refresh.catalog
+    return (
+        f"[index-historical] {label}\n"
+        f"  catalog:       {catalog.dataset_dir / '_catalog'}\n"
+        f"  columns:       token={','.join(catalog.token_cols)} ts={catalog.ts_col}\n"
+        f"  files:         {len(catalog.files):,} "
+        f"(scanned {refresh.files_scanned:,}, reused {refresh.files_reused:,}, "
+        f"removed {refresh.files_removed:,})\n"
+        f"  token_ranges:  {refresh.token_ranges:,}\n"
+        f"  status:        OK\n"
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="index-historical",
+        description=(
+            "Build or incrementally refresh per-file token/timestamp catalogs\n"
+            "for the pmxt and Jon-Becker raw datasets so point lookups only\n"
+            "read the files that can match."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    p.add_argument(
+        "--pmxt-root",
+        default=None,
+        metavar="PATH",
+        help="Root of the pmxt_archive dataset (expects Polymarket/**/*.parquet).",
+    )
+    p.add_argument(
+        "--jon-root",
+        default=None,
+        metavar="PATH",
+        help="Root of the jon_becker dataset (expects data/polymarket/trades/).",
+    )
+    p.add_argument(
+        "--rebuild",
+        action="store_true",
+        default=False,
+        help="Rescan every file instead of refreshing incrementally.",
+    )
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    try:
+        import duckdb  # noqa: F401
+    except ImportError:
+        print(
+            "[index-historical] ERROR: duckdb is not installed.\n"
+            "  Install:  pip install duckdb>=1.0.0\n"
+            "  Or:       pip install 'polytool[historical]'",
+            file=sys.stderr,
+        )
+        return 1
+
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    if not args.pmxt_root and not args.jon_root:
+        parser.print_help()
+        print(
+            "\nError: at least one of --pmxt-root or --jon-root must be provided.",
+            file=sys.stderr,
+        )
+        return 1
+
+    from packages.polymarket.silver_reconstructor import (
+        index_jon_dataset,
+        index_pmxt_dataset,
+    )
+
+    indexed = 0
+    total = 0
+    if args.pmxt_root:
+        total += 1
+        refresh = index_pmxt_dataset(args.pmxt_root, rebuild=args.rebuild)
+        print(_report("pmxt_archive", refresh), end="")
+        indexed += refresh is not None
+    if args.jon_root:
+        total += 1
+        refresh = index_jon_dataset(args.jon_root, rebuild=args.rebuild)
+        print(_report("jon_becker", refresh), end="")
+        indexed += refresh is not None
+
+    if indexed == 0:
+        print(f"[index-historical] FAIL - 0/{total} source(s) indexed", file=sys.stderr)
+        return 1
+    print(f"[index-historical] DONE - {indexed}/{total} source(s) indexed")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -156,38 +156,30 @@ def polymarket_rag_query(question: str, user: str = "", k: int = 8) -> str:
     if not question:
         raise ValueError("question is required")
 
-    from polymarket.rag.embedder import (
-        DEFAULT_EMBED_MODEL,
-        SentenceTransformerEmbedder,
-    )
-    from polymarket.rag.query import query_index
     from polymarket.rag.knowledge_store import DEFAULT_KNOWLEDGE_DB_PATH
+    from polymarket.rag.service import resolve_service_url, run_query
 
     ks_path = DEFAULT_KNOWLEDGE_DB_PATH
     ks_active = ks_path.exists()
 
+    request = {
+        "question": question,
+        "k": k,
+        "user_slug": user or None,
+        "private_only": True,
+    }
+    if ks_active:
+        request.update(
+            hybrid=True,
+            top_k_vector=25,
+            top_k_lexical=25,
+            knowledge_store_path=str(ks_path),
+        )
+
+    # The MCP process is long-lived: keep the embedder and index handles warm
+    # in-process, or share a running `polytool rag-serve` when one is configured.
     with _suppress_stdout():
-        embedder = SentenceTransformerEmbedder(model_name=DEFAULT_EMBED_MODEL)
-        if ks_active:
-            results = query_index(
-                question=question,
-                embedder=embedder,
-                k=k,
-                user_slug=user or None,
-                private_only=True,
-                hybrid=True,
-                top_k_vector=25,
-                top_k_lexical=25,
-                knowledge_store_path=ks_path,
-            )
-        else:
-            results = query_index(
-                question=question,
-                embedder=embedder,
-                k=k,
-                user_slug=user or None,
-                private_only=True,
-            )
+        results = run_query(request, service_url=resolve_service_url())
     return json.dumps({
         "success": True,
         "question": question,
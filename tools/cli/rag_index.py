@@ -12,7 +12,13 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "packages
 
 from polymarket.rag.defaults import RAG_DEFAULT_COLLECTION, RAG_DEFAULT_PERSIST_DIR
 from polymarket.rag.embedder import DEFAULT_EMBED_MODEL, SentenceTransformerEmbedder
-from polymarket.rag.index import DEFAULT_MAX_BYTES, IndexProgress, build_index, reconcile_index
+from polymarket.rag.index import (
+    DEFAULT_EMBED_BATCH_SIZE,
+    DEFAULT_MAX_BYTES,
+    IndexProgress,
+    build_index,
+    reconcile_index,
+)
 
 
 def _parse_roots(raw: str) -> List[str]:
@@ -30,6 +36,11 @@ def build_parser() -> argparse.ArgumentParser:
         help="Comma-separated corpus roots (default: kb,artifacts)",
     )
     parser.add_argument("--rebuild", action="store_true", help="Rebuild the index from scratch.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip files whose content is already indexed (doc_id unchanged).",
+    )
     parser.add_argument(
         "--reconcile",
         action="store_true",
@@ -43,6 +54,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_MAX_BYTES,
         help=f"Skip files larger than this many bytes (default: {DEFAULT_MAX_BYTES}). Use 0 to disable.",
     )
+    parser.add_argument(
+        "--embed-batch-size",
+        type=int,
+        default=DEFAULT_EMBED_BATCH_SIZE,
+        help=f"Chunks per embedding batch across files (default: {DEFAULT_EMBED_BATCH_SIZE}).",
+    )
     parser.add_argument(
         "--progress-every-files",
         type=int,
@@ -83,6 +100,9 @@ def main(argv: Optional[list[str]] = None) -> int:
     if args.reconcile and args.rebuild:
         print("Error: --reconcile and --rebuild are mutually exclusive.")
         return 1
+    if args.incremental and args.rebuild:
+        print("Error: --incremental and --rebuild are mutually exclusive.")
+        return 1
 
     if args.reconcile:
         try:
@@ -111,6 +131,9 @@ def main(argv: Optional[list[str]] = None) -> int:
     if args.max_bytes < 0:
         print("Error: --max-bytes must be >= 0.")
         return 1
+    if args.embed_batch_size <= 0:
+        print("Error: --embed-batch-size must be positive.")
+        return 1
     if args.progress_every_files < 0 or args.progress_every_chunks < 0:
         print("Error: progress intervals must be >= 0.")
         return 1
@@ -124,6 +147,7 @@ def main(argv: Optional[list[str]] = None) -> int:
             f"skipped_binary={progress.skipped_binary} "
             f"skipped_too_big={progress.skipped_too_big} "
             f"skipped_decode={progress.skipped_decode} "
+            f"skipped_unchanged={progress.skipped_unchanged} "
             f'last_path="{last_path}"'
         )
 
@@ -137,7 +161,9 @@ def main(argv: Optional[list[str]] = None) -> int:
             persist_directory=args.persist_dir,
             collection_name=args.collection,
             rebuild=args.rebuild,
+            incremental=args.incremental,
             max_bytes=args.max_bytes,
+            embed_batch_size=args.embed_batch_size,
             progress_every_files=args.progress_every_files,
             progress_every_chunks=args.progress_every_chunks,
             progress_callback=_print_progress,
@@ -153,6 +179,7 @@ def main(argv: Optional[list[str]] = None) -> int:
     print(f"Skipped binary/non-text: {summary.skipped_binary}")
     print(f"Skipped too big: {summary.skipped_too_big}")
     print(f"Skipped decode failures: {summary.skipped_decode}")
+    print(f"Skipped unchanged: {summary.skipped_unchanged}")
     print(f"Manifest: {summary.manifest_path}")
     return 0
 
@@ -7,6 +7,7 @@ import argparse
 import json
 import os
 import sys
+from pathlib import Path
 from typing import List, Optional
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "packages"))
@@ -15,8 +16,16 @@ from polymarket.llm_research_packets import _username_to_slug
 from polymarket.rag.defaults import RAG_DEFAULT_COLLECTION, RAG_DEFAULT_PERSIST_DIR
 from polymarket.rag.embedder import DEFAULT_EMBED_MODEL, SentenceTransformerEmbedder
 from polymarket.rag.knowledge_store import DEFAULT_KNOWLEDGE_DB_PATH
+from polymarket.rag.lexical import DEFAULT_LEXICAL_DB_PATH
 from polymarket.rag.query import query_index
 from polymarket.rag.reranker import CrossEncoderReranker, DEFAULT_RERANK_MODEL
+from polymarket.rag.service import (
+    DEFAULT_SERVICE_URL,
+    SERVICE_URL_ENV,
+    RagServiceUnavailable,
+    query_service,
+    resolve_service_url,
+)
 
 
 def _build_user_prefixes(user: str) -> List[str]:
@@ -187,6 +196,27 @@ def build_parser() -> argparse.ArgumentParser:
         default=25,
         help="Number of KnowledgeStore claim candidates for RRF fusion (default 25).",
     )
+    # --- resident query service ---
+    service = parser.add_mutually_exclusive_group()
+    service.add_argument(
+        "--service",
+        dest="service_url",
+        nargs="?",
+        const=DEFAULT_SERVICE_URL,
+        default=None,
+        metavar="URL",
+        help=(
+            "Send the query to a running `polytool rag-serve` (default URL "
+            f"{DEFAULT_SERVICE_URL}; ${SERVICE_URL_ENV} is used when the flag is "
+            "omitted). Falls back to in-process retrieval if nothing is listening."
+        ),
+    )
+    service.add_argument(
+        "--no-service",
+        action="store_true",
+        default=False,
+        help=f"Always query in-process, ignoring ${SERVICE_URL_ENV}.",
+    )
     return parser
 
 
@@ -226,51 +256,77 @@ def main(argv: Optional[list[str]] = None) -> int:
             flat.extend(t.strip() for t in entry.split(",") if t.strip())
         doc_types = flat or None
 
-    try:
-        embedder = None
-        if not args.lexical_only:
-            embedder = SentenceTransformerEmbedder(model_name=args.model, device=args.device)
+    if args.rerank and not args.hybrid:
+        print("Warning: --rerank is most useful with --hybrid. Proceeding anyway.")
 
-        # Build reranker if requested
-        reranker = None
-        if args.rerank:
-            if not args.hybrid:
-                print("Warning: --rerank is most useful with --hybrid. Proceeding anyway.")
-            reranker = CrossEncoderReranker(
-                model_name=args.rerank_model,
-                device=args.device,
-                cache_folder="kb/rag/models",
-            )
+    query_kwargs = dict(
+        question=args.question,
+        k=args.k,
+        persist_directory=args.persist_dir,
+        collection_name=args.collection,
+        filter_prefixes=prefixes,
+        user_slug=user_slug,
+        doc_types=doc_types,
+        private_only=args.private_only and not args.public_only,
+        public_only=args.public_only,
+        date_from=args.date_from,
+        date_to=args.date_to,
+        include_archive=args.include_archive,
+        hybrid=args.hybrid,
+        lexical_only=args.lexical_only,
+        top_k_vector=args.top_k_vector,
+        top_k_lexical=args.top_k_lexical,
+        rrf_k=args.rrf_k,
+        rerank_top_n=args.rerank_top_n,
+        knowledge_store_path=knowledge_store_path,
+        source_family=args.source_family,
+        min_freshness=args.min_freshness,
+        top_k_knowledge=args.top_k_knowledge,
+    )
 
-        results = query_index(
-            question=args.question,
-            embedder=embedder,
-            k=args.k,
-            persist_directory=args.persist_dir,
-            collection_name=args.collection,
-            filter_prefixes=prefixes,
-            user_slug=user_slug,
-            doc_types=doc_types,
-            private_only=args.private_only and not args.public_only,
-            public_only=args.public_only,
-            date_from=args.date_from,
-            date_to=args.date_to,
-            include_archive=args.include_archive,
-            hybrid=args.hybrid,
-            lexical_only=args.lexical_only,
-            top_k_vector=args.top_k_vector,
-            top_k_lexical=args.top_k_lexical,
-            rrf_k=args.rrf_k,
-            reranker=reranker,
-            rerank_top_n=args.rerank_top_n,
-            knowledge_store_path=knowledge_store_path,
-            source_family=args.source_family,
-            min_freshness=args.min_freshness,
-            top_k_knowledge=args.top_k_knowledge,
+    results = None
+    service_url = None if args.no_service else resolve_service_url(args.service_url)
+    if service_url:
+        # The service may run from another directory: send absolute paths.
+        request = dict(
+            query_kwargs,
+            persist_directory=str(Path(args.persist_dir).resolve()),
+            lexical_db_path=str(DEFAULT_LEXICAL_DB_PATH.resolve()),
+            knowledge_store_path=(
+                str(Path(knowledge_store_path).resolve()) if knowledge_store_path else None
+            ),
+            embed_model=args.model,
+            device=args.device,
+            rerank=args.rerank,
+            rerank_model=args.rerank_model,
         )
-    except RuntimeError as exc:
-        print(f"Error: {exc}")
-        return 1
+        try:
+            results = query_service(request, url=service_url)
+        except RagServiceUnavailable as exc:
+            print(f"Warning: {exc}; querying in-process.", file=sys.stderr)
+        except (ValueError, RuntimeError) as exc:
+            print(f"Error: {exc}")
+            return 1
+
+    if results is None:
+        try:
+            embedder = None
+            if not args.lexical_only:
+                embedder = SentenceTransformerEmbedder(model_name=args.model, device=args.device)
+
+            # Build reranker if requested
+            reranker = None
+            if args.rerank:
+                reranker = CrossEncoderReranker(
+                    model_name=args.rerank_model,
+                    device=args.device,
+                    cache_folder="kb/rag/models",
+                )
+
+            results = query_index(embedder=embedder, reranker=reranker, **query_kwargs)
+        except RuntimeError as exc:
+            print(f"Error: {exc}")
+            return 1
 
     # Determine mode string
     if args.hybrid:
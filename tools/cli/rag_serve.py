@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Run the resident RAG query service on localhost.
+
+Keeps the embedder, reranker, Chroma collection and FTS5 connection warm so
+``rag-query --service``, the MCP server and research synthesis skip the
+per-query model load.  Point clients at it with ``--service-url`` or the
+``POLYTOOL_RAG_SERVICE_URL`` environment variable.
+
+Queries may only use the ``--model`` / ``--rerank-model`` given here and
+index paths under the directory the service was started from.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "packages"))
+
+from polymarket.rag.embedder import DEFAULT_EMBED_MODEL
+from polymarket.rag.reranker import DEFAULT_RERANK_MODEL
+from polymarket.rag.service import (
+    DEFAULT_QUERY_CACHE_SIZE,
+    DEFAULT_SERVICE_HOST,
+    DEFAULT_SERVICE_PORT,
+    SERVICE_URL_ENV,
+    RagQueryServer,
+    WarmRagResources,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Serve local RAG queries from warm models and index handles."
+    )
+    parser.add_argument("--host", default=DEFAULT_SERVICE_HOST, help="Bind address (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=DEFAULT_SERVICE_PORT, help="Bind port.")
+    parser.add_argument("--model", default=DEFAULT_EMBED_MODEL, help="Embedding model to preload and serve.")
+    parser.add_argument(
+        "--rerank-model",
+        default=DEFAULT_RERANK_MODEL,
+        help="Cross-encoder model served to --rerank queries (loaded on first use).",
+    )
+    parser.add_argument("--device", default="auto", help="Device: auto, cpu, cuda.")
+    parser.add_argument(
+        "--no-preload",
+        action="store_true",
+        default=False,
+        help="Load the embedding model on the first query instead of at startup.",
+    )
+    parser.add_argument(
+        "--query-cache-size",
+        type=int,
+        default=DEFAULT_QUERY_CACHE_SIZE,
+        help="Query embeddings kept in the LRU cache per model (0 disables).",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging level (stderr).",
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.query_cache_size < 0:
+        print("Error: --query-cache-size must be >= 0.")
+        return 1
+
+    logging.basicConfig(
+        stream=sys.stderr,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        level=getattr(logging, args.log_level),
+    )
+
+    resources = WarmRagResources(query_cache_size=args.query_cache_size)
+    if not args.no_preload:
+        try:
+            resources.get_embedder(args.model, args.device)
+        except RuntimeError as exc:
+            print(f"Error: {exc}")
+            return 1
+
+    try:
+        server = RagQueryServer(
+            args.host,
+            args.port,
+            resources=resources,
+            embed_models=(args.model,),
+            rerank_models=(args.rerank_model,),
+        )
+    except OSError as exc:
+        print(f"Error: cannot bind {args.host}:{args.port}: {exc}")
+        return 1
+
+    print(f"RAG query service listening on {server.url}")
+    print(f"  export {SERVICE_URL_ENV}={server.url}")
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        resources.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
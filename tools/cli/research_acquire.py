@@ -99,7 +99,10 @@ def _write_to_review_queue(decision, source_url: str, abstract: str, queue_dir:
             "review_threshold": decision.review_threshold,
             "config_version": decision.config_version,
         }
-        written = store.enqueue(record)
+        try:
+            written = store.enqueue(record)
+        finally:
+            store.close()
         if not written:
             print(
                 f"[filter:hold-review] already queued: {source_url}",
@@ -452,7 +455,12 @@ def main(argv: list) -> int:
     error_str = None
 
     store = None
+    near_dup_index = None
     try:
+        from packages.research.evaluation.near_dup_index import (
+            NearDuplicateIndex,
+            near_dup_db_path_for,
+        )
         from packages.research.ingestion.source_cache import RawSourceCache
         from packages.research.ingestion.pipeline import IngestPipeline
         from packages.polymarket.rag.knowledge_store import (
@@ -468,6 +476,7 @@ def main(argv: list) -> int:
         # Build KnowledgeStore
         db_path = args.db if args.db else DEFAULT_KNOWLEDGE_DB_PATH
         store = KnowledgeStore(db_path)
+        near_dup_index = NearDuplicateIndex(near_dup_db_path_for(db_path))
 
         # Build evaluator (or None if --no-eval)
         evaluator = None
@@ -478,9 +487,12 @@ def main(argv: list) -> int:
             evaluator = DocumentEvaluator(
                 provider=provider,
                 priority_tier=getattr(args, "priority_tier", None),
+                near_dup_index=near_dup_index,
             )
 
-        pipeline = IngestPipeline(store=store, evaluator=evaluator)
+        pipeline = IngestPipeline(
+            store=store, evaluator=evaluator, near_dup_index=near_dup_index
+        )
 
         # Ingest via adapter
         result = pipeline.ingest_external(
@@ -501,6 +513,8 @@ def main(argv: list) -> int:
     finally:
         if store is not None:
             store.close()
+        if near_dup_index is not None:
+            near_dup_index.close()
 
     # --- Step 6: Write acquisition review ---
     try:
@@ -625,8 +639,13 @@ def _run_search_mode(args) -> int:
 
     results_output = []
     store = None
+    near_dup_index = None
 
     try:
+        from packages.research.evaluation.near_dup_index import (
+            NearDuplicateIndex,
+            near_dup_db_path_for,
+        )
         from packages.research.ingestion.source_cache import RawSourceCache
         from packages.research.ingestion.pipeline import IngestPipeline
         from packages.research.ingestion.normalize import canonicalize_url, normalize_metadata
@@ -638,6 +657,7 @@ def _run_search_mode(args) -> int:
 
         db_path = args.db if args.db else DEFAULT_KNOWLEDGE_DB_PATH
         store = KnowledgeStore(db_path)
+        near_dup_index = NearDuplicateIndex(near_dup_db_path_for(db_path))
         cache_obj = RawSourceCache(args.cache_dir)
 
         evaluator = None
@@ -645,9 +665,11 @@ def _run_search_mode(args) -> int:
             from packages.research.evaluation.evaluator import DocumentEvaluator
             from packages.research.evaluation.providers import get_provider
             provider = get_provider(args.provider)
-            evaluator = DocumentEvaluator(provider=provider)
+            evaluator = DocumentEvaluator(provider=provider, near_dup_index=near_dup_index)
 
-        pipeline = IngestPipeline(store=store, evaluator=evaluator)
+        pipeline = IngestPipeline(
+            store=store, evaluator=evaluator, near_dup_index=near_dup_index
+        )
 
         for raw_source in raw_sources:
             paper_url = raw_source.get("url", "")
@@ -780,6 +802,8 @@ def _run_search_mode(args) -> int:
                 store.close()
             except Exception:
                 pass
+        if near_dup_index is not None:
+            near_dup_index.close()
 
     if args.output_json:
         print(
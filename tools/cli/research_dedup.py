@@ -0,0 +1,200 @@
+"""CLI entrypoint for the RIS near-duplicate (MinHash/LSH) index.
+
+Subcommands:
+  backfill  Index the bodies of existing KnowledgeStore source documents.
+  stats     Print index size and parameters.
+
+The index lives next to the KnowledgeStore DB (near_dup.sqlite3).  New
+documents are registered automatically by research-ingest / research-acquire;
+run ``backfill`` once for sources ingested before the index existed.
+
+Usage:
+  python -m polytool research-dedup backfill
+  python -m polytool research-dedup backfill --db kb/rag/knowledge/knowledge.sqlite3 --json
+  python -m polytool research-dedup stats
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+_KNOWN_SUBCOMMANDS = frozenset({"backfill", "stats"})
+
+
+def _add_common_path_args(parser: argparse.ArgumentParser) -> None:
+    """Add shared path-override arguments to a subcommand parser."""
+    parser.add_argument(
+        "--db",
+        metavar="PATH",
+        default=None,
+        help="Override KnowledgeStore SQLite path (default: kb/rag/knowledge/knowledge.sqlite3)",
+    )
+    parser.add_argument(
+        "--index",
+        metavar="PATH",
+        default=None,
+        help="Override near-duplicate index path (default: near_dup.sqlite3 next to --db)",
+    )
+    parser.add_argument(
+        "--json",
+        dest="output_json",
+        action="store_true",
+        default=False,
+        help="Output JSON instead of text.",
+    )
+
+
+def _open_index(args: argparse.Namespace):
+    from packages.polymarket.rag.knowledge_store import DEFAULT_KNOWLEDGE_DB_PATH
+    from packages.research.evaluation.near_dup_index import (
+        NearDuplicateIndex,
+        near_dup_db_path_for,
+    )
+
+    db_path = Path(args.db) if args.db else DEFAULT_KNOWLEDGE_DB_PATH
+    index_path = Path(args.index) if args.index else near_dup_db_path_for(db_path)
+    return db_path, index_path, NearDuplicateIndex(index_path)
+
+
+def _cmd_backfill(args: argparse.Namespace) -> int:
+    """Handle `research-dedup backfill` subcommand."""
+    from packages.polymarket.rag.knowledge_store import KnowledgeStore
+    from packages.research.ingestion.claim_extractor import _get_document_body
+
+    db_path, index_path, index = _open_index(args)
+    if not Path(db_path).exists():
+        index.close()
+        print(f"Error: KnowledgeStore not found: {db_path}", file=sys.stderr)
+        return 1
+
+    store = KnowledgeStore(db_path)
+    counts = {"scanned": 0, "indexed": 0, "skipped_existing": 0, "skipped_no_body": 0}
+    started = time.monotonic()
+
+    def _bodies():
+        for doc in store.iter_source_documents(batch_size=args.batch_size):
+            counts["scanned"] += 1
+            doc_id = doc["id"]
+            if not args.force and doc_id in index:
+                counts["skipped_existing"] += 1
+                continue
+            body = _get_document_body(store, doc)
+            if not body or not body.strip():
+                counts["skipped_no_body"] += 1
+                continue
+            yield doc_id, body
+
+    try:
+        counts["indexed"] = index.add_many(_bodies(), batch_size=args.batch_size)
+        total = len(index)
+    finally:
+        store.close()
+        index.close()
+
+    summary = {
+        "db_path": str(db_path),
+        "index_path": str(index_path),
+        **counts,
+        "index_size": total,
+        "elapsed_s": round(time.monotonic() - started, 3),
+    }
+    if args.output_json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"Near-duplicate index: {index_path}")
+        print(
+            f"  scanned={counts['scanned']} indexed={counts['indexed']} "
+            f"skipped_existing={counts['skipped_existing']} "
+            f"skipped_no_body={counts['skipped_no_body']}"
+        )
+        print(f"  index_size={total} elapsed={summary['elapsed_s']}s")
+        if counts["skipped_no_body"]:
+            print(
+                "  Note: sources without a stored body (metadata 'body' or file:// URL) "
+                "cannot be indexed; re-ingest them to register their text."
+            )
+    return 0
+
+
+def _cmd_stats(args: argparse.Namespace) -> int:
+    """Handle `research-dedup stats` subcommand."""
+    _, index_path, index = _open_index(args)
+    try:
+        stats = {
+            "index_path": str(index_path),
+            "documents": len(index),
+            "num_perm": index.num_perm,
+            "bands": index.bands,
+            "rows_per_band": index.rows,
+            "shingle_size": index.shingle_size,
+        }
+    finally:
+        index.close()
+
+    if args.output_json:
+        print(json.dumps(stats, indent=2))
+    else:
+        for key, value in stats.items():
+            print(f"{key}: {value}")
+    return 0
+
+
+def main(argv: list) -> int:
+    """CLI entrypoint for research-dedup command.
+
+    Args:
+        argv: Command-line arguments (excluding the command name itself).
+
+    Returns:
+        Exit code (0 = success, 1 = error).
+    """
+    parser = argparse.ArgumentParser(
+        prog="research-dedup",
+        description="Maintain the RIS MinHash/LSH near-duplicate index.",
+    )
+    subparsers = parser.add_subparsers(dest="subcommand", metavar="SUBCOMMAND")
+
+    backfill_parser = subparsers.add_parser(
+        "backfill",
+        help="Index the bodies of existing KnowledgeStore source documents.",
+    )
+    backfill_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Documents read and committed per batch (default: 500).",
+    )
+    backfill_parser.add_argument(
+        "--force",
+        action="store_true",
+        default=False,
+        help="Re-index documents that are already in the index.",
+    )
+    _add_common_path_args(backfill_parser)
+
+    stats_parser = subparsers.add_parser(
+        "stats",
+        help="Print index size and parameters.",
+    )
+    _add_common_path_args(stats_parser)
+
+    args = parser.parse_args(argv)
+
+    if not args.subcommand or args.subcommand not in _KNOWN_SUBCOMMANDS:
+        parser.print_help()
+        return 1
+
+    if args.subcommand == "backfill":
+        if args.batch_size <= 0:
+            print("Error: --batch-size must be positive.", file=sys.stderr)
+            return 1
+        return _cmd_backfill(args)
+    elif args.subcommand == "stats":
+        return _cmd_stats(args)
+
+    parser.print_help()
+    return 1
@@ -151,15 +151,21 @@ def main(argv: list) -> int:
     _ingest_error: bool = False
 
     store = None
+    near_dup_index = None
     try:
         from packages.polymarket.rag.knowledge_store import (
             KnowledgeStore,
             DEFAULT_KNOWLEDGE_DB_PATH,
         )
+        from packages.research.evaluation.near_dup_index import (
+            NearDuplicateIndex,
+            near_dup_db_path_for,
+        )
         from packages.research.ingestion.pipeline import IngestPipeline
 
         db_path = args.db if args.db else DEFAULT_KNOWLEDGE_DB_PATH
         store = KnowledgeStore(db_path)
+        near_dup_index = NearDuplicateIndex(near_dup_db_path_for(db_path))
 
         # Build evaluator if eval is active
         evaluator = None
@@ -170,9 +176,12 @@ def main(argv: list) -> int:
             evaluator = DocumentEvaluator(
                 provider=provider,
                 priority_tier=getattr(args, "priority_tier", None),
+                near_dup_index=near_dup_index,
             )
 
-        pipeline = IngestPipeline(store=store, evaluator=evaluator)
+        pipeline = IngestPipeline(
+            store=store, evaluator=evaluator, near_dup_index=near_dup_index
+        )
 
         if args.from_adapter:
             # Phase 4 adapter path: load raw JSON -> ingest via adapter
@@ -234,6 +243,8 @@ def main(argv: list) -> int:
     finally:
         if store is not None:
             store.close()
+        if near_dup_index is not None:
+            near_dup_index.close()
 
     # Output
     if result.rejected:
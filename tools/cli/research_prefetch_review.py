@@ -155,8 +155,7 @@ def _cmd_label(args: argparse.Namespace) -> int:
 
     # Find matching queue record for title/URL
     queue = _open_queue(args)
-    records = queue.all_records()
-    matched = [r for r in records if r.get("candidate_id", "").startswith(candidate_id)]
+    matched = queue.find(candidate_id)
 
     if not matched:
         print(
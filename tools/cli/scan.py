@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import hashlib
 import json
 import os
@@ -299,6 +300,22 @@ def _resolve_bool_flag(
     return default_value
 
 
+# Optional semaphore-like object capping in-flight local API requests; set by
+# wallet-scan workers when --api-concurrency is below --concurrency. The
+# upstream Polymarket rate is budgeted by per-host token buckets instead.
+_API_REQUEST_GATE: Optional[Any] = None
+
+
+def set_api_request_gate(gate: Optional[Any]) -> None:
+    """Route every API request through ``gate`` (anything usable as a context manager)."""
+    global _API_REQUEST_GATE
+    _API_REQUEST_GATE = gate
+
+
+def _api_request_gate() -> Any:
+    return _API_REQUEST_GATE if _API_REQUEST_GATE is not None else contextlib.nullcontext()
+
+
 def request_with_retry(
     method: str,
     url: str,
@@ -311,7 +328,8 @@ def request_with_retry(
     last_is_connection_error = False
     while True:
         try:
-            response = requests.request(method, url, json=payload, timeout=timeout)
+            with _api_request_gate():
+                response = requests.request(method, url, json=payload, timeout=timeout)
             return response
         except requests.exceptions.RequestException as exc:
             last_is_connection_error = isinstance(exc, requests.exceptions.ConnectionError)
@@ -361,7 +379,8 @@ def get_json(
     attempt = 0
     while True:
         try:
-            response = requests.get(url, params=params, timeout=timeout)
+            with _api_request_gate():
+                response = requests.get(url, params=params, timeout=timeout)
             break
         except requests.exceptions.RequestException as exc:
             if attempt >= retries:
@@ -331,8 +331,9 @@ def scan_tapes(
 ) -> list[CandidateResult]:
     """Replay local tape files and score tick-by-tick for Gate 2 criteria.
 
-    Finds all subdirectories under ``tapes_dir`` that contain ``events.jsonl``,
-    replays each tape through L2 books, and computes per-tape statistics.
+    Finds all subdirectories under ``tapes_dir`` that contain ``events.jsonl``
+    (or a converted ``events.ctape``), replays each tape through L2 books,
+    and computes per-tape statistics.
 
     Args:
         tapes_dir:  Directory containing tape subdirectories.
@@ -343,6 +344,8 @@ def scan_tapes(
         List of CandidateResult, one per tape with at least one scoreable tick.
     """
     from packages.polymarket.simtrader.orderbook.l2book import L2Book
+    from packages.polymarket.simtrader.replay.stream import iter_tape_events
+    from packages.polymarket.simtrader.tape.columnar import resolve_tape_events_path
     from packages.polymarket.simtrader.tape.schema import (
         EVENT_TYPE_BOOK,
         EVENT_TYPE_PRICE_CHANGE,
@@ -356,22 +359,15 @@ def scan_tapes(
     logger.debug("Found %d potential tape directories under %s", len(tape_dirs), tapes_dir)
 
     for tape_dir in tape_dirs:
-        events_file = tape_dir / "events.jsonl"
-        if not events_file.exists():
-            logger.debug("Skipping %s: no events.jsonl", tape_dir.name)
+        events_file = resolve_tape_events_path(tape_dir)
+        if events_file is None:
+            logger.debug("Skipping %s: no events.jsonl or events.ctape", tape_dir.name)
             continue
 
-        # Load all events
-        events: list[dict] = []
-        with open(events_file, encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+        # Load all events (JSONL or columnar; malformed lines are skipped)
+        events: list[dict] = list(
+            iter_tape_events(events_file, on_malformed=lambda *_: None)
+        )
 
         # Discover asset IDs from book events and price_change batches
         seen_assets: list[str] = []
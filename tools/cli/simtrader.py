@@ -238,6 +238,34 @@ def _tape_info(args: argparse.Namespace) -> int:
     return 0
 
 
+def _tape_convert(args: argparse.Namespace) -> int:
+    """Convert an events.jsonl tape into the columnar .ctape format."""
+    from packages.polymarket.simtrader.tape.columnar import convert_jsonl_tape
+
+    events_path = Path(args.tape)
+    if not events_path.exists():
+        print(f"Error: tape file not found: {events_path}", file=sys.stderr)
+        return 1
+
+    out_path = Path(args.out) if args.out else None
+    try:
+        result = convert_jsonl_tape(events_path, out_path)
+    except (OSError, ValueError) as exc:
+        print(f"Error: tape conversion failed: {exc}", file=sys.stderr)
+        return 1
+
+    ratio = result.source_bytes / result.output_bytes if result.output_bytes else 0.0
+    print(f"Columnar tape written: {result.out_path}")
+    print(f"  events       : {result.events} ({result.raw_events} stored as raw JSON)")
+    print(f"  levels       : {result.levels}")
+    print(f"  malformed    : {result.malformed_lines} line(s) dropped")
+    print(
+        f"  size         : {result.source_bytes} -> {result.output_bytes} bytes "
+        f"({ratio:.1f}x smaller)"
+    )
+    return 0
+
+
 def _replay(args: argparse.Namespace) -> int:
     try:
         from packages.polymarket.simtrader.replay.runner import ReplayRunner
@@ -263,6 +291,9 @@ def _replay(args: argparse.Namespace) -> int:
         run_dir=run_dir,
         strict=args.strict,
         output_format=args.format,
+        stream=getattr(args, "stream", False),
+        start_ts=getattr(args, "start_ts", None),
+        end_ts=getattr(args, "end_ts", None),
     )
 
     try:
@@ -353,17 +384,14 @@ def _trade(args: argparse.Namespace) -> int:
     print(f"[simtrader trade] mark-method   : {mark_method}", file=sys.stderr)
 
     # -- Load and sort events --------------------------------------------------
-    events: list[dict] = []
+    from packages.polymarket.simtrader.replay.stream import iter_tape_events
+
     warnings: list[str] = []
-    with open(events_path, encoding="utf-8") as fh:
-        for lineno, line in enumerate(fh, start=1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                events.append(json.loads(line))
-            except json.JSONDecodeError as exc:
-                warnings.append(f"Skipping malformed line {lineno}: {exc}")
+
+    def _on_malformed(lineno: int, exc: json.JSONDecodeError) -> None:
+        warnings.append(f"Skipping malformed line {lineno}: {exc}")
+
+    events: list[dict] = list(iter_tape_events(events_path, on_malformed=_on_malformed))
     events.sort(key=lambda e: e.get("seq", 0))
 
     if not events:
@@ -1148,10 +1176,17 @@ def _run(args: argparse.Namespace) -> int:
     if tape_event_count is None:
         # Fallback: quick line count (not parsed, just non-blank lines).
         try:
-            tape_event_count = sum(
-                1 for line in events_path.read_text(encoding="utf-8").splitlines()
-                if line.strip()
+            from packages.polymarket.simtrader.tape.columnar import (
+                ColumnarTape,
+                is_columnar_tape,
             )
+
+            if is_columnar_tape(events_path):
+                with ColumnarTape(events_path) as _ct:
+                    tape_event_count = _ct.n_events
+            else:
+                with open(events_path, encoding="utf-8") as _fh:
+                    tape_event_count = sum(1 for line in _fh if line.strip())
         except Exception:  # noqa: BLE001
             pass
     if tape_event_count is not None and min_events > 0 and tape_event_count < min_events:
@@ -1218,6 +1253,9 @@ def _run(args: argparse.Namespace) -> int:
                 market_slug=market_slug,
                 fee_category=fee_category,
                 fee_role="taker",
+                stream=getattr(args, "stream", False),
+                start_ts=getattr(args, "start_ts", None),
+                end_ts=getattr(args, "end_ts", None),
             )
         )
     except StrategyRunConfigError as exc:
@@ -1379,6 +1417,7 @@ def _sweep(args: argparse.Namespace) -> int:
                 market_slug=market_slug,
                 fee_category=fee_category,
                 fee_role="taker",
+                workers=getattr(args, "workers", 1),
             ),
             sweep_config=sweep_config,
         )
@@ -1974,6 +2013,7 @@ def _quickrun(args: argparse.Namespace) -> int:
                     market_slug=resolved.slug,
                     fee_category=fee_category_qs,
                     fee_role="taker",
+                    workers=getattr(args, "workers", 1),
                 ),
                 sweep_config=sweep_config,
             )
@@ -3041,6 +3081,30 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Optional path to write the JSON summary (prints to stdout if omitted).",
     )
 
+    # ------------------------------------------------------------------
+    # tape-convert
+    # ------------------------------------------------------------------
+    tape_convert = sub.add_parser(
+        "tape-convert",
+        help=(
+            "Convert an events.jsonl tape to the columnar .ctape format (smaller "
+            "on disk; replay load time is about the same as JSONL).  "
+            "replay, run, trade and sweep accept the resulting .ctape via --tape."
+        ),
+    )
+    tape_convert.add_argument(
+        "--tape",
+        required=True,
+        metavar="PATH",
+        help="Path to the events.jsonl tape file.",
+    )
+    tape_convert.add_argument(
+        "--out",
+        default=None,
+        metavar="PATH",
+        help="Output path (default: events.ctape next to the input tape).",
+    )
+
     # ------------------------------------------------------------------
     # replay
     # ------------------------------------------------------------------
@@ -3075,6 +3139,32 @@ def _build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Fail on missing book snapshot or invalid events.",
     )
+    rep.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help=(
+            "Bounded-memory replay: read the seq-ordered tape lazily and write "
+            "timeline rows as they are produced."
+        ),
+    )
+    rep.add_argument(
+        "--start-ts",
+        type=float,
+        default=None,
+        metavar="TS",
+        help=(
+            "Windowed replay: skip events with ts_recv before TS (epoch seconds). "
+            "Books start from the tape index sidecar's nearest checkpoint."
+        ),
+    )
+    rep.add_argument(
+        "--end-ts",
+        type=float,
+        default=None,
+        metavar="TS",
+        help="Windowed replay: stop after the last event with ts_recv <= TS.",
+    )
 
     # ------------------------------------------------------------------
     # trade
@@ -3369,6 +3459,32 @@ def _build_parser() -> argparse.ArgumentParser:
             "The run is marked degraded instead of invalid."
         ),
     )
+    run_p.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help=(
+            "Bounded-memory replay for long tapes: read the seq-ordered tape lazily "
+            "and stream timeline/decision/order rows to disk as they are produced."
+        ),
+    )
+    run_p.add_argument(
+        "--start-ts",
+        type=float,
+        default=None,
+        metavar="TS",
+        help=(
+            "Windowed replay: skip events with ts_recv before TS (epoch seconds). "
+            "Books start from the tape index sidecar's nearest checkpoint."
+        ),
+    )
+    run_p.add_argument(
+        "--end-ts",
+        type=float,
+        default=None,
+        metavar="TS",
+        help="Windowed replay: stop after the last event with ts_recv <= TS.",
+    )
     run_p.add_argument(
         "--min-events",
         type=int,
@@ -3522,6 +3638,17 @@ def _build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Fail on L2BookError or malformed events instead of warning and skipping.",
     )
+    sweep_p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        dest="workers",
+        help=(
+            "Run scenarios in N worker processes (default: 1 = sequential).  "
+            "Output ordering is identical to a sequential sweep."
+        ),
+    )
 
     mm_sweep_p = sub.add_parser(
         "sweep-mm",
@@ -3860,6 +3987,14 @@ def _build_parser() -> argparse.ArgumentParser:
             "Also accepts 'preset:quick' for future-proof usage."
         ),
     )
+    qr.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        dest="workers",
+        help="With --sweep: run scenarios in N worker processes (default: 1).",
+    )
 
     # ------------------------------------------------------------------
     # batch
@@ -4021,6 +4156,18 @@ def _build_parser() -> argparse.ArgumentParser:
             "When exceeded, no new markets are launched and remaining markets are skipped."
         ),
     )
+    batch_p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        dest="workers",
+        help=(
+            "Record up to N markets at once and sweep finished tapes in up to N "
+            "worker processes (default: 1 = sequential).  Summary output is "
+            "identical to a sequential batch."
+        ),
+    )
 
     # ------------------------------------------------------------------
     # shadow
@@ -4664,6 +4811,7 @@ def _batch(args: argparse.Namespace) -> int:
         rerun=args.rerun,
         time_budget_seconds=args.time_budget_seconds,
         strategy_preset=strategy_preset,
+        workers=getattr(args, "workers", 1),
     )
 
     print(
@@ -5429,6 +5577,8 @@ def main(argv: list[str]) -> int:
         return _record(args)
     if args.subcommand == "tape-info":
         return _tape_info(args)
+    if args.subcommand == "tape-convert":
+        return _tape_convert(args)
     if args.subcommand == "replay":
         return _replay(args)
     if args.subcommand == "trade":
@@ -499,9 +499,23 @@ def _read_asset_ids(tape_dir: Path) -> tuple[str, str]:
             pass
 
     # Last resort: discover from event stream.
-    events_path = tape_dir / "events.jsonl"
-    if events_path.exists():
-        seen: list[str] = []
+    from packages.polymarket.simtrader.tape.columnar import (
+        ColumnarTape,
+        is_columnar_tape,
+        resolve_tape_events_path,
+    )
+
+    events_path = resolve_tape_events_path(tape_dir)
+    seen: list[str] = []
+    if events_path is not None and is_columnar_tape(events_path):
+        try:
+            with ColumnarTape(events_path) as tape:
+                seen = tape.book_asset_ids(limit=2)
+        except (OSError, ValueError):
+            pass
+        if len(seen) >= 2:
+            return seen[0], seen[1]
+    elif events_path is not None:
         try:
             with open(events_path, encoding="utf-8") as fh:
                 for line in fh:
@@ -575,8 +589,10 @@ def scan_one_tape(
         reference_time=tape_metadata.get("captured_at"),
     )
 
-    events_path = tape_dir / "events.jsonl"
-    if not events_path.exists():
+    from packages.polymarket.simtrader.tape.columnar import resolve_tape_events_path
+
+    events_path = resolve_tape_events_path(tape_dir)
+    if events_path is None:
         return TapeRecord(
             tape_dir=str(tape_dir),
             slug=slug,
@@ -8,17 +8,25 @@ Output artifacts (under <out>/<YYYY-MM-DD>/<run_id>/):
   per_user_results.jsonl      - one JSON object per identifier
   leaderboard.json            - sorted deterministic leaderboard
   leaderboard.md              - human-readable top-N summary
+
+With --concurrency N (N > 1) entries are scanned in N worker processes.
+Each entry also gets per_user/<index>.json and logs/<index>.log; the
+leaderboard and per_user_results.jsonl are merged in input order.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
+import multiprocessing
+import os
 import sys
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from polytool.user_context import resolve_user_context
 
@@ -26,6 +34,8 @@ DEFAULT_OUTPUT_ROOT = Path("artifacts") / "research" / "wallet_scan"
 DEFAULT_PROFILE = "lite"
 DEFAULT_DOSSIER_DB = "kb/rag/knowledge/knowledge.sqlite3"
 TOP_N_LEADERBOARD = 20
+# Requests per second per Polymarket API host, shared by all parallel scan workers.
+DEFAULT_API_RATE_PER_SECOND = 20.0
 
 # Scan flags used for each profile. These are passed to the injected scan callable.
 _PROFILE_FLAGS: Dict[str, Dict[str, Any]] = {
@@ -47,6 +57,10 @@ _PROFILE_FLAGS: Dict[str, Dict[str, Any]] = {
 
 ScanCallable = Callable[[str, Dict[str, Any]], str]
 
+# ExecutorFactory: builds the pool used for --concurrency > 1 from
+# (workers, api_concurrency, api_rate_per_second). The default is a process pool.
+ExecutorFactory = Callable[[int, int, float], Executor]
+
 # PostScanExtractor: called once per successful scan with the scan run root dir,
 # the resolved user slug, and the wallet address.  Must never raise (errors are
 # caught and logged non-fatally so the scan loop is never aborted).
@@ -224,6 +238,91 @@ def _default_scan_callable(identifier: str, scan_flags: Dict[str, Any]) -> str:
     raise ValueError(f"Scan output missing run root for identifier '{identifier}'")
 
 
+# ---------------------------------------------------------------------------
+# Parallel workers
+# ---------------------------------------------------------------------------
+
+# Set by _init_scan_worker in worker processes: write scan output to per-entry logs.
+_ISOLATE_WORKER_OUTPUT = False
+
+
+def _polymarket_api_bases() -> List[str]:
+    """Base URLs of the Polymarket APIs scan workers call directly."""
+    from packages.polymarket.clob import DEFAULT_CLOB_API_BASE
+    from packages.polymarket.data_api import DEFAULT_DATA_API_BASE
+    from packages.polymarket.gamma import DEFAULT_GAMMA_API_BASE
+
+    return [
+        os.getenv("GAMMA_API_BASE", DEFAULT_GAMMA_API_BASE),
+        os.getenv("DATA_API_BASE", DEFAULT_DATA_API_BASE),
+        os.getenv("CLOB_API_BASE", DEFAULT_CLOB_API_BASE),
+    ]
+
+
+def _init_scan_worker(api_gate: Any, host_limiters: Dict[str, Any]) -> None:
+    """Process-pool initializer: install the shared per-host budgets (and optional API gate)."""
+    global _ISOLATE_WORKER_OUTPUT
+    from packages.polymarket import http_client
+    from tools.cli import scan
+
+    _ISOLATE_WORKER_OUTPUT = True
+    scan.set_api_request_gate(api_gate)
+    for base_url, bucket in host_limiters.items():
+        http_client.set_host_rate_limiter(base_url, bucket)
+
+
+def _process_pool_executor(workers: int, api_concurrency: int, api_rate: float) -> Executor:
+    """Default executor for --concurrency: worker processes sharing one upstream budget.
+
+    Each Polymarket host gets one ``SharedTokenBucket`` drawn on by every
+    worker, so the combined request rate stays at ``api_rate`` however many
+    workers run. The cross-process API gate is only installed when
+    ``api_concurrency`` is below ``workers``.
+    """
+    from packages.polymarket.http_client import SharedTokenBucket
+
+    burst = max(int(api_rate), 1)
+    host_limiters = {base_url: SharedTokenBucket(api_rate, burst) for base_url in _polymarket_api_bases()}
+    api_gate = None
+    if api_concurrency < workers:
+        api_gate = multiprocessing.BoundedSemaphore(max(int(api_concurrency), 1))
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_scan_worker,
+        initargs=(api_gate, host_limiters),
+    )
+
+
+def _scan_entry(
+    entry: Dict[str, str],
+    scan_flags: Dict[str, Any],
+    scan_callable: ScanCallable,
+    log_path: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Optional[BaseException]]:
+    """Resolve and scan one entry; return (per-user result, exception or None)."""
+    identifier = entry["identifier"]
+    slug: Optional[str] = None
+    with contextlib.ExitStack() as stack:
+        if log_path is not None and _ISOLATE_WORKER_OUTPUT:
+            log_file = stack.enter_context(open(log_path, "w", encoding="utf-8"))
+            stack.enter_context(contextlib.redirect_stdout(log_file))
+            stack.enter_context(contextlib.redirect_stderr(log_file))
+        try:
+            # Resolve slug before scanning (for failure records)
+            kind = entry["kind"]
+            if kind == "handle":
+                ctx = resolve_user_context(handle=identifier, persist_mapping=False)
+            else:
+                ctx = resolve_user_context(wallet=identifier, persist_mapping=False)
+            slug = ctx.slug
+
+            scan_run_root_str = scan_callable(identifier, scan_flags)
+            return _success_result(entry, slug, Path(scan_run_root_str)), None
+        except Exception as exc:
+            error_text = f"{type(exc).__name__}: {exc}"
+            return _failure_result(entry, slug, error_text), exc
+
+
 # ---------------------------------------------------------------------------
 # Artifact extraction
 # ---------------------------------------------------------------------------
@@ -432,10 +531,108 @@ class WalletScanner:
         scan_callable: Optional[ScanCallable] = None,
         now_provider: Optional[Callable[[], datetime]] = None,
         post_scan_extractor: Optional[PostScanExtractor] = None,
+        executor_factory: Optional[ExecutorFactory] = None,
     ) -> None:
         self._scan_callable = scan_callable or _default_scan_callable
         self._now_provider = now_provider or _utcnow
         self._post_scan_extractor = post_scan_extractor
+        self._executor_factory = executor_factory or _process_pool_executor
+
+    def _run_post_scan_extractor(self, result: Dict[str, Any]) -> None:
+        # Non-fatal: errors are caught and logged; the scan loop always continues.
+        if self._post_scan_extractor is None or result.get("status") != "success":
+            return
+        scan_run_root = Path(str(result["run_root"]))
+        wallet_addr = _read_wallet_from_dossier(scan_run_root)
+        try:
+            self._post_scan_extractor(
+                scan_run_root,
+                str(result.get("slug") or ""),
+                wallet_addr,
+            )
+        except Exception as exc:
+            print(
+                f"[dossier-extract] Non-fatal error for {result['identifier']!r}: {exc}",
+                file=sys.stderr,
+            )
+
+    def _scan_sequential(
+        self,
+        entries: List[Dict[str, str]],
+        scan_flags: Dict[str, Any],
+        continue_on_error: bool,
+    ) -> List[Dict[str, Any]]:
+        per_user_results: List[Dict[str, Any]] = []
+        for entry in entries:
+            result, error = _scan_entry(entry, scan_flags, self._scan_callable)
+            # Post-scan hook: extract dossier findings into KnowledgeStore.
+            self._run_post_scan_extractor(result)
+            per_user_results.append(result)
+            if error is not None and not continue_on_error:
+                raise error
+        return per_user_results
+
+    def _scan_parallel(
+        self,
+        entries: List[Dict[str, str]],
+        scan_flags: Dict[str, Any],
+        continue_on_error: bool,
+        *,
+        run_root: Path,
+        concurrency: int,
+        api_concurrency: int,
+        api_rate: float,
+    ) -> List[Dict[str, Any]]:
+        """Scan entries in worker processes; results come back in input order.
+
+        Each finished entry is written to per_user/<index>.json as soon as it
+        completes (scan output goes to logs/<index>.log), so a crashed run
+        still leaves every completed user's result on disk. The dossier
+        extractor runs here in the parent, one entry at a time.
+        """
+        per_user_dir = run_root / "per_user"
+        logs_dir = run_root / "logs"
+        per_user_dir.mkdir(parents=True, exist_ok=True)
+        logs_dir.mkdir(parents=True, exist_ok=True)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(entries)
+        first_error: Optional[BaseException] = None
+        executor = self._executor_factory(concurrency, api_concurrency, api_rate)
+        try:
+            pending: Dict[Future, int] = {
+                executor.submit(
+                    _scan_entry,
+                    entry,
+                    scan_flags,
+                    self._scan_callable,
+                    (logs_dir / f"{idx:05d}.log").as_posix(),
+                ): idx
+                for idx, entry in enumerate(entries)
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    idx = pending.pop(future)
+                    try:
+                        result, error = future.result()
+                    except Exception as exc:  # worker crashed or result not picklable
+                        error = exc
+                        result = _failure_result(entries[idx], None, f"{type(exc).__name__}: {exc}")
+                    results[idx] = result
+                    _write_json(per_user_dir / f"{idx:05d}.json", result)
+                    self._run_post_scan_extractor(result)
+                    if error is not None and not continue_on_error and first_error is None:
+                        first_error = error
+                        for other in pending:
+                            other.cancel()
+                if first_error is not None:
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if first_error is not None:
+            raise first_error
+        return [result for result in results if result is not None]
 
     def run(
         self,
@@ -446,6 +643,9 @@ class WalletScanner:
         profile: str,
         input_file_path: str,
         continue_on_error: bool = True,
+        concurrency: int = 1,
+        api_concurrency: Optional[int] = None,
+        api_rate: float = DEFAULT_API_RATE_PER_SECOND,
     ) -> Dict[str, str]:
         now = self._now_provider()
         created_at = _iso_utc(now)
@@ -455,46 +655,20 @@ class WalletScanner:
         run_root = output_root / scan_date / run_id
         run_root.mkdir(parents=True, exist_ok=True)
 
-        per_user_results: List[Dict[str, Any]] = []
-
-        for entry in entries:
-            identifier = entry["identifier"]
-            slug: Optional[str] = None
-            try:
-                # Resolve slug before scanning (for failure records)
-                kind = entry["kind"]
-                if kind == "handle":
-                    ctx = resolve_user_context(handle=identifier, persist_mapping=False)
-                else:
-                    ctx = resolve_user_context(wallet=identifier, persist_mapping=False)
-                slug = ctx.slug
-
-                scan_run_root_str = self._scan_callable(identifier, scan_flags)
-                scan_run_root = Path(scan_run_root_str)
-                result = _success_result(entry, slug, scan_run_root)
-
-                # Post-scan hook: extract dossier findings into KnowledgeStore.
-                # Non-fatal: errors are caught and logged; the scan loop always continues.
-                if self._post_scan_extractor is not None:
-                    wallet_addr = _read_wallet_from_dossier(scan_run_root)
-                    try:
-                        self._post_scan_extractor(
-                            scan_run_root,
-                            str(slug or ""),
-                            wallet_addr,
-                        )
-                    except Exception as exc:
-                        print(
-                            f"[dossier-extract] Non-fatal error for {identifier!r}: {exc}",
-                            file=sys.stderr,
-                        )
-
-                per_user_results.append(result)
-            except Exception as exc:
-                error_text = f"{type(exc).__name__}: {exc}"
-                per_user_results.append(_failure_result(entry, slug, error_text))
-                if not continue_on_error:
-                    raise
+        workers = max(int(concurrency), 1)
+        if workers > 1 and len(entries) > 1:
+            pool_size = min(workers, len(entries))
+            per_user_results = self._scan_parallel(
+                entries,
+                scan_flags,
+                continue_on_error,
+                run_root=run_root,
+                concurrency=pool_size,
+                api_concurrency=api_concurrency or pool_size,
+                api_rate=api_rate,
+            )
+        else:
+            per_user_results = self._scan_sequential(entries, scan_flags, continue_on_error)
 
         leaderboard = _build_leaderboard(
             per_user_results,
@@ -516,6 +690,7 @@ class WalletScanner:
             "entries_attempted": len(entries),
             "entries_succeeded": leaderboard["entries_succeeded"],
             "entries_failed": leaderboard["entries_failed"],
+            "concurrency": workers,
             "output_paths": {
                 "run_root": run_root.as_posix(),
                 "wallet_scan_manifest_json": (run_root / "wallet_scan_manifest.json").as_posix(),
@@ -591,6 +766,30 @@ def build_parser() -> argparse.ArgumentParser:
         default=True,
         help="Continue on per-entry scan failures (default: true).",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Scan this many wallets in parallel worker processes (default: 1, sequential).",
+    )
+    parser.add_argument(
+        "--api-concurrency",
+        type=int,
+        help=(
+            "Max in-flight local API requests shared by all workers "
+            "(default: --concurrency, i.e. no extra cap)."
+        ),
+    )
+    parser.add_argument(
+        "--api-rate",
+        type=float,
+        default=DEFAULT_API_RATE_PER_SECOND,
+        help=(
+            "Requests per second to each Polymarket API host, shared by all workers "
+            f"(default: {DEFAULT_API_RATE_PER_SECOND:g}). Calls made through the local "
+            "API server are budgeted by its POLYMARKET_API_RATE_PER_SECOND."
+        ),
+    )
     parser.add_argument(
         "--extract-dossier",
         action="store_true",
@@ -631,6 +830,13 @@ def main(argv: Optional[List[str]] = None) -> int:
         print("Error: input file produced zero entries after filtering blank/comment lines.", file=sys.stderr)
         return 1
 
+    if args.concurrency < 1 or (args.api_concurrency is not None and args.api_concurrency < 1):
+        print("Error: --concurrency and --api-concurrency must be >= 1.", file=sys.stderr)
+        return 1
+    if args.api_rate <= 0:
+        print("Error: --api-rate must be > 0.", file=sys.stderr)
+        return 1
+
     post_scan_extractor = None
     if getattr(args, "extract_dossier", False):
         post_scan_extractor = _make_dossier_extractor(
@@ -646,6 +852,9 @@ def main(argv: Optional[List[str]] = None) -> int:
             profile=args.profile,
             input_file_path=input_path.as_posix(),
             continue_on_error=bool(args.continue_on_error),
+            concurrency=args.concurrency,
+            api_concurrency=args.api_concurrency,
+            api_rate=args.api_rate,
         )
     except Exception as exc:
         print(f"Wallet scan failed: {type(exc).__name__}: {exc}", file=sys.stderr)
@@ -428,13 +428,10 @@ def run_diagnostic(
 
 def _has_competitive_levels(book: L2Book, order: "Order") -> bool:
     """Return True if the book has levels that would satisfy *order* at its limit price."""
-    from packages.polymarket.simtrader.broker.fill_engine import (
-        _sorted_ask_levels,
-        _sorted_bid_levels,
-    )
-    if order.side == Side.BUY:
-        return bool(_sorted_ask_levels(book, order.limit_price))
-    return bool(_sorted_bid_levels(book, order.limit_price))
+    from packages.polymarket.simtrader.broker.fill_engine import iter_competitive_levels
+
+    levels = iter_competitive_levels(book, order.side, order.limit_price)
+    return next(levels, None) is not None
 
 
 def _compute_verdict(
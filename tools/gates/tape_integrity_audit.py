@@ -31,6 +31,15 @@ from typing import Dict, List, Optional, Tuple
 # Paths
 # ---------------------------------------------------------------------------
 _REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from packages.polymarket.simtrader.tape.columnar import (  # noqa: E402
+    ColumnarTape,
+    is_columnar_tape,
+    iter_columnar_events,
+    resolve_tape_events_path,
+)
 
 _TAPE_ROOTS: Dict[str, Path] = {
     "gold":       _REPO_ROOT / "artifacts/tapes/gold",
@@ -151,6 +160,44 @@ def _load_jsonl_lines(path: Path) -> Tuple[List[dict], List[str]]:
     return lines, issues
 
 
+def _load_tape_events(path: Path) -> Tuple[List[dict], List[str]]:
+    """Like :func:`_load_jsonl_lines`, but also reads converted ``.ctape`` tapes.
+
+    Columnar tapes are written atomically and drop malformed lines at
+    conversion time, so the only structural issue they can report is an
+    unreadable file.
+    """
+    if not is_columnar_tape(path):
+        return _load_jsonl_lines(path)
+    try:
+        events = [ev for ev in iter_columnar_events(path) if isinstance(ev, dict)]
+    except (OSError, ValueError):
+        return [], [JSONL_BROKEN]
+    return events, ([] if events else [EMPTY_TAPE])
+
+
+def _load_ts_recv(path: Path) -> List[float]:
+    """Return the ts_recv sequence of a tape; ``.ctape`` reads the column directly."""
+    if not is_columnar_tape(path):
+        events, _ = _load_jsonl_lines(path)
+        return _extract_ts_recv(events)
+    with ColumnarTape(path) as tape:
+        ts_col = tape.column("ts_recv").tolist()
+        raws = tape.column("raw").tolist()
+        if not any(ref >= 0 for ref in raws):
+            return ts_col
+        strings = tape.strings
+        result = []
+        for ts, ref in zip(ts_col, raws):
+            if ref < 0:
+                result.append(ts)
+                continue
+            raw_event = json.loads(strings[ref])
+            if isinstance(raw_event, dict):
+                result.extend(_extract_ts_recv([raw_event]))
+        return result
+
+
 def _extract_ts_recv(events: List[dict]) -> List[float]:
     """Extract ts_recv from events, skipping any that lack it."""
     result = []
@@ -359,20 +406,14 @@ def _find_events_file(tape_abs: Path, root_name: str) -> Optional[Path]:
     """Return the primary events file path for this tape, or None if missing."""
     # Silver tapes use silver_events.jsonl
     if root_name == "silver":
-        candidate = tape_abs / "silver_events.jsonl"
-        if candidate.exists():
+        candidate = resolve_tape_events_path(tape_abs, "silver_events.jsonl")
+        if candidate is not None:
             return candidate
         # Fallback — some silver tapes may have events.jsonl too
-        fallback = tape_abs / "events.jsonl"
-        if fallback.exists():
-            return fallback
-        return None
+        return resolve_tape_events_path(tape_abs)
 
-    # All other roots use events.jsonl
-    candidate = tape_abs / "events.jsonl"
-    if candidate.exists():
-        return candidate
-    return None
+    # All other roots use events.jsonl (or its converted events.ctape)
+    return resolve_tape_events_path(tape_abs)
 
 
 # ---------------------------------------------------------------------------
@@ -391,7 +432,7 @@ def _audit_tape(tape_abs: Path, root_name: str) -> TapeResult:
         result.issues.append(MISSING_FILES)
         return result  # Can't proceed further without events file
 
-    events, struct_issues = _load_jsonl_lines(events_path)
+    events, struct_issues = _load_tape_events(events_path)
     result.issues.extend(i for i in struct_issues if i not in result.issues)
 
     if not events:
@@ -549,14 +590,13 @@ def _compute_cadence(shadow_root: Path, sample_n: int) -> Optional[CadenceStats]
     sampled_count = 0
 
     for tape_abs in sampled:
-        ev_path = tape_abs / "events.jsonl"
-        if not ev_path.exists():
+        ev_path = resolve_tape_events_path(tape_abs)
+        if ev_path is None:
             continue
         try:
-            events, _ = _load_jsonl_lines(ev_path)
+            ts_list = _load_ts_recv(ev_path)
         except Exception:
             continue
-        ts_list = _extract_ts_recv(events)
         if len(ts_list) < 2:
             continue
         gaps = [ts_list[i] - ts_list[i - 1] for i in range(1, len(ts_list)) if ts_list[i] >= ts_list[i - 1]]